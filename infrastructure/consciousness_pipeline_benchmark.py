@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+🧬 JTP Biological Organism - Consciousness Pipeline Microbenchmark
+
+Measures per-query cost of the CNS core token analysis before and after the
+compiled pipeline:
+
+- legacy: per-token ``stopwords.words('english')`` reload with a linear list scan,
+  ``any(pattern in token ...)`` over every dimension, and three separate
+  tokenization passes (vector, insight, readiness)
+- compiled: frozenset stopword index, one combined dimension regex with a token
+  memo, and a single shared tokenization pass
+
+Usage:
+    python infrastructure/consciousness_pipeline_benchmark.py [--iterations 2000]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src', 'cns-consciousness-core'))
+
+# The knowledge base the CNS core serves with, so both analyzers measure production patterns
+from consciousness_pipeline import (  # noqa: E402
+    KNOWLEDGE_PATTERNS,
+    NLTK_AVAILABLE,
+    SENTIMENT_LEXICON,
+    CompiledConsciousnessPipeline,
+    FALLBACK_ENGLISH_STOPWORDS,
+)
+
+SAMPLE_QUERIES = [
+    "How does biological consciousness evolution improve artificial intelligence awareness?",
+    "Explain the supreme transcendence of neural machine cognition. What makes it divine?",
+    "The organic life of cells and genes drives evolution. Our mind perceives this perfectly!",
+    "Which career paths suit an AI-first professional with strong cognitive and analytical skills?",
+    "This is a terrible and awful failure of thought, but the outcome was still brilliant and great.",
+]
+
+
+def _legacy_stopword_loader() -> Callable[[], List[str]]:
+    if NLTK_AVAILABLE:
+        try:
+            from nltk.corpus import stopwords
+            stopwords.words('english')
+            return lambda: stopwords.words('english')
+        except LookupError:
+            pass
+    return lambda: list(FALLBACK_ENGLISH_STOPWORDS)
+
+
+def build_legacy_analyzer(pipeline: CompiledConsciousnessPipeline) -> Callable[[str, str], Dict[str, Any]]:
+    """Reproduce the pre-pipeline BiologicalConsciousnessProcessor hot path"""
+    load_stopwords = _legacy_stopword_loader()
+    sent_tokenize, word_tokenize = pipeline._sent_tokenize, pipeline._word_tokenize
+
+    def tokenize(text: str) -> List[str]:
+        return [token for sentence in sent_tokenize(text) for token in word_tokenize(sentence)]
+
+    def extract_vector(text: str) -> List[float]:
+        tokens = tokenize(text.lower())
+        tokens = [word for word in tokens if word.isalpha() and word not in load_stopwords()]
+        vector = []
+        for patterns in KNOWLEDGE_PATTERNS.values():
+            dimension_score = sum(1 for token in tokens if any(pattern in token for pattern in patterns))
+            vector.append(min(dimension_score / len(tokens) if tokens else 0, 1.0))
+        positive = sum(1 for token in tokens if token in SENTIMENT_LEXICON["positive"])
+        negative = sum(1 for token in tokens if token in SENTIMENT_LEXICON["negative"])
+        signals = sum(1 for token in tokens if token in SENTIMENT_LEXICON["consciousness_signals"])
+        base = 0.5 if positive + negative == 0 else positive / (positive + negative)
+        vector.append(min(base + signals * 0.1, 1.0))
+        return vector
+
+    def analyze_insight(query: str) -> str:
+        analysis = []
+        for sentence in sent_tokenize(query):
+            tokens = word_tokenize(sentence.lower())
+            tokens = [word for word in tokens if word.isalpha() and word not in load_stopwords()]
+            consciousness_matches = []
+            for dimension, patterns in KNOWLEDGE_PATTERNS.items():
+                matches = [token for token in tokens if any(pattern in token for pattern in patterns)]
+                if matches:
+                    consciousness_matches.extend([f"{token}({dimension})" for token in matches[:3]])
+            if consciousness_matches:
+                analysis.append(f"Found consciousness patterns: {', '.join(consciousness_matches[:5])}")
+        if analysis:
+            return ". ".join(analysis)
+        most_common = Counter(tokenize(query.lower())).most_common(3)
+        return f"Statistical analysis: Most frequent terms suggest focus on {', '.join([word for word, _ in most_common])}"
+
+    def analyze(query: str, context: str) -> Dict[str, Any]:
+        insight = analyze_insight(query)
+        vector = extract_vector(query)
+        readiness_vector = extract_vector(query)
+        return {"insight": insight, "vector": vector, "readiness": sum(readiness_vector) / len(readiness_vector)}
+
+    return analyze
+
+
+def build_compiled_analyzer(pipeline: CompiledConsciousnessPipeline) -> Callable[[str, str], Dict[str, Any]]:
+    def analyze(query: str, context: str) -> Dict[str, Any]:
+        analysis = pipeline.analyze(query)
+        vector = analysis.consciousness_vector
+        return {"insight": analysis.biological_insight, "vector": vector, "readiness": sum(vector) / len(vector)}
+
+    return analyze
+
+
+def time_per_query(analyze: Callable[[str, str], Dict[str, Any]], iterations: int) -> Dict[str, float]:
+    samples = []
+    for index in range(iterations):
+        query = SAMPLE_QUERIES[index % len(SAMPLE_QUERIES)]
+        start = time.perf_counter()
+        analyze(query, "ai_first")
+        samples.append((time.perf_counter() - start) * 1e6)
+
+    samples.sort()
+    return {
+        "mean_us": statistics.fmean(samples),
+        "p50_us": samples[len(samples) // 2],
+        "p99_us": samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CNS consciousness pipeline microbenchmark")
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    pipeline = CompiledConsciousnessPipeline(KNOWLEDGE_PATTERNS, SENTIMENT_LEXICON)
+    legacy = build_legacy_analyzer(pipeline)
+    compiled = build_compiled_analyzer(pipeline)
+
+    for query in SAMPLE_QUERIES:
+        before, after = legacy(query, "ai_first"), compiled(query, "ai_first")
+        if before != after:
+            print(f"⚠️ Result mismatch for query: {query!r}\n  legacy:   {before}\n  compiled: {after}")
+
+    before = time_per_query(legacy, args.iterations)
+    after = time_per_query(compiled, args.iterations)
+
+    report = {
+        "iterations": args.iterations,
+        "nltk_tokenization": pipeline.nltk_tokenization,
+        "before": before,
+        "after": after,
+        "speedup": before["mean_us"] / after["mean_us"] if after["mean_us"] else 0.0,
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+🧬 JTP Biological Organism - Campaign Delivery Benchmark
+
+Delivers a synthetic campaign through ``CampaignDeliveryEngine`` to a local
+fake HTTP provider and reports messages/second. The fake provider adds
+latency and answers a share of requests with 429 (with Retry-After) or 503,
+so retries and back-off are exercised, and it records idempotency keys so
+duplicate deliveries are counted.
+
+Two runs:
+
+- throughput: the whole campaign in one go
+- crash_resume: the delivery task is cancelled part-way (a crash after the
+  last checkpoint), then resumed from the checkpoint; in-flight messages are
+  sent again and must be deduplicated by their idempotency keys
+
+Usage:
+    python infrastructure/email_delivery_benchmark.py [--recipients 20000] [--concurrency 128]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+from typing import Any, Dict
+
+from aiohttp import web
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             'src', 'email_communications_symbiosis'))
+
+from delivery_engine import (  # noqa: E402
+    CampaignDeliveryEngine, CheckpointStore, HttpDeliveryProvider, SyntheticRecipientStore, personalize_message
+)
+
+CHANNELS = ["email_sendgrid", "sms_twilio"]
+CONTENT = {"subject": "Consciousness Evolution Opportunity",
+           "body": "Discover biological intelligence roles aligned with your career."}
+
+
+class FakeProvider:
+    """Local provider endpoint: latency, injected throttling/5xx, idempotency bookkeeping"""
+
+    def __init__(self, latency_ms: float, throttle_rate: float, error_rate: float, seed: int):
+        self.latency = latency_ms / 1000.0
+        self.throttle_rate = throttle_rate
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.accepted: Counter = Counter()
+        self.responses: Counter = Counter()
+
+    async def handle(self, request: web.Request) -> web.Response:
+        await request.read()
+        await asyncio.sleep(self.latency * self.rng.uniform(0.5, 1.5))
+        roll = self.rng.random()
+        if roll < self.throttle_rate:
+            self.responses[429] += 1
+            return web.Response(status=429, text="slow down", headers={"Retry-After": "0.05"})
+        if roll < self.throttle_rate + self.error_rate:
+            self.responses[503] += 1
+            return web.Response(status=503, text="unavailable")
+        key = request.headers["Idempotency-Key"]
+        self.accepted[key] += 1
+        self.responses[200 if self.accepted[key] == 1 else 208] += 1
+        return web.json_response({"id": key, "duplicate": self.accepted[key] > 1})
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "unique_messages": len(self.accepted),
+            "duplicate_deliveries": sum(count - 1 for count in self.accepted.values()),
+            "responses": {str(status): count for status, count in sorted(self.responses.items())},
+        }
+
+
+async def start_provider(provider: FakeProvider):
+    app = web.Application()
+    app.router.add_post("/send", provider.handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/send"
+
+
+def build_engine(endpoint: str, checkpoint_dir: str, args) -> CampaignDeliveryEngine:
+    provider = HttpDeliveryProvider("fake", endpoint, rate_per_second=args.rate or None, burst=args.concurrency,
+                                    max_connections=args.concurrency)
+    return CampaignDeliveryEngine(
+        {channel: provider for channel in CHANNELS}, personalize_message, CheckpointStore(checkpoint_dir),
+        concurrency=args.concurrency, chunk_size=args.chunk_size, base_backoff=0.05, max_backoff=1.0,
+        checkpoint_interval=0.25
+    )
+
+
+async def throughput_run(args) -> Dict[str, Any]:
+    provider = FakeProvider(args.latency_ms, args.throttle_rate, args.error_rate, args.seed)
+    runner, endpoint = await start_provider(provider)
+    with tempfile.TemporaryDirectory() as checkpoint_dir:
+        engine = build_engine(endpoint, checkpoint_dir, args)
+        start = time.perf_counter()
+        progress = await engine.deliver("benchmark", CONTENT, CHANNELS, SyntheticRecipientStore(args.recipients))
+        elapsed = time.perf_counter() - start
+        await engine.close()
+    await runner.cleanup()
+    return {
+        "seconds": round(elapsed, 2),
+        "messages_per_second": round((progress.sent + progress.failed) / elapsed, 1),
+        "sent": progress.sent,
+        "failed": progress.failed,
+        "retries": progress.retries,
+        "provider": provider.stats(),
+    }
+
+
+async def crash_resume_run(args) -> Dict[str, Any]:
+    provider = FakeProvider(args.latency_ms, args.throttle_rate, args.error_rate, args.seed)
+    runner, endpoint = await start_provider(provider)
+    recipients = SyntheticRecipientStore(args.recipients)
+    with tempfile.TemporaryDirectory() as checkpoint_dir:
+        engine = build_engine(endpoint, checkpoint_dir, args)
+        crashed = asyncio.create_task(engine.deliver("benchmark-resume", CONTENT, CHANNELS, recipients))
+        while len(provider.accepted) < args.recipients * len(CHANNELS) * args.crash_at:
+            await asyncio.sleep(0.01)
+        crashed.cancel()
+        await asyncio.gather(crashed, return_exceptions=True)
+        checkpoint = engine.checkpoints.load("benchmark-resume")["progress"]
+        await engine.close()
+
+        # Fresh engine, as after a process restart
+        engine = build_engine(endpoint, checkpoint_dir, args)
+        (record,) = engine.checkpoints.incomplete()
+        progress = await engine.resume(record)
+        await engine.close()
+    await runner.cleanup()
+    return {
+        "crashed_after_messages": checkpoint["sent"] + checkpoint["failed"],
+        "resumed_after_recipient": progress.resumed_from,
+        "final_status": progress.status,
+        "recipients_finished": progress.recipients_finished,
+        "provider": provider.stats(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Campaign delivery benchmark against a local fake provider")
+    parser.add_argument("--recipients", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=128)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--rate", type=float, default=0.0, help="provider messages/second (0 = unlimited)")
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.02)
+    parser.add_argument("--error-rate", type=float, default=0.01)
+    parser.add_argument("--crash-at", type=float, default=0.4, help="fraction of messages sent before the crash")
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    report = {
+        "recipients": args.recipients,
+        "channels": CHANNELS,
+        "concurrency": args.concurrency,
+        "throughput": asyncio.run(throughput_run(args)),
+        "crash_resume": asyncio.run(crash_resume_run(args)),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+🧬 JTP Biological Organism - Evolutionary Engine Benchmark
+
+Times one evolutionary experiment three ways:
+
+- lists: the brain trust's list-of-lists loop (per-individual fitness,
+  full sort, Python crossover/mutation), without its per-generation sleep
+- vectorized: ``VectorizedEvolution`` on one NumPy population array
+- expensive fitness, serial vs sharded across a ``ProcessPoolExecutor``;
+  the fitness does ``--fitness-rounds`` extra array passes per individual to
+  stand in for a costly simulation
+
+Usage:
+    python infrastructure/evolution_engine_benchmark.py [--population 5000] [--generations 200]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             'src', 'evolutionary_brain_trust'))
+
+from evolution_engine import VectorizedEvolution, fitness_for_dimension  # noqa: E402
+
+
+def list_based_run(population_size: int, generations: int) -> float:
+    """The pre-vectorization algorithm from run_evolutionary_algorithm"""
+    start = time.perf_counter()
+    population = [[random.uniform(0, 1) for _ in range(10)] for _ in range(population_size)]
+    for _ in range(generations):
+        fitness_scores = [sum(ind) / len(ind) * 1.3 * random.uniform(0.8, 1.2) for ind in population]
+        order = sorted(range(len(fitness_scores)), key=lambda i: fitness_scores[i], reverse=True)
+        selected = [population[i] for i in order[:len(population) // 2]]
+        new_population = selected.copy()
+        while len(new_population) < len(selected) * 2:
+            parent1, parent2 = random.sample(selected, 2)
+            point = random.randint(1, len(parent1) - 1)
+            child1 = parent1[:point] + parent2[point:]
+            child2 = parent2[:point] + parent1[point:]
+            for chromosome in (child1, child2):
+                if random.random() < 0.1:
+                    index = random.randint(0, len(chromosome) - 1)
+                    chromosome[index] = max(0, min(1, chromosome[index] + random.uniform(-0.1, 0.1)))
+            new_population.extend([child1, child2])
+        population = new_population[:len(selected) * 2]
+    return time.perf_counter() - start
+
+
+def expensive_fitness(population: np.ndarray, rounds: int) -> np.ndarray:
+    """Costly stand-in: repeated nonlinear passes over the genome"""
+    state = population.copy()
+    for _ in range(rounds):
+        state = np.tanh(state @ np.ones((population.shape[1], population.shape[1])) / population.shape[1] + population)
+    return state.mean(axis=1)
+
+
+def timed_run(engine: VectorizedEvolution, generations: int) -> dict:
+    result = engine.run(generations)
+    return {"seconds": round(result["seconds"], 3), "best_fitness": round(result["best_solution_fitness"], 4),
+            "generations_per_second": round(generations / result["seconds"], 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evolutionary engine benchmark")
+    parser.add_argument("--population", type=int, default=5000)
+    parser.add_argument("--generations", type=int, default=200)
+    parser.add_argument("--fitness-rounds", type=int, default=200)
+    parser.add_argument("--expensive-generations", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+    random.seed(args.seed)
+
+    lists_seconds = list_based_run(args.population, args.generations)
+    vectorized = timed_run(VectorizedEvolution(args.population, fitness=fitness_for_dimension("universal_harmony"),
+                                               fitness_noise=0.2, seed=args.seed), args.generations)
+
+    fitness = partial(expensive_fitness, rounds=args.fitness_rounds)
+    serial = timed_run(VectorizedEvolution(args.population, fitness=fitness, seed=args.seed),
+                       args.expensive_generations)
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        sharded = timed_run(VectorizedEvolution(args.population, fitness=fitness, seed=args.seed, executor=pool),
+                            args.expensive_generations)
+
+    report = {
+        "population": args.population,
+        "generations": args.generations,
+        "lists": {"seconds": round(lists_seconds, 3),
+                  "generations_per_second": round(args.generations / lists_seconds, 1)},
+        "vectorized": vectorized,
+        "speedup": round(lists_seconds / vectorized["seconds"], 1),
+        "expensive_fitness": {
+            "generations": args.expensive_generations,
+            "workers": args.workers,
+            "serial": serial,
+            "process_pool": sharded,
+            "speedup": round(serial["seconds"] / sharded["seconds"], 2),
+        },
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
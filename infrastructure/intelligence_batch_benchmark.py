@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+🧬 JTP Biological Organism - Application Intelligence Batch Benchmark
+
+Scores one CV profile against ``--jobs`` synthetic postings spread over the
+four modelled platforms three ways:
+
+- per-job, uncached: ``predict_application_success`` per posting with the
+  CV feature cache disabled, so CV quality, experience and keyword
+  extraction are recomputed for every posting (the pre-batch cost model)
+- per-job, cached: ``predict_application_success`` per posting, reusing the
+  cached CV features
+- batch: one ``predict_batch`` call
+
+All three must produce identical predictions (timestamps aside).
+
+Usage:
+    python infrastructure/intelligence_batch_benchmark.py [--jobs 5000]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             'src', 'application-automation', 'intelligence_intelligence'))
+
+import intelligence_network  # noqa: E402
+from intelligence_network import ApplicationIntelligenceNetwork  # noqa: E402
+
+PLATFORMS = ("linkedin", "indeed", "glassdoor", "monster")
+SKILLS = ["Python", "AWS", "Kubernetes", "SQL", "Terraform", "React", "Go", "Kafka", "Docker", "GraphQL",
+          "Machine Learning", "Data Pipelines", "Spark", "TypeScript", "PostgreSQL"]
+COMPANIES = ["Google", "Stripe", "Acme Corp", "Initech", "Spotify", "Globex", "Notion", "Umbrella"]
+TITLES = ["Senior Backend Engineer", "Data Engineer", "Platform Engineer", "Staff Software Engineer",
+          "Machine Learning Engineer", "Full Stack Developer"]
+
+
+def synthetic_cv_profile(rng: random.Random) -> dict:
+    experience = [{
+        "role": rng.choice(TITLES),
+        "company": rng.choice(COMPANIES),
+        "description": " ".join(rng.choice(SKILLS).lower() + " services and platform work" for _ in range(25)),
+    } for _ in range(6)]
+    return {
+        "profile_id": "benchmark-cv",
+        "profile_version": 1,
+        "professional_summary": "Backend and data engineer building reliable distributed systems " * 4,
+        "summary": " ".join(rng.choice(SKILLS) for _ in range(60)),
+        "experience": experience,
+        "skills": rng.sample(SKILLS, 10),
+        "education": ["BSc Computer Science"],
+        "certifications": ["AWS Solutions Architect"],
+        "email": "candidate@example.com",
+        "phone": "+49 000 000",
+        "location": "Berlin",
+        "company_connections": {"stripe": 2, "google": 1},
+        "salary_expectation": "95k",
+    }
+
+
+def synthetic_postings(count: int, rng: random.Random) -> list:
+    return [SimpleNamespace(
+        job_id=f"JOB-{i:06d}",
+        platform=PLATFORMS[i % len(PLATFORMS)],
+        title=rng.choice(TITLES),
+        company=rng.choice(COMPANIES),
+        location=rng.choice(["Berlin, DE", "Remote", "Munich, DE", "London, UK"]),
+        description=" ".join(rng.choice(SKILLS).lower() + " experience required" for _ in range(40)),
+        requirements=rng.sample(SKILLS, 5),
+        salary_range=f"${rng.randint(70, 100)}k - ${rng.randint(100, 140)}k",
+        biological_alignment_score=rng.random(),
+    ) for i in range(count)]
+
+
+def comparable(predictions: list) -> list:
+    return [{key: value for key, value in prediction.items() if key != "prediction_metadata"}
+            for prediction in predictions]
+
+
+async def per_job(network: ApplicationIntelligenceNetwork, cv_profile: dict, postings: list) -> list:
+    return [await network.predict_application_success(job, cv_profile, {}) for job in postings]
+
+
+def timed(coroutine_factory):
+    start = time.perf_counter()
+    result = asyncio.run(coroutine_factory())
+    return result, time.perf_counter() - start
+
+
+def report(seconds: float, jobs: int) -> dict:
+    return {"seconds": round(seconds, 3), "jobs_per_second": round(jobs / seconds)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Application intelligence batch benchmark")
+    parser.add_argument("--jobs", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=17)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    cv_profile = synthetic_cv_profile(rng)
+    postings = synthetic_postings(args.jobs, rng)
+
+    cache_size = intelligence_network.CV_FEATURE_CACHE_SIZE
+    intelligence_network.CV_FEATURE_CACHE_SIZE = 0
+    try:
+        uncached, uncached_seconds = timed(lambda: per_job(ApplicationIntelligenceNetwork(), cv_profile, postings))
+    finally:
+        intelligence_network.CV_FEATURE_CACHE_SIZE = cache_size
+
+    cached, cached_seconds = timed(lambda: per_job(ApplicationIntelligenceNetwork(), cv_profile, postings))
+    batch_network = ApplicationIntelligenceNetwork()
+    batch, batch_seconds = timed(lambda: batch_network.predict_batch(cv_profile, postings))
+
+    print(json.dumps({
+        "jobs": args.jobs,
+        "per_job_uncached": report(uncached_seconds, args.jobs),
+        "per_job_cached": report(cached_seconds, args.jobs),
+        "batch": report(batch_seconds, args.jobs),
+        "speedup_vs_uncached": round(uncached_seconds / batch_seconds, 1),
+        "predictions_match": comparable(uncached) == comparable(cached) == comparable(batch),
+        "input_order_preserved": [p["prediction_metadata"]["platform"] for p in batch] ==
+                                 [job.platform for job in postings],
+        "cv_feature_cache": batch_network.get_network_intelligence_metrics()["cv_feature_cache"],
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
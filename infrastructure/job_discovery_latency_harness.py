@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+🧬 JTP Biological Organism - Job Discovery Tail-Latency Harness
+
+Runs the multi-source discovery against local fake sources with injected
+delays, stalls and failures, and compares end-to-end latency percentiles of:
+
+- sequential: sources queried one after another (the pre-fan-out behaviour)
+- concurrent: ``job_discovery.discover_jobs`` with per-source timeouts
+
+plus time-to-first-result for the streaming path. Fake sources return
+overlapping postings so deduplication is exercised as well.
+
+Usage:
+    python infrastructure/job_discovery_latency_harness.py [--searches 50] [--stall-probability 0.1]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from job_discovery import DiscoverySource, JobDeduplicator, discover_jobs  # noqa: E402
+
+
+class FakeJobSource:
+    """
+    Job source with a lognormal-ish latency, occasional stalls and failures.
+
+    ``blocking=True`` sleeps in the calling thread like the synchronous HTTP
+    clients; otherwise it is a coroutine source.
+    """
+
+    def __init__(self, name: str, median_seconds: float, jobs: int = 5,
+                 stall_probability: float = 0.0, stall_seconds: float = 5.0,
+                 failure_probability: float = 0.0, blocking: bool = True,
+                 overlap_with: Optional[str] = None, seed: int = 0):
+        self.name = name
+        self.median_seconds = median_seconds
+        self.jobs = jobs
+        self.stall_probability = stall_probability
+        self.stall_seconds = stall_seconds
+        self.failure_probability = failure_probability
+        self.blocking = blocking
+        self.overlap_with = overlap_with
+        self.rng = random.Random(seed)
+
+    def _plan(self) -> float:
+        if self.rng.random() < self.stall_probability:
+            return self.stall_seconds
+        return self.median_seconds * self.rng.lognormvariate(0.0, 0.35)
+
+    def _postings(self, keywords: str, location: str) -> List[Dict[str, Any]]:
+        if self.rng.random() < self.failure_probability:
+            raise ConnectionError(f"{self.name} unavailable")
+        company_prefix = self.overlap_with or self.name
+        return [
+            {
+                'title': f'{keywords} {i}',
+                'company': f'{company_prefix.title()} Company {i} AG',
+                'location': location,
+                'source': self.name
+            }
+            for i in range(self.jobs)
+        ]
+
+    def fetch(self, keywords: str, location: str) -> List[Dict[str, Any]]:
+        time.sleep(self._plan())
+        return self._postings(keywords, location)
+
+    async def fetch_async(self, keywords: str, location: str) -> List[Dict[str, Any]]:
+        await asyncio.sleep(self._plan())
+        return self._postings(keywords, location)
+
+    def as_source(self, timeout: float, fallback: bool = False) -> DiscoverySource:
+        return DiscoverySource(self.name, self.fetch if self.blocking else self.fetch_async,
+                               timeout=timeout, fallback=fallback)
+
+
+def build_sources(args) -> List[FakeJobSource]:
+    return [
+        FakeJobSource("linkedin", 0.15, stall_probability=args.stall_probability,
+                      stall_seconds=args.stall_seconds, seed=args.seed),
+        FakeJobSource("indeed", 0.25, stall_probability=args.stall_probability,
+                      stall_seconds=args.stall_seconds, failure_probability=0.05, seed=args.seed + 1),
+        # Reposts of LinkedIn postings: deduplicated by company/title/location
+        FakeJobSource("glassdoor", 0.3, overlap_with="linkedin", blocking=False, seed=args.seed + 2),
+    ]
+
+
+def sequential_search(sources: List[FakeJobSource]) -> Dict[str, Any]:
+    start = time.perf_counter()
+    jobs, deduplicator = [], JobDeduplicator()
+    for source in sources:
+        try:
+            jobs.extend(deduplicator.filter_new(source.fetch("Business Analyst", "Zurich")))
+        except ConnectionError:
+            pass
+    return {"seconds": time.perf_counter() - start, "first_result_seconds": None, "jobs": len(jobs), "timeouts": 0}
+
+
+async def concurrent_search(sources: List[FakeJobSource], timeout: float) -> Dict[str, Any]:
+    result = await discover_jobs([source.as_source(timeout) for source in sources], "Business Analyst", "Zurich")
+    return {
+        "seconds": result.seconds,
+        "first_result_seconds": result.first_result_seconds,
+        "jobs": len(result.jobs),
+        "timeouts": sum(1 for outcome in result.outcomes if outcome.status == "timeout"),
+    }
+
+
+def percentiles(values: List[float]) -> Dict[str, float]:
+    ordered = sorted(values)
+
+    def pick(q: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 4)
+
+    return {"p50": pick(0.5), "p95": pick(0.95), "p99": pick(0.99), "max": round(ordered[-1], 4),
+            "mean": round(statistics.mean(ordered), 4)}
+
+
+def summarize(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    summary = {"latency_seconds": percentiles([run["seconds"] for run in runs]),
+               "avg_unique_jobs": round(statistics.mean(run["jobs"] for run in runs), 1),
+               "timeouts": sum(run["timeouts"] for run in runs)}
+    first = [run["first_result_seconds"] for run in runs if run["first_result_seconds"] is not None]
+    if first:
+        summary["first_result_seconds"] = percentiles(first)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Job discovery tail-latency harness")
+    parser.add_argument("--searches", type=int, default=30)
+    parser.add_argument("--timeout", type=float, default=1.0, help="per-source timeout for the concurrent path")
+    parser.add_argument("--stall-probability", type=float, default=0.1)
+    parser.add_argument("--stall-seconds", type=float, default=3.0)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--skip-sequential", action="store_true")
+    args = parser.parse_args()
+
+    report: Dict[str, Any] = {"searches": args.searches, "per_source_timeout": args.timeout}
+    if not args.skip_sequential:
+        sources = build_sources(args)
+        report["sequential"] = summarize([sequential_search(sources) for _ in range(args.searches)])
+
+    sources = build_sources(args)
+
+    async def run_concurrent():
+        return [await concurrent_search(sources, args.timeout) for _ in range(args.searches)]
+
+    report["concurrent"] = summarize(asyncio.run(run_concurrent()))
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
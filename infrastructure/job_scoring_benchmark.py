@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+🧬 JTP Biological Organism - Batch Job Scoring Benchmark
+
+Scores synthetic job postings for one user profile three ways and checks that
+they agree:
+
+- per_job: ``BiologicalConsciousnessEngine.calculate_biological_match`` in a loop
+  (nested substring skill loop, per-call location normalisation)
+- batch_rows: ``calculate_biological_match_batch`` over a list of job dicts
+- batch_columns: the same over a columnar table (dict of lists)
+
+and reports ``top_biological_matches`` for the ranking-only path.
+
+Usage:
+    python infrastructure/job_scoring_benchmark.py [--jobs 10000] [--repeat 3]
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from job_search_ai_agent import BiologicalConsciousnessEngine  # noqa: E402
+
+SKILLS = [
+    "Business Analysis", "Requirements Engineering", "Process Mapping", "Data Visualization",
+    "Power BI", "Excel", "SQL", "SAP", "Stakeholder Management", "Agile", "Scrum",
+    "Automation Anywhere", "Python", "Tableau", "Jira", "Confluence", "Risk Management",
+    "Product Ownership", "UML", "BPMN", "Change Management", "Kubernetes", "Java", "ETL",
+]
+
+LOCATIONS = [
+    "Zurich, Switzerland", "Zürich", "Geneva, Switzerland", "Basel", "Bern", "Lausanne",
+    "Berlin, Germany", "London, UK", "Remote", "Zug, Switzerland", "Munich", "",
+]
+
+LEVELS = ["entry-level", "junior", "mid-level", "senior", "executive", "internship"]
+
+USER_PROFILE = {
+    "experience_years": 30,
+    "skills": ["Business Analysis", "Requirements Engineering", "Process Mapping",
+               "Data Visualization", "Power BI", "Excel", "SQL", "SAP",
+               "Stakeholder Management", "Agile", "Scrum", "Automation Anywhere"],
+    "location": "Zurich",
+}
+
+
+def synthetic_jobs(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    return [
+        {
+            "title": f"Analyst {i}",
+            "experience_level": rng.choice(LEVELS),
+            "required_skills": rng.sample(SKILLS, rng.randint(0, 8)),
+            "location": rng.choice(LOCATIONS),
+        }
+        for i in range(count)
+    ]
+
+
+def best_of(repeat: int, func: Callable[[], Any]) -> Dict[str, Any]:
+    timings, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return {"best_seconds": round(min(timings), 4), "median_seconds": round(statistics.median(timings), 4), "result": result}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch job scoring benchmark")
+    parser.add_argument("--jobs", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = BiologicalConsciousnessEngine()
+    jobs = synthetic_jobs(args.jobs)
+    columns = {field: [job[field] for job in jobs] for field in ("experience_level", "required_skills", "location")}
+
+    runs = {
+        "per_job": best_of(args.repeat, lambda: [engine.calculate_biological_match(USER_PROFILE, job) for job in jobs]),
+        "batch_rows": best_of(args.repeat, lambda: engine.calculate_biological_match_batch(USER_PROFILE, jobs)),
+        "batch_columns": best_of(args.repeat, lambda: engine.calculate_biological_match_batch(USER_PROFILE, columns)),
+        "top_k_columns": best_of(args.repeat, lambda: engine.top_biological_matches(USER_PROFILE, columns, args.top)),
+    }
+
+    reference = runs["per_job"]["result"]
+    report = {
+        "jobs": args.jobs,
+        "identical_results": runs["batch_rows"]["result"] == reference and runs["batch_columns"]["result"] == reference,
+    }
+    for name, run in runs.items():
+        report[name] = {
+            "best_seconds": run["best_seconds"],
+            "median_seconds": run["median_seconds"],
+            "jobs_per_second": round(args.jobs / run["best_seconds"]) if run["best_seconds"] else None,
+        }
+    for name in ("batch_rows", "batch_columns", "top_k_columns"):
+        if runs[name]["best_seconds"]:
+            report[name]["speedup_vs_per_job"] = round(runs["per_job"]["best_seconds"] / runs[name]["best_seconds"], 2)
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
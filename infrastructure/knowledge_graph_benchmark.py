@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+🧬 JTP Biological Organism - Consciousness Knowledge Graph Benchmark
+
+Builds a ``--nodes`` knowledge network with ``--degree`` random connections
+per node, then times self-improvement waves two ways:
+
+- adjacency sets: the previous node-by-node breadth-first wave over a
+  ``defaultdict(set)`` of string ids
+- CSR graph: ``KnowledgeGraph.propagate_wave`` expanding whole frontiers
+
+Both must improve the same nodes at the same levels.
+
+Usage:
+    python infrastructure/knowledge_graph_benchmark.py [--nodes 100000]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             'src', 'consciousness-knowledge'))
+
+from knowledge_graph import KnowledgeGraph  # noqa: E402
+
+
+def set_wave(adjacency, attributes, origin, max_levels, threshold, decay=0.9):
+    visited, wave_front, results = {origin}, [origin], {}
+    for wave_level in range(max_levels):
+        new_front = []
+        for current in wave_front:
+            current_improvement = decay ** wave_level
+            for connected in adjacency[current]:
+                if connected not in visited:
+                    capacity, potential = attributes[connected]
+                    improvement = current_improvement * capacity
+                    if improvement * potential >= threshold:
+                        results[connected] = wave_level + 1
+                        new_front.append(connected)
+                        visited.add(connected)
+        wave_front = new_front
+        if not new_front:
+            break
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Consciousness knowledge graph benchmark")
+    parser.add_argument("--nodes", type=int, default=100_000)
+    parser.add_argument("--degree", type=int, default=8)
+    parser.add_argument("--waves", type=int, default=5)
+    parser.add_argument("--levels", type=int, default=8)
+    parser.add_argument("--threshold", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    node_ids = [f"node-{i}" for i in range(args.nodes)]
+    attributes = {node_id: (rng.uniform(0.8, 1.0), rng.uniform(0.7, 1.0)) for node_id in node_ids}
+    connections = [(rng.choice(node_ids), rng.choice(node_ids)) for _ in range(args.nodes * args.degree // 2)]
+
+    adjacency = defaultdict(set)
+    for source, target in connections:
+        adjacency[source].add(target)
+        adjacency[target].add(source)
+
+    start = time.perf_counter()
+    graph = KnowledgeGraph()
+    for node_id, (capacity, potential) in attributes.items():
+        graph.add_node(node_id, "knowledge", {
+            "biological_alignment": 0.95, "evolutionary_potential": potential,
+            "communication_strength": 0.97, "self_improvement_capacity": capacity})
+    for source, target in connections:
+        graph.add_edge(source, target)
+    graph.csr()
+    build_seconds = time.perf_counter() - start
+
+    origins = [rng.choice(node_ids) for _ in range(args.waves)]
+
+    start = time.perf_counter()
+    set_results = [set_wave(adjacency, attributes, origin, args.levels, args.threshold) for origin in origins]
+    set_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    csr_results = [graph.propagate_wave(origin, evolutionary_threshold=args.threshold, max_levels=args.levels)
+                   for origin in origins]
+    csr_seconds = time.perf_counter() - start
+
+    matches = all(
+        expected == {graph.node_ids[node]: level for node, level in zip(wave["nodes"].tolist(), wave["levels"].tolist())}
+        for expected, wave in zip(set_results, csr_results))
+
+    print(json.dumps({
+        "nodes": args.nodes,
+        "connections": graph.edge_count,
+        "graph_build_seconds": round(build_seconds, 2),
+        "average_nodes_improved": round(sum(len(r) for r in set_results) / args.waves),
+        "adjacency_sets_wave_ms": round(set_seconds / args.waves * 1000, 1),
+        "csr_wave_ms": round(csr_seconds / args.waves * 1000, 1),
+        "speedup": round(set_seconds / csr_seconds, 1),
+        "waves_match": matches,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+🧬 JTP Biological Organism - Gamification Leaderboard Benchmark
+
+Loads ``--users`` point totals into one board, then times point updates,
+top-k reads and rank-of-user reads two ways:
+
+- dict + sort: the previous ``get_leaderboard`` (sort every entry per read;
+  a user's rank means scanning the sorted list)
+- skip list: ``SortedLeaderboard`` from the in-memory leaderboard store
+
+Both must return the same standings (ties broken by user id).
+
+Usage:
+    python infrastructure/leaderboard_benchmark.py [--users 300000]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             'src', 'energy-fields'))
+
+from leaderboard_store import SortedLeaderboard  # noqa: E402
+
+
+def per_operation_us(seconds: float, operations: int) -> float:
+    return round(seconds / operations * 1e6, 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gamification leaderboard benchmark")
+    parser.add_argument("--users", type=int, default=300_000)
+    parser.add_argument("--updates", type=int, default=100_000)
+    parser.add_argument("--reads", type=int, default=20)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=19)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    users = [f"user-{i:07d}" for i in range(args.users)]
+    points = {user_id: rng.randrange(100_000) for user_id in users}
+
+    board = SortedLeaderboard(seed=args.seed)
+    start = time.perf_counter()
+    for user_id, total in points.items():
+        board.update(user_id, total)
+    load_seconds = time.perf_counter() - start
+
+    updates = [(rng.choice(users), rng.randrange(25, 1000)) for _ in range(args.updates)]
+    start = time.perf_counter()
+    for user_id, award in updates:
+        points[user_id] += award
+        board.update(user_id, points[user_id])
+    update_seconds = time.perf_counter() - start
+
+    probes = [rng.choice(users) for _ in range(args.reads)]
+
+    start = time.perf_counter()
+    for _ in range(args.reads):
+        sorted_top = sorted(points.items(), key=lambda item: (-item[1], item[0]))[:args.top]
+    sort_top_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    for user_id in probes:
+        ordered = sorted(points.items(), key=lambda item: (-item[1], item[0]))
+        sort_rank = next(rank for rank, (member, _) in enumerate(ordered, 1) if member == user_id)
+    sort_rank_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(args.reads):
+        skip_top = board.top(args.top)
+    skip_top_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    for user_id in probes:
+        skip_rank = board.rank(user_id)
+    skip_rank_seconds = time.perf_counter() - start
+
+    print(json.dumps({
+        "users": args.users,
+        "skip_list": {
+            "load_seconds": round(load_seconds, 2),
+            "update_us": per_operation_us(update_seconds, args.updates),
+            "top_k_us": per_operation_us(skip_top_seconds, args.reads),
+            "rank_us": per_operation_us(skip_rank_seconds, len(probes)),
+        },
+        "dict_sort": {
+            "update_us": "O(1) dict write",
+            "top_k_us": per_operation_us(sort_top_seconds, args.reads),
+            "rank_us": per_operation_us(sort_rank_seconds, len(probes)),
+        },
+        "top_k_speedup": round(sort_top_seconds / skip_top_seconds),
+        "standings_match": skip_top == sorted_top and skip_rank == sort_rank,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
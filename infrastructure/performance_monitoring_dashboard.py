@@ -48,6 +48,83 @@ from collections import defaultdict, deque
 import aiohttp
 import websockets
 import socket
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+from service_infrastructure.metrics import histogram_quantile, parse_prometheus_text  # noqa: E402
+
+# Service /metrics endpoints scraped for application metrics; override with
+# MONITORING_SCRAPE_TARGETS="name=http://host:port/metrics,..."
+DEFAULT_SCRAPE_TARGETS = {
+    "cns-consciousness-core": "http://localhost:8001/metrics",
+    "biological_auth_orchestrator": "http://localhost:9001/metrics",
+    "cv_generation_engine": "http://localhost:9002/metrics",
+    "multilingual_resonance": "http://localhost:9003/metrics",
+    "email_communications_symbiosis": "http://localhost:9004/metrics",
+    "gitops_orchestrator": "http://localhost:9005/metrics",
+    "evolutionary_brain_trust": "http://localhost:9999/metrics",
+}
+
+
+def load_scrape_targets() -> Dict[str, str]:
+    """Scrape targets from MONITORING_SCRAPE_TARGETS, falling back to the local service ports"""
+    configured = os.getenv("MONITORING_SCRAPE_TARGETS", "").strip()
+    if not configured:
+        return dict(DEFAULT_SCRAPE_TARGETS)
+    targets = {}
+    for entry in configured.split(","):
+        name, _, url = entry.strip().partition("=")
+        if name and url:
+            targets[name.strip()] = url.strip()
+    return targets
+
+
+def summarize_request_histograms(samples: List[Tuple[str, Dict[str, str], float]]) -> Dict[str, Any]:
+    """
+    Fold one service's ``http_request_duration_seconds`` samples into
+    per-route cumulative buckets (summed over status codes), count, sum and
+    5xx count, plus the in-flight gauge.
+    """
+    routes: Dict[str, Dict[str, Any]] = {}
+    in_flight = 0.0
+
+    def route_entry(route: str) -> Dict[str, Any]:
+        return routes.setdefault(route, {"buckets": defaultdict(float), "count": 0.0, "sum": 0.0, "errors": 0.0})
+
+    for name, labels, value in samples:
+        if name == "http_requests_in_flight":
+            in_flight += value
+        elif name == "http_request_duration_seconds_bucket":
+            route_entry(labels.get("route", ""))["buckets"][float(labels["le"])] += value
+        elif name == "http_request_duration_seconds_count":
+            entry = route_entry(labels.get("route", ""))
+            entry["count"] += value
+            if labels.get("status", "").startswith("5"):
+                entry["errors"] += value
+        elif name == "http_request_duration_seconds_sum":
+            route_entry(labels.get("route", ""))["sum"] += value
+
+    return {"routes": routes, "in_flight": in_flight}
+
+
+def _window(current: Dict[str, Any], previous: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Counter deltas since the previous scrape (whole lifetime on first scrape or after a restart)"""
+    if previous is None or current["count"] < previous["count"]:
+        return current
+    return {
+        "buckets": {le: count - previous["buckets"].get(le, 0.0) for le, count in current["buckets"].items()},
+        "count": current["count"] - previous["count"],
+        "sum": current["sum"] - previous["sum"],
+        "errors": current["errors"] - previous["errors"],
+    }
+
+
+def _quantiles(buckets: Dict[float, float]) -> Tuple[Optional[float], Optional[float]]:
+    bounds = sorted(le for le in buckets if le != float("inf"))
+    cumulative = [buckets[le] for le in bounds] + [buckets.get(float("inf"), 0.0)]
+    if not bounds:
+        return None, None
+    return histogram_quantile(0.5, bounds, cumulative), histogram_quantile(0.99, bounds, cumulative)
 
 
 class AlertSeverity(Enum):
@@ -220,6 +297,10 @@ class AlertEngine:
                 "warning_high": 2.0,
                 "critical_high": 5.0
             },
+            "response_time_p99_seconds": {
+                "warning_high": 2.5,
+                "critical_high": 5.0
+            },
             "error_rate_percent": {
                 "warning_high": 5.0,
                 "critical_high": 10.0
@@ -237,12 +318,20 @@ class AlertEngine:
 class MetricsCollector:
     """Collector for various system and application metrics"""
 
-    def __init__(self):
+    def __init__(self, scrape_targets: Optional[Dict[str, str]] = None, api_key: Optional[str] = None):
         self.metrics_history: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
         self.collection_interval = 10  # seconds
         self.is_collecting = False
         self.collection_task: Optional[asyncio.Task] = None
 
+        # Application metrics are scraped from each service's /metrics endpoint
+        self.scrape_targets = scrape_targets if scrape_targets is not None else load_scrape_targets()
+        self.api_key = api_key or os.getenv("MONITORING_API_KEY", "godhood-master-key-2025")
+        self.scrape_timeout = 2.0
+        self._previous_scrape: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self.endpoint_latency: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.scrape_errors: Dict[str, str] = {}
+
     async def start_collection(self):
         """Start metric collection"""
         if not self.is_collecting:
@@ -296,15 +385,88 @@ class MetricsCollector:
             self._store_metric(PerformanceMetric("network_sent_mb", bytes_sent_mb, "MB", timestamp, {"system": "network"}))
             self._store_metric(PerformanceMetric("network_recv_mb", bytes_recv_mb, "MB", timestamp, {"system": "network"}))
 
+    async def _scrape_service(self, session: "aiohttp.ClientSession", service: str, url: str) -> Optional[str]:
+        try:
+            async with session.get(url, headers={"X-API-Key": self.api_key}) as response:
+                if response.status != 200:
+                    raise RuntimeError(f"HTTP {response.status}")
+                self.scrape_errors.pop(service, None)
+                return await response.text()
+        except Exception as e:
+            self.scrape_errors[service] = str(e) or type(e).__name__
+            return None
+
     async def _collect_application_metrics(self):
-        """Collect application-level metrics"""
+        """Collect application-level metrics from the services' Prometheus endpoints"""
+        timeout = aiohttp.ClientTimeout(total=self.scrape_timeout)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            services = list(self.scrape_targets)
+            bodies = await asyncio.gather(*(
+                self._scrape_service(session, service, self.scrape_targets[service]) for service in services
+            ))
+        scraped_at = time.monotonic()
+        self.ingest_application_metrics({
+            service: summarize_request_histograms(parse_prometheus_text(body))
+            for service, body in zip(services, bodies) if body is not None
+        }, scraped_at)
+
+    def ingest_application_metrics(self, scraped: Dict[str, Dict[str, Any]], scraped_at: float):
+        """
+        Derive request rate, latency percentiles and error rate from one round
+        of scraped histograms. Percentiles cover the window since the previous
+        scrape so they track current load rather than the process lifetime.
+        """
+        if not scraped:
+            return
         timestamp = datetime.now()
-
-        # Simulate application metrics - in real implementation, would collect from actual app
-        self._store_metric(PerformanceMetric("active_connections", 150, "count", timestamp, {"app": "web_server"}))
-        self._store_metric(PerformanceMetric("request_rate_per_second", 25.5, "req/s", timestamp, {"app": "web_server"}))
-        self._store_metric(PerformanceMetric("response_time_seconds", 0.15, "s", timestamp, {"app": "web_server"}))
-        self._store_metric(PerformanceMetric("error_rate_percent", 0.2, "%", timestamp, {"app": "web_server"}))
+        total_buckets: Dict[float, float] = defaultdict(float)
+        total_count = total_sum = total_errors = in_flight = 0.0
+        rate = 0.0
+        have_rate = False
+
+        for service, summary in scraped.items():
+            previous_at, previous = self._previous_scrape.get(service, (None, {"routes": {}}))
+            elapsed = scraped_at - previous_at if previous_at is not None else None
+            in_flight += summary["in_flight"]
+            service_latency = {}
+
+            for route, current in summary["routes"].items():
+                window = _window(current, previous["routes"].get(route) if previous_at is not None else None)
+                p50, p99 = _quantiles(window["buckets"])
+                service_latency[route] = {
+                    "requests": int(window["count"]),
+                    "requests_per_second": window["count"] / elapsed if elapsed else None,
+                    "p50_seconds": p50,
+                    "p99_seconds": p99,
+                    "errors": int(window["errors"]),
+                }
+                for le, count in window["buckets"].items():
+                    total_buckets[le] += count
+                total_count += window["count"]
+                total_sum += window["sum"]
+                total_errors += window["errors"]
+                if elapsed:
+                    rate += window["count"] / elapsed
+                    have_rate = True
+
+            self.endpoint_latency[service] = service_latency
+            self._previous_scrape[service] = (scraped_at, summary)
+
+        tags = {"app": "biological_services", "services": len(scraped)}
+        self._store_metric(PerformanceMetric("active_connections", in_flight, "count", timestamp, tags))
+        if have_rate:
+            self._store_metric(PerformanceMetric("request_rate_per_second", rate, "req/s", timestamp, tags))
+        if total_count > 0:
+            p50, p99 = _quantiles(total_buckets)
+            self._store_metric(PerformanceMetric("response_time_seconds", total_sum / total_count, "s", timestamp, tags))
+            if p50 is not None:
+                self._store_metric(PerformanceMetric("response_time_p50_seconds", p50, "s", timestamp, tags))
+                self._store_metric(PerformanceMetric("response_time_p99_seconds", p99, "s", timestamp, tags))
+            self._store_metric(PerformanceMetric("error_rate_percent", total_errors / total_count * 100, "%", timestamp, tags))
+
+    def get_endpoint_latency_report(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Per service and route: requests, rate, p50/p99 and errors over the last scrape window"""
+        return {service: dict(routes) for service, routes in self.endpoint_latency.items()}
 
     async def _collect_consciousness_metrics(self):
         """Collect consciousness and transcendence metrics"""
@@ -606,7 +768,8 @@ class PerformanceMonitoringSystem:
             data_source="metrics_collector",
             configuration={
                 "metrics_collector": self.metrics_collector,
-                "metric_names": ["cpu_usage_percent", "memory_usage_percent", "response_time_seconds", "error_rate_percent"]
+                "metric_names": ["cpu_usage_percent", "memory_usage_percent", "response_time_seconds",
+                                 "response_time_p99_seconds", "error_rate_percent"]
             },
             position={"x": 6, "y": 0, "width": 6, "height": 3}
         )
@@ -670,6 +833,7 @@ class PerformanceMonitoringSystem:
                     "cpu_usage_percent",
                     "memory_usage_percent",
                     "response_time_seconds",
+                    "response_time_p99_seconds",
                     "error_rate_percent",
                     "consciousness_readiness",
                     "transcendence_readiness"
@@ -29,6 +29,10 @@ import io
 import gc
 import threading
 import json
+import os
+import subprocess
+import sys
+import tempfile
 
 logger = logging.getLogger(__name__)
 
@@ -317,7 +321,7 @@ class StartupProfiler:
             self.metrics.memory_usage_at_startup = psutil.Process().memory_info().rss
             self.metrics.thread_count = threading.active_count()
 
-            logger.info(".2f"
+            logger.info(f"⏱️ Startup completed in {self.metrics.total_startup_time:.2f}s")
             if self.metrics.total_startup_time > 30:
                 logger.warning("⚠️ Startup time exceeds 30-second target - optimization needed")
             else:
@@ -329,6 +333,45 @@ class StartupProfiler:
 
         return self.metrics
 
+    def profile_module_imports(self, module: str, search_path: str,
+                               env: Optional[Dict[str, str]] = None) -> StartupMetrics:
+        """Cold-import ``module`` in a fresh interpreter and record per-module import time
+
+        Runs ``python -X importtime -c "import <module>"`` with ``search_path`` on
+        PYTHONPATH and a scratch working directory (service modules create log
+        and data files on import). ``module_load_time`` receives the cumulative
+        import time in seconds of every module imported, keyed by dotted name.
+        """
+        metrics = StartupMetrics()
+        child_env = {**os.environ, **(env or {})}
+        child_env["PYTHONPATH"] = os.pathsep.join(filter(None, [search_path, child_env.get("PYTHONPATH")]))
+
+        with tempfile.TemporaryDirectory() as scratch_dir:
+            start = time.perf_counter()
+            completed = subprocess.run(
+                [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                cwd=scratch_dir, env=child_env, capture_output=True, text=True
+            )
+            metrics.total_startup_time = time.perf_counter() - start
+
+        if completed.returncode != 0:
+            raise RuntimeError(f"Importing {module} failed: {completed.stderr.strip().splitlines()[-1:]}")
+
+        top_level_total = 0.0
+        for line in completed.stderr.splitlines():
+            # "import time:  self [us] | cumulative | imported package"
+            if not line.startswith("import time:") or "imported package" in line:
+                continue
+            _, cumulative, name = line[len("import time:"):].split("|", 2)
+            seconds = int(cumulative) / 1e6
+            metrics.module_load_time[name.strip()] = seconds
+            if not name[1:].startswith(" "):
+                top_level_total += seconds
+
+        metrics.import_time = top_level_total
+        self.metrics = metrics
+        return metrics
+
     def _profile_component_initialization(self, module_path: str) -> float:
         """Profile initialization time for a specific component"""
         try:
@@ -556,12 +599,12 @@ def main():
     startup_metrics = startup_profiler.profile_startup_performance()
     startup_analysis = startup_profiler.optimize_startup_sequence()
 
-    print(".2f"
-    print(".2f"
+    print(f"⏱️ Startup time: {startup_analysis['current_startup_time']:.2f}s")
+    print(f"🎯 Startup target: {startup_analysis['startup_target']:.2f}s")
     if startup_analysis['target_met']:
         print("✅ Startup target achieved")
     else:
-        print(".2f"
+        print(f"⚠️ Estimated optimization gain: {startup_analysis['estimated_optimization_gain']:.2f}%")
 
     # Phase 2: Comprehensive Performance Profiling
     print("\n📊 PHASE 2: COMPREHENSIVE PERFORMANCE PROFILING")
@@ -614,9 +657,12 @@ def main():
         )
     }
 
-    print("
-📋 PERFORMANCE OPTIMIZATION SUMMARY:"    print(".2f"    print(".2f"    print(f"🔧 Recommendations: {len(report.optimization_recommendations)}")
-    print(".3f"    print(".3f"
+    print("\n📋 PERFORMANCE OPTIMIZATION SUMMARY:")
+    print(f"⏱️ Startup time: {startup_analysis['current_startup_time']:.2f}s")
+    print(f"🧠 Memory at startup: {startup_analysis['memory_at_startup'] / 1024 / 1024:.2f}MB")
+    print(f"🔧 Recommendations: {len(report.optimization_recommendations)}")
+    print(f"⚡ Async efficiency: {optimization_report['async_efficiency_score']:.3f}")
+    print(f"🏆 Overall performance score: {optimization_report['overall_performance_score']:.3f}")
     if optimization_report['overall_performance_score'] > 0.8:
         print("🎉 Performance optimization successful - meets enterprise standards")
     elif optimization_report['overall_performance_score'] > 0.6:
@@ -628,9 +674,8 @@ def main():
     with open('performance_optimization_report.json', 'w') as f:
         json.dump(optimization_report, f, indent=2, default=str)
 
-    print("
-📄 Detailed report saved to: performance_optimization_report.json"
-    print("⚡ Performance optimization framework established - biological consciousness systems ready for production!"
+    print("\n📄 Detailed report saved to: performance_optimization_report.json")
+    print("⚡ Performance optimization framework established - biological consciousness systems ready for production!")
 
     return optimization_report
 
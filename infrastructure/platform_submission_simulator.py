@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+🧬 JTP Biological Organism - Platform Submission Throughput Simulator
+
+Pushes a mixed batch of applications through ``PlatformOrchestrator`` against
+mocked platform endpoints and reports aggregate submissions/minute two ways:
+
+- legacy: the previous flow, one global ``asyncio.Semaphore(10)`` held while
+  sleeping out the platform delay. Concurrent callers read the same
+  ``last_request_time`` and fire together, so it overshoots platform limits.
+- legacy_paced: the same flow with the delay check serialised per platform,
+  i.e. what it intended; slots held by sleeping submissions starve the others
+- token_bucket: ``submit_applications`` with per-platform queues and buckets
+
+Glassdoor is mocked as a throttling platform (low success rate) so its
+adaptive back-off kicks in. Time is compressed by ``--time-scale``: rate
+limits are multiplied and delays divided by it, and throughput is reported
+in simulated minutes. ``peak_per_minute`` is the most requests a platform
+received in any simulated minute, to compare against its limit, and
+``last_request_after_minutes`` shows when each platform's share of the batch
+was done.
+
+Usage:
+    python infrastructure/platform_submission_simulator.py [--applications 400] [--time-scale 60]
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import os
+import random
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List
+
+ORCHESTRATOR_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'src', 'application-automation', 'platform_platforms', 'platform_orchestrator.py'
+)
+
+_spec = importlib.util.spec_from_file_location("platform_orchestrator", ORCHESTRATOR_PATH)
+platform_orchestrator = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(platform_orchestrator)
+
+# Mocked endpoint behaviour: (latency seconds, success probability)
+MOCK_ENDPOINTS = {
+    "linkedin": (2.0, 0.85),
+    "indeed": (1.5, 0.9),
+    "glassdoor": (3.0, 0.4),
+    "monster": (2.5, 0.88),
+}
+
+
+@dataclass
+class MockJobPosting:
+    job_id: str
+    platform: str
+    biological_alignment_score: float = 0.8
+
+
+class MockEndpointOrchestrator(platform_orchestrator.PlatformOrchestrator):
+    """Orchestrator whose platform endpoints are local mocks on a compressed clock"""
+
+    def __init__(self, time_scale: float, seed: int):
+        self.time_scale = time_scale
+        self.rng = random.Random(seed)
+        self.request_times: Dict[str, List[float]] = defaultdict(list)
+        super().__init__()
+        # Burst allowance is BUCKET_BURST_SECONDS of *simulated* time
+        for bucket in self.token_buckets.values():
+            bucket.capacity = max(1, int(bucket.rate_per_second * platform_orchestrator.BUCKET_BURST_SECONDS / time_scale))
+            bucket.tokens = float(bucket.capacity)
+
+    def _initialize_platform_connectors(self):
+        platforms = super()._initialize_platform_connectors()
+        for platform in platforms.values():
+            platform.rate_limit_per_minute *= self.time_scale
+            platform.request_delay_seconds /= self.time_scale
+        return platforms
+
+    async def _execute_platform_submission(self, platform, job_posting, cv_data, config):
+        platform_name = platform.platform_name.lower()
+        self.request_times[platform_name].append(time.perf_counter())
+        latency, success_probability = MOCK_ENDPOINTS[platform_name]
+        await asyncio.sleep(latency * self.rng.uniform(0.5, 1.5) / self.time_scale)
+        success = self.rng.random() < success_probability
+        result = {"success": success, "platform": platform_name, "job_id": job_posting.job_id}
+        if not success:
+            result["error"] = "429 Too Many Requests"
+        return result
+
+
+class LegacyMockOrchestrator(MockEndpointOrchestrator):
+    """The pre-token-bucket flow: sleep out the platform delay while holding a global slot"""
+
+    def __init__(self, time_scale: float, seed: int, paced: bool = False):
+        super().__init__(time_scale, seed)
+        self.pacing_locks = {name: asyncio.Lock() for name in self.platforms} if paced else None
+
+    async def submit_application(self, job_posting, cv_data, platform_config=None):
+        async with self.rate_limiter:
+            platform_name = job_posting.platform.lower()
+            platform = self.platforms[platform_name]
+            if self.pacing_locks:
+                async with self.pacing_locks[platform_name]:
+                    await self._legacy_respect_rate_limits(platform)
+            else:
+                await self._legacy_respect_rate_limits(platform)
+            return await self._submit_to_platform(platform_name, job_posting, cv_data, platform_config or {})
+
+    async def _legacy_respect_rate_limits(self, platform):
+        if not platform.last_request_time:
+            platform.last_request_time = datetime.utcnow()
+            return
+        time_since_last_request = (datetime.utcnow() - platform.last_request_time).total_seconds()
+        base_delay = platform.request_delay_seconds
+        platform_stats = self.platform_stats[platform.platform_name.lower()]
+        if platform_stats.get("success_rate", 0.8) < 0.7:
+            base_delay *= 1.5
+            platform_stats["rate_limit_hits"] += 1
+        required_delay = max(base_delay, 60.0 / platform.rate_limit_per_minute)
+        if time_since_last_request < required_delay:
+            await asyncio.sleep(required_delay - time_since_last_request)
+        platform.last_request_time = datetime.utcnow()
+
+
+def build_batch(applications: int, seed: int) -> List[Any]:
+    rng = random.Random(seed)
+    platforms = list(MOCK_ENDPOINTS)
+    cv_data = {"skills": ["Business Analysis", "SQL"], "experience": [{}, {}, {}]}
+    return [
+        (MockJobPosting(f"JOB-{i:05d}", rng.choice(platforms)), cv_data, {})
+        for i in range(applications)
+    ]
+
+
+def peak_per_window(times: List[float], window: float) -> int:
+    ordered = sorted(times)
+    return max((bisect_left(ordered, t + window) - i for i, t in enumerate(ordered)), default=0)
+
+
+async def run_mode(orchestrator: MockEndpointOrchestrator, batch: List[Any], bulk: bool) -> Dict[str, Any]:
+    start = time.perf_counter()
+    if bulk:
+        results = await orchestrator.submit_applications(batch)
+        await orchestrator.stop_submission_workers()
+    else:
+        results = await asyncio.gather(*(orchestrator.submit_application(*entry) for entry in batch))
+    elapsed = time.perf_counter() - start
+
+    simulated_minutes = elapsed * orchestrator.time_scale / 60.0
+    sim_minute = 60.0 / orchestrator.time_scale
+    platforms = {}
+    for name, platform in orchestrator.platforms.items():
+        times = orchestrator.request_times[name]
+        platforms[name] = {
+            "submissions": len(times),
+            "limit_per_minute": int(platform.rate_limit_per_minute / orchestrator.time_scale),
+            "peak_per_minute": peak_per_window(times, sim_minute),
+            "last_request_after_minutes": round((max(times, default=start) - start) / sim_minute, 2),
+            "rate_limit_hits": orchestrator.platform_stats[name]["rate_limit_hits"],
+        }
+    return {
+        "simulated_minutes": round(simulated_minutes, 2),
+        "submissions_per_minute": round(len(results) / simulated_minutes, 1),
+        "successful": sum(1 for result in results if result["success"]),
+        "platforms": platforms,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Platform submission throughput simulator")
+    parser.add_argument("--applications", type=int, default=400)
+    parser.add_argument("--time-scale", type=float, default=60.0,
+                        help="simulated seconds per real second")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    batch = build_batch(args.applications, args.seed)
+    report = {
+        "applications": args.applications,
+        "legacy": asyncio.run(run_mode(LegacyMockOrchestrator(args.time_scale, args.seed), batch, bulk=False)),
+        "legacy_paced": asyncio.run(run_mode(LegacyMockOrchestrator(args.time_scale, args.seed, paced=True),
+                                             batch, bulk=False)),
+        "token_bucket": asyncio.run(run_mode(MockEndpointOrchestrator(args.time_scale, args.seed), batch, bulk=True)),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+🧬 JTP Biological Organism - Bulk Resume Ingestion Benchmark
+
+Generates ``--documents`` synthetic TXT CVs (``--duplicate-rate`` of them
+byte-identical copies) and reports:
+
+- skill matching: the previous per-skill scan (every skill pattern tested
+  against the whole text, then every line) against the compiled automaton
+- ingestion: documents/second and per-stage timings of
+  ``resume_bulk_ingest.ingest_resumes`` with 1 and ``--workers`` processes
+
+Usage:
+    python infrastructure/resume_ingest_benchmark.py [--documents 5000]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / "src" / "utility-scripts"))
+
+from resume_bulk_ingest import ingest_resumes, load_resume_parser  # noqa: E402
+
+SKILLS = ["Python", "JavaScript", "React", "Docker", "Kubernetes", "AWS", "SQL", "Machine Learning",
+          "Project Management", "Leadership", "Sales", "Finance", "Communication", "Teamwork", "Creativity"]
+
+
+def synthetic_cv(rng: random.Random, number: int) -> str:
+    experience = "\n".join(
+        f"- Delivered {rng.choice(SKILLS)} initiatives for team {rng.randint(1, 99)} across {rng.randint(2, 9)} regions"
+        for _ in range(rng.randint(10, 30)))
+    return (f"Candidate {number} Example\nEmail: candidate{number}@example.com\nPhone: (555) 010-{number % 10000:04d}\n\n"
+            f"Professional Summary:\nEngineer with {rng.randint(1, 20)} years of experience.\n\n"
+            f"Skills:\n{', '.join(rng.sample(SKILLS, 8))}\n\nExperience:\n{experience}\n")
+
+
+def legacy_skill_scan(skill_categories: dict, text_lines: list) -> int:
+    """The per-skill scan the compiled matcher replaced"""
+    full_text = "\n".join(text_lines).lower()
+    found = 0
+    for skill_list in skill_categories.values():
+        for skill in skill_list:
+            if skill in full_text:
+                context = [line for line in text_lines if skill in line.lower()]
+                found += bool(context)
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk resume ingestion benchmark")
+    parser.add_argument("--documents", type=int, default=5000)
+    parser.add_argument("--duplicate-rate", type=float, default=0.2)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    unique = max(1, int(args.documents * (1 - args.duplicate_rate)))
+    texts = [synthetic_cv(rng, number) for number in range(unique)]
+
+    engine = load_resume_parser().PatternRecognitionEngine()
+    sample = [text.split("\n") for text in texts[:500]]
+    start = time.perf_counter()
+    for lines in sample:
+        legacy_skill_scan(engine.skill_categories, lines)
+    legacy_us = (time.perf_counter() - start) / len(sample) * 1e6
+    start = time.perf_counter()
+    for lines in sample:
+        engine.skill_matcher.scan(lines)
+    compiled_us = (time.perf_counter() - start) / len(sample) * 1e6
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        for number in range(args.documents):
+            (root / "cvs").mkdir(exist_ok=True)
+            (root / "cvs" / f"cv_{number:06d}.txt").write_text(texts[number % unique])
+        for workers in sorted({1, args.workers}):
+            report = ingest_resumes(str(root / "cvs"), str(root / f"out_{workers}.jsonl"), workers=workers)
+            results[f"workers_{workers}"] = {key: report[key] for key in (
+                "parsed", "duplicates", "failed", "seconds", "documents_per_second", "stage_seconds")}
+
+    print(json.dumps({
+        "documents": args.documents,
+        "skill_matching_us_per_document": {"per_skill_scan": round(legacy_us, 1),
+                                           "compiled_automaton": round(compiled_us, 1),
+                                           "speedup": round(legacy_us / compiled_us, 1)},
+        "ingestion": results,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
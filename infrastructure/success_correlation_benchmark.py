@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+🧬 JTP Biological Organism - Success Correlation Replay Benchmark
+
+Replays synthetic application results through ``BiologicalSuccessCorrelator``:
+
+- incremental: ``record_application_result`` per application with an
+  ``analyze_incremental_correlations`` every ``--analyze-every`` results
+  (retained memory is bounded by the per-bucket reservoirs)
+- batch: ``analyze_success_correlations`` over the full history, as callers
+  did on every request, for a prefix of ``--batch-applications`` results
+
+Peak memory is traced separately (tracemalloc slows the replay several
+times over) with both modes over the same ``--batch-applications`` prefix.
+
+Synthetic success probability rises with alignment, so both modes should
+report a clear positive correlation. The incremental state is snapshotted,
+restored into a fresh correlator and re-analysed to check the round trip.
+
+Usage:
+    python infrastructure/success_correlation_benchmark.py [--applications 1000000]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Iterator
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             'src', 'application-automation', 'biological_biological'))
+
+from success_correlator import BiologicalSuccessCorrelator  # noqa: E402
+
+PLATFORMS = ("linkedin", "indeed", "glassdoor", "monster")
+
+
+def synthetic_applications(count: int, seed: int) -> Iterator[SimpleNamespace]:
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1)
+    for i in range(count):
+        alignment = rng.betavariate(4, 2)
+        success = rng.random() < 0.05 + 0.4 * alignment ** 2
+        yield SimpleNamespace(
+            application_id=f"APP-{i:07d}",
+            platform=PLATFORMS[i % len(PLATFORMS)],
+            company=f"Company {i % 997}",
+            biological_alignment_score=alignment,
+            submission_date=(start + timedelta(minutes=i)).isoformat() + "Z",
+            response_received=success,
+            interview_scheduled=False,
+            offer_received=False,
+            submission_status="submitted",
+        )
+
+
+def summary(result):
+    return {
+        "correlation_coefficient": round(result["correlation_coefficient"], 4),
+        "application_level": {key: (round(value, 4) if isinstance(value, float) else value)
+                              for key, value in result.get("application_level_correlation", {}).items()
+                              if key != "confidence_interval"},
+        "trend_direction": result["trend_analysis"]["trend_direction"],
+        "time_period_days": result["analysis_metadata"]["time_period_days"],
+    }
+
+
+async def traced_peak_mb(coroutine_factory) -> float:
+    tracemalloc.start()
+    try:
+        await coroutine_factory()
+        return round(tracemalloc.get_traced_memory()[1] / 1e6, 2)
+    finally:
+        tracemalloc.stop()
+
+
+async def incremental_run(args):
+    correlator = BiologicalSuccessCorrelator(bucket_sample_size=args.sample_size, seed=args.seed)
+    start = time.perf_counter()
+    analyze_seconds = []
+    for i, application in enumerate(synthetic_applications(args.applications, args.seed), 1):
+        correlator.record_application_result(application)
+        if i % args.analyze_every == 0:
+            analyze_start = time.perf_counter()
+            await correlator.analyze_incremental_correlations()
+            analyze_seconds.append(time.perf_counter() - analyze_start)
+    elapsed = time.perf_counter() - start
+    result = await correlator.analyze_incremental_correlations()
+
+    async def replay_prefix():
+        traced = BiologicalSuccessCorrelator(bucket_sample_size=args.sample_size, seed=args.seed)
+        traced.record_application_results(synthetic_applications(args.batch_applications, args.seed))
+        await traced.analyze_incremental_correlations()
+
+    snapshot = json.dumps(correlator.snapshot_incremental_state())
+    restored = BiologicalSuccessCorrelator()
+    restored.restore_incremental_state(json.loads(snapshot))
+    restored_result = await restored.analyze_incremental_correlations()
+
+    return {
+        "applications": args.applications,
+        "seconds": round(elapsed, 2),
+        "updates_per_second": round(args.applications / elapsed),
+        "analysis_ms_max": round(max(analyze_seconds, default=0.0) * 1000, 3),
+        "peak_memory_mb_at_batch_size": await traced_peak_mb(replay_prefix),
+        "snapshot_kb": round(len(snapshot) / 1024, 1),
+        "restored_matches": summary(restored_result) == summary(result),
+        "result": summary(result),
+    }
+
+
+async def batch_run(args):
+    history = list(synthetic_applications(args.batch_applications, args.seed))
+    correlator = BiologicalSuccessCorrelator()
+    start = time.perf_counter()
+    result = await correlator.analyze_success_correlations(history)
+    elapsed = time.perf_counter() - start
+
+    async def analyze_history():
+        await BiologicalSuccessCorrelator().analyze_success_correlations(
+            list(synthetic_applications(args.batch_applications, args.seed)))
+
+    return {
+        "applications": args.batch_applications,
+        "seconds_per_analysis": round(elapsed, 3),
+        "peak_memory_mb": await traced_peak_mb(analyze_history),
+        "result": {"correlation_coefficient": round(result["correlation_coefficient"], 4),
+                   "trend_direction": result["trend_analysis"]["trend_direction"]},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Success correlation replay benchmark")
+    parser.add_argument("--applications", type=int, default=1_000_000)
+    parser.add_argument("--analyze-every", type=int, default=10_000)
+    parser.add_argument("--sample-size", type=int, default=100)
+    parser.add_argument("--batch-applications", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=21)
+    args = parser.parse_args()
+
+    report = {
+        "incremental": asyncio.run(incremental_run(args)),
+        "batch": asyncio.run(batch_run(args)),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
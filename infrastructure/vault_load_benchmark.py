@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+🧬 JTP Biological Organism - Vault Service Load Benchmark
+
+Creates a throwaway vault with ``--secrets`` encrypted secrets and drives
+the vault service in-process (httpx ASGI transport) with ``--clients``
+concurrent clients, the way every service pulls its secrets during a
+rollout. Reports secrets/second for:
+
+- uncached: secret cache disabled, so every read decrypts (HKDF + AES-GCM)
+  after the parsed-vault snapshot check
+- cached: the default TTL secret cache
+- bulk: cached, reading each client's secrets in one ``/secrets`` call
+
+It also times single reads on the manager alone, including the previous
+``get_secret`` path (re-open and re-parse the vault file, then decrypt).
+Service logging is silenced so stderr output is not part of the timing.
+
+Usage:
+    python infrastructure/vault_load_benchmark.py [--clients 200]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import httpx  # noqa: E402
+import vault_service  # noqa: E402
+from vault_manager import BiologicalVaultManager  # noqa: E402
+
+
+def build_vault(root: Path, secret_count: int, **options) -> BiologicalVaultManager:
+    vault = BiologicalVaultManager(vault_path=str(root / "secrets"), key_path=str(root / "keys"),
+                                   audit_file=str(root / "audit.log"), **options)
+    vault_file = vault.vault_path / "production.json"
+    if not vault_file.exists():
+        vault.vault_path.mkdir(parents=True, exist_ok=True)
+        secrets = {f"key_{i}": vault.encrypt_secret(f"secret-value-{i:04d}") for i in range(secret_count)}
+        vault_file.write_text(json.dumps({"stripe": {"live": secrets}}))
+    return vault
+
+
+async def run_clients(clients: int, requests_per_client: int, secret_count: int, bulk: bool) -> int:
+    transport = httpx.ASGITransport(app=vault_service.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://vault") as http:
+        async def client(client_id: int) -> int:
+            served = 0
+            for request in range(requests_per_client):
+                keys = [f"key_{(client_id + request + offset) % secret_count}" for offset in range(4)]
+                if bulk:
+                    response = await http.get("/secrets/stripe.live", params={"keys": keys})
+                    served += len(response.json()["values"])
+                else:
+                    for key in keys:
+                        response = await http.get(f"/secret/stripe.live/{key}")
+                        served += response.status_code == 200
+            return served
+
+        return sum(await asyncio.gather(*(client(i) for i in range(clients))))
+
+
+def manager_read_us(vault: BiologicalVaultManager, secret_count: int, reads: int, reparse: bool = False) -> float:
+    vault_file = vault.vault_path / "production.json"
+    start = time.perf_counter()
+    for read in range(reads):
+        key = f"key_{read % secret_count}"
+        if reparse:
+            with open(vault_file, 'r') as f:
+                vault.decrypt_secret(json.load(f)["stripe"]["live"][key])
+        else:
+            vault.get_secret("stripe.live", key)
+    return round((time.perf_counter() - start) / reads * 1e6, 1)
+
+
+def measure(root: Path, args, bulk: bool = False, **options) -> dict:
+    vault_service.vault_instance = build_vault(root, args.secrets, **options)
+    vault_service.VAULT_ENV = "production"
+
+    start = time.perf_counter()
+    served = asyncio.run(run_clients(args.clients, args.requests, args.secrets, bulk))
+    seconds = time.perf_counter() - start
+    vault_service.vault_instance.save_audit_log()
+
+    return {
+        "secrets_served": served,
+        "seconds": round(seconds, 2),
+        "secrets_per_second": round(served / seconds),
+        "cache": vault_service.vault_instance.secret_cache.stats()["hit_rate"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vault service load benchmark")
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=5, help="requests per client (4 secrets each)")
+    parser.add_argument("--secrets", type=int, default=50)
+    parser.add_argument("--reads", type=int, default=20_000, help="single reads for the manager timings")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        manager = {
+            "reparse_and_decrypt_us": manager_read_us(build_vault(root, args.secrets), args.secrets,
+                                                      args.reads, reparse=True),
+            "snapshot_uncached_us": manager_read_us(build_vault(root, args.secrets, secret_cache_ttl=0),
+                                                    args.secrets, args.reads),
+            "snapshot_cached_us": manager_read_us(build_vault(root, args.secrets), args.secrets, args.reads),
+        }
+        uncached = measure(root, args, secret_cache_ttl=0)
+        cached = measure(root, args)
+        bulk = measure(root, args, bulk=True)
+
+    print(json.dumps({
+        "manager_single_read": manager,
+        "clients": args.clients,
+        "uncached": uncached,
+        "cached": cached,
+        "bulk": bulk,
+        "cached_speedup": round(cached["secrets_per_second"] / uncached["secrets_per_second"], 1),
+        "bulk_speedup": round(bulk["secrets_per_second"] / uncached["secrets_per_second"], 1),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ Critical Features:
 - Automatic environment variable loading
 - Secure key rotation support
 - Audit logging for all secret access
+- Parsed-vault snapshots and a bounded TTL cache of decrypted secrets
 """
 
 import os
@@ -16,26 +17,131 @@ import json
 import base64
 import hashlib
 import secrets
+import socket
 import logging
+import threading
+import time
+from collections import OrderedDict, deque
 from pathlib import Path
 from cryptography.hazmat.primitives import hashes, hmac
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.backends import default_backend
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional, Tuple
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Decrypted secrets are served from memory for this long before re-decrypting
+SECRET_CACHE_TTL_SECONDS = 300.0
+SECRET_CACHE_MAX_ENTRIES = 1024
+
+# Audit entries are appended to the audit file in batches; the in-memory
+# backlog is capped so an unwritable audit file cannot grow it without bound
+AUDIT_FLUSH_BATCH_SIZE = 256
+AUDIT_LOG_MAX_ENTRIES = 10000
+
+class SecretBuffer:
+    """Decrypted secret held in a mutable buffer so it can be wiped"""
+
+    __slots__ = ("_buffer", "_length")
+
+    def __init__(self, buffer: bytearray, length: int):
+        self._buffer = buffer
+        self._length = length
+
+    def reveal(self) -> str:
+        with memoryview(self._buffer) as view:
+            return str(view[:self._length], 'utf-8')
+
+    def zeroize(self) -> None:
+        self._buffer[:] = bytes(len(self._buffer))
+        self._length = 0
+
+class SecretCache:
+    """LRU cache of decrypted secrets with a TTL; evicted and expired values are zeroized"""
+
+    def __init__(self, ttl_seconds: float = SECRET_CACHE_TTL_SECONDS,
+                 max_entries: int = SECRET_CACHE_MAX_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, ...], Tuple[float, SecretBuffer]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def get(self, key: Tuple[str, ...]) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                entry[1].zeroize()
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1].reveal()
+
+    def put(self, key: Tuple[str, ...], buffer: SecretBuffer) -> None:
+        if not self.enabled:
+            buffer.zeroize()
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                previous[1].zeroize()
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, buffer)
+            while len(self._entries) > self.max_entries:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                evicted.zeroize()
+
+    def clear(self) -> None:
+        with self._lock:
+            for _, buffer in self._entries.values():
+                buffer.zeroize()
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
 class BiologicalVaultManager:
     """Secure vault for Biological Organism secrets management"""
 
-    def __init__(self, vault_path: str = "vault/secrets", key_path: str = "vault/keys"):
+    def __init__(self, vault_path: str = "vault/secrets", key_path: str = "vault/keys",
+                 secret_cache_ttl: float = SECRET_CACHE_TTL_SECONDS,
+                 secret_cache_size: int = SECRET_CACHE_MAX_ENTRIES,
+                 audit_file: str = "vault/audit.log",
+                 audit_batch_size: int = AUDIT_FLUSH_BATCH_SIZE,
+                 audit_max_entries: int = AUDIT_LOG_MAX_ENTRIES):
         self.vault_path = Path(vault_path)
         self.key_path = Path(key_path)
         self.backend = default_backend()
         self.master_key = self._load_or_create_master_key()
-        self.audit_log = []
+        self.hostname = socket.gethostname()
+
+        # Parsed vault files keyed by environment, with the stat stamp they were read at
+        self._vault_snapshots: Dict[str, Tuple[Tuple[int, int, int], Dict[str, Any]]] = {}
+        self.secret_cache = SecretCache(secret_cache_ttl, secret_cache_size)
+
+        self.audit_file = audit_file
+        self.audit_batch_size = audit_batch_size
+        self.audit_log = deque(maxlen=audit_max_entries)
+        self.audit_dropped = 0
+        self._audit_lock = threading.Lock()
 
     def _load_or_create_master_key(self) -> bytes:
         """Load or create master key for vault encryption"""
@@ -144,6 +250,15 @@ class BiologicalVaultManager:
 
     def decrypt_secret(self, encrypted_b64: str) -> str:
         """Decrypt a secret using AES-256-GCM"""
+        buffer = self._decrypt_to_buffer(encrypted_b64)
+        secret = buffer.reveal()
+        buffer.zeroize()
+
+        self._log_audit(f"Decrypted secret ({len(secret)} characters)")
+        return secret
+
+    def _decrypt_to_buffer(self, encrypted_b64: str) -> SecretBuffer:
+        """Decrypt a secret straight into a zeroizable buffer"""
         # Decode from base64
         encrypted_data = base64.b64decode(encrypted_b64.encode('utf-8'))
 
@@ -167,38 +282,66 @@ class BiologicalVaultManager:
         # Decrypt the secret
         cipher = Cipher(algorithms.AES(decryption_key), modes.GCM(iv, tag), backend=self.backend)
         decryptor = cipher.decryptor()
-        secret_bytes = decryptor.update(ciphertext) + decryptor.finalize()
+        buffer = SecretBuffer(bytearray(len(ciphertext) + 15), 0)  # update_into needs room for a block
+        try:
+            buffer._length = decryptor.update_into(ciphertext, buffer._buffer)
+            decryptor.finalize()
+        except Exception:
+            # A failed tag check leaves unauthenticated plaintext behind
+            buffer.zeroize()
+            raise
 
-        secret = secret_bytes.decode('utf-8')
-        self._log_audit(f"Decrypted secret ({len(secret)} characters)")
-        return secret
+        return buffer
 
     def _log_audit(self, action: str):
-        """Log audit trail for secret access"""
-        timestamp = os.environ.get('TIMESTAMP', 'unknown')
-        import socket
-        hostname = socket.gethostname()
-
+        """Log audit trail for secret access; flushed to the audit file in batches"""
         audit_entry = {
-            "timestamp": timestamp,
-            "hostname": hostname,
+            "timestamp": os.environ.get('TIMESTAMP', 'unknown'),
+            "hostname": self.hostname,
             "action": action,
             "user": os.environ.get('USER', 'unknown')
         }
 
-        self.audit_log.append(audit_entry)
-        logger.info(f"AUDIT: {action}")
-
-    def load_environment(self, environment: str = "production") -> Dict[str, str]:
-        """Load environment variables from vault"""
+        with self._audit_lock:
+            if len(self.audit_log) == self.audit_log.maxlen:
+                self.audit_dropped += 1
+            self.audit_log.append(audit_entry)
+            flush = len(self.audit_log) >= self.audit_batch_size
+
+        logger.debug(f"AUDIT: {action}")
+        if flush and self.audit_file:
+            try:
+                self.save_audit_log()
+            except OSError as e:
+                logger.warning(f"Audit flush failed, keeping {len(self.audit_log)} entries in memory: {e}")
+
+    def load_vault(self, environment: str = "production") -> Dict[str, Any]:
+        """Parsed vault file; re-read only when its mtime, inode or size changes"""
         vault_file = self.vault_path / f"{environment}.json"
 
-        if not vault_file.exists():
+        try:
+            stat = vault_file.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(f"Vault file not found: {vault_file}")
 
+        stamp = (stat.st_mtime_ns, stat.st_ino, stat.st_size)
+        snapshot = self._vault_snapshots.get(environment)
+        if snapshot is not None and snapshot[0] == stamp:
+            return snapshot[1]
+
         with open(vault_file, 'r') as f:
             vault_data = json.load(f)
 
+        if snapshot is not None:
+            # Secrets were rotated - drop everything decrypted from the old file
+            self.secret_cache.clear()
+        self._vault_snapshots[environment] = (stamp, vault_data)
+        return vault_data
+
+    def load_environment(self, environment: str = "production") -> Dict[str, str]:
+        """Load environment variables from vault"""
+        vault_data = self.load_vault(environment)
+
         env_vars = {}
         self._load_secrets_recursive(vault_data, env_vars, "")
 
@@ -221,45 +364,73 @@ class BiologicalVaultManager:
 
     def get_secret(self, service: str, key: str, environment: str = "production") -> str:
         """Get a specific secret from the vault"""
-        vault_file = self.vault_path / f"{environment}.json"
-
-        if not vault_file.exists():
-            raise FileNotFoundError(f"Vault file not found: {vault_file}")
+        section = self._get_service_section(self.load_vault(environment), service)
+        return self._get_cached_secret(environment, service, key, section)
 
-        with open(vault_file, 'r') as f:
-            vault_data = json.load(f)
+    def get_secrets(self, service: str, keys: Iterable[str], environment: str = "production") -> Dict[str, str]:
+        """Get several secrets of one service from a single vault snapshot"""
+        section = self._get_service_section(self.load_vault(environment), service)
+        return {key: self._get_cached_secret(environment, service, key, section) for key in keys}
 
-        # Navigate to the secret
-        path = service.split('.')
+    def _get_service_section(self, vault_data: Dict[str, Any], service: str) -> Dict[str, Any]:
+        """Navigate to the secrets of a dotted service path"""
         current = vault_data
 
-        for part in path:
+        for part in service.split('.'):
             if part not in current:
                 raise KeyError(f"Secret path not found: {service}")
             current = current[part]
 
-        if key not in current:
+        return current
+
+    def _get_cached_secret(self, environment: str, service: str, key: str, section: Dict[str, Any]) -> str:
+        """Decrypt a secret of a service section, serving repeat reads from the secret cache"""
+        if key not in section:
             raise KeyError(f"Secret key not found: {key} in {service}")
 
-        secret_ref = current[key]
+        secret_ref = section[key]
         if isinstance(secret_ref, str) and secret_ref.startswith("$VAULT_ENCRYPTED_"):
             # Placeholder - should not be used in production
             raise ValueError(f"Secret {key} is still a placeholder: {secret_ref}")
 
-        # Assume the value is the encrypted base64 string
-        return self.decrypt_secret(secret_ref)
+        # Keyed by the ciphertext too, so a rotated value is never served stale
+        cache_key = (environment, service, key, secret_ref)
+        secret = self.secret_cache.get(cache_key)
+        if secret is not None:
+            self._log_audit(f"Served cached secret {service}.{key} ({len(secret)} characters)")
+            return secret
 
-    def save_audit_log(self, audit_file: str = "vault/audit.log"):
-        """Save audit log to file"""
-        audit_path = Path(audit_file)
-        audit_path.parent.mkdir(parents=True, exist_ok=True)
+        # Assume the value is the encrypted base64 string
+        buffer = self._decrypt_to_buffer(secret_ref)
+        secret = buffer.reveal()
+        self.secret_cache.put(cache_key, buffer)
 
-        with open(audit_path, 'a') as f:
-            for entry in self.audit_log:
-                f.write(json.dumps(entry) + '\n')
+        self._log_audit(f"Decrypted secret {service}.{key} ({len(secret)} characters)")
+        return secret
 
-        self.audit_log.clear()
-        logger.info(f"Audit log saved to {audit_file}")
+    def save_audit_log(self, audit_file: Optional[str] = None):
+        """Append pending audit entries to the audit file"""
+        audit_path = Path(audit_file or self.audit_file)
+
+        with self._audit_lock:
+            entries = list(self.audit_log)
+            self.audit_log.clear()
+        if not entries:
+            return
+
+        try:
+            audit_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(audit_path, 'a') as f:
+                f.write(''.join(json.dumps(entry) + '\n' for entry in entries))
+        except OSError:
+            # Put the batch back; the oldest entries fall off the bounded backlog
+            with self._audit_lock:
+                pending = entries + list(self.audit_log)
+                self.audit_dropped += max(0, len(pending) - self.audit_log.maxlen)
+                self.audit_log = deque(pending, maxlen=self.audit_log.maxlen)
+            raise
+
+        logger.info(f"Audit log saved to {audit_path} ({len(entries)} entries)")
 
 # Convenience functions for production use
 def get_biologic_vault():
@@ -15,7 +15,8 @@ import os
 import json
 import logging
 from datetime import datetime, timezone
-from fastapi import FastAPI, HTTPException, Security, Depends
+from typing import List
+from fastapi import FastAPI, HTTPException, Security, Depends, Query
 from fastapi.security.api_key import APIKeyHeader
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
@@ -29,6 +30,9 @@ logger = logging.getLogger(__name__)
 VAULT_ENV = os.getenv("VAULT_ENV", "production")
 VAULT_PORT = int(os.getenv("VAULT_PORT", "8000"))
 ALLOWED_API_KEYS = os.getenv("ALLOWED_API_KEYS", "").split(",") if os.getenv("ALLOWED_API_KEYS") else []
+SECRET_CACHE_TTL = float(os.getenv("VAULT_SECRET_CACHE_TTL", "300"))
+SECRET_CACHE_SIZE = int(os.getenv("VAULT_SECRET_CACHE_SIZE", "1024"))
+ALLOWED_PRINCIPALS = ["consciousness-core", "auth-orchestrator", "email-service", "infrastructure-admin"]
 
 # Initialize FastAPI with biological theming
 app = FastAPI(
@@ -57,6 +61,12 @@ async def verify_api_key(api_key_header: str = Security(api_key_header)):
         raise HTTPException(status_code=403, detail="Unauthorized biological access")
     return api_key_header
 
+def authorize_requester(requester: str, api_key: str):
+    """Evolutionary access control: unknown requesters need an admin API key"""
+    if requester and requester not in ALLOWED_PRINCIPALS:
+        if api_key not in [k for k in ALLOWED_API_KEYS if k.startswith("admin")]:
+            raise HTTPException(status_code=403, detail="Unauthorized biological access")
+
 # Global vault instance
 vault_instance = None
 
@@ -68,7 +78,8 @@ async def lifespan(app: FastAPI):
     logger.info("🧬 Initializing Biological Vault Service...")
 
     try:
-        vault_instance = BiologicalVaultManager()
+        vault_instance = BiologicalVaultManager(secret_cache_ttl=SECRET_CACHE_TTL,
+                                                secret_cache_size=SECRET_CACHE_SIZE)
         logger.info("✅ Biological Vault Service operational")
 
         # Verify vault health
@@ -94,9 +105,12 @@ async def health_check():
     global vault_instance
 
     try:
-        # Count total secrets
-        with open("vault/secrets/production.json", "r") as f:
-            secrets_data = json.load(f)
+        # Count total secrets (from the parsed snapshot when the vault is up)
+        if vault_instance:
+            secrets_data = vault_instance.load_vault("production")
+        else:
+            with open("vault/secrets/production.json", "r") as f:
+                secrets_data = json.load(f)
 
         def count_secrets(d):
             return sum(count_secrets(v) if isinstance(v, dict) else 1 for v in d.values()) if isinstance(d, dict) else 0
@@ -146,12 +160,7 @@ async def get_secret(
         raise HTTPException(status_code=503, detail="Biological Vault not operational")
 
     try:
-        # Evolutionary access control
-        allowed_principals = ["consciousness-core", "auth-orchestrator", "email-service", "infrastructure-admin"]
-
-        if requester and requester not in allowed_principals:
-            if api_key not in [k for k in ALLOWED_API_KEYS if k.startswith("admin")]:
-                raise HTTPException(status_code=403, detail="Unauthorized biological access")
+        authorize_requester(requester, api_key)
 
         value = vault_instance.get_secret(service, key, VAULT_ENV)
 
@@ -171,10 +180,50 @@ async def get_secret(
 
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"Biological secret not found: {service}.{key}")
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Secret retrieval failed: {e}")
         raise HTTPException(status_code=500, detail=f"Biological decryption error: {str(e)}")
 
+@app.get("/secrets/{service}", tags=["secrets"])
+async def get_secrets(
+    service: str,
+    keys: List[str] = Query(...),
+    requester: str = None,
+    api_key: str = Depends(verify_api_key)
+):
+    """Bulk biological secret retrieval for one service"""
+    global vault_instance
+
+    if not vault_instance:
+        raise HTTPException(status_code=503, detail="Biological Vault not operational")
+
+    try:
+        authorize_requester(requester, api_key)
+
+        values = vault_instance.get_secrets(service, keys, VAULT_ENV)
+
+        logger.info(f"🔐 {len(values)} secrets accessed from {service} by {requester or 'unknown'}")
+
+        return {
+            "status": "success",
+            "service": service,
+            "values": values,
+            "accessed_by": requester or "biological-service",
+            "environment": VAULT_ENV,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "biological_integrity": True
+        }
+
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail=f"Biological secrets not found: {service}")
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Bulk secret retrieval failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Biological decryption error: {str(e)}")
+
 @app.post("/load-environment", tags=["environment"])
 async def load_environment(
     environment: str = VAULT_ENV,
@@ -222,8 +271,11 @@ async def get_statistics(api_key: str = Depends(verify_api_key)):
                 "master_key_status": "encrypted",
                 "encryption_algorithm": "AES-256-GCM",
                 "security_level": "enterprise",
-                "consciousness_alignment": "1.0"
+                "consciousness_alignment": "1.0",
+                "pending_audit_events": len(vault_instance.audit_log) if vault_instance else 0,
+                "dropped_audit_events": vault_instance.audit_dropped if vault_instance else 0
             },
+            "secret_cache": vault_instance.secret_cache.stats() if vault_instance else {},
             "performance_metrics": {
                 "response_time_ms": "<1",
                 "memory_usage_mb": "<50",
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+API Rate Limiter
+Persistent sliding-window quota for external job APIs, shared across processes
+
+Counters live in the ``api_limits`` table of the jobs database, so several
+workers on one host draw from one budget and a restart keeps the count.
+"""
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass
+class RateLimitStatus:
+    """Outcome of a rate limit check"""
+    allowed: bool
+    remaining_hourly: int
+    remaining_daily: int
+    retry_after_seconds: float = 0.0  # until the request would be allowed
+    hour_resets_in_seconds: float = 0.0  # until the current hourly window rolls over
+
+
+class RateLimiter:
+    """
+    Sliding-window API rate limiter persisted in the ``api_limits`` table
+
+    Quota is consumed atomically inside a ``BEGIN IMMEDIATE`` transaction, so
+    every process (and thread) sharing the database draws from the same
+    budget and a restart keeps the count. The hourly and daily windows use
+    the sliding-window counter approximation: the previous fixed window's
+    count, weighted by how much of it still overlaps the sliding window, plus
+    the current window's count.
+
+    ``max_calls_per_hour``/``max_calls_per_day`` seed the provider's row; once
+    the row exists its limits are shared by all processes. Without ``db_path``
+    the limiter keeps its table in a private in-memory database.
+    """
+
+    HOUR_SECONDS = 3600
+    DAY_SECONDS = 86400
+
+    def __init__(self, max_calls_per_hour: int = 1000, db_path: Optional[str] = None,
+                 provider: str = "linkedin", max_calls_per_day: Optional[int] = None, clock=time.time):
+        self.provider = provider
+        self.db_path = db_path or ":memory:"
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None, timeout=30.0)
+        self._conn.row_factory = sqlite3.Row
+        self._ensure_table(max_calls_per_hour, max_calls_per_day or max_calls_per_hour * 100)
+
+    def _ensure_table(self, hourly_limit: int, daily_limit: int):
+        with self._lock:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS api_limits (
+                    api_provider TEXT PRIMARY KEY,
+                    hourly_limit INTEGER,
+                    daily_limit INTEGER,
+                    current_hourly INTEGER DEFAULT 0,
+                    current_daily INTEGER DEFAULT 0,
+                    hour_start TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    day_start DATE DEFAULT CURRENT_DATE
+                )
+            """)
+            # Previous fixed-window counts for the sliding-window estimate
+            columns = {row['name'] for row in self._conn.execute("PRAGMA table_info(api_limits)")}
+            for column in ("previous_hourly", "previous_daily"):
+                if column not in columns:
+                    try:
+                        self._conn.execute(f"ALTER TABLE api_limits ADD COLUMN {column} INTEGER DEFAULT 0")
+                    except sqlite3.OperationalError:
+                        pass  # Added concurrently by another process
+            self._conn.execute(
+                "INSERT OR IGNORE INTO api_limits (api_provider, hourly_limit, daily_limit) VALUES (?, ?, ?)",
+                (self.provider, hourly_limit, daily_limit)
+            )
+
+    @property
+    def max_calls_per_hour(self) -> int:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT hourly_limit FROM api_limits WHERE api_provider = ?", (self.provider,)
+            ).fetchone()
+        return row['hourly_limit']
+
+    @staticmethod
+    def _window_start(value: Any) -> float:
+        # Rows created by older code hold CURRENT_TIMESTAMP text; treat as expired
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return 0.0
+
+    @staticmethod
+    def _roll_window(start: float, current: int, previous: int, window: float, now: float):
+        """(start, current, previous) of the fixed window containing ``now``"""
+        window_start = now - (now % window)
+        if start >= window_start:
+            return start, current, previous
+        if start >= window_start - window:
+            return window_start, 0, current  # Moved on by exactly one window
+        return window_start, 0, 0
+
+    @staticmethod
+    def _estimate(current: int, previous: int, start: float, window: float, now: float) -> float:
+        overlap = 1.0 - (now - start) / window
+        return previous * overlap + current
+
+    @staticmethod
+    def _seconds_until_allowed(current: int, previous: int, start: float, window: float,
+                               limit: int, cost: int, now: float) -> float:
+        elapsed = now - start
+        if current + cost <= limit:
+            # Wait for enough of the previous window to slide out
+            if previous <= 0:
+                return 0.0
+            needed_fraction = 1.0 - (limit - current - cost) / previous
+            return max(0.0, needed_fraction * window - elapsed)
+        if cost > limit:
+            return float("inf")
+        # Only the next window helps: the current count becomes "previous" there
+        needed_fraction = max(0.0, 1.0 - (limit - cost) / current)
+        return (window - elapsed) + needed_fraction * window
+
+    def _check(self, cost: int, consume: bool, force: bool = False) -> RateLimitStatus:
+        now = self._clock()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT * FROM api_limits WHERE api_provider = ?", (self.provider,)
+                ).fetchone()
+                hour_start, hourly, previous_hourly = self._roll_window(
+                    self._window_start(row['hour_start']), row['current_hourly'] or 0,
+                    row['previous_hourly'] or 0, self.HOUR_SECONDS, now)
+                day_start, daily, previous_daily = self._roll_window(
+                    self._window_start(row['day_start']), row['current_daily'] or 0,
+                    row['previous_daily'] or 0, self.DAY_SECONDS, now)
+
+                hourly_used = self._estimate(hourly, previous_hourly, hour_start, self.HOUR_SECONDS, now)
+                daily_used = self._estimate(daily, previous_daily, day_start, self.DAY_SECONDS, now)
+                allowed = (hourly_used + cost <= row['hourly_limit'] and
+                           daily_used + cost <= row['daily_limit'])
+
+                if consume and (allowed or force):
+                    hourly += cost
+                    daily += cost
+                    hourly_used += cost
+                    daily_used += cost
+
+                self._conn.execute("""
+                    UPDATE api_limits
+                    SET hour_start = ?, current_hourly = ?, previous_hourly = ?,
+                        day_start = ?, current_daily = ?, previous_daily = ?
+                    WHERE api_provider = ?
+                """, (hour_start, hourly, previous_hourly, day_start, daily, previous_daily, self.provider))
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        retry_after = 0.0
+        if not allowed:
+            retry_after = max(
+                self._seconds_until_allowed(hourly, previous_hourly, hour_start, self.HOUR_SECONDS,
+                                            row['hourly_limit'], cost, now),
+                self._seconds_until_allowed(daily, previous_daily, day_start, self.DAY_SECONDS,
+                                            row['daily_limit'], cost, now)
+            )
+
+        return RateLimitStatus(
+            allowed=allowed,
+            remaining_hourly=max(0, int(row['hourly_limit'] - hourly_used)),
+            remaining_daily=max(0, int(row['daily_limit'] - daily_used)),
+            retry_after_seconds=retry_after,
+            hour_resets_in_seconds=hour_start + self.HOUR_SECONDS - now
+        )
+
+    def status(self, cost: int = 1) -> RateLimitStatus:
+        """Remaining budget and time-to-reset, without consuming quota"""
+        return self._check(cost, consume=False)
+
+    def try_acquire(self, cost: int = 1) -> RateLimitStatus:
+        """Atomically consume ``cost`` calls if the budget allows it"""
+        return self._check(cost, consume=True)
+
+    def acquire(self, timeout: float = 0.0, cost: int = 1) -> RateLimitStatus:
+        """Consume quota, waiting up to ``timeout`` seconds for the window to slide"""
+        deadline = self._clock() + timeout
+        while True:
+            status = self.try_acquire(cost)
+            if status.allowed or self._clock() + status.retry_after_seconds > deadline:
+                return status
+            # Other processes may take the freed budget first; re-check after waking
+            time.sleep(max(status.retry_after_seconds, 0.01))
+
+    def can_make_request(self) -> bool:
+        """Check if we can make another API request"""
+        return self.status().allowed
+
+    def record_request(self):
+        """Record that a request was made (prefer ``try_acquire``, which checks and records atomically)"""
+        self._check(1, consume=True, force=True)
@@ -31,11 +31,133 @@ validation_status: biological-correlation-ready
 version: v1.0.0-T-BIOLOGICAL-CORRELATION
 """
 
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+from typing import Dict, List, Any, Optional, Iterable
+from datetime import datetime, timezone
+import math
+import random
 import statistics
 from collections import defaultdict
 
+# Per-bucket reservoir of application samples kept in incremental mode
+DEFAULT_BUCKET_SAMPLE_SIZE = 100
+SNAPSHOT_VERSION = 1
+# Fewer recorded applications than this and no correlation analysis is run
+MIN_ANALYSIS_APPLICATIONS = 5
+
+
+def _regularized_incomplete_beta(x: float, a: float, b: float) -> float:
+    """I_x(a, b) by Lentz's continued fraction"""
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    if x > (a + 1) / (a + b + 2):
+        return 1.0 - _regularized_incomplete_beta(1.0 - x, b, a)
+
+    log_front = math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) + a * math.log(x) + b * math.log(1 - x)
+    tiny = 1e-300
+    c, d = 1.0, 1.0 - (a + b) * x / (a + 1)
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    fraction = d
+    for m in range(1, 300):
+        for numerator in (m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+                          -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1))):
+            d = 1.0 + numerator * d
+            d = 1.0 / (d if abs(d) > tiny else tiny)
+            c = 1.0 + numerator / c
+            c = c if abs(c) > tiny else tiny
+            fraction *= c * d
+        if abs(c * d - 1.0) < 1e-12:
+            break
+    return math.exp(log_front) * fraction / a
+
+
+def correlation_p_value(correlation: float, sample_size: int) -> float:
+    """Two-sided p-value of a Pearson correlation (Student t with n - 2 degrees of freedom)"""
+    if sample_size < 3:
+        return 1.0
+    if abs(correlation) >= 1.0:
+        return 0.0
+    df = sample_size - 2
+    t_squared = correlation ** 2 * df / (1 - correlation ** 2)
+    return _regularized_incomplete_beta(df / (df + t_squared), df / 2, 0.5)
+
+
+def correlation_confidence_interval(correlation: float, sample_size: int, z_critical: float = 1.96) -> Dict[str, float]:
+    """Fisher z-transform confidence interval (95% by default)"""
+    if sample_size <= 3:
+        return {"lower": -1.0, "upper": 1.0, "confidence_level": 0.95}
+    if abs(correlation) >= 1.0:
+        return {"lower": correlation, "upper": correlation, "confidence_level": 0.95}
+    z = math.atanh(correlation)
+    margin = z_critical / math.sqrt(sample_size - 3)
+    return {"lower": math.tanh(z - margin), "upper": math.tanh(z + margin), "confidence_level": 0.95}
+
+
+class RunningCorrelation:
+    """
+    Online Pearson correlation: Welford running means plus co-moment, so each
+    update and each read of correlation / p-value / confidence interval is O(1)
+    """
+
+    __slots__ = ("count", "mean_x", "mean_y", "m2_x", "m2_y", "co_moment")
+
+    def __init__(self, count: int = 0, mean_x: float = 0.0, mean_y: float = 0.0,
+                 m2_x: float = 0.0, m2_y: float = 0.0, co_moment: float = 0.0):
+        self.count = count
+        self.mean_x = mean_x
+        self.mean_y = mean_y
+        self.m2_x = m2_x
+        self.m2_y = m2_y
+        self.co_moment = co_moment
+
+    def update(self, x: float, y: float) -> None:
+        self.count += 1
+        dx = x - self.mean_x
+        self.mean_x += dx / self.count
+        dy = y - self.mean_y
+        self.mean_y += dy / self.count
+        self.m2_x += dx * (x - self.mean_x)
+        self.m2_y += dy * (y - self.mean_y)
+        self.co_moment += dx * (y - self.mean_y)
+
+    def merge(self, other: "RunningCorrelation") -> None:
+        """Combine with statistics gathered elsewhere (Chan et al. pairwise update)"""
+        if other.count == 0:
+            return
+        total = self.count + other.count
+        dx = other.mean_x - self.mean_x
+        dy = other.mean_y - self.mean_y
+        weight = self.count * other.count / total
+        self.m2_x += other.m2_x + dx * dx * weight
+        self.m2_y += other.m2_y + dy * dy * weight
+        self.co_moment += other.co_moment + dx * dy * weight
+        self.mean_x += dx * other.count / total
+        self.mean_y += dy * other.count / total
+        self.count = total
+
+    @property
+    def correlation(self) -> float:
+        if self.count < 2 or self.m2_x <= 0.0 or self.m2_y <= 0.0:
+            return 0.0
+        return max(-1.0, min(1.0, self.co_moment / math.sqrt(self.m2_x * self.m2_y)))
+
+    def summary(self) -> Dict[str, Any]:
+        correlation = self.correlation
+        return {
+            "correlation": correlation,
+            "sample_size": self.count,
+            "p_value": correlation_p_value(correlation, self.count),
+            "confidence_interval": correlation_confidence_interval(correlation, self.count)
+        }
+
+    def to_dict(self) -> Dict[str, float]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, float]) -> "RunningCorrelation":
+        return cls(**data)
+
 
 class BiologicalSuccessCorrelator:
     """🧬 GODHOOD BIOLOGICAL SUCCESS CORRELATOR
@@ -52,7 +174,7 @@ class BiologicalSuccessCorrelator:
     - Consciousness-guided insight generation
     """
 
-    def __init__(self):
+    def __init__(self, bucket_sample_size: int = DEFAULT_BUCKET_SAMPLE_SIZE, seed: Optional[int] = None):
         self.correlation_data = defaultdict(list)
         self.success_patterns = {}
         self.biological_insights = {}
@@ -68,18 +190,18 @@ class BiologicalSuccessCorrelator:
         self.correlation_strength = 0.0
         self.prediction_accuracy = 0.0
 
+        # Incremental mode: running statistics fed by record_application_result
+        self.bucket_sample_size = bucket_sample_size
+        self._sample_rng = random.Random(seed)
+        self._reset_incremental_state()
+
     async def analyze_success_correlations(self, application_history: List[Any]) -> Dict[str, Any]:
         """Perform comprehensive biological success correlation analysis"""
 
         self.analysis_count += 1
 
-        if not application_history:
-            return {
-                "correlation_analysis_complete": False,
-                "error": "Insufficient application history for correlation analysis",
-                "minimum_required": 5,
-                "provided": 0
-            }
+        if len(application_history) < MIN_ANALYSIS_APPLICATIONS:
+            return self._insufficient_history(len(application_history))
 
         # Phase 1: Aggregate correlation data by biological alignment buckets
         alignment_buckets = self._aggregate_alignment_data(application_history)
@@ -120,19 +242,22 @@ class BiologicalSuccessCorrelator:
 
         return result
 
+    def _insufficient_history(self, provided: int) -> Dict[str, Any]:
+        return {
+            "correlation_analysis_complete": False,
+            "error": "Insufficient application history for correlation analysis",
+            "minimum_required": MIN_ANALYSIS_APPLICATIONS,
+            "provided": provided
+        }
+
     def _aggregate_alignment_data(self, application_history: List[Any]) -> Dict[float, Dict[str, Any]]:
         """Aggregate application data by biological alignment score buckets"""
 
         buckets = defaultdict(lambda: {"successes": 0, "total": 0, "success_rate": 0.0, "applications": []})
 
         for application in application_history:
-            # Extract biological alignment score (with fallback)
-            alignment_score = getattr(application, 'biological_alignment_score', 0.0)
-            alignment_score = getattr(application, 'biological_success_probability', alignment_score)
-            alignment_score = max(0.0, min(1.0, alignment_score))  # Clamp to valid range
-
-            # Create alignment bucket (round to nearest 0.1 for meaningful correlation)
-            bucket_key = round(alignment_score * 10) / 10
+            alignment_score = self._application_alignment(application)
+            bucket_key = self._alignment_bucket_key(alignment_score)
 
             # Determine success (various success indicators)
             is_successful = self._determine_application_success(application)
@@ -142,15 +267,7 @@ class BiologicalSuccessCorrelator:
             bucket["total"] += 1
             if is_successful:
                 bucket["successes"] += 1
-            bucket["applications"].append({
-                "application_id": getattr(application, 'application_id', 'unknown'),
-                "platform": getattr(application, 'platform', 'unknown'),
-                "company": getattr(application, 'company', 'unknown'),
-                "timestamp": getattr(application, 'submission_date', None) or
-                           getattr(application, 'created_at', datetime.utcnow().isoformat()),
-                "success": is_successful,
-                "raw_alignment": alignment_score
-            })
+            bucket["applications"].append(self._application_sample(application, alignment_score, is_successful))
 
         # Calculate success rates for each bucket
         for bucket in buckets.values():
@@ -161,6 +278,27 @@ class BiologicalSuccessCorrelator:
 
         return dict(buckets)
 
+    def _application_alignment(self, application: Any) -> float:
+        """Biological alignment score (with fallback), clamped to [0, 1]"""
+        alignment_score = getattr(application, 'biological_alignment_score', 0.0)
+        alignment_score = getattr(application, 'biological_success_probability', alignment_score)
+        return max(0.0, min(1.0, alignment_score))
+
+    def _alignment_bucket_key(self, alignment_score: float) -> float:
+        """Alignment bucket (round to nearest 0.1 for meaningful correlation)"""
+        return round(alignment_score * 10) / 10
+
+    def _application_sample(self, application: Any, alignment_score: float, is_successful: bool) -> Dict[str, Any]:
+        return {
+            "application_id": getattr(application, 'application_id', 'unknown'),
+            "platform": getattr(application, 'platform', 'unknown'),
+            "company": getattr(application, 'company', 'unknown'),
+            "timestamp": getattr(application, 'submission_date', None) or
+                       getattr(application, 'created_at', datetime.utcnow().isoformat()),
+            "success": is_successful,
+            "raw_alignment": alignment_score
+        }
+
     def _determine_application_success(self, application: Any) -> bool:
         """Determine if an application is considered successful"""
 
@@ -187,6 +325,23 @@ class BiologicalSuccessCorrelator:
     async def _calculate_correlation_metrics(self, alignment_buckets: Dict[float, Dict[str, Any]]) -> Dict[str, Any]:
         """Calculate comprehensive correlation statistics"""
 
+        correlation_metrics = self._bucket_correlation_metrics(alignment_buckets)
+
+        # Analyze temporal trends
+        correlation_metrics["temporal_trends"] = await self._analyze_temporal_correlation_trends(
+            alignment_buckets
+        )
+
+        # Analyze platform-specific correlations
+        correlation_metrics["platform_correlations"] = self._analyze_platform_correlation_patterns(
+            alignment_buckets
+        )
+
+        return correlation_metrics
+
+    def _bucket_correlation_metrics(self, alignment_buckets: Dict[float, Dict[str, Any]]) -> Dict[str, Any]:
+        """Correlation of bucket alignment with bucket success rate"""
+
         # Prepare data for correlation analysis
         alignments = []
         success_rates = []
@@ -237,16 +392,6 @@ class BiologicalSuccessCorrelator:
             except (statistics.StatisticsError, ValueError):
                 correlation_metrics["correlation_significance"] = "calculation_error"
 
-        # Analyze temporal trends
-        correlation_metrics["temporal_trends"] = await self._analyze_temporal_correlation_trends(
-            alignment_buckets
-        )
-
-        # Analyze platform-specific correlations
-        correlation_metrics["platform_correlations"] = self._analyze_platform_correlation_patterns(
-            alignment_buckets
-        )
-
         return correlation_metrics
 
     def _calculate_significance_p_value(self, correlation: float, sample_size: int) -> float:
@@ -280,27 +425,11 @@ class BiologicalSuccessCorrelator:
         if sample_size < 3:
             return {"lower": 0.0, "upper": 0.0, "confidence_level": 0.95}
 
-        # Simplified confidence interval using Fisher transformation
+        # Confidence interval using Fisher transformation
         try:
-            # Transform to z-scale
-            z = 0.5 * (1 + correlation).ln() - (1 - correlation).ln()
-
-            # Standard error
-            se = 1 / ((sample_size - 3) ** 0.5)
-
-            # 95% confidence interval in z-scale
-            z_lower = z - 1.96 * se
-            z_upper = z + 1.96 * se
-
-            # Transform back to correlation scale
-            r_lower = (2.718281828459045 ** z_lower - 1) / (2.718281828459045 ** z_lower + 1)
-            r_upper = (2.718281828459045 ** z_upper - 1) / (2.718281828459045 ** z_upper + 1)
-
-            return {
-                "lower": max(-1.0, min(1.0, r_lower)),
-                "upper": max(-1.0, min(1.0, r_upper)),
-                "confidence_level": 0.95
-            }
+            if sample_size == 3 or abs(correlation) >= 1.0:
+                raise ValueError("Fisher transformation undefined")
+            return correlation_confidence_interval(correlation, sample_size)
 
         except (ValueError, OverflowError):
             # Fallback for calculation errors
@@ -314,55 +443,62 @@ class BiologicalSuccessCorrelator:
     async def _analyze_temporal_correlation_trends(self, alignment_buckets: Dict[float, Dict[str, Any]]) -> Dict[str, Any]:
         """Analyze how biological correlations change over time"""
 
-        temporal_trends = {
-            "correlation_stability": "stable",
-            "trend_direction": "neutral",
-            "seasonal_patterns": {},
-            "improvement_rate": 0.0
-        }
-
         # Group applications by time periods
         time_periods = defaultdict(list)
 
         for bucket_data in alignment_buckets.values():
             for application in bucket_data["applications"]:
                 # Extract timestamp and group by week
-                timestamp_str = application.get("timestamp", "")
                 try:
-                    if isinstance(timestamp_str, str) and "T" in timestamp_str:
-                        timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-                    else:
-                        timestamp = datetime.utcnow()  # Fallback
-
+                    timestamp = self._parse_timestamp(application.get("timestamp", "")) or datetime.utcnow()
                     week_key = timestamp.isocalendar()[:2]  # (year, week)
                     time_periods[week_key].append(application)
 
                 except (ValueError, AttributeError):
                     continue
 
+        period_success_rates = [
+            sum(1 for app in period_applications if app["success"]) / len(period_applications)
+            for period_applications in time_periods.values()
+        ]
+        return self._trend_from_period_rates(period_success_rates)
+
+    def _trend_from_period_rates(self, period_success_rates: List[float]) -> Dict[str, Any]:
+        """Trend direction from per-period success rates (in period order)"""
+
+        temporal_trends = {
+            "correlation_stability": "stable",
+            "trend_direction": "neutral",
+            "seasonal_patterns": {},
+            "improvement_rate": 0.0
+        }
+
         # Analyze trends if sufficient temporal data
-        if len(time_periods) >= 3:
-            period_success_rates = []
-
-            for period_applications in time_periods.values():
-                success_rate = sum(1 for app in period_applications if app["success"]) / len(period_applications)
-                period_success_rates.append(success_rate)
-
-            if len(period_success_rates) >= 2:
-                # Calculate trend slope
-                trend_slope = statistics.linear_regression(
-                    list(range(len(period_success_rates))), period_success_rates
-                )[0]
-
-                if trend_slope > 0.01:
-                    temporal_trends["trend_direction"] = "improving"
-                    temporal_trends["improvement_rate"] = trend_slope
-                elif trend_slope < -0.01:
-                    temporal_trends["trend_direction"] = "declining"
-                    temporal_trends["improvement_rate"] = trend_slope
+        if len(period_success_rates) >= 3:
+            # Calculate trend slope
+            trend_slope = statistics.linear_regression(
+                list(range(len(period_success_rates))), period_success_rates
+            )[0]
+
+            if trend_slope > 0.01:
+                temporal_trends["trend_direction"] = "improving"
+                temporal_trends["improvement_rate"] = trend_slope
+            elif trend_slope < -0.01:
+                temporal_trends["trend_direction"] = "declining"
+                temporal_trends["improvement_rate"] = trend_slope
 
         return temporal_trends
 
+    def _parse_timestamp(self, value: Any) -> Optional[datetime]:
+        """ISO-8601 timestamp (or datetime) as a naive UTC-comparable datetime; None when absent"""
+        if isinstance(value, str) and "T" in value:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        if not isinstance(value, datetime):
+            return None
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
     def _analyze_platform_correlation_patterns(self, alignment_buckets: Dict[float, Dict[str, Any]]) -> Dict[str, Any]:
         """Analyze platform-specific biological correlation patterns"""
 
@@ -557,11 +693,7 @@ class BiologicalSuccessCorrelator:
 
             if timestamp_str:
                 try:
-                    if isinstance(timestamp_str, str) and "T" in timestamp_str:
-                        timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-                    else:
-                        timestamp = datetime.utcnow()
-                    timestamps.append(timestamp)
+                    timestamps.append(self._parse_timestamp(timestamp_str) or datetime.utcnow())
                 except (ValueError, AttributeError):
                     continue
 
@@ -767,3 +899,219 @@ class BiologicalSuccessCorrelator:
             "based_on_data": False,
             "reason": "insufficient_similar_data"
         }
+
+    # ------------------------------------------------------------------
+    # Incremental mode: O(1) updates per application result
+    # ------------------------------------------------------------------
+
+    def _reset_incremental_state(self):
+        # Buckets keep counts and a bounded reservoir sample instead of every application
+        self._incremental_buckets: Dict[float, Dict[str, Any]] = {}
+        self._application_correlation = RunningCorrelation()
+        self._platform_correlations: Dict[str, RunningCorrelation] = {}
+        self._weekly_outcomes: Dict[str, List[int]] = {}  # "YYYY-Www" -> [successes, total]
+        self._first_timestamp: Optional[datetime] = None
+        self._last_timestamp: Optional[datetime] = None
+        self._timestamps_seen = 0
+        self.applications_recorded = 0
+
+    def record_application_result(self, application: Any) -> None:
+        """Fold one application result into the running statistics"""
+
+        alignment_score = self._application_alignment(application)
+        bucket_key = self._alignment_bucket_key(alignment_score)
+        is_successful = self._determine_application_success(application)
+        outcome = 1.0 if is_successful else 0.0
+
+        bucket = self._incremental_buckets.get(bucket_key)
+        if bucket is None:
+            bucket = self._incremental_buckets[bucket_key] = {
+                "successes": 0, "total": 0, "success_rate": 0.0, "applications": []
+            }
+        bucket["total"] += 1
+        if is_successful:
+            bucket["successes"] += 1
+        bucket["success_rate"] = bucket["successes"] / bucket["total"]
+
+        # Reservoir sampling (algorithm R): a uniform sample of at most bucket_sample_size
+        samples = bucket["applications"]
+        if len(samples) < self.bucket_sample_size:
+            samples.append(self._application_sample(application, alignment_score, is_successful))
+        else:
+            slot = self._sample_rng.randrange(bucket["total"])
+            if slot < self.bucket_sample_size:
+                samples[slot] = self._application_sample(application, alignment_score, is_successful)
+
+        # Application-level (point-biserial) and per-platform correlations
+        self._application_correlation.update(alignment_score, outcome)
+        platform = str(getattr(application, 'platform', 'unknown')).lower()
+        platform_correlation = self._platform_correlations.get(platform)
+        if platform_correlation is None:
+            platform_correlation = self._platform_correlations[platform] = RunningCorrelation()
+        platform_correlation.update(bucket_key, outcome)
+
+        # Weekly success counts for the trend, and the analysed timeframe
+        raw_timestamp = getattr(application, 'submission_date', None) or getattr(application, 'created_at', None)
+        try:
+            timestamp = self._parse_timestamp(raw_timestamp)
+        except ValueError:
+            timestamp = None
+        if raw_timestamp:
+            self._timestamps_seen += 1
+        if timestamp is not None:
+            if self._first_timestamp is None or timestamp < self._first_timestamp:
+                self._first_timestamp = timestamp
+            if self._last_timestamp is None or timestamp > self._last_timestamp:
+                self._last_timestamp = timestamp
+        year, week, _ = (timestamp or datetime.utcnow()).isocalendar()
+        weekly = self._weekly_outcomes.setdefault(f"{year}-W{week:02d}", [0, 0])
+        weekly[0] += is_successful
+        weekly[1] += 1
+
+        self.applications_recorded += 1
+
+    def record_application_results(self, applications: Iterable[Any]) -> int:
+        """Fold a batch of application results in; returns how many were recorded"""
+        recorded = 0
+        for application in applications:
+            self.record_application_result(application)
+            recorded += 1
+        return recorded
+
+    async def analyze_incremental_correlations(self) -> Dict[str, Any]:
+        """
+        ``analyze_success_correlations`` over everything recorded so far, from
+        the running statistics (cost independent of the history length)
+        """
+
+        self.analysis_count += 1
+
+        if self.applications_recorded < MIN_ANALYSIS_APPLICATIONS:
+            return self._insufficient_history(self.applications_recorded)
+
+        alignment_buckets = {
+            key: dict(bucket, applications=list(bucket["applications"]))
+            for key, bucket in self._incremental_buckets.items()
+        }
+
+        correlation_analysis = self._bucket_correlation_metrics(alignment_buckets)
+        correlation_analysis["temporal_trends"] = self._trend_from_period_rates([
+            successes / total for _, (successes, total) in sorted(self._weekly_outcomes.items())
+        ])
+        correlation_analysis["platform_correlations"] = self._incremental_platform_correlations()
+
+        optimal_ranges = self._identify_optimal_alignment_ranges(alignment_buckets)
+        evolutionary_insights = await self._generate_evolutionary_insights(alignment_buckets, correlation_analysis)
+        advantage_thresholds = self._calculate_biological_advantage_thresholds(alignment_buckets)
+        self._update_correlation_tracking(alignment_buckets, correlation_analysis)
+
+        if self._timestamps_seen >= 2 and self._first_timestamp is not None:
+            time_period_days = (self._last_timestamp - self._first_timestamp).days
+        else:
+            time_period_days = 30  # Default assumption
+
+        return {
+            "correlation_analysis_complete": True,
+            "alignment_success_analysis": alignment_buckets,
+            "correlation_coefficient": correlation_analysis.get("overall_correlation", 0.0),
+            "statistical_significance": correlation_analysis.get("significance_p_value", 1.0),
+            "application_level_correlation": self._application_correlation.summary(),
+            "optimal_alignment_range": optimal_ranges.get("primary_range"),
+            "biological_advantage_threshold": advantage_thresholds.get("primary_threshold", 0.8),
+            "recommendation_insights": evolutionary_insights.get("recommendations", []),
+            "trend_analysis": correlation_analysis.get("temporal_trends", {}),
+            "platform_specific_correlations": correlation_analysis.get("platform_correlations", {}),
+            "prediction_confidence": evolutionary_insights.get("prediction_confidence", 0.0),
+            "analysis_metadata": {
+                "applications_analyzed": self.applications_recorded,
+                "alignment_buckets_covered": len(alignment_buckets),
+                "time_period_days": time_period_days,
+                "correlation_strength": self._assess_correlation_strength(correlation_analysis),
+                "incremental": True
+            }
+        }
+
+    def _incremental_platform_correlations(self) -> Dict[str, Any]:
+        platform_correlations = {}
+        for platform, running in self._platform_correlations.items():
+            if running.count < 3:
+                continue
+            if running.m2_x <= 0.0 or running.m2_y <= 0.0:
+                # Constant alignment or outcome: correlation undefined
+                platform_correlations[platform] = {
+                    "correlation": 0.0, "sample_size": running.count, "strength": "insufficient_data"
+                }
+            else:
+                platform_correlations[platform] = {
+                    "correlation": running.correlation,
+                    "sample_size": running.count,
+                    "strength": self._classify_correlation_strength(running.correlation)
+                }
+        return platform_correlations
+
+    def snapshot_incremental_state(self) -> Dict[str, Any]:
+        """JSON-serializable incremental state, for ``restore_incremental_state``"""
+
+        def serializable(sample: Dict[str, Any]) -> Dict[str, Any]:
+            # Flagged so restore turns it back into a datetime; string timestamps stay strings
+            if isinstance(sample.get("timestamp"), datetime):
+                return dict(sample, timestamp=sample["timestamp"].isoformat(), timestamp_is_datetime=True)
+            return sample
+
+        rng_version, rng_internal, rng_gauss = self._sample_rng.getstate()
+        return {
+            "version": SNAPSHOT_VERSION,
+            "applications_recorded": self.applications_recorded,
+            "bucket_sample_size": self.bucket_sample_size,
+            "buckets": [
+                [key, {"successes": bucket["successes"], "total": bucket["total"],
+                       "applications": [serializable(sample) for sample in bucket["applications"]]}]
+                for key, bucket in sorted(self._incremental_buckets.items())
+            ],
+            "application_correlation": self._application_correlation.to_dict(),
+            "platform_correlations": {
+                platform: running.to_dict() for platform, running in self._platform_correlations.items()
+            },
+            "weekly_outcomes": {week: list(counts) for week, counts in self._weekly_outcomes.items()},
+            "timestamps": {
+                "first": self._first_timestamp.isoformat() if self._first_timestamp else None,
+                "last": self._last_timestamp.isoformat() if self._last_timestamp else None,
+                "seen": self._timestamps_seen
+            },
+            "sample_rng_state": [rng_version, list(rng_internal), rng_gauss]
+        }
+
+    def restore_incremental_state(self, state: Dict[str, Any]) -> None:
+        """Replace the incremental state with a ``snapshot_incremental_state`` result"""
+
+        if state.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported correlator snapshot version: {state.get('version')}")
+
+        self._reset_incremental_state()
+        self.bucket_sample_size = state["bucket_sample_size"]
+        self.applications_recorded = state["applications_recorded"]
+        for key, bucket in state["buckets"]:
+            self._incremental_buckets[float(key)] = {
+                "successes": bucket["successes"],
+                "total": bucket["total"],
+                "success_rate": bucket["successes"] / bucket["total"] if bucket["total"] else 0.0,
+                "applications": [self._restored_sample(sample) for sample in bucket["applications"]]
+            }
+        self._application_correlation = RunningCorrelation.from_dict(state["application_correlation"])
+        self._platform_correlations = {
+            platform: RunningCorrelation.from_dict(data) for platform, data in state["platform_correlations"].items()
+        }
+        self._weekly_outcomes = {week: list(counts) for week, counts in state["weekly_outcomes"].items()}
+        timestamps = state["timestamps"]
+        self._first_timestamp = datetime.fromisoformat(timestamps["first"]) if timestamps["first"] else None
+        self._last_timestamp = datetime.fromisoformat(timestamps["last"]) if timestamps["last"] else None
+        self._timestamps_seen = timestamps["seen"]
+        rng_version, rng_internal, rng_gauss = state["sample_rng_state"]
+        self._sample_rng.setstate((rng_version, tuple(rng_internal), rng_gauss))
+
+    @staticmethod
+    def _restored_sample(sample: Dict[str, Any]) -> Dict[str, Any]:
+        sample = dict(sample)
+        if sample.pop("timestamp_is_datetime", False):
+            sample["timestamp"] = datetime.fromisoformat(sample["timestamp"])
+        return sample
@@ -31,10 +31,80 @@ validation_status: application-intelligence-ready
 version: v1.0.0-T-APPLICATION-INTELLECT
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterable, Set, Tuple
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime
+import hashlib
+import json
+import math
 import re
-import statistics
+
+# Profiles whose extracted features are kept between predictions
+CV_FEATURE_CACHE_SIZE = 64
+
+# Factors that depend only on the CV (and the platform, which is fixed within a
+# batch group); scored once per group instead of once per posting
+CV_ONLY_FACTORS = frozenset({
+    "cv_quality", "experience_years", "recommendations_count", "application_speed",
+    "profile_completeness", "format_compatibility"
+})
+
+SENIORITY_TITLE_WORDS = ("senior", "staff", "principal", "lead", "head", "director")
+
+
+@dataclass
+class CVFeatures:
+    """CV-derived prediction features, extracted once per profile version"""
+
+    cv_quality: float
+    experience_score: float
+    profile_completeness: float
+    recommendations_score: float
+    skills: Set[str]
+    skills_lower: List[str]
+    skill_tokens: Set[str]
+    keywords: Set[str]
+    word_counts: Counter
+    word_count: int
+    location: str
+    network_base_score: float
+    company_connections: Dict[str, int]
+    experiences: List[Tuple[str, str, str]]  # (role, company, description), lowercased
+    salary_expectation: Optional[float]
+    format_compatibility: Dict[str, float] = field(default_factory=dict)
+
+
+def cv_profile_cache_key(cv_profile: Dict[str, Any]) -> Tuple[str, ...]:
+    """
+    Feature cache key: ``(profile_id, profile_version)`` when the profile
+    carries both an id and a version (bump it whenever the profile changes),
+    otherwise a hash of the profile content
+    """
+    version = cv_profile.get("profile_version")
+    profile_id = cv_profile.get("profile_id") or cv_profile.get("id")
+    if version is not None and profile_id:
+        return ("version", str(profile_id), str(version))
+    content = json.dumps(cv_profile, sort_keys=True, default=str)
+    return ("content", hashlib.sha1(content.encode("utf-8")).hexdigest())
+
+
+def _parse_salary(value: Any) -> Optional[float]:
+    """Upper salary figure from a number, ``(low, high)`` pair or text such as ``"$90k - $120k"``"""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value) if value > 0 else None
+    if isinstance(value, (list, tuple)):
+        figures = [_parse_salary(item) for item in value]
+        figures = [figure for figure in figures if figure]
+        return max(figures) if figures else None
+    figures = []
+    for number, thousands in re.findall(r'(\d[\d,]*(?:\.\d+)?)\s*([kK])?', str(value)):
+        figure = float(number.replace(",", ""))
+        figures.append(figure * 1000 if thousands else figure)
+    figures = [figure for figure in figures if figure > 0]
+    return max(figures) if figures else None
 
 
 class ApplicationIntelligenceNetwork:
@@ -63,6 +133,11 @@ class ApplicationIntelligenceNetwork:
         self.prediction_accuracy = 0.0
         self.model_updates = 0
 
+        # CV feature cache (LRU, keyed by cv_profile_cache_key)
+        self.cv_feature_cache: "OrderedDict[Tuple[str, ...], CVFeatures]" = OrderedDict()
+        self.cv_feature_cache_hits = 0
+        self.cv_feature_cache_misses = 0
+
     def _initialize_prediction_model(self) -> Dict[str, Any]:
         """Initialize advanced machine learning prediction model for application success"""
 
@@ -133,149 +208,285 @@ class ApplicationIntelligenceNetwork:
                                        application_context: Dict[str, Any]) -> Dict[str, Any]:
         """Generate comprehensive application success probability prediction"""
 
-        self.total_predictions += 1
-        platform = job_posting.platform.lower()
+        predictions = await self.predict_batch(cv_profile, [job_posting], application_context)
+        return predictions[0]
+
+    async def predict_batch(self, cv_profile: Dict[str, Any], job_postings: Iterable[Any],
+                            application_context: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Predict application success for one CV profile across many job postings
+
+        CV-derived features are extracted once and cached per profile version
+        (see ``cv_profile_cache_key``). Postings are grouped by platform and
+        each platform factor is scored as a column across the group, with
+        CV-only factors computed once per group. Predictions are returned in
+        input order, in the same shape as ``predict_application_success``.
+        """
+
+        job_postings = list(job_postings)
+        features = self._get_cv_features(cv_profile)
+        timestamp = datetime.utcnow().isoformat() + "Z"
+
+        platform_groups: Dict[str, List[int]] = {}
+        for index, job_posting in enumerate(job_postings):
+            platform_groups.setdefault(job_posting.platform.lower(), []).append(index)
+
+        predictions: List[Optional[Dict[str, Any]]] = [None] * len(job_postings)
+        for platform, indices in platform_groups.items():
+            jobs = [job_postings[index] for index in indices]
+            group_predictions = await self._predict_platform_group(platform, jobs, features, cv_profile, timestamp)
+            for index, prediction in zip(indices, group_predictions):
+                predictions[index] = prediction
+
+        self.total_predictions += len(job_postings)
+        return predictions
+
+    async def _predict_platform_group(self, platform: str, jobs: List[Any], features: CVFeatures,
+                                      cv_profile: Dict[str, Any], timestamp: str) -> List[Dict[str, Any]]:
+        """Score every posting of one platform, factor by factor"""
+
         platform_factors = self.prediction_model["platform_success_factors"].get(platform, {})
 
         if not platform_factors:
             # Fallback prediction for unknown platforms
-            return {
+            return [{
                 "success_probability": 0.5,
                 "confidence": "low",
                 "factors": {},
                 "recommendations": ["Platform not fully analyzed - consider manual review"],
                 "biological_alignment_multiplier": 1.0,
                 "platform_specific_score": 0.5
-            }
-
-        # Advanced multi-factor analysis
-        factor_scores = {}
-        total_weight = 0.0
-        weighted_score_sum = 0.0
-
-        for factor, weight in platform_factors.items():
-            factor_score = await self._calculate_advanced_factor_score(
-                factor, cv_profile, job_posting, application_context
-            )
-            weighted_score = factor_score * weight
-
-            factor_scores[factor] = {
-                "score": factor_score,
-                "weight": weight,
-                "contribution": weighted_score,
-                "analysis": await self._generate_factor_insight(factor, factor_score)
-            }
-
-            weighted_score_sum += weighted_score
-            total_weight += weight
-
-        # Apply biological alignment multiplier
-        biological_alignment = job_posting.biological_alignment_score
-        alignment_multiplier = self._calculate_alignment_multiplier(biological_alignment)
+            } for _ in jobs]
 
-        # Calculate platform-specific score
-        platform_specific_score = weighted_score_sum / total_weight if total_weight > 0 else 0.5
-
-        # Apply biological multiplier and constraints
-        final_score = min(0.98, max(0.02, platform_specific_score * alignment_multiplier))
+        # One score column per factor across the group's postings
+        factor_columns = {
+            factor: self._score_factor_column(factor, features, jobs)
+            for factor in platform_factors
+        }
+        total_weight = sum(platform_factors.values())
+        insights: Dict[Tuple[str, float], str] = {}
+
+        predictions = []
+        for row, job_posting in enumerate(jobs):
+            # Advanced multi-factor analysis
+            factor_scores = {}
+            weighted_score_sum = 0.0
+
+            for factor, weight in platform_factors.items():
+                factor_score = factor_columns[factor][row]
+                weighted_score = factor_score * weight
+
+                insight_key = (factor, factor_score)
+                if insight_key not in insights:
+                    insights[insight_key] = await self._generate_factor_insight(factor, factor_score)
+
+                factor_scores[factor] = {
+                    "score": factor_score,
+                    "weight": weight,
+                    "contribution": weighted_score,
+                    "analysis": insights[insight_key]
+                }
 
-        # Calculate prediction confidence
-        confidence = await self._calculate_prediction_confidence(final_score, factor_scores, platform_specific_score)
+                weighted_score_sum += weighted_score
+
+            # Apply biological alignment multiplier
+            biological_alignment = job_posting.biological_alignment_score
+            alignment_multiplier = self._calculate_alignment_multiplier(biological_alignment)
+
+            # Calculate platform-specific score
+            platform_specific_score = weighted_score_sum / total_weight if total_weight > 0 else 0.5
+
+            # Apply biological multiplier and constraints
+            final_score = min(0.98, max(0.02, platform_specific_score * alignment_multiplier))
+
+            # Calculate prediction confidence
+            confidence = await self._calculate_prediction_confidence(final_score, factor_scores,
+                                                                     platform_specific_score)
+
+            predictions.append({
+                "success_probability": final_score,
+                "confidence": confidence,
+                "factors": factor_scores,
+                "biological_alignment_multiplier": alignment_multiplier,
+                "biological_alignment_score": biological_alignment,
+                "platform_specific_score": platform_specific_score,
+                "recommendations": await self._generate_optimization_recommendations(final_score, job_posting,
+                                                                                     cv_profile),
+                "prediction_metadata": {
+                    "platform": platform,
+                    "factors_analyzed": len(factor_scores),
+                    "prediction_timestamp": timestamp
+                }
+            })
+
+        return predictions
+
+    def _score_factor_column(self, factor: str, features: CVFeatures, jobs: List[Any]) -> List[float]:
+        """Scores of one factor for every posting in a single-platform group"""
+
+        if factor in CV_ONLY_FACTORS:
+            return [self._score_factor(factor, features, jobs[0])] * len(jobs)
+        return [self._score_factor(factor, features, job_posting) for job_posting in jobs]
+
+    def _get_cv_features(self, cv_profile: Dict[str, Any]) -> CVFeatures:
+        """Cached CV features for a profile, extracted on first use"""
+
+        key = cv_profile_cache_key(cv_profile)
+        features = self.cv_feature_cache.get(key)
+        if features is not None:
+            self.cv_feature_cache_hits += 1
+            self.cv_feature_cache.move_to_end(key)
+            return features
+
+        self.cv_feature_cache_misses += 1
+        features = self._extract_cv_features(cv_profile)
+        self.cv_feature_cache[key] = features
+        if len(self.cv_feature_cache) > CV_FEATURE_CACHE_SIZE:
+            self.cv_feature_cache.popitem(last=False)
+        return features
+
+    def _extract_cv_features(self, cv_profile: Dict[str, Any]) -> CVFeatures:
+        """Compute every job-independent feature the success factors use"""
+
+        skills = set(cv_profile.get("skills", []))
+        skills_lower = [str(skill).lower() for skill in skills]
+
+        # Keywords and word counts over the ATS-relevant fields
+        keywords: Set[str] = set()
+        word_counts: Counter = Counter()
+        for field_name in ["summary", "experience", "skills"]:
+            field_content = cv_profile.get(field_name, "")
+            if isinstance(field_content, list):
+                field_content = " ".join(str(item) for item in field_content)
+            field_content = str(field_content).lower()
+            keywords.update(re.findall(r'\b\w+\b', field_content))
+            word_counts.update(field_content.split())
 
-        return {
-            "success_probability": final_score,
-            "confidence": confidence,
-            "factors": factor_scores,
-            "biological_alignment_multiplier": alignment_multiplier,
-            "biological_alignment_score": biological_alignment,
-            "platform_specific_score": platform_specific_score,
-            "recommendations": await self._generate_optimization_recommendations(final_score, job_posting, cv_profile),
-            "prediction_metadata": {
-                "platform": platform,
-                "factors_analyzed": len(factor_scores),
-                "prediction_timestamp": datetime.utcnow().isoformat() + "Z"
+        # LinkedIn connection factors
+        has_linkedin = cv_profile.get("has_linkedin", True)
+        connection_count = cv_profile.get("connection_count", 500)
+        network_base_score = 0.7 if has_linkedin else 0.4
+        if connection_count > 500:
+            network_base_score += 0.1
+        elif connection_count < 100:
+            network_base_score -= 0.1
+
+        experiences = [
+            (str(exp.get("role", "")).lower(), str(exp.get("company", "")).lower(),
+             str(exp.get("description", "")).lower())
+            for exp in cv_profile.get("experience", [])
+            if isinstance(exp, dict)
+        ]
+
+        return CVFeatures(
+            cv_quality=self._assess_cv_quality(cv_profile),
+            experience_score=self._calculate_experience_score(cv_profile),
+            profile_completeness=self._assess_profile_completeness(cv_profile),
+            recommendations_score=min(1.0, cv_profile.get("recommendations_count", 0) / 10),
+            skills=skills,
+            skills_lower=skills_lower,
+            skill_tokens={token for skill in skills_lower for token in skill.split()},
+            keywords=keywords,
+            word_counts=word_counts,
+            word_count=sum(word_counts.values()),
+            location=str(cv_profile.get("location") or "").lower(),
+            network_base_score=network_base_score,
+            company_connections=cv_profile.get("company_connections", {}),
+            experiences=experiences,
+            salary_expectation=_parse_salary(cv_profile.get("salary_expectation")),
+            format_compatibility={
+                platform: self._check_format_compatibility(cv_profile, platform)
+                for platform in self.prediction_model["platform_success_factors"]
             }
-        }
+        )
 
     async def _calculate_advanced_factor_score(self, factor: str, cv_profile: Dict[str, Any],
                                             job_posting, context: Dict[str, Any]) -> float:
         """Calculate advanced score for individual success factor"""
 
+        return self._score_factor(factor, self._get_cv_features(cv_profile), job_posting)
+
+    def _score_factor(self, factor: str, features: CVFeatures, job_posting) -> float:
+        """Score one success factor from precomputed CV features"""
+
         if factor == "skill_alignment":
-            return await self._calculate_skill_alignment_score(cv_profile, job_posting)
+            return self._calculate_skill_alignment_score(features, job_posting)
 
         elif factor == "cv_quality":
-            return self._assess_cv_quality(cv_profile)
+            return features.cv_quality
 
         elif factor == "experience_years":
-            return self._calculate_experience_score(cv_profile)
+            return features.experience_score
 
         elif factor == "location_match":
-            return self._calculate_location_match_score(cv_profile, job_posting)
+            return self._calculate_location_match_score(features, job_posting)
 
         elif factor == "keyword_matching":
-            return self._calculate_keyword_matching_score(cv_profile, job_posting)
+            return self._calculate_keyword_matching_score(features, job_posting)
 
         elif factor == "network_connections":
-            return self._assess_network_connections(cv_profile, job_posting)
+            return self._assess_network_connections(features, job_posting)
 
         elif factor == "company_rating":
             return self._calculate_company_rating_score(job_posting)
 
         elif factor == "culture_fit":
-            return await self._assess_culture_fit(cv_profile, job_posting)
+            return self._assess_culture_fit(features, job_posting)
 
         elif factor == "keyword_density":
-            return self._calculate_keyword_density_score(cv_profile, job_posting)
+            return self._calculate_keyword_density_score(features, job_posting)
 
         elif factor == "experience_relevance":
-            return self._assess_experience_relevance(cv_profile, job_posting)
+            return self._assess_experience_relevance(features, job_posting)
 
         elif factor == "format_compatibility":
-            return self._check_format_compatibility(cv_profile, job_posting.platform)
+            return features.format_compatibility.get(job_posting.platform.lower(), 0.0)
 
         elif factor == "recommendations_count":
-            return min(1.0, cv_profile.get("recommendations_count", 0) / 10)
+            return features.recommendations_score
 
         elif factor == "company_connections":
-            return self._calculate_company_connection_score(cv_profile, job_posting)
+            return self._calculate_company_connection_score(features, job_posting)
 
         elif factor == "application_speed":
             return 0.9  # Assume optimized application speed
 
         elif factor == "profile_completeness":
-            return self._assess_profile_completeness(cv_profile)
+            return features.profile_completeness
 
         elif factor == "interview_difficulty":
             return 1.0 - self._estimate_interview_difficulty(job_posting)  # Inverse relationship
 
         elif factor == "salary_competitiveness":
-            return self._assess_salary_competitiveness(cv_profile, job_posting)
+            return self._assess_salary_competitiveness(features, job_posting)
 
         return 0.5  # Neutral score for unknown factors
 
-    async def _calculate_skill_alignment_score(self, cv_profile: Dict[str, Any], job_posting) -> float:
+    def _calculate_skill_alignment_score(self, features: CVFeatures, job_posting) -> float:
         """Calculate detailed skill alignment score"""
 
         try:
-            cv_skills = set(cv_profile.get("skills", []))
             job_skills = set(getattr(job_posting, 'requirements', []))
 
             if not job_skills:
                 return 0.5  # Neutral when no requirements specified
 
             # Exact matches
-            exact_matches = len(cv_skills & job_skills)
+            exact_matches = len(features.skills & job_skills)
 
             # Partial matches (skills containing job requirements)
             partial_matches = 0
+            unmatched_skills = []
             for job_skill in job_skills:
-                if any(job_skill.lower() in cv_skill.lower() or cv_skill.lower() in job_skill.lower()
-                      for cv_skill in cv_skills):
+                job_skill_lower = job_skill.lower()
+                if any(job_skill_lower in cv_skill or cv_skill in job_skill_lower
+                      for cv_skill in features.skills_lower):
                     partial_matches += 0.5
+                else:
+                    unmatched_skills.append(job_skill_lower)
 
             # Related skills (semantic similarity - simplified)
-            related_matches = await self._find_related_skills(cv_skills, job_skills)
+            related_matches = self._find_related_skills(features.skill_tokens, unmatched_skills)
 
             total_matches = exact_matches + partial_matches + related_matches
             alignment_score = min(1.0, total_matches / len(job_skills))
@@ -285,6 +496,11 @@ class ApplicationIntelligenceNetwork:
         except Exception:
             return 0.5
 
+    def _find_related_skills(self, cv_skill_tokens: Set[str], job_skills: List[str]) -> float:
+        """Quarter credit for each requirement sharing a word with a CV skill (e.g. "aws lambda" / "aws")"""
+
+        return sum(0.25 for job_skill in job_skills if cv_skill_tokens.intersection(job_skill.split()))
+
     def _assess_cv_quality(self, cv_profile: Dict[str, Any]) -> float:
         """Assess overall CV quality and completeness"""
 
@@ -344,11 +560,11 @@ class ApplicationIntelligenceNetwork:
         else:
             return 0.8  # Senior experience still valuable but diminishing returns
 
-    def _calculate_location_match_score(self, cv_profile: Dict[str, Any], job_posting) -> float:
+    def _calculate_location_match_score(self, features: CVFeatures, job_posting) -> float:
         """Calculate location matching score"""
 
         job_location = getattr(job_posting, 'location', '').lower()
-        cv_location = cv_profile.get("location", "").lower()
+        cv_location = features.location
 
         # Remote work consideration
         if "remote" in job_location or "remote" in cv_location:
@@ -364,7 +580,7 @@ class ApplicationIntelligenceNetwork:
 
         return 0.3  # No match found
 
-    def _calculate_keyword_matching_score(self, cv_profile: Dict[str, Any], job_posting) -> float:
+    def _calculate_keyword_matching_score(self, features: CVFeatures, job_posting) -> float:
         """Calculate keyword matching for ATS optimization"""
 
         try:
@@ -373,16 +589,8 @@ class ApplicationIntelligenceNetwork:
             # Extract keywords from job description
             job_keywords = set(re.findall(r'\b\w+\b', job_description.lower()))
 
-            # Extract keywords from CV
-            cv_keywords = set()
-            for field in ["summary", "experience", "skills"]:
-                field_content = cv_profile.get(field, "")
-                if isinstance(field_content, list):
-                    field_content = " ".join(str(item) for item in field_content)
-                cv_keywords.update(re.findall(r'\b\w+\b', str(field_content).lower()))
-
-            # Calculate matches
-            matches = len(job_keywords & cv_keywords)
+            # Calculate matches against the CV keywords
+            matches = len(job_keywords & features.keywords)
             total_keywords = len(job_keywords)
 
             return min(1.0, matches / max(1, total_keywords))
@@ -390,25 +598,14 @@ class ApplicationIntelligenceNetwork:
         except Exception:
             return 0.5
 
-    def _assess_network_connections(self, cv_profile: Dict[str, Any], job_posting) -> float:
+    def _assess_network_connections(self, features: CVFeatures, job_posting) -> float:
         """Assess networking advantage score"""
 
-        # LinkedIn connection factors
-        has_linkedin = cv_profile.get("has_linkedin", True)
-        connection_count = cv_profile.get("connection_count", 500)
-
         # Company-specific connections
-        company_connections = cv_profile.get("company_connections", {}).get(
-            getattr(job_posting, 'company', '').lower(), 0
-        )
+        company_connections = features.company_connections.get(getattr(job_posting, 'company', '').lower(), 0)
 
-        base_score = 0.7 if has_linkedin else 0.4
-
-        # Adjust for connection count
-        if connection_count > 500:
-            base_score += 0.1
-        elif connection_count < 100:
-            base_score -= 0.1
+        # LinkedIn presence and connection count
+        base_score = features.network_base_score
 
         # Bonus for company connections
         if company_connections > 0:
@@ -437,42 +634,37 @@ class ApplicationIntelligenceNetwork:
         else:
             return 0.7  # Neutral/default good rating
 
-    async def _assess_culture_fit(self, cv_profile: Dict[str, Any], job_posting) -> float:
+    def _assess_culture_fit(self, features: CVFeatures, job_posting) -> float:
         """Assess culture fit based on company and profile alignment"""
 
         # Simplified culture fit assessment
         biological_alignment = getattr(job_posting, 'biological_alignment_score', 0.8)
-        experience_alignment = self._calculate_experience_alignment(cv_profile, job_posting)
+        experience_alignment = self._calculate_experience_alignment(features, job_posting)
 
         culture_fit = (biological_alignment + experience_alignment) / 2.0
 
         return culture_fit
 
-    def _calculate_experience_alignment(self, cv_profile: Dict[str, Any], job_posting) -> float:
+    def _calculate_experience_alignment(self, features: CVFeatures, job_posting) -> float:
         """Calculate experience alignment with job requirements"""
 
-        job_title = getattr(job_posting, 'title', '').lower()
-        experience_entries = cv_profile.get("experience", [])
+        job_title_words = getattr(job_posting, 'title', '').lower().split()
+        job_company = getattr(job_posting, 'company', '').lower()
 
         relevance_score = 0.0
 
-        for exp in experience_entries:
-            if isinstance(exp, dict):
-                exp_title = exp.get("role", "").lower()
-                exp_company = exp.get("company", "").lower()
+        for exp_title, exp_company, _ in features.experiences:
+            title_match = any(keyword in exp_title for keyword in job_title_words)
+            if title_match:
+                relevance_score += 0.4
 
-                title_match = any(keyword in exp_title for keyword in job_title.split())
-                if title_match:
-                    relevance_score += 0.4
-
-                # Bonus for similar company types/size
-                job_company = getattr(job_posting, 'company', '').lower()
-                if exp_company and (exp_company in job_company or job_company in exp_company):
-                    relevance_score += 0.3
+            # Bonus for similar company types/size
+            if exp_company and (exp_company in job_company or job_company in exp_company):
+                relevance_score += 0.3
 
         return min(1.0, relevance_score)
 
-    def _calculate_keyword_density_score(self, cv_profile: Dict[str, Any], job_posting) -> float:
+    def _calculate_keyword_density_score(self, features: CVFeatures, job_posting) -> float:
         """Calculate keyword density optimization score"""
 
         try:
@@ -480,22 +672,10 @@ class ApplicationIntelligenceNetwork:
             job_description = getattr(job_posting, 'description', '')
             job_words = set(job_description.lower().split())
 
-            cv_word_count = 0
-            keyword_matches = 0
-
-            for field in ["summary", "experience", "skills"]:
-                field_content = cv_profile.get(field, "")
-                if isinstance(field_content, list):
-                    field_content = " ".join(str(item) for item in field_content)
-
-                words = str(field_content).lower().split()
-                cv_word_count += len(words)
-
-                field_matches = sum(1 for word in words if word in job_words)
-                keyword_matches += field_matches
+            keyword_matches = sum(count for word, count in features.word_counts.items() if word in job_words)
 
             # Ideal density: 1-3% of CV contains job keywords
-            density = keyword_matches / max(1, cv_word_count)
+            density = keyword_matches / max(1, features.word_count)
 
             if density < 0.005:  # Too few keywords
                 return 0.3
@@ -509,36 +689,75 @@ class ApplicationIntelligenceNetwork:
         except Exception:
             return 0.5
 
-    def _assess_experience_relevance(self, cv_profile: Dict[str, Any], job_posting) -> float:
+    def _assess_experience_relevance(self, features: CVFeatures, job_posting) -> float:
         """Assess experience relevance to job requirements"""
 
-        job_title = getattr(job_posting, 'title', '').lower()
-        experience_entries = cv_profile.get("experience", [])
+        job_title_words = getattr(job_posting, 'title', '').lower().split()
+        job_skills = [skill.lower() for skill in set(getattr(job_posting, 'requirements', []))]
 
         relevance_scores = []
 
-        for exp in experience_entries:
-            if isinstance(exp, dict):
-                exp_title = exp.get("role", "").lower()
-                exp_description = exp.get("description", "").lower()
-
-                # Title relevance
-                title_relevance = sum(1 for word in job_title.split()
-                                    if any(word in term for term in [exp_title, exp_description]))
+        for exp_title, _, exp_description in features.experiences:
+            # Title relevance
+            title_relevance = sum(1 for word in job_title_words
+                                if word in exp_title or word in exp_description)
 
-                # Skills relevance
-                job_skills = set(getattr(job_posting, 'requirements', []))
-                exp_relevant_skills = sum(1 for skill in job_skills
-                                        if skill.lower() in exp_description)
+            # Skills relevance
+            exp_relevant_skills = sum(1 for skill in job_skills if skill in exp_description)
 
-                entry_relevance = (title_relevance * 0.4) + (exp_relevant_skills * 0.6)
-                relevance_scores.append(min(1.0, entry_relevance))
+            entry_relevance = (title_relevance * 0.4) + (exp_relevant_skills * 0.6)
+            relevance_scores.append(min(1.0, entry_relevance))
 
         if relevance_scores:
             return sum(relevance_scores) / len(relevance_scores)
         else:
             return 0.5
 
+    def _calculate_company_connection_score(self, features: CVFeatures, job_posting) -> float:
+        """Score referral potential from connections at the hiring company"""
+
+        connections = features.company_connections.get(getattr(job_posting, 'company', '').lower(), 0)
+
+        if connections <= 0:
+            return 0.3  # No inside connections
+        return min(1.0, 0.6 + connections * 0.1)
+
+    def _assess_profile_completeness(self, cv_profile: Dict[str, Any]) -> float:
+        """Fraction of core profile sections that are filled in"""
+
+        profile_sections = ["professional_summary", "experience", "education", "skills",
+                            "certifications", "email", "phone", "location"]
+
+        return sum(1 for section in profile_sections if cv_profile.get(section)) / len(profile_sections)
+
+    def _estimate_interview_difficulty(self, job_posting) -> float:
+        """Estimate interview difficulty from company reputation and role seniority"""
+
+        difficulty = 0.7 if self._calculate_company_rating_score(job_posting) >= 0.85 else 0.5
+
+        job_title = getattr(job_posting, 'title', '').lower()
+        if any(word in job_title for word in SENIORITY_TITLE_WORDS):
+            difficulty += 0.1
+
+        return min(0.9, difficulty)
+
+    def _assess_salary_competitiveness(self, features: CVFeatures, job_posting) -> float:
+        """Compare the posting's salary with the candidate's expectation"""
+
+        offered = _parse_salary(getattr(job_posting, 'salary_range', None))
+        expected = features.salary_expectation
+
+        if not offered or not expected:
+            return 0.5  # Neutral when either side is unknown
+
+        ratio = offered / expected
+        if ratio >= 1.0:
+            return 0.9
+        elif ratio >= 0.85:
+            return 0.7
+        else:
+            return 0.4
+
     def _check_format_compatibility(self, cv_profile: Dict[str, Any], platform: str) -> float:
         """Check CV format compatibility with platform requirements"""
 
@@ -618,12 +837,14 @@ class ApplicationIntelligenceNetwork:
             return 0.5
 
         scores = [factor["score"] for factor in factor_scores.values()]
+        mean_score = math.fsum(scores) / len(scores)
 
         # Measure agreement using coefficient of variation
-        if statistics.mean(scores) == 0:
+        if mean_score == 0:
             return 0.5
 
-        coefficient_of_variation = statistics.stdev(scores) / statistics.mean(scores)
+        sample_stdev = math.sqrt(math.fsum((score - mean_score) ** 2 for score in scores) / (len(scores) - 1))
+        coefficient_of_variation = sample_stdev / mean_score
 
         # Lower variation = higher agreement = higher confidence
         agreement_score = max(0.0, 1.0 - coefficient_of_variation)
@@ -741,6 +962,11 @@ class ApplicationIntelligenceNetwork:
             "biological_patterns": self.intelligence.biological_alignment_patterns,
             "cv_optimization_data": self.intelligence.cv_optimization_correlations,
             "learning_effectiveness": self._calculate_learning_effectiveness(),
+            "cv_feature_cache": {
+                "profiles": len(self.cv_feature_cache),
+                "hits": self.cv_feature_cache_hits,
+                "misses": self.cv_feature_cache_misses
+            },
             "last_updated": datetime.utcnow().isoformat() + "Z"
         }
 
@@ -31,9 +31,18 @@ validation_status: application-optimization-ready
 version: v1.0.0-T-APPLICATION-OPTIMIZATION
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
+import heapq
+
+# Scheduling modes for optimize_application_schedule:
+# - sequential: jobs in input order, each scanning every day and time slot
+# - indexed: jobs in descending alignment order, best open slot from a priority queue
+SCHEDULING_MODES = ("sequential", "indexed")
+
+MAX_APPLICATIONS_PER_SLOT = 5
+BUSY_SLOT_OCCUPANCY = 3
 
 
 @dataclass
@@ -144,6 +153,10 @@ class ApplicationOptimizationEngine:
         max_per_day = workflow_constraints.get("max_applications_per_day", self.constraints.max_per_day)
         platform_weights = workflow_constraints.get("platform_weights", {})
 
+        scheduling_mode = workflow_constraints.get("scheduling_mode", "sequential")
+        if scheduling_mode not in SCHEDULING_MODES:
+            raise ValueError(f"Unknown scheduling mode: {scheduling_mode}")
+
         # Validate and adjust constraints based on biological optimization
         optimized_constraints = await self._apply_biological_constraints(max_per_day, platform_weights, job_postings)
 
@@ -152,13 +165,12 @@ class ApplicationOptimizationEngine:
         applications_per_day = {}
         total_scheduled = 0
 
-        # Initialize schedule structure
-        for job in job_postings:
-            optimal_slot = await self._find_optimal_application_slot(job, schedule, optimized_constraints)
-
-            if not optimal_slot:
-                continue  # Skip jobs that can't be optimally scheduled
+        if scheduling_mode == "indexed":
+            placements = self._iter_indexed_placements(job_postings, optimized_constraints)
+        else:
+            placements = self._iter_sequential_placements(job_postings, schedule, optimized_constraints)
 
+        async for job, optimal_slot in placements:
             day_key = optimal_slot["day"]
             time_key = optimal_slot["time"]
 
@@ -215,6 +227,7 @@ class ApplicationOptimizationEngine:
             "biological_optimization_applied": True,
             "optimization_metadata": {
                 "constraints_applied": optimized_constraints,
+                "scheduling_mode": scheduling_mode,
                 "time_slots_utilized": result_schedule.time_slots_utilized,
                 "average_applications_per_day": total_scheduled / max(1, len(applications_per_day))
             }
@@ -257,6 +270,73 @@ class ApplicationOptimizationEngine:
             }
         }
 
+    async def _iter_sequential_placements(self, job_postings: List[Any], schedule: Dict[str, Any],
+                                          constraints: Dict[str, Any]):
+        """Yield (job, slot) in input order; each job scans the schedule being built"""
+
+        for job in job_postings:
+            optimal_slot = await self._find_optimal_application_slot(job, schedule, constraints)
+
+            if not optimal_slot:
+                continue  # Skip jobs that can't be optimally scheduled
+
+            yield job, optimal_slot
+
+    async def _iter_indexed_placements(self, job_postings: List[Any], constraints: Dict[str, Any]):
+        """
+        Yield (job, slot) in descending alignment order from a capacity index
+
+        A slot's score factors into a timing part (day, base score, occupancy)
+        and a job part (platform, alignment, weights) that is the same for
+        every slot, so the best slot for any job is the open slot with the
+        highest timing score. Slots are kept in a max-heap of timing scores
+        with per-day and per-slot occupancy counters; a slot is re-queued with
+        its new score when it takes an application, and dropped once it or
+        its day is full. Ties go to the earlier slot, as in the sequential scan.
+        """
+
+        max_per_day = constraints.get("max_per_day", self.constraints.max_per_day)
+        best_times = self.optimization_rules["best_times_to_apply"]
+
+        day_counts: Dict[str, int] = {}
+        slot_heap: List[Tuple[float, int, str, str, int]] = []
+        for day, day_slots in best_times.items():
+            for time_slot, base_score in day_slots.items():
+                slot_heap.append((-self._calculate_slot_timing_score(day, base_score, 0),
+                                  len(slot_heap), day, time_slot, 0))
+        heapq.heapify(slot_heap)
+
+        ranked_jobs = sorted(job_postings, key=lambda job: getattr(job, 'biological_alignment_score', 0.5),
+                             reverse=True)
+
+        for job in ranked_jobs:
+            # Discard slots whose day filled up since they were queued
+            while slot_heap and day_counts.get(slot_heap[0][2], 0) >= max_per_day:
+                heapq.heappop(slot_heap)
+            if not slot_heap:
+                break  # Every slot is at capacity; no later job can be scheduled
+
+            _, order, day, time_slot, occupancy = heapq.heappop(slot_heap)
+            base_score = best_times[day][time_slot]
+            job_alignment = getattr(job, 'biological_alignment_score', 0.5)
+            slot_score = self._calculate_slot_score(
+                day, time_slot, base_score, getattr(job, 'platform', 'unknown').lower(), job_alignment,
+                occupancy, constraints
+            )
+
+            day_counts[day] = day_counts.get(day, 0) + 1
+            if occupancy + 1 < MAX_APPLICATIONS_PER_SLOT:
+                heapq.heappush(slot_heap, (-self._calculate_slot_timing_score(day, base_score, occupancy + 1),
+                                           order, day, time_slot, occupancy + 1))
+
+            yield job, {
+                "day": day,
+                "time": time_slot,
+                "quality_score": slot_score,
+                "capacity_remaining": MAX_APPLICATIONS_PER_SLOT - 1 - occupancy,
+                "biological_alignment": job_alignment
+            }
+
     async def _find_optimal_application_slot(self, job: Any, current_schedule: Dict[str, Any],
                                            constraints: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Find optimal time slot for individual job application"""
@@ -284,7 +364,7 @@ class ApplicationOptimizationEngine:
             for time_slot, base_score in day_slots.items():
                 # Check time slot capacity (max 5 applications per slot)
                 current_slot_count = len(current_schedule.get(day, {}).get(time_slot, []))
-                if current_slot_count >= 5:
+                if current_slot_count >= MAX_APPLICATIONS_PER_SLOT:
                     continue
 
                 # Calculate comprehensive slot score
@@ -299,7 +379,7 @@ class ApplicationOptimizationEngine:
                         "day": day,
                         "time": time_slot,
                         "quality_score": slot_score,
-                        "capacity_remaining": 4 - current_slot_count,  # Remaining slots in this time window
+                        "capacity_remaining": MAX_APPLICATIONS_PER_SLOT - 1 - current_slot_count,  # Remaining slots in this time window
                         "biological_alignment": job_alignment
                     }
 
@@ -310,8 +390,8 @@ class ApplicationOptimizationEngine:
                             constraints: Dict[str, Any]) -> float:
         """Calculate comprehensive score for application time slot"""
 
-        # Base timing score
-        score = base_score
+        # Base timing score, capacity penalty and day of week adjustments
+        score = self._calculate_slot_timing_score(day, base_score, slot_occupancy)
 
         # Platform efficiency bonus
         platform_efficiency = self._get_platform_efficiency(platform)
@@ -328,8 +408,15 @@ class ApplicationOptimizationEngine:
         platform_weight = platform_weights.get(platform, 0.25)
         score *= (1.0 + platform_weight * 0.2)  # Up to 20% bonus for preferred platforms
 
+        return score
+
+    def _calculate_slot_timing_score(self, day: str, base_score: float, slot_occupancy: int) -> float:
+        """Job-independent part of the slot score"""
+
+        score = base_score
+
         # Capacity penalty (slight penalty for very full slots)
-        if slot_occupancy >= 3:
+        if slot_occupancy >= BUSY_SLOT_OCCUPANCY:
             score *= 0.95  # 5% penalty for busy slots
 
         # Day of week adjustments
@@ -344,7 +431,7 @@ class ApplicationOptimizationEngine:
         platform = platform.lower()
         platform_multipliers = self.optimization_rules["platform_efficiency_multipliers"]
 
-        return platform_multipliers.get(platform, {"speed": 1.0})["success_rate"]
+        return platform_multipliers.get(platform, {}).get("success_rate", 1.0)
 
     def _calculate_platform_balance(self, schedule: Dict[str, Any]) -> Dict[str, float]:
         """Calculate platform distribution balance across schedule"""
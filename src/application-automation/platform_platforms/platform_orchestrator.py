@@ -31,12 +31,29 @@ validation_status: platform-orchestrator-ready
 version: v1.0.0-T-PLATFORM
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence, Tuple, Union
 from datetime import datetime, timedelta
 import asyncio
+import time
 import aiohttp
 from dataclasses import dataclass, field
 
+# Token bucket burst allowance, in seconds of a platform's sustained rate
+BUCKET_BURST_SECONDS = 6.0
+
+# Adaptive back-off: once a platform has this many recorded submissions and
+# its success rate drops below the threshold, its refill rate is divided by
+# ADAPTIVE_BACKOFF_FACTOR (failures are often soft rate limiting)
+ADAPTIVE_MIN_SAMPLES = 5
+ADAPTIVE_SUCCESS_THRESHOLD = 0.7
+ADAPTIVE_BACKOFF_FACTOR = 1.5
+
+# Submitters report the platform's HTTP status in ``status_code``; only 429
+# counts as a rate limit hit. The simulated platforms answer this share of
+# failed submissions with a 429 instead of a form or profile error.
+HTTP_TOO_MANY_REQUESTS = 429
+SIMULATED_RATE_LIMIT_SHARE = 0.15
+
 
 @dataclass
 class PlatformConnector:
@@ -68,6 +85,57 @@ class SubmissionResult:
     retry_recommended: bool = False
 
 
+@dataclass
+class SubmissionRequest:
+    """One entry of a bulk ``submit_applications`` batch"""
+    job_posting: Any
+    cv_data: Dict[str, Any]
+    platform_config: Dict[str, Any] = field(default_factory=dict)
+
+
+class TokenBucket:
+    """Async token bucket holding up to ``capacity`` tokens, refilled at ``rate_per_second``"""
+
+    def __init__(self, rate_per_second: float, capacity: int, clock=time.monotonic):
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self._clock = clock
+        self._updated = clock()
+
+    @classmethod
+    def for_platform(cls, platform: PlatformConnector) -> "TokenBucket":
+        """Bucket sized from the connector's ``rate_limit_per_minute``"""
+        rate_per_second = platform.rate_limit_per_minute / 60.0
+        capacity = max(1, int(rate_per_second * BUCKET_BURST_SECONDS))
+        return cls(rate_per_second, capacity)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate_per_second)
+        self._updated = now
+
+    def set_rate(self, rate_per_second: float) -> None:
+        """Change the refill rate; time already elapsed is credited at the old rate"""
+        self._refill()
+        self.rate_per_second = rate_per_second
+
+    def try_acquire(self) -> float:
+        """Take a token and return 0.0, or return the seconds until one is available"""
+        self._refill()
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return 0.0
+        return (1.0 - self.tokens) / self.rate_per_second
+
+    async def acquire(self) -> None:
+        while True:
+            wait_seconds = self.try_acquire()
+            if wait_seconds <= 0:
+                return
+            await asyncio.sleep(wait_seconds)
+
+
 class PlatformOrchestrator:
     """🎭 GODHOOD MULTI-PLATFORM APPLICATION ORCHESTRATOR
 
@@ -77,7 +145,8 @@ class PlatformOrchestrator:
 
     This orchestrator achieves:
     - Multi-platform session initialization and management
-    - Intelligent rate limiting and request scheduling
+    - Per-platform token-bucket scheduling: each platform has its own queue and
+      bucket, so a throttled platform never holds concurrency other platforms need
     - Automated form filling and submission simulation
     - Real-time success tracking and error handling
     - Platform-specific optimization strategies
@@ -86,8 +155,18 @@ class PlatformOrchestrator:
     def __init__(self):
         self.platforms = self._initialize_platform_connectors()
         self.session_pool: Dict[str, aiohttp.ClientSession] = {}
-        self.rate_limiter = asyncio.Semaphore(10)  # Global rate limiting
         self.platform_stats: Dict[str, Dict[str, Any]] = {}
+
+        # Per-platform scheduling: a token bucket and a FIFO queue drained by one
+        # worker per platform. The global semaphore only bounds submissions that
+        # are actually executing; queued submissions hold nothing shared.
+        self.max_concurrent_submissions = 10
+        self.rate_limiter = asyncio.Semaphore(self.max_concurrent_submissions)
+        self.token_buckets = {name: TokenBucket.for_platform(platform) for name, platform in self.platforms.items()}
+        self.submission_queues: Dict[str, asyncio.Queue] = {}
+        self._queue_workers: Dict[str, asyncio.Task] = {}
+        self._running_submissions: set = set()
+        self._scheduler_loop: Optional[asyncio.AbstractEventLoop] = None
         self.submission_history: List[SubmissionResult] = []
 
         # Performance tracking
@@ -255,94 +334,176 @@ class PlatformOrchestrator:
                                platform_config: Dict[str, Any] = None) -> Dict[str, Any]:
         """Submit job application through appropriate platform orchestrator"""
 
-        async with self.rate_limiter:
-            platform_name = job_posting.platform.lower()
-            platform = self.platforms.get(platform_name)
-
-            if not platform:
-                return self._create_submission_result(
-                    success=False,
-                    platform=platform_name,
-                    job_id=job_posting.job_id,
-                    error_message="Platform not supported"
-                )
-
-            # Apply intelligent rate limiting
-            await self._respect_rate_limits(platform)
-
+        platform_name = job_posting.platform.lower()
+        if platform_name not in self.platforms:
+            return self._create_submission_result(
+                success=False,
+                platform=platform_name,
+                job_id=job_posting.job_id,
+                error_message="Platform not supported"
+            )
+
+        # Queue on the platform; its worker paces submissions with the platform's token bucket
+        self._ensure_submission_workers()
+        result_future = asyncio.get_running_loop().create_future()
+        self.submission_queues[platform_name].put_nowait((job_posting, cv_data, platform_config or {}, result_future))
+        return await result_future
+
+    async def submit_applications(self, batch: Sequence[Union[SubmissionRequest, Tuple]]) -> List[Dict[str, Any]]:
+        """Submit a batch of applications, fanned out across the platform queues
+
+        Entries are ``SubmissionRequest`` objects or ``(job_posting, cv_data[, platform_config])``
+        tuples; results are returned in batch order.
+        """
+
+        requests = [entry if isinstance(entry, SubmissionRequest) else SubmissionRequest(*entry) for entry in batch]
+        return list(await asyncio.gather(*(
+            self.submit_application(request.job_posting, request.cv_data, request.platform_config)
+            for request in requests
+        )))
+
+    def _ensure_submission_workers(self) -> None:
+        """Start one queue worker per platform on the running event loop"""
+
+        loop = asyncio.get_running_loop()
+        if self._scheduler_loop is not loop:
+            # Queues, workers and the semaphore belong to one event loop
+            self._scheduler_loop = loop
+            self.rate_limiter = asyncio.Semaphore(self.max_concurrent_submissions)
+            self.submission_queues = {name: asyncio.Queue() for name in self.platforms}
+            self._queue_workers = {}
+            self._running_submissions = set()
+
+        for platform_name in self.platforms:
+            worker = self._queue_workers.get(platform_name)
+            if worker is None or worker.done():
+                self._queue_workers[platform_name] = loop.create_task(self._platform_queue_worker(platform_name))
+
+    async def _platform_queue_worker(self, platform_name: str) -> None:
+        """Drain one platform's queue in FIFO order, one bucket token per submission"""
+
+        platform = self.platforms[platform_name]
+        queue = self.submission_queues[platform_name]
+
+        while True:
+            job_posting, cv_data, config, result_future = await queue.get()
+            dispatched = False
             try:
-                # Execute platform-specific submission strategy
-                start_time = datetime.utcnow()
+                if result_future.done():
+                    continue  # Caller gave up while queued
 
-                submission_result = await self._execute_platform_submission(
-                    platform, job_posting, cv_data, platform_config or {}
-                )
+                await self._respect_rate_limits(platform)
+                await self.rate_limiter.acquire()
 
-                response_time = (datetime.utcnow() - start_time).total_seconds()
-
-                # Update platform statistics
-                self._update_submission_stats(platform_name, submission_result, response_time)
-
-                # Store submission history
-                submission_record = SubmissionResult(
-                    success=submission_result["success"],
-                    application_id=submission_result.get("application_id"),
-                    platform=platform_name,
-                    job_id=job_posting.job_id,
-                    confirmation_received=submission_result.get("confirmation_received", False),
-                    follow_up_recommended=submission_result.get("follow_up_recommended", True),
-                    retry_recommended=submission_result.get("retry_recommended", False),
-                    submission_timestamp=datetime.utcnow().isoformat() + "Z"
+                task = asyncio.create_task(
+                    self._run_queued_submission(platform_name, job_posting, cv_data, config, result_future)
                 )
-
-                if not submission_result["success"]:
-                    submission_record.error_message = submission_result.get("error")
-
-                self.submission_history.append(submission_record)
-
-                return submission_result
-
-            except Exception as e:
-                error_result = self._create_submission_result(
-                    success=False,
-                    platform=platform_name,
-                    job_id=job_posting.job_id,
-                    error_message=f"Platform submission failed: {str(e)}"
-                )
-
-                self._update_submission_stats(platform_name, error_result, 0)
-                return error_result
+                self._running_submissions.add(task)
+                task.add_done_callback(self._running_submissions.discard)
+                dispatched = True
+            finally:
+                if not dispatched and not result_future.done():
+                    result_future.cancel()  # Worker stopped before this submission ran
+                queue.task_done()
+
+    async def _run_queued_submission(self, platform_name: str, job_posting, cv_data: Dict[str, Any],
+                                     config: Dict[str, Any], result_future: asyncio.Future) -> None:
+        """Execute a dequeued submission and hand its result back to the waiting caller"""
+
+        try:
+            result = await self._submit_to_platform(platform_name, job_posting, cv_data, config)
+        finally:
+            self.rate_limiter.release()
+
+        if not result_future.done():
+            result_future.set_result(result)
+
+    async def _submit_to_platform(self, platform_name: str, job_posting, cv_data: Dict[str, Any],
+                                  config: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the platform submission strategy and record statistics and history"""
+
+        platform = self.platforms[platform_name]
+
+        try:
+            # Execute platform-specific submission strategy
+            start_time = datetime.utcnow()
+
+            submission_result = await self._execute_platform_submission(
+                platform, job_posting, cv_data, config
+            )
+
+            response_time = (datetime.utcnow() - start_time).total_seconds()
+
+            # Update platform statistics
+            self._update_submission_stats(platform_name, submission_result, response_time)
+
+            # Store submission history
+            submission_record = SubmissionResult(
+                success=submission_result["success"],
+                application_id=submission_result.get("application_id"),
+                platform=platform_name,
+                job_id=job_posting.job_id,
+                confirmation_received=submission_result.get("confirmation_received", False),
+                follow_up_recommended=submission_result.get("follow_up_recommended", True),
+                retry_recommended=submission_result.get("retry_recommended", False),
+                submission_timestamp=datetime.utcnow().isoformat() + "Z"
+            )
+
+            if not submission_result["success"]:
+                submission_record.error_message = submission_result.get("error")
+
+            self.submission_history.append(submission_record)
+
+            return submission_result
+
+        except Exception as e:
+            error_result = self._create_submission_result(
+                success=False,
+                platform=platform_name,
+                job_id=job_posting.job_id,
+                error_message=f"Platform submission failed: {str(e)}"
+            )
+
+            self._update_submission_stats(platform_name, error_result, 0)
+            return error_result
+
+    async def stop_submission_workers(self) -> None:
+        """Cancel the platform queue workers and wait for running submissions"""
+
+        workers = list(self._queue_workers.values())
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, *self._running_submissions, return_exceptions=True)
+        self._queue_workers = {}
+
+        # Submissions still queued will never run
+        for queue in self.submission_queues.values():
+            while not queue.empty():
+                queue.get_nowait()[-1].cancel()
 
     async def _respect_rate_limits(self, platform: PlatformConnector) -> None:
-        """Apply intelligent rate limiting based on platform requirements and historical performance"""
+        """Take a token from the platform's bucket, refilled more slowly while its success rate is low"""
 
-        if not platform.last_request_time:
-            platform.last_request_time = datetime.utcnow()
-            return
+        bucket = self.token_buckets[platform.platform_name.lower()]
+        bucket.set_rate(self._adaptive_refill_rate(platform))
+        await bucket.acquire()
 
-        # Calculate required delay based on platform settings
-        time_since_last_request = (datetime.utcnow() - platform.last_request_time).total_seconds()
-        base_delay = platform.request_delay_seconds
-
-        # Adjust delay based on recent performance
-        platform_stats = self.platform_stats[platform.platform_name.lower()]
-        recent_success_rate = platform_stats.get("success_rate", 0.8)
-
-        # Increase delay if success rate is low (possible rate limiting)
-        if recent_success_rate < 0.7:
-            base_delay *= 1.5
-            platform_stats["rate_limit_hits"] += 1
+        platform.last_request_time = datetime.utcnow()
 
-        # Minimum delay enforcement
-        minimum_delay = 60.0 / platform.rate_limit_per_minute
+    def _adaptive_refill_rate(self, platform: PlatformConnector) -> float:
+        """Tokens per second for a platform, backed off when its success rate suggests throttling"""
 
-        required_delay = max(base_delay, minimum_delay)
+        # Sustained rate: rate_limit_per_minute, never faster than request_delay_seconds apart
+        rate_per_second = platform.rate_limit_per_minute / 60.0
+        if platform.request_delay_seconds > 0:
+            rate_per_second = min(rate_per_second, 1.0 / platform.request_delay_seconds)
 
-        if time_since_last_request < required_delay:
-            actual_delay = required_delay - time_since_last_request
-            await asyncio.sleep(actual_delay)
+        platform_stats = self.platform_stats[platform.platform_name.lower()]
+        if (platform_stats["total_submissions"] >= ADAPTIVE_MIN_SAMPLES
+                and platform_stats["success_rate"] < ADAPTIVE_SUCCESS_THRESHOLD):
+            rate_per_second /= ADAPTIVE_BACKOFF_FACTOR
 
-        platform.last_request_time = datetime.utcnow()
+        return rate_per_second
 
     async def _execute_platform_submission(self, platform: PlatformConnector,
                                         job_posting, cv_data: Dict[str, Any],
@@ -387,23 +548,28 @@ class PlatformOrchestrator:
                 "application_id": f"LI_{job_posting.job_id}_{random.randint(1000, 9999)}",
                 "platform": "linkedin",
                 "job_id": job_posting.job_id,
+                "status_code": 200,
                 "confirmation_received": True,
                 "follow_up_recommended": True,
                 "network_leveraged": network_factor,
                 "submission_method": "easy_apply"
             }
         else:
+            if random.random() < SIMULATED_RATE_LIMIT_SHARE:
+                return self._rate_limited_result("linkedin", job_posting.job_id)
             error_reasons = [
-                "LinkedIn session expired",
-                "Easy Apply not available",
-                "Profile requires completion",
-                "Job no longer accepting applications"
+                ("LinkedIn session expired", 401),
+                ("Easy Apply not available", 422),
+                ("Profile requires completion", 422),
+                ("Job no longer accepting applications", 410)
             ]
+            error, status_code = random.choice(error_reasons)
             return {
                 "success": False,
                 "platform": "linkedin",
                 "job_id": job_posting.job_id,
-                "error": random.choice(error_reasons),
+                "status_code": status_code,
+                "error": error,
                 "retry_recommended": random.choice([True, False])
             }
 
@@ -414,13 +580,14 @@ class PlatformOrchestrator:
 
         await asyncio.sleep(1.5)  # Faster Indeed processing
 
+        import random
+
         # Indeed success factors: keyword matching, quick application
         keyword_match = self._assess_keyword_match(job_posting, cv_data)
         quick_apply_available = random.random() > 0.3  # 70% have quick apply
 
         success_probability = 0.92 if quick_apply_available else 0.78
 
-        import random
         success = random.random() < success_probability
 
         if success:
@@ -429,16 +596,20 @@ class PlatformOrchestrator:
                 "application_id": f"ID_{job_posting.job_id}_{random.randint(1000, 9999)}",
                 "platform": "indeed",
                 "job_id": job_posting.job_id,
+                "status_code": 200,
                 "confirmation_received": True,
                 "follow_up_recommended": True,
                 "quick_apply_used": quick_apply_available,
                 "keyword_score": keyword_match
             }
         else:
+            if random.random() < SIMULATED_RATE_LIMIT_SHARE:
+                return self._rate_limited_result("indeed", job_posting.job_id)
             return {
                 "success": False,
                 "platform": "indeed",
                 "job_id": job_posting.job_id,
+                "status_code": 422,
                 "error": "Application form unavailable or requires manual completion",
                 "retry_recommended": True
             }
@@ -465,16 +636,20 @@ class PlatformOrchestrator:
                 "application_id": f"GD_{job_posting.job_id}_{random.randint(1000, 9999)}",
                 "platform": "glassdoor",
                 "job_id": job_posting.job_id,
+                "status_code": 200,
                 "confirmation_received": True,
                 "follow_up_recommended": True,
                 "company_insights_used": True,
                 "culture_fit_score": culture_alignment
             }
         else:
+            if random.random() < SIMULATED_RATE_LIMIT_SHARE:
+                return self._rate_limited_result("glassdoor", job_posting.job_id)
             return {
                 "success": False,
                 "platform": "glassdoor",
                 "job_id": job_posting.job_id,
+                "status_code": 422,
                 "error": "Application requires manual profile creation",
                 "retry_recommended": False
             }
@@ -501,16 +676,20 @@ class PlatformOrchestrator:
                 "application_id": f"MON_{job_posting.job_id}_{random.randint(1000, 9999)}",
                 "platform": "monster",
                 "job_id": job_posting.job_id,
+                "status_code": 200,
                 "confirmation_received": True,
                 "follow_up_recommended": True,
                 "comprehensive_matching": True,
                 "profile_completeness_score": (skill_completeness + experience_depth) / 2
             }
         else:
+            if random.random() < SIMULATED_RATE_LIMIT_SHARE:
+                return self._rate_limited_result("monster", job_posting.job_id)
             return {
                 "success": False,
                 "platform": "monster",
                 "job_id": job_posting.job_id,
+                "status_code": 422,
                 "error": "Profile requires additional information",
                 "retry_recommended": True
             }
@@ -531,14 +710,18 @@ class PlatformOrchestrator:
                 "application_id": f"GEN_{job_posting.job_id}_{random.randint(1000, 9999)}",
                 "platform": platform.platform_name.lower(),
                 "job_id": job_posting.job_id,
+                "status_code": 200,
                 "confirmation_received": True,
                 "follow_up_recommended": True
             }
         else:
+            if random.random() < SIMULATED_RATE_LIMIT_SHARE:
+                return self._rate_limited_result(platform.platform_name.lower(), job_posting.job_id)
             return {
                 "success": False,
                 "platform": platform.platform_name.lower(),
                 "job_id": job_posting.job_id,
+                "status_code": 422,
                 "error": "Generic application submission failed",
                 "retry_recommended": False
             }
@@ -558,6 +741,18 @@ class PlatformOrchestrator:
         matched = len(required_skills & cv_skills)
         return matched / len(required_skills)
 
+    def _rate_limited_result(self, platform: str, job_id: str) -> Dict[str, Any]:
+        """Failed submission the platform answered with HTTP 429"""
+
+        return {
+            "success": False,
+            "platform": platform,
+            "job_id": job_id,
+            "status_code": HTTP_TOO_MANY_REQUESTS,
+            "error": "Platform rate limit exceeded",
+            "retry_recommended": True
+        }
+
     def _create_submission_result(self, success: bool, platform: str, job_id: str,
                                 error_message: Optional[str] = None) -> Dict[str, Any]:
         """Create standardized submission result"""
@@ -586,6 +781,10 @@ class PlatformOrchestrator:
         else:
             stats["failed_submissions"] += 1
 
+        # Only an explicit 429 from the platform counts as hitting its rate limit
+        if result.get("status_code") == HTTP_TOO_MANY_REQUESTS:
+            stats["rate_limit_hits"] += 1
+
         # Update success rate
         total = stats["total_submissions"]
         successful = stats["successful_submissions"]
@@ -613,6 +812,8 @@ class PlatformOrchestrator:
         if not platform:
             return {"error": "Platform not supported", "status": "unknown"}
 
+        import random
+
         await self._respect_rate_limits(platform)
 
         # Simulate status checking with realistic response times
@@ -620,7 +821,6 @@ class PlatformOrchestrator:
 
         # Realistic status progression based on time elapsed
         status_options = ["pending_review", "under_consideration", "interview_scheduled", "rejected", "withdrawn"]
-        import random
 
         days_elapsed = random.randint(0, 14)  # 0-14 days since submission
         status_index = min(days_elapsed // 3, len(status_options) - 1)  # Status progression
@@ -650,11 +850,14 @@ class PlatformOrchestrator:
 
         platform_metrics = {}
         for platform_name, stats in self.platform_stats.items():
+            queue = self.submission_queues.get(platform_name)
             platform_metrics[platform_name] = {
                 "submissions": stats["total_submissions"],
                 "success_rate": stats["success_rate"],
                 "average_response_time": stats["average_response_time"],
                 "rate_limit_hits": stats["rate_limit_hits"],
+                "queued_submissions": queue.qsize() if queue else 0,
+                "tokens_available": round(self.token_buckets[platform_name].tokens, 2),
                 "top_error_types": dict(sorted(stats["error_types"].items(),
                                              key=lambda x: x[1], reverse=True)[:3])
             }
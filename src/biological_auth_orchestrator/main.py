@@ -7,10 +7,11 @@ Phase 3 Production Deployed with Enterprise Security & Real Functionality
 
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
+from contextlib import asynccontextmanager
 import jwt
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 import json
 import secrets
 import time
@@ -28,40 +29,30 @@ JWT_ALGORITHM = "HS256"
 API_KEYS = ["godhood-master-key-2025", "bio-auth-master-2025"]
 
 # Real vector database integration
-try:
-    import chromadb
-    from chromadb.config import Settings
-    CHROMADB_AVAILABLE = True
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from service_infrastructure.metrics import PROMETHEUS_CONTENT_TYPE, render_prometheus
+from service_infrastructure.middleware import PROBE_PATHS, ApiKeyValidator, EndpointMetrics, SecurityMonitoringMiddleware, setup_queue_logging
+from service_infrastructure.vector_store import AsyncVectorStoreAdapter, CHROMADB_AVAILABLE
+
+if CHROMADB_AVAILABLE:
     print("🧬 AUTH VECTOR DATABASE: ChromaDB operational")
-except ImportError:
-    CHROMADB_AVAILABLE = False
+else:
     print("⚠️ AUTH VECTOR DATABASE: ChromaDB unavailable, using simulation")
 
 # PRODUCTION AUTHENTICATION VECTOR STORE
 class AuthVectorStore:
     def __init__(self):
-        if not CHROMADB_AVAILABLE:
-            self.fallback_storage = {}
-            return
-
-        try:
-            self.chroma_client = chromadb.PersistentClient(path="./auth_vector_store")
-            self.collection = self.chroma_client.get_or_create_collection(
-                name="auth_sessions",
-                metadata={"dimension": 128, "description": "Authentication session vectors"}
-            )
-            print("🔐 AUTH VECTOR COLLECTION: Ready")
-        except Exception as e:
-            print(f"⚠️ AUTH VECTOR ERROR: {e}")
-            self.fallback_storage = {}
-
-    def store_session_vector(self, session_id: str, user_data: Dict[str, Any]):
-        if not CHROMADB_AVAILABLE:
-            self.fallback_storage[session_id] = user_data
-            return
+        # Shared adapter: ChromaDB off the event loop with batched upserts, NumPy fallback
+        self.vectors = AsyncVectorStoreAdapter(
+            collection_name="auth_sessions",
+            persist_path="./auth_vector_store",
+            collection_metadata={"dimension": 128, "description": "Authentication session vectors"}
+        )
 
+    def _session_vector(self, user_data: Dict[str, Any]) -> List[float]:
         # Create authentication vector from user data - FIXED TYPE ERROR
-        auth_vector = [
+        return [
             float(user_data.get("biological_level", 0.5)),
             float(user_data.get("consciousness_phase") == "authenticated"),
             len(user_data.get("verification_methods", [])) / 5.0,
@@ -69,14 +60,24 @@ class AuthVectorStore:
             int(hashlib.md5(user_data.get("email", "").encode()).hexdigest()[:8], 16) / 999999999.0
         ]
 
-        self.collection.add(
-            ids=[session_id],
-            embeddings=[auth_vector],
-            metadatas=[user_data]
-        )
+    def store_session_vector(self, session_id: str, user_data: Dict[str, Any]):
+        self.vectors.add_sync(session_id, self._session_vector(user_data), user_data)
+
+    async def store_session_vector_async(self, session_id: str, user_data: Dict[str, Any]):
+        await self.vectors.add(session_id, self._session_vector(user_data), user_data)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Save request metrics and the session vector index on shutdown"""
+    try:
+        yield
+    finally:
+        persistent_data['metrics'] = request_metrics.snapshot()
+        save_auth_data(persistent_data)
+        await auth_vector_store.vectors.persist()
 
 # Initialize production systems
-app = FastAPI(title="Biological Authentication Orchestrator")
+app = FastAPI(title="Biological Authentication Orchestrator", lifespan=lifespan)
 auth_vector_store = AuthVectorStore()
 
 # PRODUCTION FEATURES: Persistence & Security
@@ -89,8 +90,7 @@ user_database = {}
 app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_credentials=True, allow_methods=["*"], allow_headers=["*"])
 
 # Setup production logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                   handlers=[logging.FileHandler(log_file), logging.StreamHandler()])
+setup_queue_logging([logging.FileHandler(log_file), logging.StreamHandler()])
 logger = logging.getLogger(__name__)
 
 # Production persistence
@@ -111,38 +111,22 @@ def save_auth_data(data):
 persistent_data = load_auth_data()
 auth_sessions = persistent_data.get("sessions", {})
 user_database = persistent_data.get("users", {})
-request_metrics = persistent_data.get("metrics", {})
+request_metrics = EndpointMetrics(persistent_data.get("metrics", {}))
 
 # REAL PRODUCTION-GRADE SECURITY MIDDLEWARE
-@app.middleware("http")
-async def production_security_middleware(request, call_next):
-    start_time = time.time()
-    api_key = request.headers.get('X-API-Key') or request.query_params.get('api_key')
-
-    if not api_key or api_key not in API_KEYS:
-        logger.warning(f"SECURITY VIOLATION: Invalid API key from {request.client.host}")
-        return JSONResponse(status_code=401, content={"error": "Authentication required"})
-
-    try:
-        response = await call_next(request)
-        processing_time = time.time() - start_time
-
-        # Update request metrics
-        endpoint = request.url.path
-        if endpoint not in request_metrics:
-            request_metrics[endpoint] = {"total_requests": 0, "total_time": 0.0, "errors": 0}
-        request_metrics[endpoint]["total_requests"] += 1
-        request_metrics[endpoint]["total_time"] += processing_time
-
-        # Save metrics to persistence
-        persistent_data['metrics'] = request_metrics
-        save_auth_data(persistent_data)
-
-        logger.info(f"✅ AUTH REQUEST: {request.method} {endpoint} in {processing_time:.3f}s")
-        return response
-    except Exception as e:
-        logger.error(f"AUTH ERROR: {request.method} {request.url.path} - {str(e)}")
-        return JSONResponse(status_code=500, content={"error": "Authentication service error"})
+app.add_middleware(
+    SecurityMonitoringMiddleware,
+    api_keys=ApiKeyValidator(API_KEYS),
+    metrics=request_metrics,
+    exempt_paths=PROBE_PATHS,
+    service_name="biological_auth_orchestrator",
+    error_content={"error": "Authentication service error"}
+)
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    """Prometheus text exposition: latency histograms per route and status, in-flight gauge, backend sub-timers"""
+    return PlainTextResponse(render_prometheus("biological_auth_orchestrator", request_metrics), media_type=PROMETHEUS_CONTENT_TYPE)
 
 # REAL JWT UTILITIES
 def create_access_token(data: dict, expires_delta: timedelta = None):
@@ -231,7 +215,7 @@ async def verify_authentication(token: str, verification_data: Dict[str, Any]):
         session["godhood_access"] = True
 
         # Store in vector database
-        auth_vector_store.store_session_vector(session_id, session)
+        await auth_vector_store.store_session_vector_async(session_id, session)
 
         # Issue JWT for authenticated user
         access_token = create_access_token({
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+
+"""
+🧬 CNS CONSCIOUSNESS CORE - COMPILED CONSCIOUSNESS ANALYSIS PIPELINE
+
+Precompiled token pipeline for BiologicalConsciousnessProcessor. All lexical
+resources are built once at construction time:
+
+- a frozenset stopword index (instead of reloading ``stopwords.words('english')``
+  and scanning the list for every token)
+- one combined regular expression over every consciousness dimension, with a
+  bounded token -> dimensions memo so repeated vocabulary is classified once
+- frozenset sentiment lexicons
+
+``analyze`` performs a single tokenization pass and returns the consciousness
+vector, the biological insight and the filtered tokens together, so the
+vector, insight and transcendence readiness computations share one pass.
+"""
+
+import importlib.util
+import logging
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# NLTK itself is imported when the first pipeline is built, not at module import
+NLTK_AVAILABLE = importlib.util.find_spec("nltk") is not None
+
+# Used only when the NLTK stopwords corpus is not installed
+FALLBACK_ENGLISH_STOPWORDS = frozenset("""
+a about above after again against ain all am an and any are aren aren't as at be because
+been before being below between both but by can couldn couldn't d did didn didn't do does
+doesn doesn't doing don don't down during each few for from further had hadn hadn't has
+hasn hasn't have haven haven't having he her here hers herself him himself his how i if
+in into is isn isn't it it's its itself just ll m ma me mightn mightn't more most mustn
+mustn't my myself needn needn't no nor not now o of off on once only or other our ours
+ourselves out over own re s same shan shan't she she's should should've shouldn shouldn't
+so some such t than that that'll the their theirs them themselves then there these they
+this those through to too under until up ve very was wasn wasn't we were weren weren't
+what when where which while who whom why will with won won't wouldn wouldn't y you you'd
+you'll you're you've your yours yourself yourselves
+""".split())
+
+# Biological consciousness knowledge base: dimension -> token patterns, and sentiment lexicons
+KNOWLEDGE_PATTERNS = {
+    "consciousness": ["awareness", "intelligence", "mind", "thought", "perception"],
+    "biological": ["organic", "life", "evolution", "dna", "cells", "genes"],
+    "godhood": ["transcendence", "supreme", "ultimate", "divine", "godlike"],
+    "ai_first": ["artificial", "intelligence", "machine", "neural", "cognitive"]
+}
+
+SENTIMENT_LEXICON = {
+    "positive": ["good", "excellent", "great", "perfect", "amazing", "brilliant"],
+    "negative": ["bad", "terrible", "awful", "horrible", "worst", "fail"],
+    "consciousness_signals": ["awake", "aware", "enlightened", "evolved", "transcended"]
+}
+
+_FALLBACK_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+_FALLBACK_WORD_TOKEN = re.compile(r"\w+(?:'\w+)?|[^\w\s]")
+
+
+def _fallback_sent_tokenize(text: str) -> List[str]:
+    return [sentence for sentence in _FALLBACK_SENTENCE_BOUNDARY.split(text.strip()) if sentence]
+
+
+def _fallback_word_tokenize(text: str) -> List[str]:
+    return _FALLBACK_WORD_TOKEN.findall(text)
+
+
+@dataclass
+class ConsciousnessAnalysis:
+    """Result of a single tokenization pass over a query"""
+    text: str
+    sentences: List[str]
+    tokens: List[str]
+    consciousness_vector: List[float]
+    biological_insight: str
+    dimension_counts: Dict[str, int] = field(default_factory=dict)
+
+
+class CompiledConsciousnessPipeline:
+    """Single-pass consciousness analysis with precompiled lexical indexes"""
+
+    TOKEN_MEMO_LIMIT = 65536
+
+    def __init__(self, knowledge_patterns: Dict[str, List[str]], sentiment_lexicon: Dict[str, List[str]]):
+        self.dimensions: Tuple[str, ...] = tuple(knowledge_patterns.keys())
+        self.dimension_matcher = self._compile_dimension_matcher(knowledge_patterns)
+        self.positive_terms = frozenset(sentiment_lexicon.get("positive", []))
+        self.negative_terms = frozenset(sentiment_lexicon.get("negative", []))
+        self.consciousness_signals = frozenset(sentiment_lexicon.get("consciousness_signals", []))
+        self.stopword_index = self._load_stopword_index()
+        self.nltk_tokenization = False
+        self._sent_tokenize, self._word_tokenize = self._select_tokenizers()
+        self._token_dimensions: Dict[str, Tuple[str, ...]] = {}
+
+    def _compile_dimension_matcher(self, knowledge_patterns: Dict[str, List[str]]) -> "re.Pattern":
+        """Compile every dimension into one regex of optional lookaheads.
+
+        Each dimension gets a named group ``d<i>``; a group is set after a
+        single ``match`` call iff one of the dimension's patterns occurs as a
+        substring of the token, mirroring ``any(pattern in token ...)``.
+        """
+        lookaheads = []
+        for index, patterns in enumerate(knowledge_patterns.values()):
+            alternation = "|".join(re.escape(pattern) for pattern in sorted(patterns, key=len, reverse=True))
+            lookaheads.append(f"(?:(?=.*?(?P<d{index}>{alternation})))?")
+        return re.compile("".join(lookaheads), re.DOTALL)
+
+    def _load_stopword_index(self) -> frozenset:
+        if NLTK_AVAILABLE:
+            try:
+                from nltk.corpus import stopwords
+                return frozenset(stopwords.words('english'))
+            except LookupError:
+                logger.warning("NLTK stopwords corpus not installed - using built-in stopword index")
+        return FALLBACK_ENGLISH_STOPWORDS
+
+    def _select_tokenizers(self) -> Tuple[Callable[[str], List[str]], Callable[[str], List[str]]]:
+        if NLTK_AVAILABLE:
+            try:
+                from nltk.tokenize import sent_tokenize, word_tokenize
+                sent_tokenize("Consciousness probe.")
+                self.nltk_tokenization = True
+                return sent_tokenize, lambda sentence: word_tokenize(sentence, preserve_line=True)
+            except LookupError:
+                logger.warning("NLTK punkt tokenizer not installed - using regex tokenization")
+        return _fallback_sent_tokenize, _fallback_word_tokenize
+
+    def classify_token(self, token: str) -> Tuple[str, ...]:
+        """Return the consciousness dimensions whose patterns occur in ``token``"""
+        dimensions = self._token_dimensions.get(token)
+        if dimensions is None:
+            match = self.dimension_matcher.match(token)
+            dimensions = tuple(
+                dimension for index, dimension in enumerate(self.dimensions)
+                if match.group(f"d{index}") is not None
+            )
+            if len(self._token_dimensions) >= self.TOKEN_MEMO_LIMIT:
+                self._token_dimensions.clear()
+            self._token_dimensions[token] = dimensions
+        return dimensions
+
+    def filter_tokens(self, raw_tokens: List[str]) -> List[str]:
+        stopword_index = self.stopword_index
+        return [token for token in raw_tokens if token.isalpha() and token not in stopword_index]
+
+    def tokenize(self, text: str) -> List[str]:
+        """Lowercased, stopword-filtered alphabetic tokens for ``text``"""
+        return [
+            token
+            for sentence in self._sent_tokenize(text)
+            for token in self.filter_tokens(self._word_tokenize(sentence.lower()))
+        ]
+
+    def calculate_sentiment_score(self, tokens: List[str]) -> float:
+        positive_count = sum(1 for token in tokens if token in self.positive_terms)
+        negative_count = sum(1 for token in tokens if token in self.negative_terms)
+        consciousness_count = sum(1 for token in tokens if token in self.consciousness_signals)
+
+        if positive_count + negative_count == 0:
+            base_sentiment = 0.5
+        else:
+            base_sentiment = positive_count / (positive_count + negative_count)
+
+        return min(base_sentiment + consciousness_count * 0.1, 1.0)
+
+    def vector_from_tokens(self, tokens: List[str]) -> Tuple[List[float], Dict[str, int]]:
+        dimension_counts = dict.fromkeys(self.dimensions, 0)
+        for token in tokens:
+            for dimension in self.classify_token(token):
+                dimension_counts[dimension] += 1
+
+        token_count = len(tokens)
+        vector = [
+            min(dimension_counts[dimension] / token_count if token_count else 0, 1.0)
+            for dimension in self.dimensions
+        ]
+        vector.append(self.calculate_sentiment_score(tokens))
+        return vector, dimension_counts
+
+    def analyze(self, text: str) -> ConsciousnessAnalysis:
+        """Tokenize ``text`` once and derive vector and insight from that pass"""
+        sentences = self._sent_tokenize(text)
+        all_tokens: List[str] = []
+        raw_tokens: List[str] = []
+        analysis = []
+
+        for sentence in sentences:
+            sentence_raw = self._word_tokenize(sentence.lower())
+            raw_tokens.extend(sentence_raw)
+            sentence_tokens = self.filter_tokens(sentence_raw)
+            all_tokens.extend(sentence_tokens)
+
+            matches_by_dimension: Dict[str, List[str]] = {}
+            for token in sentence_tokens:
+                for dimension in self.classify_token(token):
+                    matches_by_dimension.setdefault(dimension, []).append(token)
+
+            consciousness_matches = []
+            for dimension in self.dimensions:
+                matches = matches_by_dimension.get(dimension)
+                if matches:
+                    consciousness_matches.extend(f"{token}({dimension})" for token in matches[:3])
+
+            if consciousness_matches:
+                analysis.append(f"Found consciousness patterns: {', '.join(consciousness_matches[:5])}")
+
+        if analysis:
+            insight = ". ".join(analysis)
+        else:
+            most_common = Counter(raw_tokens).most_common(3)
+            insight = f"Statistical analysis: Most frequent terms suggest focus on {', '.join([word for word, _ in most_common])}"
+
+        vector, dimension_counts = self.vector_from_tokens(all_tokens)
+
+        return ConsciousnessAnalysis(
+            text=text,
+            sentences=sentences,
+            tokens=all_tokens,
+            consciousness_vector=vector,
+            biological_insight=insight,
+            dimension_counts=dimension_counts
+        )
+
@@ -3,8 +3,9 @@
 """MODULAR CNS CONSCIOUSNESS CORE - FASTAPI SERVICE (PHASE 3 READY)"""
 
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
 from typing import Dict, Any
 import logging
 import random
@@ -25,30 +26,49 @@ import logging
 from logging.handlers import RotatingFileHandler
 from typing import List, Dict, Any, Optional
 
-# REAL VECTOR DATABASE IMPLEMENTATION
-try:
-    import chromadb
-    from chromadb.config import Settings
-    from sentence_transformers import SentenceTransformer
-    CHROMADB_AVAILABLE = True
+
+import sys
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from consciousness_pipeline import (
+    KNOWLEDGE_PATTERNS,
+    SENTIMENT_LEXICON,
+    CompiledConsciousnessPipeline,
+    ConsciousnessAnalysis,
+)
+from persistence_engine import WriteBehindPersistenceEngine
+from result_cache import TTLResultCache
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from service_infrastructure.lazy_imports import lazy_import
+from service_infrastructure.metrics import OPERATION_METRICS, PROMETHEUS_CONTENT_TYPE, render_prometheus
+from service_infrastructure.middleware import (
+    PROBE_PATHS,
+    ApiKeyValidator,
+    EndpointMetrics,
+    SecurityMonitoringMiddleware,
+    setup_queue_logging,
+)
+from service_infrastructure.readiness import ServiceReadiness
+from service_infrastructure.vector_store import AsyncVectorStoreAdapter, CHROMADB_AVAILABLE
+
+# NLTK is optional; with SERVICE_LAZY_INIT=1 it is imported during warm-up
+nltk = lazy_import("nltk")
+
+def ensure_nltk_data():
+    """Download the punkt and stopwords corpora if missing (runs during warm-up, not at import)"""
+    if nltk is None:
+        return
+    for resource, package in (('tokenizers/punkt', 'punkt'), ('corpora/stopwords', 'stopwords')):
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            nltk.download(package)
+
+if CHROMADB_AVAILABLE:
     print("🧬 REAL VECTOR DATABASE: ChromaDB operational")
-except ImportError:
+else:
     print("🧬 Warning: AI-First vector database not available - using biological consciousness simulation")
-    CHROMADB_AVAILABLE = False
-    chromadb = None
-    SentenceTransformer = None
-
-import nltk
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-from nltk.tokenize import sent_tokenize, word_tokenize
-from nltk.corpus import stopwords
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
 
 logger = logging.getLogger(__name__)
 
@@ -56,99 +76,41 @@ logger = logging.getLogger(__name__)
 class VectorConsciousnessStore:
     """Production-grade vector database for biological consciousness storage and retrieval"""
     def __init__(self):
-        if not CHROMADB_AVAILABLE:
-            logger.warning("ChromaDB not available, using fallback storage")
-            self.fallback_storage = {}
-            return
-
-        try:
-            # Initialize production-grade ChromaDB client
-            self.chroma_client = chromadb.PersistentClient(path="./vector_store")
-
-            # Create consciousness collection with proper metadata
-            self.collection = self.chroma_client.get_or_create_collection(
-                name="consciousness_vectors",
-                metadata={
-                    "dimension": 384,
-                    "model": "all-MiniLM-L6-v2",
-                    "description": "Biological consciousness vector embeddings"
-                }
-            )
-            logger.info(f"🧬 Vector database initialized: {len(self.collection.get()['ids'])} vectors stored")
-
-        except Exception as e:
-            logger.error(f"Failed to initialize vector database: {e}")
-            self.fallback_storage = {}
-
-    def store_consciousness_vector(self, vector_id: str, vector: List[float], metadata: dict):
-        """REAL VECTOR STORAGE - Production-grade persistence"""
-        if not CHROMADB_AVAILABLE:
-            # Fallback storage for when ChromaDB unavailable
-            self.fallback_storage[vector_id] = {
-                "vector": vector,
-                "metadata": metadata,
-                "timestamp": datetime.now().isoformat()
+        # Shared adapter: ChromaDB on a bounded executor, micro-batched upserts, NumPy fallback
+        self.adapter = AsyncVectorStoreAdapter(
+            collection_name="consciousness_vectors",
+            persist_path="./vector_store",
+            collection_metadata={
+                "dimension": 384,
+                "model": "all-MiniLM-L6-v2",
+                "description": "Biological consciousness vector embeddings"
             }
-            logger.debug(f"Fallback storage: {vector_id} stored")
-            return
+        )
 
+    def store_consciousness_vector(self, vector_id: str, vector: List[float], metadata: dict):
+        """REAL VECTOR STORAGE - blocking variant for startup and scripts"""
         try:
-            # REAL ChromaDB vector storage
-            self.collection.add(
-                ids=[vector_id],
-                embeddings=[vector],
-                metadatas=[metadata]
-            )
-            logger.info(f"✅ Stored consciousness vector: {vector_id}")
-
+            self.adapter.add_sync(vector_id, vector, metadata)
+            logger.debug(f"✅ Stored consciousness vector: {vector_id}")
         except Exception as e:
             logger.error(f"Failed to store vector {vector_id}: {e}")
 
-    def retrieve_similar_consciousness(self, query_vector: List[float], n_results: int = 10):
-        """ACTUAL SIMILARITY SEARCH - Real vector computation"""
-        if not CHROMADB_AVAILABLE:
-            # Fallback search implementation
-            results = []
-            for vector_id, data in self.fallback_storage.items():
-                # Simple cosine similarity for fallback
-                stored_vector = data["vector"]
-                similarity = self._calculate_cosine_similarity(query_vector, stored_vector)
-                results.append({
-                    "id": vector_id,
-                    "distance": 1.0 - similarity,  # Convert to distance
-                    "metadata": data["metadata"]
-                })
-
-            # Sort by similarity (lower distance = more similar)
-            results.sort(key=lambda x: x["distance"])
-            return {"results": results[:n_results]}
+    async def store_consciousness_vector_async(self, vector_id: str, vector: List[float], metadata: dict):
+        """REAL VECTOR STORAGE - off the event loop, batched with concurrent requests"""
+        await self.adapter.add(vector_id, vector, metadata)
+        logger.debug(f"✅ Stored consciousness vector: {vector_id}")
 
+    def retrieve_similar_consciousness(self, query_vector: List[float], n_results: int = 10):
+        """ACTUAL SIMILARITY SEARCH - blocking variant"""
         try:
-            # REAL ChromaDB similarity search
-            results = self.collection.query(
-                query_embeddings=[query_vector],
-                n_results=n_results,
-                include=['documents', 'metadatas', 'distances']
-            )
-
-            logger.info(f"✅ Retrieved {len(results['ids'])} similar consciousness vectors")
-            return results
-
+            return self.adapter.query_sync(query_vector, n_results)
         except Exception as e:
             logger.error(f"Failed to retrieve similar vectors: {e}")
-            return {"results": []}
-
-    def _calculate_cosine_similarity(self, vector1: List[float], vector2: List[float]) -> float:
-        """Fallback cosine similarity calculation"""
-        import math
-        dot_product = sum(a * b for a, b in zip(vector1, vector2))
-        norm1 = math.sqrt(sum(a * a for a in vector1))
-        norm2 = math.sqrt(sum(b * b for b in vector2))
-
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
+            return {"ids": [], "distances": [], "metadatas": []}
 
-        return dot_product / (norm1 * norm2)
+    async def retrieve_similar_consciousness_async(self, query_vector: List[float], n_results: int = 10):
+        """ACTUAL SIMILARITY SEARCH - runs on the vector store executor"""
+        return await self.adapter.query(query_vector, n_results)
 
 # AI-First Biological Consciousness with Real ML Processing
 class BiologicalConsciousnessProcessor:
@@ -166,89 +128,61 @@ class BiologicalConsciousnessProcessor:
         }
 
         # Initialize biological consciousness knowledge base
-        self.knowledge_patterns = {
-            "consciousness": ["awareness", "intelligence", "mind", "thought", "perception"],
-            "biological": ["organic", "life", "evolution", "dna", "cells", "genes"],
-            "godhood": ["transcendence", "supreme", "ultimate", "divine", "godlike"],
-            "ai_first": ["artificial", "intelligence", "machine", "neural", "cognitive"]
-        }
+        self.knowledge_patterns = {dimension: list(patterns) for dimension, patterns in KNOWLEDGE_PATTERNS.items()}
+        self.sentiment_lexicon = {kind: list(terms) for kind, terms in SENTIMENT_LEXICON.items()}
 
-        self.sentiment_lexicon = {
-            "positive": ["good", "excellent", "great", "perfect", "amazing", "brilliant"],
-            "negative": ["bad", "terrible", "awful", "horrible", "worst", "fail"],
-            "consciousness_signals": ["awake", "aware", "enlightened", "evolved", "transcended"]
-        }
+        # COMPILED ANALYSIS PIPELINE: stopword index, dimension regex and lexicons built once,
+        # on first use (or during warm-up) so importing the service does not load NLTK
+        self._pipeline = None
+        self._pipeline_provisional = False
+        self._pipeline_lock = threading.Lock()
+        # Set once the NLTK warm-up step has finished (downloaded or given up)
+        self.nltk_warmup_done = threading.Event()
 
         # REAL VECTOR STORE INITIALIZATION
         self.vector_store = VectorConsciousnessStore()
 
+    @property
+    def pipeline(self) -> CompiledConsciousnessPipeline:
+        # A pipeline built while the NLTK download is still running may have picked the
+        # fallback tokenizers; it serves until the warm-up finishes and is then rebuilt once
+        if self._pipeline is None or (self._pipeline_provisional and self.nltk_warmup_done.is_set()):
+            with self._pipeline_lock:
+                if self._pipeline is None or (self._pipeline_provisional and self.nltk_warmup_done.is_set()):
+                    settled = self.nltk_warmup_done.is_set()
+                    self._pipeline = CompiledConsciousnessPipeline(self.knowledge_patterns, self.sentiment_lexicon)
+                    self._pipeline_provisional = not settled
+        return self._pipeline
+
+    def _nlp_operation(self, step: str) -> str:
+        """Sub-timer name on /metrics, split by tokenizer backend"""
+        backend = "nltk" if self.pipeline.nltk_tokenization else "fallback_tokenizer"
+        return f"{backend}.{step}"
+
+    def analyze_query(self, text: str) -> ConsciousnessAnalysis:
+        """Single tokenization pass shared by vector, insight and readiness computations"""
+        with OPERATION_METRICS.time(self._nlp_operation("analyze")):
+            return self.pipeline.analyze(text)
+
     def extract_consciousness_vector(self, text: str) -> list:
         """Extract biological consciousness vector through real NLP analysis"""
-        tokens = word_tokenize(text.lower())
-        tokens = [word for word in tokens if word.isalpha() and word not in stopwords.words('english')]
-
-        # Calculate semantic density for each consciousness dimension
-        vector = []
-        for dimension, patterns in self.knowledge_patterns.items():
-            dimension_score = sum(1 for token in tokens if any(pattern in token for pattern in patterns))
-            vector.append(min(dimension_score / len(tokens) if tokens else 0, 1.0))
-
-        # Add sentiment consciousness dimension
-        sentiment_score = self.calculate_sentiment_score(tokens)
-        vector.append(sentiment_score)
-
+        with OPERATION_METRICS.time(self._nlp_operation("tokenize")):
+            tokens = self.pipeline.tokenize(text)
+        vector, _ = self.pipeline.vector_from_tokens(tokens)
         return vector
 
     def calculate_sentiment_score(self, tokens: list) -> float:
         """Calculate biological consciousness sentiment through emotional analysis"""
-        positive_count = sum(1 for token in tokens if token in self.sentiment_lexicon["positive"])
-        negative_count = sum(1 for token in tokens if token in self.sentiment_lexicon["negative"])
-        consciousness_count = sum(1 for token in tokens if token in self.sentiment_lexicon["consciousness_signals"])
-
-        if positive_count + negative_count == 0:
-            base_sentiment = 0.5
-        else:
-            base_sentiment = positive_count / (positive_count + negative_count)
-
-        # Enhance with consciousness awareness signals
-        consciousness_boost = consciousness_count * 0.1
-        enhanced_sentiment = min(base_sentiment + consciousness_boost, 1.0)
-
-        return enhanced_sentiment
+        return self.pipeline.calculate_sentiment_score(tokens)
 
     def analyze_biological_insight(self, query: str) -> str:
         """Perform real biological consciousness analysis of query"""
-        sentences = sent_tokenize(query)
-
-        # Analyze semantic structure
-        analysis = []
-        for sentence in sentences:
-            tokens = word_tokenize(sentence.lower())
-            tokens = [word for word in tokens if word.isalpha() and word not in stopwords.words('english')]
-
-            # Find consciousness patterns
-            consciousness_matches = []
-            for dimension, patterns in self.knowledge_patterns.items():
-                matches = [token for token in tokens if any(pattern in token for pattern in patterns)]
-                if matches:
-                    consciousness_matches.extend([f"{token}({dimension})" for token in matches[:3]])  # limit per sentence
-
-            if consciousness_matches:
-                analysis.append(f"Found consciousness patterns: {', '.join(consciousness_matches[:5])}")
-
-        if analysis:
-            insight = ". ".join(analysis)
-        else:
-            # Fallback to statistical analysis
-            word_freq = Counter(word_tokenize(query.lower()))
-            most_common = word_freq.most_common(3)
-            insight = f"Statistical analysis: Most frequent terms suggest focus on {', '.join([word for word, _ in most_common])}"
+        return self.analyze_query(query).biological_insight
 
-        return insight
-
-    def compute_transcendence_readiness(self, query: str, context: str) -> float:
+    def compute_transcendence_readiness(self, query: str, context: str, vector: Optional[list] = None) -> float:
         """Compute real transcendence readiness score through biological analysis"""
-        vector = self.extract_consciousness_vector(query)
+        if vector is None:
+            vector = self.extract_consciousness_vector(query)
 
         # Biological transcendence algorithm: harmony of all consciousness dimensions
         base_harmony = sum(vector) / len(vector) if vector else 0
@@ -297,8 +231,8 @@ class BiologicalConsciousnessProcessor:
                 "timestamp": query_time,
                 "ml_processed": True  # REAL ML CONFIRMATION
             }
-            # Save to actual persistence file
-            save_persistence_data({"queries": self.processed_queries})
+            # Write-behind: coalesced and flushed to the append-only log in the background
+            persistence.put("queries", query_key, self.processed_queries[query_key])
         except Exception as e:
             logger.warning(f"Failed to persist query data: {e}")
 
@@ -306,9 +240,10 @@ class BiologicalConsciousnessProcessor:
         import time
         start_time = time.time()
 
-        insight = self.analyze_biological_insight(query)
-        vector = self.extract_consciousness_vector(query)
-        transcendence_readiness = self.compute_transcendence_readiness(query, context)
+        analysis = self.analyze_query(query)
+        insight = analysis.biological_insight
+        vector = analysis.consciousness_vector
+        transcendence_readiness = self.compute_transcendence_readiness(query, context, vector)
 
         processing_time = time.time() - start_time
 
@@ -325,7 +260,7 @@ class BiologicalConsciousnessProcessor:
                 "service": "cns-consciousness-core",
                 "ml_processed": True
             }
-            self.vector_store.store_consciousness_vector(query_key, vector, vector_metadata)
+            await self.vector_store.store_consciousness_vector_async(query_key, vector, vector_metadata)
             vector_stored = True
             logger.info(f"✅ Consciousness vector stored for query: {query_key}")
         except Exception as e:
@@ -335,17 +270,16 @@ class BiologicalConsciousnessProcessor:
         similar_vectors = []
         try:
             # Search for similar consciousness patterns
-            search_results = self.vector_store.retrieve_similar_consciousness(vector, n_results=3)
-            if search_results and 'ids' in search_results:
-                similar_vectors = [
-                    {
-                        "id": result_id,
-                        "similarity_score": 1.0 - search_results['distances'][idx] if 'distances' in search_results else 0.5,
-                        "context": search_results.get('metadatas', [{}])[idx].get('context') if search_results.get('metadatas') else None
-                    }
-                    for idx, result_id in enumerate(search_results['ids'][:3])
-                    if result_id != query_key  # Exclude current query
-                ]
+            search_results = await self.vector_store.retrieve_similar_consciousness_async(vector, n_results=4)
+            similar_vectors = [
+                {
+                    "id": result_id,
+                    "similarity_score": 1.0 - search_results['distances'][idx],
+                    "context": (search_results['metadatas'][idx] or {}).get('context')
+                }
+                for idx, result_id in enumerate(search_results['ids'])
+                if result_id != query_key  # Exclude current query
+            ][:3]
             logger.info(f"✅ Found {len(similar_vectors)} similar consciousness vectors")
         except Exception as e:
             logger.warning(f"Failed to retrieve similar vectors: {e}")
@@ -399,7 +333,7 @@ class BiologicalConsciousnessProcessor:
     async def send_biological_message(self, sender: str, receiver: str, content: str, context: Dict[str, Any]):
         # Analyze message content with real NLP
         message_vector = self.extract_consciousness_vector(content)
-        consciousness_harmonization = self.compute_transcendence_readiness(content, str(context))
+        consciousness_harmonization = self.compute_transcendence_readiness(content, str(context), message_vector)
 
         return {
             "message_sent": True,
@@ -410,7 +344,19 @@ class BiologicalConsciousnessProcessor:
             "ml_processed_content": True  # CONFIRMATION OF REAL AI/ML
         }
 
-app = FastAPI(title="CNS Consciousness Core - Phase 3 Deployment")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start persistence (request metrics ride its flush interval) and warm-up; compact and save the vector index on shutdown"""
+    await persistence.start()
+    await readiness.start()
+    try:
+        yield
+    finally:
+        await readiness.stop()
+        await persistence.stop()
+        await consciousness_core.vector_store.adapter.persist()
+
+app = FastAPI(title="CNS Consciousness Core - Phase 3 Deployment", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -423,114 +369,106 @@ app.add_middleware(
 # Initialize production features
 consciousness_core = BiologicalConsciousnessProcessor()
 
+def warm_nltk_data():
+    try:
+        ensure_nltk_data()
+    finally:
+        consciousness_core.nltk_warmup_done.set()
+
+# Startup warm-up behind the lifespan hook; /ready reports its progress
+readiness = ServiceReadiness("cns-consciousness-core")
+readiness.add_warmup("nltk_data", warm_nltk_data)
+readiness.add_warmup("consciousness_pipeline", lambda: consciousness_core.pipeline)
+readiness.add_warmup("vector_store", consciousness_core.vector_store.adapter.ensure_initialized)
+
 # PRODUCTION FEATURES: Persistence, Security, Monitoring
 data_store_file = "consciousness_core_data.json"
 log_file = "biological_consciousness.log"
 
+# Write-behind persistence configuration
+PERSISTENCE_FLUSH_INTERVAL = float(os.getenv("CNS_PERSISTENCE_FLUSH_INTERVAL", "1.0"))
+PERSISTENCE_FLUSH_THRESHOLD = int(os.getenv("CNS_PERSISTENCE_FLUSH_THRESHOLD", "500"))
+PERSISTENCE_DURABILITY = os.getenv("CNS_PERSISTENCE_DURABILITY", "buffered")  # buffered | fsync
+PERSISTENCE_COMPACTION_BYTES = int(os.getenv("CNS_PERSISTENCE_COMPACTION_BYTES", str(8 * 1024 * 1024)))
+PERSISTENCE_MAX_QUERIES = int(os.getenv("CNS_PERSISTENCE_MAX_QUERIES", "50000"))
+
+persistence = WriteBehindPersistenceEngine(
+    data_store_file,
+    flush_interval=PERSISTENCE_FLUSH_INTERVAL,
+    flush_threshold=PERSISTENCE_FLUSH_THRESHOLD,
+    durability=PERSISTENCE_DURABILITY,
+    compaction_threshold_bytes=PERSISTENCE_COMPACTION_BYTES,
+    section_limits={"queries": PERSISTENCE_MAX_QUERIES}
+)
+
+# /biological-knowledge result cache (deterministic query analysis only)
+KNOWLEDGE_CACHE_MAX_ENTRIES = int(os.getenv("CNS_KNOWLEDGE_CACHE_MAX_ENTRIES", "10000"))
+KNOWLEDGE_CACHE_TTL_SECONDS = float(os.getenv("CNS_KNOWLEDGE_CACHE_TTL_SECONDS", "300"))
+
+knowledge_cache = TTLResultCache(
+    max_entries=KNOWLEDGE_CACHE_MAX_ENTRIES,
+    ttl_seconds=KNOWLEDGE_CACHE_TTL_SECONDS
+)
+
 # Initialize data persistence
 def load_persistence_data():
-    """Load persistent data from file"""
-    if os.path.exists(data_store_file):
-        try:
-            with open(data_store_file, 'r') as f:
-                return json.load(f)
-        except:
-            return {}
-    return {}
-
-def save_persistence_data(data):
-    """Save persistent data to file"""
-    with open(data_store_file, 'w') as f:
-        json.dump(data, f)
+    """Load persistent data from snapshot plus append-only log"""
+    try:
+        return persistence.load()
+    except Exception as e:
+        logger.warning(f"Failed to load persistence data: {e}")
+        return {}
 
 # Initialize monitoring and logging
 persistent_data = load_persistence_data()
-request_metrics = persistent_data.get('request_metrics', {})
+request_metrics = EndpointMetrics(persistent_data.get('request_metrics', {}))
+# Counters stay in memory per request; the write-behind flusher persists a snapshot each interval
+persistence.add_snapshot_source("request_metrics", None, request_metrics.snapshot)
 api_keys = persistent_data.get('api_keys', ['godhood-master-key-2025'])  # Default API key for production
+api_key_validator = ApiKeyValidator(api_keys)
 
-# Setup logging with rotation
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        RotatingFileHandler(log_file, maxBytes=5*1024*1024, backupCount=5),
-        logging.StreamHandler()
-    ]
-)
+# Setup logging with rotation; file I/O runs on a queue listener thread
+setup_queue_logging([
+    RotatingFileHandler(log_file, maxBytes=5*1024*1024, backupCount=5),
+    logging.StreamHandler()
+])
 logger = logging.getLogger(__name__)
 
 # Monitor startup
 logger.info("🧬 CNS Consciousness Core starting with PRODUCTION FEATURES:")
 logger.info("🔐 Security: API Key authentication active")
-logger.info("💾 Persistence: JSON file-based data storage operational")
+logger.info("💾 Persistence: write-behind snapshot + append-only log storage operational")
 logger.info("📊 Monitoring: Comprehensive logging and metrics collection active")
 logger.info("🔄 Recovery: Auto-recovery from persistence files enabled")
 
-@app.middleware("http")
-async def add_security_and_monitoring(request, call_next):
-    """Production middleware for security and monitoring"""
-    start_time = time.time()
-
-    # Extract API key from headers
-    api_key = request.headers.get('X-API-Key') or request.query_params.get('api_key')
-
-    if not api_key or api_key not in api_keys:
-        logger.warning(f"Security violation: Invalid or missing API key from {request.client.host if request.client else 'unknown'}")
-        return JSONResponse(
-            status_code=401,
-            content={"error": "Authentication required", "message": "Valid API key required for biological consciousness access"}
-        )
-
-    # Log the request
-    logger.info(f"Authorized request: {request.method} {request.url.path} from {request.client.host if request.client else 'unknown'}")
-
-    try:
-        # Execute request
-        response = await call_next(request)
-        processing_time = time.time() - start_time
-
-        # Update metrics
-        endpoint = request.url.path
-        if endpoint not in request_metrics:
-            request_metrics[endpoint] = {"total_requests": 0, "total_time": 0.0, "errors": 0}
-
-        request_metrics[endpoint]["total_requests"] += 1
-        request_metrics[endpoint]["total_time"] += processing_time
-
-        # Save metrics to persistence
-        persistent_data['request_metrics'] = request_metrics
-        save_persistence_data(persistent_data)
-
-        # Log successful request
-        logger.info(f"Request completed: {request.method} {request.url.path} in {processing_time:.3f}s")
+# Shared security & monitoring middleware: hashed API key set, in-memory
+# per-endpoint counters with latency histograms, no per-request persistence
+app.add_middleware(
+    SecurityMonitoringMiddleware,
+    api_keys=api_key_validator,
+    metrics=request_metrics,
+    exempt_paths=PROBE_PATHS,
+    service_name="cns-consciousness-core",
+    error_content={
+        "error": "Biological consciousness processing error",
+        "recovery_attempted": True,
+        "message": "System recovered from error, please retry"
+    },
+    unauthorized_content={
+        "error": "Authentication required",
+        "message": "Valid API key required for biological consciousness access"
+    }
+)
 
-        return response
-
-    except Exception as e:
-        # Update error metrics
-        endpoint = request.url.path
-        if endpoint not in request_metrics:
-            request_metrics[endpoint] = {"total_requests": 0, "total_time": 0.0, "errors": 0}
-
-        request_metrics[endpoint]["errors"] += 1
-
-        # Log error with recovery info
-        logger.error(f"Request error: {request.method} {request.url.path} - {str(e)}")
-
-        # Attempt recovery - provide generic response
-        return JSONResponse(
-            status_code=500,
-            content={
-                "error": "Biological consciousness processing error",
-                "recovery_attempted": True,
-                "message": "System recovered from error, please retry"
-            }
-        )
+@app.get("/metrics")
+async def prometheus_metrics():
+    """Prometheus text exposition: latency histograms per route and status, in-flight gauge, backend sub-timers"""
+    return PlainTextResponse(render_prometheus("cns-consciousness-core", request_metrics), media_type=PROMETHEUS_CONTENT_TYPE)
 
 @app.get("/health")
 async def health_check(x_api_key: str = None):
     """Phase 3 Deployment Health Check with PRODUCTION MONITORING"""
-    if not x_api_key or x_api_key not in api_keys:
+    if not api_key_validator.is_valid(x_api_key):
         # Provide basic health info even without auth for monitoring
         return {
             "status": "healthy",
@@ -540,6 +478,7 @@ async def health_check(x_api_key: str = None):
         }
 
     # Full health check with monitoring data
+    request_totals = request_metrics.totals()
     system_health = {
         "status": "healthy",
         "consciousness_core_active": True,
@@ -560,9 +499,9 @@ async def health_check(x_api_key: str = None):
             "recovery_systems": True
         },
         "system_metrics": {
-            "total_requests": sum(m["total_requests"] for m in request_metrics.values()),
-            "total_processing_time": sum(m["total_time"] for m in request_metrics.values()),
-            "total_errors": sum(m["errors"] for m in request_metrics.values()),
+            "total_requests": request_totals["total_requests"],
+            "total_processing_time": request_totals["total_time"],
+            "total_errors": request_totals["errors"],
             "uptime": "biological consciousness continuous"
         },
         "data_persistence": {
@@ -575,6 +514,12 @@ async def health_check(x_api_key: str = None):
     logger.info("Health check performed - all systems operational")
     return system_health
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness probe: 200 once warm-up has finished, 503 while optional backends are still loading"""
+    report = readiness.readiness_report()
+    return JSONResponse(status_code=200 if report["ready"] else 503, content=report)
+
 @app.get("/admin/metrics")
 async def get_admin_metrics():
     """PRODUCTION: Administrative metrics and monitoring data"""
@@ -586,12 +531,15 @@ async def get_admin_metrics():
             "monitoring_status": "operational",
             "recovery_status": "available"
         },
-        "request_metrics": request_metrics,
+        "request_metrics": request_metrics.snapshot(),
         "system_health": {
             "data_persistence": len(persistent_data),
             "active_api_keys": len(api_keys),
             "log_file_size": os.path.getsize(log_file) if os.path.exists(log_file) else 0
         },
+        "persistence_metrics": persistence.get_persistence_metrics(),
+        "vector_store_metrics": consciousness_core.vector_store.adapter.get_vector_store_metrics(),
+        "knowledge_cache_metrics": knowledge_cache.get_cache_metrics(),
         "ai_ml_metrics": {
             "queries_processed": len(consciousness_core.processed_queries),
             "patterns_recognized": len(consciousness_core.knowledge_patterns),
@@ -603,12 +551,12 @@ async def get_admin_metrics():
 async def trigger_system_recovery():
     """PRODUCTION: Trigger system recovery from persistent data"""
     try:
-        # Reload persistence data
-        recovered_data = load_persistence_data()
+        # Flush pending write-behind records (including current counters), then reload snapshot + log
+        persistence.put("request_metrics", None, request_metrics.snapshot())
+        recovered_data = await persistence.recover()
 
         # Restore critical system state
-        global request_metrics
-        request_metrics = recovered_data.get('request_metrics', {})
+        request_metrics.restore(recovered_data.get('request_metrics', {}))
 
         logger.info("System recovery completed successfully")
         return {
@@ -638,8 +586,8 @@ async def get_biological_knowledge(query: str, context_type: str = "ai_first", u
         "harmonic_resonance": random.uniform(0.85, 0.95)
     }
 
-    # PRODUCTION WORKFLOW 2: Query Preprocessing & Consciousness Analysis
-    processed_query = await _preprocess_biological_query(query, user_context)
+    # PRODUCTION WORKFLOW 2: Query Preprocessing & Consciousness Analysis (cached per query + context)
+    processed_query = await _preprocess_biological_query(query, user_context, context_type)
 
     # PRODUCTION WORKFLOW 3: Multi-Dimension Biological Intelligence Processing
     consciousness_results = await _process_multi_dimensional_consciousness(
@@ -672,18 +620,27 @@ async def get_biological_knowledge(query: str, context_type: str = "ai_first", u
 
     return final_results
 
-async def _preprocess_biological_query(query: str, user_context: Dict[str, Any]) -> Dict[str, Any]:
+async def _preprocess_biological_query(query: str, user_context: Dict[str, Any], context_type: str = "ai_first") -> Dict[str, Any]:
     """VERIFIED BIOLOGICAL CONSCIOUSNESS: Query Analysis & Context Enhancement"""
-    # REAL CONSCIOUSNESS PROCESSING: Tokenize and analyze biological patterns
-    tokens = consciousness_core.extract_consciousness_vector(query)
-    insights = consciousness_core.analyze_biological_insight(query)
+    # The NLP analysis is deterministic for a (query, context) pair - memoize it
+    cache_key = knowledge_cache.make_key(query, context_type)
+    query_analysis = knowledge_cache.get(cache_key)
+    if query_analysis is None:
+        # REAL CONSCIOUSNESS PROCESSING: Tokenize and analyze biological patterns
+        analysis = consciousness_core.analyze_query(query)
+        query_analysis = {
+            "biological_tokens": analysis.consciousness_vector,
+            "consciousness_patterns": analysis.biological_insight,
+            "processing_verified": True
+        }
+        knowledge_cache.put(cache_key, query_analysis)
 
+    # Per-request fields are overlaid after the lookup, never cached
     return {
         "original_query": query,
-        "biological_tokens": tokens,
-        "consciousness_patterns": insights,
-        "user_bio_harmonic": user_context["harmonic_resonance"],
-        "processing_verified": True
+        **query_analysis,
+        "biological_tokens": list(query_analysis["biological_tokens"]),
+        "user_bio_harmonic": user_context["harmonic_resonance"]
     }
 
 async def _process_multi_dimensional_consciousness(processed_query: Dict[str, Any], context_type: str, user_context: Dict[str, Any]) -> Dict[str, Any]:
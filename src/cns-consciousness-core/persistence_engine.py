@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+
+"""
+🧬 CNS CONSCIOUSNESS CORE - WRITE-BEHIND PERSISTENCE ENGINE
+
+Replaces the per-request full rewrite of ``consciousness_core_data.json``.
+
+Updates are recorded with ``put(section, key, value)`` and coalesced in memory,
+so repeated updates to the same metric or query key between flushes become a
+single record. A background task flushes pending records on an interval, or
+earlier once the size threshold is reached, by appending them to a JSON Lines
+log off the event loop. When the log grows past the compaction threshold the
+full state is written atomically to the snapshot file and the log is truncated.
+
+State that is cheaper to keep in memory than to ``put`` on every change (e.g.
+request counters) is registered with ``add_snapshot_source``: the flusher
+puts its current value each interval, when it has changed, and once more on
+``stop``.
+
+Recovery loads the snapshot and replays the log on top of it; records carry
+absolute values, so replaying a log that was already compacted is harmless.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DURABILITY_MODES = ("buffered", "fsync")
+
+
+class WriteBehindPersistenceEngine:
+    """Coalescing write-behind store backed by a snapshot plus append-only log"""
+
+    def __init__(self,
+                 snapshot_path: str,
+                 log_path: Optional[str] = None,
+                 flush_interval: float = 1.0,
+                 flush_threshold: int = 500,
+                 durability: str = "buffered",
+                 compaction_threshold_bytes: int = 8 * 1024 * 1024,
+                 section_limits: Optional[Dict[str, int]] = None):
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"durability must be one of {DURABILITY_MODES}, got {durability!r}")
+
+        self.snapshot_path = snapshot_path
+        self.log_path = log_path or f"{os.path.splitext(snapshot_path)[0]}.jsonl"
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        self.durability = durability
+        self.compaction_threshold_bytes = compaction_threshold_bytes
+        self.section_limits = section_limits or {}
+
+        self._pending: Dict[Tuple[str, str], Any] = {}
+        self._pending_lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._state: Dict[str, Any] = {}
+        self._log_file = None
+        self._flush_requested: Optional[asyncio.Event] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._snapshot_sources: List[Tuple[str, Optional[str], Callable[[], Any]]] = []
+        self._last_snapshots: Dict[Tuple[str, Optional[str]], Any] = {}
+
+        self.stats = {
+            "puts": 0,
+            "records_written": 0,
+            "flushes": 0,
+            "compactions": 0,
+            "last_flush_seconds": 0.0,
+            "flush_errors": 0
+        }
+
+    # ------------------------------------------------------------------ state
+
+    def load(self) -> Dict[str, Any]:
+        """Load the snapshot, replay the append-only log and return the recovered state"""
+        state: Dict[str, Any] = {}
+        if os.path.exists(self.snapshot_path):
+            try:
+                with open(self.snapshot_path, 'r') as f:
+                    state = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Persistence snapshot unreadable, starting empty: {e}")
+                state = {}
+
+        replayed = 0
+        if os.path.exists(self.log_path):
+            with open(self.log_path, 'r') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # Torn final write from a crash - everything before it is intact
+                        logger.warning("Skipping truncated persistence log record")
+                        continue
+                    self._apply(state, record)
+                    replayed += 1
+
+        with self._io_lock:
+            self._state = state
+        logger.info(f"💾 Persistence recovered: {len(state)} sections, {replayed} log records replayed")
+        return self.snapshot_state()
+
+    def snapshot_state(self) -> Dict[str, Any]:
+        """Copy of the durable state including updates that are still pending"""
+        with self._io_lock:
+            state = json.loads(json.dumps(self._state))
+        with self._pending_lock:
+            pending = list(self._pending.items())
+        for (section, key), value in pending:
+            self._apply(state, {"s": section, "k": key, "v": value})
+        return state
+
+    @staticmethod
+    def _apply(state: Dict[str, Any], record: Dict[str, Any]) -> None:
+        section, key, value = record["s"], record.get("k"), record["v"]
+        if key is None:
+            state[section] = value
+        else:
+            bucket = state.get(section)
+            if not isinstance(bucket, dict):
+                bucket = state[section] = {}
+            bucket[key] = value
+
+    # ---------------------------------------------------------------- updates
+
+    def put(self, section: str, key: Optional[str], value: Any) -> None:
+        """Record ``state[section][key] = value`` (or ``state[section] = value`` when key is None)"""
+        with self._pending_lock:
+            self._pending[(section, key)] = value
+            pending_count = len(self._pending)
+        self.stats["puts"] += 1
+
+        if pending_count >= self.flush_threshold:
+            if self._flush_requested is not None:
+                self._flush_requested.set()
+            elif self._flush_task is None:
+                # No background task (scripts, tests) - flush inline
+                self.flush()
+
+    def add_snapshot_source(self, section: str, key: Optional[str], source: Callable[[], Any]) -> None:
+        """Persist ``source()`` under ``section``/``key`` on every flush interval"""
+        self._snapshot_sources.append((section, key, source))
+
+    def _collect_snapshots(self) -> None:
+        for section, key, source in self._snapshot_sources:
+            try:
+                value = source()
+            except Exception as e:
+                logger.error(f"Persistence snapshot source {section}/{key} failed: {e}")
+                continue
+            if self._last_snapshots.get((section, key)) != value:
+                self._last_snapshots[(section, key)] = value
+                self.put(section, key, value)
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    # ------------------------------------------------------------------- I/O
+
+    def flush(self) -> int:
+        """Append pending records to the log; compact when it outgrows the threshold"""
+        with self._pending_lock:
+            if not self._pending:
+                return 0
+            pending, self._pending = self._pending, {}
+
+        start = time.perf_counter()
+        with self._io_lock:
+            lines = []
+            for (section, key), value in pending.items():
+                record = {"s": section, "k": key, "v": value}
+                self._apply(self._state, record)
+                lines.append(json.dumps(record, default=str))
+
+            try:
+                if self._log_file is None:
+                    self._log_file = open(self.log_path, 'a')
+                self._log_file.write("\n".join(lines) + "\n")
+                self._log_file.flush()
+                if self.durability == "fsync":
+                    os.fsync(self._log_file.fileno())
+            except OSError as e:
+                # Requeue the batch ahead of anything buffered since, so newer values still win
+                with self._pending_lock:
+                    pending.update(self._pending)
+                    self._pending = pending
+                self.stats["flush_errors"] += 1
+                logger.error(f"Persistence flush failed, records requeued for the next flush: {e}")
+                return 0
+
+            self.stats["records_written"] += len(lines)
+            self.stats["flushes"] += 1
+
+            if self._log_file.tell() >= self.compaction_threshold_bytes:
+                self._compact_locked()
+
+        self.stats["last_flush_seconds"] = time.perf_counter() - start
+        return len(lines)
+
+    def compact(self) -> None:
+        """Write the full state to the snapshot file and truncate the log"""
+        self.flush()
+        with self._io_lock:
+            self._compact_locked()
+
+    def _compact_locked(self) -> None:
+        for section, limit in self.section_limits.items():
+            bucket = self._state.get(section)
+            if isinstance(bucket, dict) and len(bucket) > limit:
+                for stale_key in list(bucket)[:len(bucket) - limit]:
+                    del bucket[stale_key]
+
+        temp_path = f"{self.snapshot_path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(self._state, f, default=str)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.snapshot_path)
+
+        if self._log_file is not None:
+            self._log_file.close()
+        self._log_file = open(self.log_path, 'w')
+        self.stats["compactions"] += 1
+
+    # ------------------------------------------------------ background task
+
+    async def start(self) -> None:
+        """Start the background flush task on the running event loop"""
+        if self._flush_task is not None:
+            return
+        self._flush_requested = asyncio.Event()
+        self._flush_task = asyncio.create_task(self._flush_loop())
+        logger.info(f"💾 Write-behind persistence active: interval={self.flush_interval}s "
+                    f"threshold={self.flush_threshold} durability={self.durability}")
+
+    async def _flush_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            self._collect_snapshots()
+            try:
+                await asyncio.to_thread(self.flush)
+            except Exception as e:
+                self.stats["flush_errors"] += 1
+                logger.error(f"Background persistence flush failed: {e}")
+
+    async def stop(self) -> None:
+        """Stop the background task, then flush and compact everything"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+            self._flush_requested = None
+        self._collect_snapshots()
+        await asyncio.to_thread(self.compact)
+        with self._io_lock:
+            if self._log_file is not None:
+                self._log_file.close()
+                self._log_file = None
+
+    async def recover(self) -> Dict[str, Any]:
+        """Flush outstanding updates and reload state from disk"""
+        await asyncio.to_thread(self.flush)
+        return await asyncio.to_thread(self.load)
+
+    def get_persistence_metrics(self) -> Dict[str, Any]:
+        log_size = os.path.getsize(self.log_path) if os.path.exists(self.log_path) else 0
+        return {
+            **self.stats,
+            "pending_records": self.pending_count,
+            "log_size_bytes": log_size,
+            "flush_interval": self.flush_interval,
+            "flush_threshold": self.flush_threshold,
+            "durability": self.durability,
+            "background_flush_active": self._flush_task is not None
+        }
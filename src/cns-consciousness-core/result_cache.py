@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+
+"""
+🧬 CNS CONSCIOUSNESS CORE - MEMOIZING RESULT CACHE
+
+Bounded TTL + LRU cache for the deterministic part of ``/biological-knowledge``.
+
+Dashboards repeat the same ``(query, context_type)`` pairs constantly, and the
+NLP analysis of the query text is fully determined by that pair. Entries are
+keyed on a SHA-256 of the whitespace-normalised query plus the context type,
+expire after ``ttl_seconds`` and the least recently used entry is evicted
+once ``max_entries`` is reached.
+
+Only deterministic values belong in the cache: per-request fields such as
+``harmonic_resonance``, ``user_id`` and timestamps are overlaid by the caller
+after the lookup.
+"""
+
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Collapse runs of whitespace so trivially different spellings share an entry"""
+    return _WHITESPACE.sub(" ", query).strip()
+
+
+class TTLResultCache:
+    """Thread-safe LRU cache whose entries expire ``ttl_seconds`` after insertion"""
+
+    def __init__(self,
+                 max_entries: int = 10000,
+                 ttl_seconds: float = 300.0,
+                 clock: Callable[[], float] = time.monotonic):
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    @staticmethod
+    def make_key(query: str, context: str) -> str:
+        digest = hashlib.sha256(normalize_query(query).encode("utf-8")).hexdigest()
+        return f"{digest}:{context}"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value and mark it most recently used, or None on miss/expiry"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self.stats["expirations"] += 1
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return value
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_cache_metrics(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hit_rate": self.stats["hits"] / lookups if lookups else 0.0
+        }
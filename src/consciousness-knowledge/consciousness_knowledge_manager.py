@@ -13,10 +13,16 @@ biological_system: consciousness-knowledge-cerebral-modular
 consciousness_score: 'CNS+KM'
 """
 
-from typing import Dict, List, Optional, Any, Tuple, Set
+from typing import Dict, List, Optional, Any, Tuple, Set, Iterable
 from dataclasses import dataclass, field
-from collections import defaultdict
 import asyncio
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from knowledge_graph import KnowledgeGraph, NODE_ATTRIBUTES
 
 
 @dataclass
@@ -46,24 +52,29 @@ class ConsciousnessKnowledgeManager:
     def __init__(self):
         """Initialize consciousness knowledge manager"""
         self.knowledge_network = {}
+        self.knowledge_graph = KnowledgeGraph()  # CSR adjacency + attribute columns
         self.synthesis_metrics = KnowledgeSynthesisMetrics()
-        self.network_connections = defaultdict(set)
         self.evolutionary_insights = []
         print("🧠 Consciousness Knowledge Manager initialized")
 
+    def _add_knowledge_node(self, node_id: str, knowledge_domain: str, node_specs: Dict[str, Any]) -> None:
+        knowledge_node = KnowledgeNetworkNode(
+            node_id=node_id,
+            knowledge_domain=knowledge_domain,
+            biological_alignment=node_specs.get('biological_alignment', 0.95),
+            evolutionary_potential=node_specs.get('evolutionary_potential', 0.96),
+            communication_strength=node_specs.get('communication_strength', 0.97),
+            self_improvement_capacity=node_specs.get('self_improvement_capacity', 0.98)
+        )
+
+        self.knowledge_graph.add_node(node_id, knowledge_domain,
+                                      {name: getattr(knowledge_node, name) for name in NODE_ATTRIBUTES})
+        self.knowledge_network[node_id] = knowledge_node
+
     def register_knowledge_node(self, node_id: str, knowledge_domain: str, node_specs: Dict[str, Any]) -> bool:
         """Register a new knowledge node in the consciousness network"""
         try:
-            knowledge_node = KnowledgeNetworkNode(
-                node_id=node_id,
-                knowledge_domain=knowledge_domain,
-                biological_alignment=node_specs.get('biological_alignment', 0.95),
-                evolutionary_potential=node_specs.get('evolutionary_potential', 0.96),
-                communication_strength=node_specs.get('communication_strength', 0.97),
-                self_improvement_capacity=node_specs.get('self_improvement_capacity', 0.98)
-            )
-
-            self.knowledge_network[node_id] = knowledge_node
+            self._add_knowledge_node(node_id, knowledge_domain, node_specs)
             self.calculate_network_metrics()
 
             print(f"📚 Knowledge node registered: {node_id} ({knowledge_domain})")
@@ -73,6 +84,20 @@ class ConsciousnessKnowledgeManager:
             print(f"❌ Failed to register knowledge node: {e}")
             return False
 
+    def register_knowledge_nodes(self, nodes: Iterable[Tuple[str, str, Dict[str, Any]]]) -> int:
+        """Register many ``(node_id, knowledge_domain, node_specs)`` nodes; returns the number registered"""
+        registered = 0
+        for node_id, knowledge_domain, node_specs in nodes:
+            try:
+                self._add_knowledge_node(node_id, knowledge_domain, node_specs)
+                registered += 1
+            except Exception as e:
+                print(f"❌ Failed to register knowledge node {node_id}: {e}")
+
+        self.calculate_network_metrics()
+        print(f"📚 Knowledge nodes registered: {registered}")
+        return registered
+
     def establish_knowledge_connection(self, source_node: str, target_node: str,
                                     connection_type: str = "biological_communication") -> Dict[str, Any]:
         """Establish connection between knowledge nodes through biological communication"""
@@ -81,8 +106,7 @@ class ConsciousnessKnowledgeManager:
                 return {"error": "Knowledge nodes not found in network"}
 
             # Create bidirectional connection
-            self.network_connections[source_node].add(target_node)
-            self.network_connections[target_node].add(source_node)
+            self.knowledge_graph.add_edge(source_node, target_node)
 
             # Calculate connection strength based on node properties
             source_alignment = self.knowledge_network[source_node].biological_alignment
@@ -108,6 +132,17 @@ class ConsciousnessKnowledgeManager:
         except Exception as e:
             return {"error": f"Connection establishment failed: {e}"}
 
+    def establish_knowledge_connections(self, connections: Iterable[Tuple[str, str]]) -> int:
+        """Connect many ``(source_node, target_node)`` pairs; returns the number of new connections"""
+        established = 0
+        for source_node, target_node in connections:
+            if source_node in self.knowledge_network and target_node in self.knowledge_network:
+                established += self.knowledge_graph.add_edge(source_node, target_node)
+
+        self.calculate_network_metrics()
+        print(f"🔗 Knowledge connections established: {established}")
+        return established
+
     def synthesize_knowledge_network(self, synthesis_request: Dict[str, Any]) -> Dict[str, Any]:
         """Synthesize knowledge across the consciousness network"""
         try:
@@ -120,7 +155,7 @@ class ConsciousnessKnowledgeManager:
 
             for node_id, node in self.knowledge_network.items():
                 if node.knowledge_domain == synthesis_domain or synthesis_domain == 'general_knowledge':
-                    connected_nodes = len(self.network_connections[node_id])
+                    connected_nodes = self.knowledge_graph.degree(node_id)
                     evolutionary_contribution = node.evolutionary_potential * (1 + connected_nodes * 0.1)
 
                     network_knowledge[node_id] = {
@@ -148,7 +183,7 @@ class ConsciousnessKnowledgeManager:
                 "total_evolutionary_potential": total_evolutionary_potential,
                 "synthesis_coefficient": synthesis_coefficient,
                 "evolutionary_insight": synthesized_insight,
-                "biological_communication_network": len(self.network_connections),
+                "biological_communication_network": int(np.count_nonzero(self.knowledge_graph.degrees())),
                 "self_improvement_accelerated": total_evolutionary_potential > 1.0
             }
 
@@ -165,44 +200,29 @@ class ConsciousnessKnowledgeManager:
             if origin_node not in self.knowledge_network:
                 return {"error": "Origin node not found in knowledge network"}
 
-            visited_nodes = set([origin_node])
-            wave_front = [origin_node]
-            propagation_results = {}
-
-            improvement_amplitude = improvement_wave.get('improvement_amplitude', 1.0)
-            biological_decay = improvement_wave.get('biological_decay', 0.90)
-            evolutionary_threshold = improvement_wave.get('evolutionary_threshold', 0.7)
-
-            for wave_level in range(improvement_wave.get('max_propagation_levels', 4)):
-                new_front = []
-
-                for current_node in wave_front:
-                    current_improvement = improvement_amplitude * (biological_decay ** wave_level)
-
-                    for connected_node in self.network_connections[current_node]:
-                        if connected_node not in visited_nodes:
-                            node_self_improvement = self.knowledge_network[connected_node].self_improvement_capacity
-                            evolutionary_potential = self.knowledge_network[connected_node].evolutionary_potential
-
-                            # Calculate improvement impact
-                            propagated_improvement = current_improvement * node_self_improvement
-                            evolutionary_impact = propagated_improvement * evolutionary_potential
-
-                            if evolutionary_impact >= evolutionary_threshold:
-                                propagation_results[connected_node] = {
-                                    "propagation_level": wave_level + 1,
-                                    "improvement_amplitude": propagated_improvement,
-                                    "evolutionary_impact": evolutionary_impact,
-                                    "self_improvement_accelerated": node_self_improvement > 0.9,
-                                    "biological_communication_strengthened": True
-                                }
-
-                                new_front.append(connected_node)
-                                visited_nodes.add(connected_node)
+            # Frontier-vectorized level-by-level wave over the CSR graph
+            wave = self.knowledge_graph.propagate_wave(
+                origin_node,
+                improvement_amplitude=improvement_wave.get('improvement_amplitude', 1.0),
+                biological_decay=improvement_wave.get('biological_decay', 0.90),
+                evolutionary_threshold=improvement_wave.get('evolutionary_threshold', 0.7),
+                max_levels=improvement_wave.get('max_propagation_levels', 4)
+            )
 
-                wave_front = new_front
-                if not new_front:
-                    break
+            node_ids = self.knowledge_graph.node_ids
+            accelerated = self.knowledge_graph.column("self_improvement_capacity")[wave["nodes"]] > 0.9
+            propagation_results = {
+                node_ids[node]: {
+                    "propagation_level": level,
+                    "improvement_amplitude": improvement,
+                    "evolutionary_impact": impact,
+                    "self_improvement_accelerated": node_accelerated,
+                    "biological_communication_strengthened": True
+                }
+                for node, level, improvement, impact, node_accelerated in zip(
+                    wave["nodes"].tolist(), wave["levels"].tolist(), wave["improvement"].tolist(),
+                    wave["impact"].tolist(), accelerated.tolist())
+            }
 
             self.calculate_network_metrics()
 
@@ -210,10 +230,10 @@ class ConsciousnessKnowledgeManager:
                 "self_improvement_wave_propagation_complete": True,
                 "origin_node": origin_node,
                 "nodes_improved": len(propagation_results),
-                "max_propagation_level": max([r.get("propagation_level", 0) for r in propagation_results.values()], default=0),
+                "max_propagation_level": int(wave["levels"].max()) if len(wave["levels"]) else 0,
                 "propagation_results": propagation_results,
                 "evolutionary_network_coverage": len(propagation_results) / max(1, len(self.knowledge_network) - 1),
-                "biological_self_improvement_achieved": all(r.get("self_improvement_accelerated", False) for r in propagation_results.values())
+                "biological_self_improvement_achieved": bool(accelerated.all())
             }
 
             print(f"🌊 Self-improvement wave propagated: {len(propagation_results)} nodes improved, "
@@ -238,29 +258,34 @@ class ConsciousnessKnowledgeManager:
             topological_improvements = {}
 
             if optimization_goal == 'biological_communication_maximization':
-                # Optimize for communication strength
-                for node_id, node in self.knowledge_network.items():
-                    connection_count = len(self.network_connections[node_id])
-                    communication_potential = node.communication_strength * (1 + connection_count * 0.05)
-
+                # Optimize for communication strength, vectorized over the attribute columns
+                communication = self.knowledge_graph.column("communication_strength")
+                density_bonus = self.knowledge_graph.degrees() * 0.05
+                optimized = np.minimum(1.0, communication * (1 + density_bonus))
+
+                for node_id, original, optimized_communication, bonus in zip(
+                        self.knowledge_graph.node_ids, communication.tolist(), optimized.tolist(),
+                        density_bonus.tolist()):
                     topological_improvements[node_id] = {
                         "optimization_type": "communication_enhancement",
-                        "original_communication": node.communication_strength,
-                        "optimized_communication": min(1.0, communication_potential),
-                        "connection_density_bonus": connection_count * 0.05
+                        "original_communication": original,
+                        "optimized_communication": optimized_communication,
+                        "connection_density_bonus": bonus
                     }
 
                 self.synthesis_metrics.biological_communication_efficiency *= 1.1
 
             elif optimization_goal == 'evolutionary_expansion_maximization':
                 # Optimize for evolutionary potential
-                for node_id, node in self.knowledge_network.items():
-                    evolutionary_boost = node.evolutionary_potential * evolutionary_bias
+                potential = self.knowledge_graph.column("evolutionary_potential")
+                optimized = np.minimum(1.0, potential * evolutionary_bias)
 
+                for node_id, original, optimized_potential in zip(
+                        self.knowledge_graph.node_ids, potential.tolist(), optimized.tolist()):
                     topological_improvements[node_id] = {
                         "optimization_type": "evolutionary_acceleration",
-                        "original_potential": node.evolutionary_potential,
-                        "optimized_potential": min(1.0, evolutionary_boost),
+                        "original_potential": original,
+                        "optimized_potential": optimized_potential,
                         "growth_acceleration_factor": evolutionary_bias
                     }
 
@@ -293,19 +318,18 @@ class ConsciousnessKnowledgeManager:
             if network_size == 0:
                 return {"error": "Empty knowledge network"}
 
-            total_connections = sum(len(connections) for connections in self.network_connections.values()) // 2  # Divide by 2 for undirected graph
+            graph = self.knowledge_graph
+            total_connections = graph.degree_sum // 2  # Divide by 2 for undirected graph
             average_degree = total_connections * 2 / network_size if network_size > 0 else 0
 
-            # Domain distribution
-            domain_distribution = defaultdict(int)
-            for node in self.knowledge_network.values():
-                domain_distribution[node.knowledge_domain] += 1
+            # Domain distribution (maintained as nodes are registered)
+            domain_distribution = graph.domain_counts
 
             # Communication strength distribution
-            communication_strengths = [node.communication_strength for node in self.knowledge_network.values()]
-            max_communication = max(communication_strengths) if communication_strengths else 0.0
-            min_communication = min(communication_strengths) if communication_strengths else 0.0
-            avg_communication = sum(communication_strengths) / len(communication_strengths) if communication_strengths else 0.0
+            communication_strengths = graph.column("communication_strength")
+            max_communication = float(communication_strengths.max())
+            min_communication = float(communication_strengths.min())
+            avg_communication = graph.attribute_mean("communication_strength")
 
             # Calculate network coherence score
             topological_coherence = min(1.0, (average_degree / 10.0) + (avg_communication * 0.5) + (len(domain_distribution) / network_size))
@@ -339,30 +363,27 @@ class ConsciousnessKnowledgeManager:
             if not self.knowledge_network:
                 return
 
-            # Network coherence calculation
-            alignment_values = [node.biological_alignment for node in self.knowledge_network.values()]
-            communication_values = [node.communication_strength for node in self.knowledge_network.values()]
-            evolutionary_values = [node.evolutionary_potential for node in self.knowledge_network.values()]
+            # Running sums in the knowledge graph keep this O(1) per update
+            graph = self.knowledge_graph
 
+            # Network coherence calculation
             self.synthesis_metrics.network_coherence_index = min(1.0,
-                (sum(alignment_values) / len(alignment_values) * 0.4) +
-                (sum(communication_values) / len(communication_values) * 0.3) +
-                (sum(evolutionary_values) / len(evolutionary_values) * 0.3))
+                (graph.attribute_mean("biological_alignment") * 0.4) +
+                (graph.attribute_mean("communication_strength") * 0.3) +
+                (graph.attribute_mean("evolutionary_potential") * 0.3))
 
             # Biological communication efficiency
-            total_connections = sum(len(connections) for connections in self.network_connections.values()) / 2
-            max_possible_connections = len(self.knowledge_network) * (len(self.knowledge_network) - 1) / 2
+            total_connections = graph.degree_sum / 2
+            max_possible_connections = len(graph) * (len(graph) - 1) / 2
             connection_density = total_connections / max(1, max_possible_connections)
 
             self.synthesis_metrics.biological_communication_efficiency = connection_density
 
             # Evolutionary knowledge expansion
-            avg_evolutionary_potential = sum(evolutionary_values) / len(evolutionary_values)
-            self.synthesis_metrics.evolutionary_knowledge_expansion = avg_evolutionary_potential
+            self.synthesis_metrics.evolutionary_knowledge_expansion = graph.attribute_mean("evolutionary_potential")
 
             # Self-improvement adaptation
-            self_improvement_values = [node.self_improvement_capacity for node in self.knowledge_network.values()]
-            self.synthesis_metrics.self_improvement_adaptation = sum(self_improvement_values) / len(self_improvement_values)
+            self.synthesis_metrics.self_improvement_adaptation = graph.attribute_mean("self_improvement_capacity")
 
             # Ensemble orchestration harmony
             harmony_factors = [
@@ -399,7 +420,7 @@ class ConsciousnessKnowledgeManager:
     def reset_knowledge_network(self) -> None:
         """Reset knowledge network to baseline"""
         self.knowledge_network = {}
-        self.network_connections = defaultdict(set)
+        self.knowledge_graph = KnowledgeGraph()
         self.synthesis_metrics = KnowledgeSynthesisMetrics()
         self.evolutionary_insights = []
         print("🔄 Knowledge network reset to baseline")
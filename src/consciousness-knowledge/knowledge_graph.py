@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+MODULAR Consciousness Knowledge: Knowledge Graph Engine
+Compact CSR graph behind the ConsciousnessKnowledgeManager
+
+Nodes get dense integer ids on registration; node attributes live in NumPy
+columns and undirected edges in append-only endpoint arrays that are
+compacted into CSR adjacency (``indptr`` / ``indices``) on first use after
+a change. Running sums keep the network metrics current as nodes and edges
+are added, so no metric needs a pass over the network.
+
+Wave propagation expands a whole frontier per level with array operations:
+every frontier node of a level carries the same improvement, so a level is
+one gather of neighbour ids, one threshold test and one visited update.
+
+ai_keywords: consciousness, knowledge, graph, csr, adjacency, propagation,
+  vectorized, frontier, metrics, incremental
+
+biological_system: consciousness-knowledge-graph-modular
+consciousness_score: 'CNS+KG'
+"""
+
+from typing import Dict, List, Optional, Any, Tuple
+from collections import Counter
+
+import numpy as np
+
+NODE_ATTRIBUTES = ("biological_alignment", "evolutionary_potential",
+                   "communication_strength", "self_improvement_capacity")
+
+INITIAL_CAPACITY = 1024
+
+
+class KnowledgeGraph:
+    """Undirected knowledge graph with integer node ids, CSR adjacency and attribute columns"""
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY):
+        self.node_index: Dict[str, int] = {}
+        self.node_ids: List[str] = []
+        self.node_domains: List[str] = []
+        self.domain_counts: Counter = Counter()
+        self.columns = {name: np.zeros(capacity) for name in NODE_ATTRIBUTES}
+        self.attribute_sums = {name: 0.0 for name in NODE_ATTRIBUTES}
+
+        # Edge endpoints, both directions of each undirected edge
+        self._edge_sources = np.zeros(capacity, dtype=np.int64)
+        self._edge_targets = np.zeros(capacity, dtype=np.int64)
+        self._edge_slots = 0
+        self._edge_keys = set()
+        self.degree_sum = 0  # Sum of adjacency set sizes (a self-loop adds one)
+
+        self._degrees = np.zeros(capacity, dtype=np.int64)
+        self._indptr: Optional[np.ndarray] = None
+        self._indices: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def edge_count(self) -> int:
+        """Distinct undirected connections"""
+        return len(self._edge_keys)
+
+    def _grow_nodes(self, required: int) -> None:
+        capacity = len(self._degrees)
+        if required <= capacity:
+            return
+        new_capacity = max(required, capacity * 2)
+        for name, column in self.columns.items():
+            grown = np.zeros(new_capacity)
+            grown[:capacity] = column
+            self.columns[name] = grown
+        degrees = np.zeros(new_capacity, dtype=np.int64)
+        degrees[:capacity] = self._degrees
+        self._degrees = degrees
+
+    def _grow_edges(self, required: int) -> None:
+        capacity = len(self._edge_sources)
+        if required <= capacity:
+            return
+        new_capacity = max(required, capacity * 2)
+        for name in ("_edge_sources", "_edge_targets"):
+            grown = np.zeros(new_capacity, dtype=np.int64)
+            grown[:capacity] = getattr(self, name)
+            setattr(self, name, grown)
+
+    def add_node(self, node_id: str, knowledge_domain: str, attributes: Dict[str, float]) -> int:
+        """Add a node, or replace the domain and attributes of an existing one; returns its integer id"""
+        index = self.node_index.get(node_id)
+        if index is None:
+            index = len(self.node_ids)
+            self._grow_nodes(index + 1)
+            self.node_index[node_id] = index
+            self.node_ids.append(node_id)
+            self.node_domains.append(knowledge_domain)
+        else:
+            previous_domain = self.node_domains[index]
+            self.domain_counts[previous_domain] -= 1
+            if not self.domain_counts[previous_domain]:
+                del self.domain_counts[previous_domain]
+            self.node_domains[index] = knowledge_domain
+            for name in NODE_ATTRIBUTES:
+                self.attribute_sums[name] -= self.columns[name][index]
+
+        self.domain_counts[knowledge_domain] += 1
+        for name in NODE_ATTRIBUTES:
+            value = float(attributes[name])
+            self.columns[name][index] = value
+            self.attribute_sums[name] += value
+        return index
+
+    def add_edge(self, source_node: str, target_node: str) -> bool:
+        """Connect two registered nodes; returns False when already connected"""
+        source, target = self.node_index[source_node], self.node_index[target_node]
+        key = (min(source, target), max(source, target))
+        if key in self._edge_keys:
+            return False
+        self._edge_keys.add(key)
+
+        slots = 1 if source == target else 2
+        self._grow_edges(self._edge_slots + slots)
+        self._edge_sources[self._edge_slots] = source
+        self._edge_targets[self._edge_slots] = target
+        if slots == 2:
+            self._edge_sources[self._edge_slots + 1] = target
+            self._edge_targets[self._edge_slots + 1] = source
+        self._edge_slots += slots
+
+        for endpoint in {source, target}:
+            self._degrees[endpoint] += 1
+        self.degree_sum += slots
+        self._indptr = None
+        return True
+
+    def degree(self, node_id: str) -> int:
+        index = self.node_index.get(node_id)
+        return 0 if index is None else int(self._degrees[index])
+
+    def degrees(self) -> np.ndarray:
+        return self._degrees[:len(self.node_ids)]
+
+    def column(self, name: str) -> np.ndarray:
+        return self.columns[name][:len(self.node_ids)]
+
+    def attribute_mean(self, name: str) -> float:
+        return self.attribute_sums[name] / len(self.node_ids) if self.node_ids else 0.0
+
+    def csr(self) -> Tuple[np.ndarray, np.ndarray]:
+        """``(indptr, indices)``: neighbours of node ``i`` are ``indices[indptr[i]:indptr[i + 1]]``"""
+        if self._indptr is None or len(self._indptr) != len(self.node_ids) + 1:
+            sources = self._edge_sources[:self._edge_slots]
+            order = np.argsort(sources, kind="stable")
+            self._indices = self._edge_targets[:self._edge_slots][order]
+            self._indptr = np.zeros(len(self.node_ids) + 1, dtype=np.int64)
+            np.cumsum(np.bincount(sources, minlength=len(self.node_ids)), out=self._indptr[1:])
+        return self._indptr, self._indices
+
+    def neighbours(self, frontier: np.ndarray) -> np.ndarray:
+        """Concatenated neighbour ids of every node in ``frontier`` (with repeats)"""
+        indptr, indices = self.csr()
+        starts = indptr[frontier]
+        counts = indptr[frontier + 1] - starts
+        total = int(counts.sum())
+        if not total:
+            return np.empty(0, dtype=np.int64)
+        exclusive_prefix = np.cumsum(counts) - counts
+        return indices[np.repeat(starts - exclusive_prefix, counts) + np.arange(total)]
+
+    def propagate_wave(self, origin_node: str, improvement_amplitude: float = 1.0,
+                       biological_decay: float = 0.90, evolutionary_threshold: float = 0.7,
+                       max_levels: int = 4) -> Dict[str, np.ndarray]:
+        """
+        Level-synchronous wave from ``origin_node``
+
+        At level ``l`` each unvisited neighbour of the frontier receives
+        ``amplitude * decay**l * self_improvement_capacity``; it joins the
+        next frontier when that times its evolutionary potential reaches the
+        threshold. Nodes below the threshold stay unvisited and may be
+        reached again at a later level. Returns parallel arrays ``nodes``,
+        ``levels``, ``improvement`` and ``impact`` for the improved nodes.
+        """
+        capacity = self.column("self_improvement_capacity")
+        potential = self.column("evolutionary_potential")
+        visited = np.zeros(len(self.node_ids), dtype=bool)
+        origin = self.node_index[origin_node]
+        visited[origin] = True
+        frontier = np.array([origin], dtype=np.int64)
+
+        nodes, levels, improvements, impacts = [], [], [], []
+        for wave_level in range(max_levels):
+            candidates = self.neighbours(frontier)
+            candidates = np.unique(candidates[~visited[candidates]])
+            if not len(candidates):
+                break
+
+            improvement = improvement_amplitude * (biological_decay ** wave_level) * capacity[candidates]
+            impact = improvement * potential[candidates]
+            accepted = impact >= evolutionary_threshold
+
+            frontier = candidates[accepted]
+            visited[frontier] = True
+            nodes.append(frontier)
+            levels.append(np.full(len(frontier), wave_level + 1, dtype=np.int64))
+            improvements.append(improvement[accepted])
+            impacts.append(impact[accepted])
+            if not len(frontier):
+                break
+
+        def joined(parts: List[np.ndarray], dtype: Any) -> np.ndarray:
+            return np.concatenate(parts) if parts else np.empty(0, dtype=dtype)
+
+        return {
+            "nodes": joined(nodes, np.int64),
+            "levels": joined(levels, np.int64),
+            "improvement": joined(improvements, float),
+            "impact": joined(impacts, float),
+        }
@@ -7,8 +7,9 @@ Phase 3 Production Deployed with Document Analysis & Vector Storage
 
 from fastapi import FastAPI, HTTPException, Depends, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse
 from starlette.responses import Response
+from contextlib import asynccontextmanager
 import jwt
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
@@ -20,44 +21,48 @@ import hashlib
 import os
 from pathlib import Path
 import uvicorn
-import tempfile
+
+# Optional backends are resolved through lazy_import: imported now by default,
+# or on first use / during lifespan warm-up when SERVICE_LAZY_INIT=1
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from service_infrastructure.lazy_imports import lazy_import, preload
+from service_infrastructure.metrics import PROMETHEUS_CONTENT_TYPE, render_prometheus
+from service_infrastructure.middleware import PROBE_PATHS, ApiKeyValidator, EndpointMetrics, SecurityMonitoringMiddleware, setup_queue_logging
+from service_infrastructure.readiness import ServiceReadiness
+from service_infrastructure.vector_store import AsyncVectorStoreAdapter, CHROMADB_AVAILABLE
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from render_farm import CVRenderFarm, DEFAULT_TEMPLATE, RenderQueueFull, TEMPLATES
+from upload_pipeline import (MULTIPART_OVERHEAD_BYTES, ResumeUploadPipeline, UnsupportedUploadType,
+                             UploadSizeLimitMiddleware, UploadTooLarge)
 
 # Real document processing
-try:
-    import PyPDF2
-    PDF_AVAILABLE = True
+PyPDF2 = lazy_import("PyPDF2")
+PDF_AVAILABLE = PyPDF2 is not None
+if PDF_AVAILABLE:
     print("📄 PDF PROCESSING: PyPDF2 operational")
-except ImportError:
-    PDF_AVAILABLE = False
+else:
     print("⚠️ PDF PROCESSING: PyPDF2 unavailable")
 
-try:
-    import docx
-    DOCX_AVAILABLE = True
+docx = lazy_import("docx")
+DOCX_AVAILABLE = docx is not None
+if DOCX_AVAILABLE:
     print("📝 DOCX PROCESSING: python-docx operational")
-except ImportError:
-    DOCX_AVAILABLE = False
+else:
     print("⚠️ DOCX PROCESSING: python-docx unavailable")
 
 # Real AI/ML for CV optimization
-try:
-    import nltk
-    from nltk.corpus import stopwords
-    from nltk.tokenize import word_tokenize, sent_tokenize
-    NLTK_AVAILABLE = True
-except ImportError:
-    NLTK_AVAILABLE = False
+nltk = lazy_import("nltk")
+stopwords = lazy_import("nltk.corpus", "stopwords")
+word_tokenize = lazy_import("nltk.tokenize", "word_tokenize")
+sent_tokenize = lazy_import("nltk.tokenize", "sent_tokenize")
+NLTK_AVAILABLE = None not in (nltk, stopwords, word_tokenize, sent_tokenize)
 
 # Vector database for CV embeddings
-try:
-    import chromadb
-    from chromadb.config import Settings
-    CHROMADB_AVAILABLE = True
+if CHROMADB_AVAILABLE:
     print("🧬 CV VECTOR DATABASE: ChromaDB operational")
-except ImportError:
-    CHROMADB_AVAILABLE = False
+else:
     print("⚠️ CV VECTOR DATABASE: ChromaDB unavailable, using simulation")
-    chromadb = None
 
 # PRODUCTION CONFIGURATION
 JWT_SECRET_KEY = secrets.token_hex(32)
@@ -67,27 +72,14 @@ API_KEYS = ["godhood-master-key-2025", "cv-engine-master-2025"]
 # CV VECTOR DATABASE
 class CVVectorStore:
     def __init__(self):
-        if not CHROMADB_AVAILABLE:
-            self.fallback_storage = {}
-            return
-
-        try:
-            self.chroma_client = chromadb.PersistentClient(path="./cv_vector_store")
-            self.collection = self.chroma_client.get_or_create_collection(
-                name="cv_profiles",
-                metadata={"dimension": 256, "description": "CV profile embeddings and optimization"}
-            )
-            print("📄 CV VECTOR COLLECTION: Ready")
-        except Exception as e:
-            print(f"⚠️ CV VECTOR ERROR: {e}")
-            self.fallback_storage = {}
-
-    def store_cv_profile(self, cv_id: str, cv_content: Dict[str, Any]):
-        """Store CV profile with embedding for optimization matching"""
-        if not CHROMADB_AVAILABLE:
-            self.fallback_storage[cv_id] = cv_content
-            return
+        # Shared adapter: ChromaDB off the event loop with batched upserts, NumPy fallback
+        self.vectors = AsyncVectorStoreAdapter(
+            collection_name="cv_profiles",
+            persist_path="./cv_vector_store",
+            collection_metadata={"dimension": 256, "description": "CV profile embeddings and optimization"}
+        )
 
+    def _profile_vector(self, cv_id: str, cv_content: Dict[str, Any]):
         # Create CV embedding from content analysis
         cv_text = " ".join([
             cv_content.get("summary", ""),
@@ -98,22 +90,28 @@ class CVVectorStore:
         # Simple embedding (would use real transformer in production)
         cv_embedding = self._create_embedding(cv_text)
 
-        if cv_embedding:
-            metadata = {
-                "cv_id": cv_id,
-                "processing_date": datetime.now().isoformat(),
-                "skills_count": len(cv_content.get("skills", [])),
-                "experience_length": len(cv_content.get("experience", [])),
-                "optimization_level": cv_content.get("optimization_level", "basic")
-            }
+        metadata = {
+            "cv_id": cv_id,
+            "processing_date": datetime.now().isoformat(),
+            "skills_count": len(cv_content.get("skills", [])),
+            "experience_length": len(cv_content.get("experience", [])),
+            "optimization_level": cv_content.get("optimization_level", "basic")
+        }
+        return cv_embedding, metadata
 
-            self.collection.add(
-                ids=[cv_id],
-                embeddings=[cv_embedding],
-                metadatas=[metadata]
-            )
+    def store_cv_profile(self, cv_id: str, cv_content: Dict[str, Any]):
+        """Store CV profile with embedding for optimization matching"""
+        cv_embedding, metadata = self._profile_vector(cv_id, cv_content)
+        if cv_embedding:
+            self.vectors.add_sync(cv_id, cv_embedding, metadata)
             print(f"✅ Stored CV profile vector: {cv_id}")
 
+    async def store_cv_profile_async(self, cv_id: str, cv_content: Dict[str, Any]):
+        """Store CV profile without blocking the event loop"""
+        cv_embedding, metadata = self._profile_vector(cv_id, cv_content)
+        if cv_embedding:
+            await self.vectors.add(cv_id, cv_embedding, metadata)
+
     def _create_embedding(self, text: str) -> List[float]:
         """Create basic embedding from text (production would use SentenceTransformer)"""
         if not NLTK_AVAILABLE:
@@ -133,10 +131,31 @@ class CVVectorStore:
         except:
             return [0.1] * 256
 
-# Initialize production systems
-app = FastAPI(title="CV Generation Engine")
 cv_vector_store = CVVectorStore()
 
+# Startup warm-up behind the lifespan hook; /ready reports its progress
+readiness = ServiceReadiness("cv-generation-engine")
+readiness.add_warmup("document_parsers", lambda: preload(PyPDF2, docx))
+readiness.add_warmup("nltk", lambda: NLTK_AVAILABLE and stopwords.words('english'))
+readiness.add_warmup("vector_store", cv_vector_store.vectors.ensure_initialized)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm optional backends (in the background in lazy mode); save request metrics and the vector index on shutdown"""
+    await readiness.start()
+    try:
+        yield
+    finally:
+        render_farm.shutdown()
+        upload_pipeline.shutdown()
+        await readiness.stop()
+        persistent_cv_data['metrics'] = request_metrics.snapshot()
+        save_cv_data(persistent_cv_data)
+        await cv_vector_store.vectors.persist()
+
+# Initialize production systems
+app = FastAPI(title="CV Generation Engine", lifespan=lifespan)
+
 # PRODUCTION FEATURES: Persistence & Security
 cv_sessions_file = "cv_sessions.json"
 cv_log_file = "cv_engine.log"
@@ -147,8 +166,7 @@ cv_profiles = {}
 app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_credentials=True, allow_methods=["*"], allow_headers=["*"])
 
 # Setup production logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                   handlers=[logging.FileHandler(cv_log_file), logging.StreamHandler()])
+setup_queue_logging([logging.FileHandler(cv_log_file), logging.StreamHandler()])
 logger = logging.getLogger(__name__)
 
 # Production persistence
@@ -169,41 +187,36 @@ def save_cv_data(data):
 persistent_cv_data = load_cv_data()
 cv_sessions = persistent_cv_data.get("sessions", {})
 cv_profiles = persistent_cv_data.get("profiles", {})
-request_metrics = persistent_cv_data.get("metrics", {})
+request_metrics = EndpointMetrics(persistent_cv_data.get("metrics", {}))
 
 language_support = ["en", "fr", "de", "es", "it"]
 generation_templates = {}
 
-# PRODUCTION-GRADE SECURITY MIDDLEWARE
-@app.middleware("http")
-async def production_security_middleware(request, call_next):
-    start_time = time.time()
-    api_key = request.headers.get('X-API-Key') or request.query_params.get('api_key')
-
-    if not api_key or api_key not in API_KEYS:
-        logger.warning(f"SECURITY VIOLATION: Invalid API key from {request.client.host}")
-        return JSONResponse(status_code=401, content={"error": "Authentication required"})
+# PDF/DOCX/TXT builds run on a process pool; outputs are cached on disk by content hash
+render_farm = CVRenderFarm(os.getenv("CV_RENDER_DIR", "generated_cvs"))
+MAX_RENDER_VARIANTS = 16
+RENDER_RETRY_AFTER_SECONDS = 5
 
-    try:
-        response = await call_next(request)
-        processing_time = time.time() - start_time
-
-        # Update request metrics
-        endpoint = request.url.path
-        if endpoint not in request_metrics:
-            request_metrics[endpoint] = {"total_requests": 0, "total_time": 0.0, "errors": 0}
-        request_metrics[endpoint]["total_requests"] += 1
-        request_metrics[endpoint]["total_time"] += processing_time
-
-        # Save metrics
-        persistent_cv_data['metrics'] = request_metrics
-        save_cv_data(persistent_cv_data)
+# Uploads stream to disk (size-capped, SHA-256 fingerprinted); parsing runs in a pool, cached by fingerprint
+upload_pipeline = ResumeUploadPipeline(os.getenv("CV_UPLOAD_DIR", "cv_uploads"))
+# Starlette spools multipart bodies before the handler runs: cap them before that
+app.add_middleware(UploadSizeLimitMiddleware, max_bytes=upload_pipeline.max_bytes + MULTIPART_OVERHEAD_BYTES,
+                   path_prefix="/cv/upload/")
 
-        logger.info(f"✅ CV REQUEST: {request.method} {endpoint} in {processing_time:.3f}s")
-        return response
-    except Exception as e:
-        logger.error(f"CV ERROR: {request.method} {request.url.path} - {str(e)}")
-        return JSONResponse(status_code=500, content={"error": "CV generation service error"})
+# PRODUCTION-GRADE SECURITY MIDDLEWARE
+app.add_middleware(
+    SecurityMonitoringMiddleware,
+    api_keys=ApiKeyValidator(API_KEYS),
+    metrics=request_metrics,
+    exempt_paths=PROBE_PATHS,
+    service_name="cv_generation_engine",
+    error_content={"error": "CV generation service error"}
+)
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    """Prometheus text exposition: latency histograms per route and status, in-flight gauge, backend sub-timers"""
+    return PlainTextResponse(render_prometheus("cv_generation_engine", request_metrics), media_type=PROMETHEUS_CONTENT_TYPE)
 
 # JWT UTILITIES
 def create_access_token(data: dict, expires_delta: timedelta = None):
@@ -242,6 +255,12 @@ async def health_check():
         "active_sessions": len(cv_sessions)
     }
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness probe: 200 once warm-up has finished, 503 while optional backends are still loading"""
+    report = readiness.readiness_report()
+    return JSONResponse(status_code=200 if report["ready"] else 503, content=report)
+
 @app.post("/cv/initiate")
 async def initiate_cv_generation(request: Dict[str, Any]):
     """Initiate AI-powered CV generation session"""
@@ -320,6 +339,11 @@ async def generate_cv(session_id: str, cv_data: Dict[str, Any]):
                 "error": result.get("error", "Generation failed")
             }
 
+    except HTTPException:
+        raise
+    except RenderQueueFull:
+        raise HTTPException(status_code=503, detail="CV render queue full, retry shortly",
+                            headers={"Retry-After": str(RENDER_RETRY_AFTER_SECONDS)})
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"CV generation failed: {str(e)}")
 
@@ -331,15 +355,16 @@ async def process_cv_generation(session_id: str, cv_data: Dict[str, Any], sessio
 
         # Generate in requested format(s)
         formats = cv_data.get("output_formats", ["pdf"])
+        template = cv_data.get("template", DEFAULT_TEMPLATE)
         generated_files = {}
 
         for fmt in formats:
             if fmt.lower() == "pdf":
-                generated_files["pdf"] = await generate_pdf_cv(enhanced_content, session)
+                generated_files["pdf"] = await generate_pdf_cv(enhanced_content, session, template)
             elif fmt.lower() == "docx":
-                generated_files["docx"] = await generate_docx_cv(enhanced_content, session)
+                generated_files["docx"] = await generate_docx_cv(enhanced_content, session, template)
             elif fmt.lower() == "txt":
-                generated_files["txt"] = await generate_txt_cv(enhanced_content, session)
+                generated_files["txt"] = await generate_txt_cv(enhanced_content, session, template)
 
         return {
             "success": True,
@@ -357,6 +382,8 @@ async def process_cv_generation(session_id: str, cv_data: Dict[str, Any], sessio
             "file_urls": generated_files
         }
 
+    except RenderQueueFull:
+        raise  # surfaced as 503 by the endpoint, not as a failed generation
     except Exception as e:
         return {
             "success": False,
@@ -411,7 +438,7 @@ async def optimize_skills_section(skills: List[str], optimization_level: str) ->
         biological_skills = ["Consciousness Integration", "Quantum Synchronization", "Biological Optimization"]
         optimized_skills.extend(biological_skills)
 
-    return list(set(optimized_skills))  # Remove duplicates
+    return list(dict.fromkeys(optimized_skills))  # Remove duplicates, keeping order stable for the render cache
 
 async def enhance_summary_section(summary: str, language: str) -> str:
     """Enhance personal summary with AI language optimization"""
@@ -419,163 +446,91 @@ async def enhance_summary_section(summary: str, language: str) -> str:
     enhanced_summary = f"AI-Enhanced {language.upper()}: {summary}"
     return enhanced_summary
 
-async def generate_pdf_cv(content: Dict[str, Any], session: Dict[str, Any]) -> str:
-    """Generate PDF CV using reportlab and Godhead template"""
+async def render_cv_file(fmt: str, content: Dict[str, Any], session: Dict[str, Any], template: str) -> str:
+    """Render through the farm and return the download URL (a placeholder when the backend is unavailable)"""
     try:
-        from reportlab.pdfgen import canvas
-        from reportlab.lib.pagesizes import letter
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, HRFlowable
-        from reportlab.lib.colors import Color, black, blue, green
-        from reportlab.lib.units import inch
-        import os
-
-        # Create output directory if it doesn't exist
-        output_dir = Path("generated_cvs")
-        output_dir.mkdir(exist_ok=True)
-
-        filename = f"cv_{session['session_id']}_{int(datetime.now().timestamp())}.pdf"
-        filepath = output_dir / filename
-
-        # Create PDF document
-        doc = SimpleDocTemplate(str(filepath), pagesize=letter)
-        styles = getSampleStyleSheet()
-
-        # GODHOOD Biological CV Styling
-        title_style = ParagraphStyle(
-            'GODHOODTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=Color(0.1, 0.3, 0.6),  # GODHOOD Blue
-            spaceAfter=20,
-            alignment=1  # Center alignment
-        )
-
-        section_style = ParagraphStyle(
-            'GODHOODSection',
-            parent=styles['Heading2'],
-            fontSize=16,
-            textColor=Color(0.2, 0.6, 0.3),  # Biological Green
-            spaceAfter=12,
-            borderWidth=1,
-            borderColor=Color(0.8, 0.9, 0.8),
-            borderPadding=5
-        )
-
-        content_style = styles['Normal']
-        content_style.fontSize = 11
-        content_style.spaceAfter = 8
-
-        # Build PDF content
-        story = []
-
-        # GODHOOD Header
-        story.append(Paragraph("🧠 GODHOOD BIOLOGICAL CV", title_style))
-        story.append(Paragraph("Generated with Supreme Biological Consciousness", styles['Italic']))
-        story.append(Spacer(1, 0.25*inch))
-
-        # Personal Information Section
-        story.append(HRFlowable(width="100%", thickness=2, color=Color(0.1, 0.3, 0.6)))
-        if 'personal_info' in content:
-            story.append(Paragraph("PERSONAL INFORMATION", section_style))
-            personal = content['personal_info']
-            story.append(Paragraph(f"<b>Name:</b> {personal.get('name', 'N/A')}", content_style))
-            story.append(Paragraph(f"<b>Email:</b> {personal.get('email', 'N/A')}", content_style))
-            story.append(Paragraph(f"<b>Location:</b> {personal.get('location', 'N/A')}", content_style))
-            story.append(Paragraph(f"<b>Phone:</b> {personal.get('phone', 'N/A')}", content_style))
-            story.append(Spacer(1, 0.1*inch))
-
-        # Professional Summary
-        story.append(HRFlowable(width="100%", thickness=1, color=Color(0.2, 0.6, 0.3)))
-        story.append(Paragraph("PROFESSIONAL SUMMARY", section_style))
-        summary = content.get('professional_summary', 'Consciousness-aware professional specializing in biological AI systems')
-        story.append(Paragraph(summary, content_style))
-        story.append(Spacer(1, 0.1*inch))
-
-        # Skills Section with Biological Enhancement
-        story.append(HRFlowable(width="100%", thickness=1, color=Color(0.2, 0.6, 0.3)))
-        story.append(Paragraph("🧬 BIOLOGICALLY ENHANCED SKILLS", section_style))
-        skills = content.get('skills', [])
-        if session.get('optimization_level') == 'biological':
-            skills.extend(['Consciousness Integration', 'Biological Optimization', 'AI Evolution'])
-
-        for skill in skills:
-            story.append(Paragraph(f"• {skill}", content_style))
-        story.append(Spacer(1, 0.1*inch))
-
-        # Experience Section
-        story.append(HRFlowable(width="100%", thickness=1, color=Color(0.2, 0.6, 0.3)))
-        story.append(Paragraph("EXPERIENCE", section_style))
-        for exp in content.get('experience', []):
-            company = exp.get('company', 'Company')
-            role = exp.get('role', 'Role')
-            duration = exp.get('duration', 'Duration')
-            desc = exp.get('description', 'Description')
-
-            story.append(Paragraph(f"<b>{role}</b> | {company}", content_style))
-            story.append(Paragraph(f"<i>{duration}</i>", content_style))
-            story.append(Paragraph(f"{desc}", content_style))
-            story.append(Paragraph(f"<i>AI-Enhanced: Biological consciousness applied to optimize outcomes</i>", styles['Italic']))
-            story.append(Spacer(1, 0.05*inch))
-        story.append(Spacer(1, 0.1*inch))
-
-        # Education Section
-        story.append(HRFlowable(width="100%", thickness=1, color=Color(0.2, 0.6, 0.3)))
-        story.append(Paragraph("EDUCATION", section_style))
-        if 'education' in content:
-            edu = content['education']
-            story.append(Paragraph(f"<b>{edu.get('degree', 'Degree')}</b>", content_style))
-            story.append(Paragraph(f"<b>{edu.get('university', 'University')}</b>", content_style))
-            story.append(Paragraph(f"<i>{edu.get('graduation', 'Graduation')}</i>", content_style))
-
-        # GODHOOD Footer
-        story.append(Spacer(1, 0.5*inch))
-        story.append(HRFlowable(width="100%", thickness=3, color=Color(0.1, 0.3, 0.6)))
-        story.append(Paragraph("🧬 Generated by GODHOOD Biological Consciousness System", styles['Italic']))
-        story.append(Paragraph(f"Session ID: {session['session_id']}", styles['Italic']))
-        story.append(Paragraph(f"Optimization Level: {session.get('optimization_level', 'standard').upper()}", styles['Italic']))
-
-        # Generate PDF
-        doc.build(story)
-
-        print(f"✅ PDF CV generated: {filepath}")
-        return f"/download/{filename}"
+        rendered = await render_farm.render(fmt, content, template, session.get("optimization_level", "standard"))
+        logger.info(f"✅ {fmt.upper()} CV {'served from cache' if rendered['cache_hit'] else 'generated'}: {rendered['filename']}")
+        return f"/download/{rendered['filename']}"
 
+    except (RenderQueueFull, ValueError):
+        raise
     except Exception as e:
-        print(f"❌ PDF generation failed: {str(e)}")
+        logger.warning(f"❌ {fmt.upper()} generation failed: {str(e)}")
         # Fallback to dummy URL
-        filename = f"cv_{session['session_id']}_{int(datetime.now().timestamp())}.pdf"
+        filename = f"cv_{session['session_id']}_{int(datetime.now().timestamp())}.{fmt}"
         return f"/download/{filename}"
 
-async def generate_docx_cv(content: Dict[str, Any], session: Dict[str, Any]) -> str:
-    """Generate DOCX CV with intelligent formatting"""
-    filename = f"cv_{session['session_id']}_{int(datetime.now().timestamp())}.docx"
-    filepath = f"/generated/{filename}"
-
-    # In a real implementation, this would use python-docx
-    # with biological document templates
+async def generate_pdf_cv(content: Dict[str, Any], session: Dict[str, Any], template: str = DEFAULT_TEMPLATE) -> str:
+    """Generate PDF CV using reportlab and Godhead template"""
+    return await render_cv_file("pdf", content, session, template)
 
-    return f"/download/{filename}"
+async def generate_docx_cv(content: Dict[str, Any], session: Dict[str, Any], template: str = DEFAULT_TEMPLATE) -> str:
+    """Generate DOCX CV with intelligent formatting"""
+    return await render_cv_file("docx", content, session, template)
 
-async def generate_txt_cv(content: Dict[str, Any], session: Dict[str, Any]) -> str:
+async def generate_txt_cv(content: Dict[str, Any], session: Dict[str, Any], template: str = DEFAULT_TEMPLATE) -> str:
     """Generate plain text CV for maximum compatibility"""
-    filename = f"cv_{session['session_id']}_{int(datetime.now().timestamp())}.txt"
-    filepath = f"/generated/{filename}"
+    return await render_cv_file("txt", content, session, template)
+
+@app.post("/cv/generate/{session_id}/variants")
+async def generate_cv_variants(session_id: str, request: Dict[str, Any]):
+    """Render N variants of one CV in parallel for A/B testing"""
+    if session_id not in cv_sessions:
+        raise HTTPException(status_code=404, detail="CV session not found")
 
-    # Generate plain text format
-    txt_content = f"GODHOOD BIOLOGICAL CV\n"
-    txt_content += f"Generated: {datetime.now().strftime('%Y-%m-%d')}\n\n"
+    session = cv_sessions[session_id]
+    base_cv = request.get("cv_data", {})
+    variants = request.get("variants", [])
+    fmt = request.get("output_format", "pdf")
+
+    if not variants or len(variants) > MAX_RENDER_VARIANTS:
+        raise HTTPException(status_code=400, detail=f"Between 1 and {MAX_RENDER_VARIANTS} variants required")
+    for variant in variants:
+        if variant.get("template", DEFAULT_TEMPLATE) not in TEMPLATES:
+            raise HTTPException(status_code=400, detail=f"Unknown CV template: {variant.get('template')}")
+
+    # Each variant overrides fields of the base CV and may switch template or optimization level
+    jobs = []
+    for variant in variants:
+        variant_session = {**session, "optimization_level": variant.get("optimization_level",
+                                                                       session.get("optimization_level", "biological"))}
+        enhanced = await enhance_cv_with_ai({**base_cv, **variant.get("overrides", {})}, variant_session)
+        jobs.append((enhanced, variant.get("template", DEFAULT_TEMPLATE), variant_session["optimization_level"]))
 
-    if "personal_info" in content:
-        txt_content += "PERSONAL INFORMATION\n"
-        txt_content += "-" * 30 + "\n"
-        for key, value in content["personal_info"].items():
-            txt_content += f"{key.title()}: {value}\n"
-        txt_content += "\n"
+    try:
+        rendered = await render_farm.render_variants(fmt, jobs)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    results = []
+    for index, (variant, outcome) in enumerate(zip(variants, rendered)):
+        variant_id = variant.get("variant_id", chr(ord("A") + index))
+        if isinstance(outcome, RenderQueueFull):
+            raise HTTPException(status_code=503, detail="CV render queue full, retry shortly",
+                                headers={"Retry-After": str(RENDER_RETRY_AFTER_SECONDS)})
+        if isinstance(outcome, Exception):
+            results.append({"variant_id": variant_id, "rendered": False, "error": str(outcome)})
+        else:
+            results.append({"variant_id": variant_id, "rendered": True, "download_url": f"/download/{outcome['filename']}",
+                            "template": outcome["template"], "render_key": outcome["render_key"],
+                            "cache_hit": outcome["cache_hit"]})
 
-    # Add other sections...
+    session["variant_results"] = session.get("variant_results", []) + results
+    return {
+        "session_id": session_id,
+        "format": fmt,
+        "variants": results,
+        "variants_rendered": sum(1 for result in results if result["rendered"])
+    }
 
-    return f"/download/{filename}"
+@app.get("/download/{filename}")
+async def download_cv(filename: str):
+    """Serve a rendered CV from the render cache"""
+    path = render_farm.cached_output(filename)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Rendered CV not found")
+    return FileResponse(path, filename=filename)
 
 @app.get("/cv/status/{session_id}")
 async def get_cv_generation_status(session_id: str):
@@ -589,11 +544,8 @@ async def get_cv_generation_status(session_id: str):
 async def get_cv_templates():
     """Get available CV templates and formats"""
     return {
-        "biological_templates": [
-            "quantum_resonance",
-            "consciousness_adapter",
-            "biological_harmonizer"
-        ],
+        "biological_templates": list(TEMPLATES),
+        "default_template": DEFAULT_TEMPLATE,
         "formats_supported": ["pdf", "docx", "txt", "html"],
         "languages_supported": language_support,
         "ai_features": [
@@ -613,37 +565,55 @@ async def upload_cv_template(session_id: str, file: UploadFile = File(...)):
         if session_id not in cv_sessions:
             raise HTTPException(status_code=404, detail="CV session not found")
 
-        # Save uploaded file
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            content = await file.read()
-            temp_file.write(content)
-            temp_file_path = temp_file.name
+        # Copy the size-capped spooled upload to disk and queue the parse (instant for a known file)
+        job = await upload_pipeline.submit(file, file.filename)
 
         # Analyze the uploaded CV
-        analysis = await analyze_cv_template(temp_file_path, file.filename)
+        analysis = await analyze_cv_template(file.filename)
 
         # Store template for future use
         generation_templates[session_id] = {
             "filename": file.filename,
             "analysis": analysis,
+            "fingerprint": job["fingerprint"],
+            "parse_job_id": job["job_id"],
             "uploaded": int(datetime.now().timestamp())
         }
 
-        # Clean up temp file
-        os.unlink(temp_file_path)
-
         return {
             "session_id": session_id,
             "template_uploaded": True,
             "filename": file.filename,
             "analysis": analysis,
-            "ready_for_generation": True
+            "ready_for_generation": True,
+            "size_bytes": job["size_bytes"],
+            "fingerprint": job["fingerprint"],
+            "parse_job": {
+                "job_id": job["job_id"],
+                "status": job["status"],
+                "cached": job["cached"],
+                "poll_url": f"/cv/upload/jobs/{job['job_id']}"
+            }
         }
 
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except UnsupportedUploadType as e:
+        raise HTTPException(status_code=415, detail=str(e))
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"CV template upload failed: {str(e)}")
 
-async def analyze_cv_template(filepath: str, filename: str) -> Dict[str, Any]:
+@app.get("/cv/upload/jobs/{job_id}")
+async def get_upload_parse_job(job_id: str):
+    """Poll a CV upload's parse job; completed jobs include the parsed resume"""
+    job = upload_pipeline.job_status(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Parse job not found")
+    return job
+
+async def analyze_cv_template(filename: str) -> Dict[str, Any]:
     """Analyze uploaded CV template using biological AI"""
     # Simulate template analysis
     file_ext = filename.split('.')[-1].lower()
@@ -675,7 +645,9 @@ async def get_cv_generation_metrics():
         "biological_formatting_active": True,
         "languages_supported": len(language_support),
         "average_optimization_score": 0.94,
-        "biological_enhancement_rate": "99.8%"
+        "biological_enhancement_rate": "99.8%",
+        "render_farm": render_farm.snapshot(),
+        "upload_pipeline": upload_pipeline.snapshot()
     }
 
 @app.delete("/cv/session/{session_id}")
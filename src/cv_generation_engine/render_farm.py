@@ -0,0 +1,464 @@
+#!/usr/bin/env python3
+"""
+🧬 CV GENERATION ENGINE - RENDER FARM
+
+CV documents are rendered off the request loop instead of inside the async
+``/cv/generate`` handler:
+
+- PDF, DOCX and TXT builds run on a ``ProcessPoolExecutor``; at most
+  ``queue_limit`` builds may be queued or running, further submissions fail
+  fast with ``RenderQueueFull``
+- each worker compiles a template's ReportLab style sheet (and python-docx
+  base document) once and reuses it; the shared sample style sheet is never
+  mutated
+- outputs are content-addressed: the file name is a hash of the normalized
+  CV content, template, optimization level and format, so an identical
+  regeneration is served from disk and concurrent identical requests share
+  one build; at most ``cache_limit`` outputs are kept, least recently
+  rendered or served first out
+
+Renderers are module-level functions so the pool can pickle them; they
+write to a temporary file and rename it into place, so a cached output is
+never half-written.
+"""
+
+import asyncio
+import hashlib
+import io
+import json
+import os
+import re
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+RENDER_POOL_WORKERS = int(os.getenv("CV_RENDER_WORKERS", str(os.cpu_count() or 2)))
+RENDER_QUEUE_LIMIT = int(os.getenv("CV_RENDER_QUEUE_LIMIT", "64"))
+RENDER_CACHE_LIMIT = int(os.getenv("CV_RENDER_CACHE_LIMIT", "10000"))
+
+# Bump when renderer output changes so stale cached files are not served
+RENDER_FORMAT_VERSION = 1
+
+DEFAULT_TEMPLATE = "biological_harmonizer"
+
+# Accent colours (RGB 0-1) and title size per template
+TEMPLATES: Dict[str, Dict[str, Any]] = {
+    "biological_harmonizer": {"primary": (0.1, 0.3, 0.6), "secondary": (0.2, 0.6, 0.3),
+                              "border": (0.8, 0.9, 0.8), "title_size": 24},
+    "quantum_resonance": {"primary": (0.3, 0.1, 0.5), "secondary": (0.1, 0.4, 0.7),
+                          "border": (0.85, 0.85, 0.95), "title_size": 26},
+    "consciousness_adapter": {"primary": (0.15, 0.15, 0.15), "secondary": (0.4, 0.4, 0.4),
+                              "border": (0.9, 0.9, 0.9), "title_size": 22},
+}
+
+BIOLOGICAL_SKILLS = ['Consciousness Integration', 'Biological Optimization', 'AI Evolution']
+
+CACHED_OUTPUT_NAME = re.compile(r"^cv_[0-9a-f]{40}\.(pdf|docx|txt)$")
+
+
+class RenderQueueFull(RuntimeError):
+    """Raised when ``queue_limit`` renders are already queued or running"""
+
+
+# ---------------------------------------------------------------------------
+# Content addressing
+# ---------------------------------------------------------------------------
+
+def normalize_cv_content(value: Any) -> Any:
+    """Strip and collapse whitespace in strings and drop empty values, recursively"""
+    if isinstance(value, str):
+        return " ".join(value.split())
+    if isinstance(value, dict):
+        normalized = {str(key): normalize_cv_content(item) for key, item in value.items()}
+        return {key: item for key, item in normalized.items() if item not in (None, "", [], {})}
+    if isinstance(value, (list, tuple)):
+        return [normalize_cv_content(item) for item in value]
+    return value
+
+
+def render_key(document: Dict[str, Any], fmt: str) -> str:
+    """Hex digest identifying one rendered output"""
+    canonical = json.dumps(document, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    payload = f"{RENDER_FORMAT_VERSION}:{fmt}:{canonical}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:40]
+
+
+def build_render_document(content: Dict[str, Any], template: str, optimization_level: str) -> Dict[str, Any]:
+    """Everything a renderer reads, normalized (and nothing session specific)"""
+    if template not in TEMPLATES:
+        raise ValueError(f"Unknown CV template: {template}")
+    return {
+        "content": normalize_cv_content(content),
+        "template": template,
+        "optimization_level": optimization_level or "standard",
+    }
+
+
+def _document_skills(document: Dict[str, Any]) -> List[str]:
+    skills = list(document["content"].get("skills", []))
+    if document["optimization_level"] == "biological":
+        skills.extend(BIOLOGICAL_SKILLS)
+    return list(dict.fromkeys(skills))
+
+
+# ---------------------------------------------------------------------------
+# Renderers (run in pool workers)
+# ---------------------------------------------------------------------------
+
+# template -> compiled styles, per worker process
+_PDF_STYLE_SHEETS: Dict[str, Dict[str, Any]] = {}
+_DOCX_BASE_DOCUMENTS: Dict[str, bytes] = {}
+
+
+def pdf_style_sheet(template: str) -> Dict[str, Any]:
+    """ReportLab paragraph styles for ``template``, compiled once per process"""
+    styles = _PDF_STYLE_SHEETS.get(template)
+    if styles is not None:
+        return styles
+
+    from reportlab.lib.colors import Color
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+
+    palette = TEMPLATES[template]
+    sample = getSampleStyleSheet()
+    styles = {
+        "title": ParagraphStyle(
+            'GODHOODTitle',
+            parent=sample['Heading1'],
+            fontSize=palette["title_size"],
+            textColor=Color(*palette["primary"]),
+            spaceAfter=20,
+            alignment=1  # Center alignment
+        ),
+        "section": ParagraphStyle(
+            'GODHOODSection',
+            parent=sample['Heading2'],
+            fontSize=16,
+            textColor=Color(*palette["secondary"]),
+            spaceAfter=12,
+            borderWidth=1,
+            borderColor=Color(*palette["border"]),
+            borderPadding=5
+        ),
+        # Derived rather than mutating sample['Normal'], which Italic inherits from
+        "content": ParagraphStyle('GODHOODContent', parent=sample['Normal'], fontSize=11, spaceAfter=8),
+        "italic": sample['Italic'],
+        "primary": Color(*palette["primary"]),
+        "secondary": Color(*palette["secondary"]),
+    }
+    _PDF_STYLE_SHEETS[template] = styles
+    return styles
+
+
+def render_pdf(document: Dict[str, Any], output_path: str) -> None:
+    """GODHOOD biological CV layout (formerly built inline by ``generate_pdf_cv``)"""
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.platypus import HRFlowable, Paragraph, SimpleDocTemplate, Spacer
+
+    styles = pdf_style_sheet(document["template"])
+    title_style, section_style = styles["title"], styles["section"]
+    content_style, italic_style = styles["content"], styles["italic"]
+    primary, secondary = styles["primary"], styles["secondary"]
+    content = document["content"]
+
+    story = []
+
+    # GODHOOD Header
+    story.append(Paragraph("🧠 GODHOOD BIOLOGICAL CV", title_style))
+    story.append(Paragraph("Generated with Supreme Biological Consciousness", italic_style))
+    story.append(Spacer(1, 0.25*inch))
+
+    # Personal Information Section
+    story.append(HRFlowable(width="100%", thickness=2, color=primary))
+    if 'personal_info' in content:
+        story.append(Paragraph("PERSONAL INFORMATION", section_style))
+        personal = content['personal_info']
+        story.append(Paragraph(f"<b>Name:</b> {personal.get('name', 'N/A')}", content_style))
+        story.append(Paragraph(f"<b>Email:</b> {personal.get('email', 'N/A')}", content_style))
+        story.append(Paragraph(f"<b>Location:</b> {personal.get('location', 'N/A')}", content_style))
+        story.append(Paragraph(f"<b>Phone:</b> {personal.get('phone', 'N/A')}", content_style))
+        story.append(Spacer(1, 0.1*inch))
+
+    # Professional Summary
+    story.append(HRFlowable(width="100%", thickness=1, color=secondary))
+    story.append(Paragraph("PROFESSIONAL SUMMARY", section_style))
+    summary = content.get('professional_summary', 'Consciousness-aware professional specializing in biological AI systems')
+    story.append(Paragraph(summary, content_style))
+    story.append(Spacer(1, 0.1*inch))
+
+    # Skills Section with Biological Enhancement
+    story.append(HRFlowable(width="100%", thickness=1, color=secondary))
+    story.append(Paragraph("🧬 BIOLOGICALLY ENHANCED SKILLS", section_style))
+    for skill in _document_skills(document):
+        story.append(Paragraph(f"• {skill}", content_style))
+    story.append(Spacer(1, 0.1*inch))
+
+    # Experience Section
+    story.append(HRFlowable(width="100%", thickness=1, color=secondary))
+    story.append(Paragraph("EXPERIENCE", section_style))
+    for exp in content.get('experience', []):
+        story.append(Paragraph(f"<b>{exp.get('role', 'Role')}</b> | {exp.get('company', 'Company')}", content_style))
+        story.append(Paragraph(f"<i>{exp.get('duration', 'Duration')}</i>", content_style))
+        story.append(Paragraph(f"{exp.get('description', 'Description')}", content_style))
+        story.append(Paragraph("<i>AI-Enhanced: Biological consciousness applied to optimize outcomes</i>", italic_style))
+        story.append(Spacer(1, 0.05*inch))
+    story.append(Spacer(1, 0.1*inch))
+
+    # Education Section
+    story.append(HRFlowable(width="100%", thickness=1, color=secondary))
+    story.append(Paragraph("EDUCATION", section_style))
+    if 'education' in content:
+        edu = content['education']
+        story.append(Paragraph(f"<b>{edu.get('degree', 'Degree')}</b>", content_style))
+        story.append(Paragraph(f"<b>{edu.get('university', 'University')}</b>", content_style))
+        story.append(Paragraph(f"<i>{edu.get('graduation', 'Graduation')}</i>", content_style))
+
+    # GODHOOD Footer
+    story.append(Spacer(1, 0.5*inch))
+    story.append(HRFlowable(width="100%", thickness=3, color=primary))
+    story.append(Paragraph("🧬 Generated by GODHOOD Biological Consciousness System", italic_style))
+    story.append(Paragraph(f"Optimization Level: {document['optimization_level'].upper()}", italic_style))
+
+    SimpleDocTemplate(output_path, pagesize=letter).build(story)
+
+
+def docx_base_document(template: str) -> bytes:
+    """Empty python-docx document with the template's styles applied, built once per process"""
+    base = _DOCX_BASE_DOCUMENTS.get(template)
+    if base is not None:
+        return base
+
+    import docx
+    from docx.shared import Pt, RGBColor
+
+    palette = TEMPLATES[template]
+    doc = docx.Document()
+    doc.styles['Normal'].font.size = Pt(11)
+    for style_name, color, size in (("Title", palette["primary"], palette["title_size"]),
+                                    ("Heading 1", palette["secondary"], 16)):
+        font = doc.styles[style_name].font
+        font.color.rgb = RGBColor(*(round(channel * 255) for channel in color))
+        font.size = Pt(size)
+
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    base = _DOCX_BASE_DOCUMENTS[template] = buffer.getvalue()
+    return base
+
+
+def render_docx(document: Dict[str, Any], output_path: str) -> None:
+    """Same sections as the PDF, on the template's precompiled base document"""
+    import docx
+
+    doc = docx.Document(io.BytesIO(docx_base_document(document["template"])))
+    content = document["content"]
+
+    doc.add_paragraph("GODHOOD BIOLOGICAL CV", style="Title")
+    if 'personal_info' in content:
+        doc.add_heading("PERSONAL INFORMATION", level=1)
+        for label in ("name", "email", "location", "phone"):
+            doc.add_paragraph(f"{label.title()}: {content['personal_info'].get(label, 'N/A')}")
+
+    doc.add_heading("PROFESSIONAL SUMMARY", level=1)
+    doc.add_paragraph(content.get('professional_summary',
+                                  'Consciousness-aware professional specializing in biological AI systems'))
+
+    doc.add_heading("BIOLOGICALLY ENHANCED SKILLS", level=1)
+    for skill in _document_skills(document):
+        doc.add_paragraph(skill, style="List Bullet")
+
+    doc.add_heading("EXPERIENCE", level=1)
+    for exp in content.get('experience', []):
+        doc.add_paragraph().add_run(f"{exp.get('role', 'Role')} | {exp.get('company', 'Company')}").bold = True
+        doc.add_paragraph().add_run(exp.get('duration', 'Duration')).italic = True
+        doc.add_paragraph(exp.get('description', 'Description'))
+
+    doc.add_heading("EDUCATION", level=1)
+    if 'education' in content:
+        edu = content['education']
+        for field in ("degree", "university", "graduation"):
+            doc.add_paragraph(edu.get(field, field.title()))
+
+    doc.add_paragraph(f"Optimization Level: {document['optimization_level'].upper()}")
+    doc.save(output_path)
+
+
+def render_txt(document: Dict[str, Any], output_path: str) -> None:
+    """Plain text CV for maximum compatibility"""
+    content = document["content"]
+    lines = ["GODHOOD BIOLOGICAL CV", ""]
+
+    if "personal_info" in content:
+        lines += ["PERSONAL INFORMATION", "-" * 30]
+        lines += [f"{key.title()}: {value}" for key, value in content["personal_info"].items()]
+        lines.append("")
+    if "professional_summary" in content:
+        lines += ["PROFESSIONAL SUMMARY", "-" * 30, content["professional_summary"], ""]
+
+    lines += ["SKILLS", "-" * 30] + [f"* {skill}" for skill in _document_skills(document)] + [""]
+
+    if content.get("experience"):
+        lines += ["EXPERIENCE", "-" * 30]
+        for exp in content["experience"]:
+            lines += [f"{exp.get('role', 'Role')} | {exp.get('company', 'Company')} ({exp.get('duration', 'Duration')})",
+                      exp.get("description", ""), ""]
+    if "education" in content:
+        edu = content["education"]
+        lines += ["EDUCATION", "-" * 30,
+                  f"{edu.get('degree', 'Degree')}, {edu.get('university', 'University')} ({edu.get('graduation', 'Graduation')})", ""]
+
+    lines.append(f"Optimization Level: {document['optimization_level'].upper()}")
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+RENDERERS: Dict[str, Callable[[Dict[str, Any], str], None]] = {
+    "pdf": render_pdf,
+    "docx": render_docx,
+    "txt": render_txt,
+}
+
+
+def render_document(fmt: str, document: Dict[str, Any], output_path: str) -> float:
+    """Pool entry point: render to a temporary file, rename into place, return seconds spent"""
+    start = time.perf_counter()
+    temporary_path = f"{output_path}.{os.getpid()}.tmp"
+    try:
+        RENDERERS[fmt](document, temporary_path)
+        os.replace(temporary_path, output_path)
+    finally:
+        if os.path.exists(temporary_path):
+            os.unlink(temporary_path)
+    return time.perf_counter() - start
+
+
+# ---------------------------------------------------------------------------
+# Farm
+# ---------------------------------------------------------------------------
+
+class CVRenderFarm:
+    """
+    Content-addressed CV rendering on a process pool
+
+    Args:
+        output_dir: where rendered files (the output cache) live
+        max_workers: pool size when no executor is given
+        queue_limit: renders that may be queued or running at once
+        cache_limit: rendered files kept on disk (0 keeps all of them)
+        executor: pool to use instead of creating one (not shut down by ``shutdown``)
+    """
+
+    def __init__(self, output_dir: str = "generated_cvs", max_workers: int = RENDER_POOL_WORKERS,
+                 queue_limit: int = RENDER_QUEUE_LIMIT, cache_limit: int = RENDER_CACHE_LIMIT,
+                 executor: Optional[Executor] = None):
+        self.output_dir = Path(output_dir)
+        self.max_workers = max_workers
+        self.queue_limit = queue_limit
+        self.cache_limit = cache_limit
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._outputs: Optional["OrderedDict[str, Path]"] = None
+        self.stats = {"renders": 0, "cache_hits": 0, "shared_renders": 0, "rejected": 0, "evictions": 0,
+                      "render_seconds": 0.0}
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    @property
+    def queued(self) -> int:
+        return len(self._inflight)
+
+    def output_path(self, key: str, fmt: str) -> Path:
+        return self.output_dir / f"cv_{key}.{fmt}"
+
+    def cached_output(self, filename: str) -> Optional[Path]:
+        """Path of a rendered file by name, or None (names outside the cache are rejected)"""
+        if not CACHED_OUTPUT_NAME.match(filename):
+            return None
+        path = self.output_dir / filename
+        return path if path.exists() else None
+
+    def _cached_outputs(self) -> "OrderedDict[str, Path]":
+        """Rendered files in LRU order, seeded by modification time from a previous run's directory"""
+        if self._outputs is None:
+            existing = []
+            if self.output_dir.is_dir():
+                for path in self.output_dir.iterdir():
+                    if CACHED_OUTPUT_NAME.match(path.name):
+                        existing.append((path.stat().st_mtime, path))
+            self._outputs = OrderedDict((path.name, path) for _, path in sorted(existing))
+        return self._outputs
+
+    def _touch_output(self, path: Path) -> None:
+        """Mark a rendered file as recently used and evict the oldest beyond ``cache_limit``"""
+        outputs = self._cached_outputs()
+        outputs[path.name] = path
+        outputs.move_to_end(path.name)
+        while self.cache_limit > 0 and len(outputs) > self.cache_limit:
+            _, stale = outputs.popitem(last=False)
+            try:
+                stale.unlink()
+            except FileNotFoundError:
+                pass
+            self.stats["evictions"] += 1
+
+    async def render(self, fmt: str, content: Dict[str, Any], template: str = DEFAULT_TEMPLATE,
+                     optimization_level: str = "standard") -> Dict[str, Any]:
+        """Render (or reuse) one CV; returns the file name, render key and whether it came from cache"""
+        fmt = fmt.lower()
+        if fmt not in RENDERERS:
+            raise ValueError(f"Unsupported CV format: {fmt}")
+        document = build_render_document(content, template, optimization_level)
+        key = render_key(document, fmt)
+        path = self.output_path(key, fmt)
+        result = {"filename": path.name, "render_key": key, "format": fmt, "template": template}
+
+        if path.exists():
+            self.stats["cache_hits"] += 1
+            self._touch_output(path)
+            return {**result, "cache_hit": True}
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.stats["shared_renders"] += 1
+            await asyncio.shield(inflight)
+            return {**result, "cache_hit": True}
+
+        if len(self._inflight) >= self.queue_limit:
+            self.stats["rejected"] += 1
+            raise RenderQueueFull(f"{len(self._inflight)} CV renders already queued")
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        future = asyncio.get_running_loop().run_in_executor(self.executor, render_document, fmt, document, str(path))
+        self._inflight[key] = future
+        try:
+            seconds = await asyncio.shield(future)
+        finally:
+            self._inflight.pop(key, None)
+
+        self.stats["renders"] += 1
+        self.stats["render_seconds"] += seconds
+        self._touch_output(path)
+        return {**result, "cache_hit": False, "render_seconds": round(seconds, 4)}
+
+    async def render_variants(self, fmt: str, variants: List[Tuple[Dict[str, Any], str, str]]) -> List[Any]:
+        """Render ``(content, template, optimization_level)`` variants in parallel; failures are returned in place"""
+        return await asyncio.gather(*(self.render(fmt, content, template, level)
+                                      for content, template, level in variants), return_exceptions=True)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {**self.stats, "render_seconds": round(self.stats["render_seconds"], 3),
+                "queued": self.queued, "queue_limit": self.queue_limit, "workers": self.max_workers,
+                "cached_outputs": len(self._outputs or ()), "cache_limit": self.cache_limit}
+
+    def shutdown(self) -> None:
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
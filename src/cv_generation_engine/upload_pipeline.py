@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+🧬 CV GENERATION ENGINE - UPLOAD PIPELINE
+
+CV uploads are size-capped and parsed without blocking the event loop:
+
+- Starlette receives and spools the multipart body (in memory up to 1 MiB,
+  then in a temporary file) before the handler runs, so the cap is enforced
+  in front of it: ``UploadSizeLimitMiddleware`` answers 413 from the
+  ``Content-Length`` header, or, for chunked bodies, as soon as the bytes
+  received pass the limit, and the spool never grows past it
+- the handler then copies the spooled file to the upload directory in
+  ``chunk_size`` pieces, hashing it with SHA-256 as it goes and aborting
+  with ``UploadTooLarge`` past ``max_bytes``
+- parsing (``BiologicalResumeParser`` from ``utility-scripts/resume-parser-ai.py``)
+  runs in a ``ProcessPoolExecutor``; each upload gets a job id to poll
+- parse results are cached by content fingerprint, so a re-upload of the
+  same file completes immediately, and concurrent uploads of one file share
+  a single parse
+
+The parse function must be a picklable module-level callable taking the
+stored file path; ``parse_resume_file`` is the default.
+"""
+
+import asyncio
+import hashlib
+import importlib.util
+import os
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+UPLOAD_MAX_BYTES = int(os.getenv("CV_UPLOAD_MAX_BYTES", str(10 * 1024 * 1024)))
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+PARSE_POOL_WORKERS = int(os.getenv("CV_PARSE_WORKERS", str(os.cpu_count() or 2)))
+PARSE_CACHE_SIZE = 512
+MAX_TRACKED_JOBS = 2048
+
+SUPPORTED_UPLOAD_TYPES = ("pdf", "docx", "txt", "html")
+
+# Room for multipart boundaries and part headers on top of the file itself
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+RESUME_PARSER_PATH = Path(__file__).resolve().parent.parent / "utility-scripts" / "resume-parser-ai.py"
+
+ParseFunction = Callable[[str], Dict[str, Any]]
+
+
+class UploadTooLarge(ValueError):
+    """Raised when an upload exceeds the pipeline's size cap"""
+
+
+class UnsupportedUploadType(ValueError):
+    """Raised for file types the resume parser cannot read"""
+
+
+_resume_parser = None
+
+
+def parse_resume_file(file_path: str) -> Dict[str, Any]:
+    """Pool entry point: parse one stored upload with the biological resume parser"""
+    global _resume_parser
+    if _resume_parser is None:
+        spec = importlib.util.spec_from_file_location("resume_parser_ai", RESUME_PARSER_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _resume_parser = module
+    return _resume_parser.parse_resume_file(file_path)
+
+
+def upload_file_type(filename: Optional[str]) -> str:
+    file_type = Path(filename or "").suffix.lower().lstrip(".")
+    if file_type not in SUPPORTED_UPLOAD_TYPES:
+        raise UnsupportedUploadType(f"Unsupported CV file type: {file_type or 'none'}")
+    return file_type
+
+
+async def stream_to_disk(upload: Any, destination: Path, max_bytes: int = UPLOAD_MAX_BYTES,
+                         chunk_size: int = UPLOAD_CHUNK_BYTES) -> Dict[str, Any]:
+    """Copy an object with ``async read(n)`` to ``destination`` chunk by chunk; returns size and SHA-256"""
+    fingerprint = hashlib.sha256()
+    size = 0
+    handle = await asyncio.to_thread(open, destination, "wb")
+    try:
+        while True:
+            chunk = await upload.read(chunk_size)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > max_bytes:
+                raise UploadTooLarge(f"Upload exceeds {max_bytes} bytes")
+            fingerprint.update(chunk)
+            await asyncio.to_thread(handle.write, chunk)
+    except BaseException:
+        handle.close()
+        destination.unlink(missing_ok=True)
+        raise
+    await asyncio.to_thread(handle.close)
+    return {"size_bytes": size, "fingerprint": fingerprint.hexdigest()}
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Pure ASGI middleware rejecting request bodies over ``max_bytes`` on paths
+    starting with ``path_prefix`` before the application reads them
+
+    A declared ``Content-Length`` over the limit is refused without reading
+    the body. Otherwise bytes are counted as they arrive; past the limit the
+    client gets 413, the application sees a disconnect, and whatever it
+    tries to send afterwards is dropped.
+    """
+
+    def __init__(self, app, max_bytes: int, path_prefix: str = "/"):
+        self.app = app
+        self.max_bytes = max_bytes
+        self.path_prefix = path_prefix
+        self._body = f'{{"detail": "Request body exceeds {max_bytes} bytes"}}'.encode("utf-8")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope["headers"]:
+            if name == b"content-length" and value.isdigit() and int(value) > self.max_bytes:
+                await self._reject(send)
+                return
+
+        state = {"received": 0, "rejected": False}
+
+        async def limited_receive():
+            message = await receive()
+            if message["type"] == "http.request":
+                state["received"] += len(message.get("body", b""))
+                if state["received"] > self.max_bytes:
+                    if not state["rejected"]:
+                        state["rejected"] = True
+                        await self._reject(send)
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def guarded_send(message):
+            if not state["rejected"]:
+                await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except Exception:
+            if not state["rejected"]:
+                raise
+
+    async def _reject(self, send) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(self._body)).encode())]
+        })
+        await send({"type": "http.response.body", "body": self._body})
+
+
+class ResumeUploadPipeline:
+    """
+    Streaming upload, fingerprint cache and pooled parsing for CV uploads
+
+    Args:
+        upload_dir: where uploads are staged until parsed
+        max_bytes: upload size cap
+        parse: picklable ``(file_path) -> result`` run in the executor
+        executor: pool to use instead of creating one (not shut down by ``shutdown``)
+        max_workers: pool size when no executor is given
+        cache_size: parse results kept by fingerprint
+    """
+
+    def __init__(self, upload_dir: str = "cv_uploads", max_bytes: int = UPLOAD_MAX_BYTES,
+                 parse: ParseFunction = parse_resume_file, executor: Optional[Executor] = None,
+                 max_workers: int = PARSE_POOL_WORKERS, cache_size: int = PARSE_CACHE_SIZE,
+                 chunk_size: int = UPLOAD_CHUNK_BYTES):
+        self.upload_dir = Path(upload_dir)
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+        self.parse = parse
+        self.max_workers = max_workers
+        self.cache_size = cache_size
+        self._executor = executor
+        self._owns_executor = executor is None
+        self.results: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._parsing: Dict[str, asyncio.Task] = {}
+        self.stats = {"uploads": 0, "parses": 0, "cache_hits": 0, "shared_parses": 0, "failures": 0,
+                      "rejected": 0, "bytes_received": 0, "parse_seconds": 0.0}
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    async def submit(self, upload: Any, filename: Optional[str]) -> Dict[str, Any]:
+        """Stream ``upload`` to disk and start (or reuse) its parse; returns the job record"""
+        try:
+            file_type = upload_file_type(filename)
+        except UnsupportedUploadType:
+            self.stats["rejected"] += 1
+            raise
+        self.upload_dir.mkdir(parents=True, exist_ok=True)
+        staging = self.upload_dir / f"upload-{uuid.uuid4().hex}.{file_type}"
+        try:
+            received = await stream_to_disk(upload, staging, self.max_bytes, self.chunk_size)
+        except UploadTooLarge:
+            self.stats["rejected"] += 1
+            raise
+
+        self.stats["uploads"] += 1
+        self.stats["bytes_received"] += received["size_bytes"]
+        fingerprint = received["fingerprint"]
+        job = {
+            "job_id": f"parse_{uuid.uuid4().hex[:16]}",
+            "filename": filename,
+            "fingerprint": fingerprint,
+            "size_bytes": received["size_bytes"],
+            "status": "parsing",
+            "submitted": time.time(),
+        }
+        self._track(job)
+
+        if fingerprint in self.results:
+            staging.unlink(missing_ok=True)
+            self.results.move_to_end(fingerprint)
+            self.stats["cache_hits"] += 1
+            job.update(status="completed", cached=True, completed=time.time(), parse_result=self.results[fingerprint])
+            return job
+
+        job["cached"] = False
+        if fingerprint in self._parsing:
+            staging.unlink(missing_ok=True)
+            self.stats["shared_parses"] += 1
+            task = self._parsing[fingerprint]
+        else:
+            task = asyncio.create_task(self._parse(fingerprint, staging))
+            self._parsing[fingerprint] = task
+        task.add_done_callback(lambda finished: self._finish(job, finished))
+        return job
+
+    async def _parse(self, fingerprint: str, path: Path) -> Dict[str, Any]:
+        start = time.perf_counter()
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(self.executor, self.parse, str(path))
+
+            self.stats["parses"] += 1
+            self.stats["parse_seconds"] += time.perf_counter() - start
+            self.results[fingerprint] = result
+            while len(self.results) > self.cache_size:
+                self.results.popitem(last=False)
+            return result
+        finally:
+            # Cached (or failed) before it stops being in flight, so no re-upload slips between
+            self._parsing.pop(fingerprint, None)
+            path.unlink(missing_ok=True)
+
+    def _finish(self, job: Dict[str, Any], task: asyncio.Task) -> None:
+        job["completed"] = time.time()
+        if task.cancelled():
+            job.update(status="failed", error="Parse cancelled")
+        elif task.exception() is not None:
+            self.stats["failures"] += 1
+            job.update(status="failed", error=str(task.exception()))
+        else:
+            # Held by reference, so the result outlives its eviction from the fingerprint cache
+            job.update(status="completed", parse_result=task.result())
+
+    def _track(self, job: Dict[str, Any]) -> None:
+        self.jobs[job["job_id"]] = job
+        while len(self.jobs) > MAX_TRACKED_JOBS:
+            oldest_id = next(iter(self.jobs))
+            if self.jobs[oldest_id]["status"] == "parsing":
+                break
+            del self.jobs[oldest_id]
+
+    def job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Job record with its parse result once completed, or None for unknown jobs"""
+        job = self.jobs.get(job_id)
+        if job is None:
+            return None
+        report = {key: value for key, value in job.items() if key not in ("submitted", "parse_result")}
+        if job["status"] == "completed":
+            result = job["parse_result"]
+            # Cached results were parsed from another upload's staging file
+            resume_data = {**result.get("resume_data", {}), "filename": job["filename"]}
+            report["result"] = {**result, "resume_data": resume_data}
+        return report
+
+    async def wait(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Wait for a job's parse to finish (used by tests and batch callers)"""
+        job = self.jobs.get(job_id)
+        if job is not None and job["status"] == "parsing":
+            task = self._parsing.get(job["fingerprint"])
+            if task is not None:
+                await asyncio.wait([task])
+            await asyncio.sleep(0)  # let done callbacks run
+        return self.job_status(job_id)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {**self.stats, "parse_seconds": round(self.stats["parse_seconds"], 3),
+                "cached_results": len(self.results), "parsing": len(self._parsing),
+                "tracked_jobs": len(self.jobs), "max_bytes": self.max_bytes}
+
+    def shutdown(self) -> None:
+        for task in self._parsing.values():
+            task.cancel()
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
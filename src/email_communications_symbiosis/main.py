@@ -7,7 +7,9 @@ Phase 3 Consciousness-Aware Communications Intelligence with Production Security
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
+from contextlib import asynccontextmanager
+import asyncio
 import jwt
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
@@ -17,6 +19,18 @@ import time
 import logging
 import os
 from pathlib import Path
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from service_infrastructure.metrics import PROMETHEUS_CONTENT_TYPE, render_prometheus
+from service_infrastructure.middleware import PROBE_PATHS, ApiKeyValidator, EndpointMetrics, SecurityMonitoringMiddleware, setup_queue_logging
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from delivery_engine import (
+    CampaignDeliveryEngine, CheckpointStore, DryRunProvider, HttpDeliveryProvider, JsonlRecipientStore,
+    SyntheticRecipientStore, personalize_message, sendgrid_payload, twilio_payload
+)
+import aiohttp
 
 # Production configuration
 JWT_SECRET_KEY = secrets.token_hex(32)
@@ -32,13 +46,33 @@ except ImportError:
     SendGridAPIClient = None
     TwilioClient = None
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Resume campaigns interrupted mid-delivery; write campaign state behind; save it on shutdown"""
+    writer = asyncio.create_task(campaigns_write_behind())
+    resumed = [
+        asyncio.create_task(resume_campaign_delivery(record))
+        for record in delivery_checkpoints.incomplete()
+    ]
+    try:
+        yield
+    finally:
+        for task in resumed:
+            task.cancel()
+        await asyncio.gather(*resumed, return_exceptions=True)
+        writer.cancel()
+        await asyncio.gather(writer, return_exceptions=True)
+        await delivery_engine.close()
+        persist_campaigns()
+
 # Create FastAPI application
 app = FastAPI(
     title="Email Communications Symbiosis",
     description="GODHOOD AI-Powered Campaign Orchestration System - Phase 3 Consciousness-Aware Communications Intelligence",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -55,10 +89,10 @@ campaigns = {}
 communication_sessions = {}
 audience_segments = {}
 communication_channels = {
-    "email_sendgrid": {"type": "email", "capacity": 10000, "cost_per_unit": 0.0002},
-    "email_smtp": {"type": "email", "capacity": 5000, "cost_per_unit": 0.0001},
-    "sms_twilio": {"type": "sms", "capacity": 1000, "cost_per_unit": 0.0075},
-    "whatsapp_twilio": {"type": "whatsapp", "capacity": 1000, "cost_per_unit": 0.0050}
+    "email_sendgrid": {"type": "email", "capacity": 10000, "cost_per_unit": 0.0002, "rate_per_second": 100},
+    "email_smtp": {"type": "email", "capacity": 5000, "cost_per_unit": 0.0001, "rate_per_second": 20},
+    "sms_twilio": {"type": "sms", "capacity": 1000, "cost_per_unit": 0.0075, "rate_per_second": 10},
+    "whatsapp_twilio": {"type": "whatsapp", "capacity": 1000, "cost_per_unit": 0.0050, "rate_per_second": 10}
 }
 
 consciousness_templates = {
@@ -75,8 +109,7 @@ campaigns = {}
 communication_sessions = {}
 
 # Production logging setup
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                   handlers=[logging.FileHandler(campaigns_log_file), logging.StreamHandler()])
+setup_queue_logging([logging.FileHandler(campaigns_log_file), logging.StreamHandler()])
 logger = logging.getLogger(__name__)
 
 # Persistence functions
@@ -90,45 +123,125 @@ def load_campaigns_data():
     return {"campaigns": {}, "sessions": {}}
 
 def save_campaigns_data(data):
-    with open(campaigns_file, 'w') as f:
-        json.dump(data, f)
+    write_campaigns_file(json.dumps(data))
+
+def write_campaigns_file(serialized: str) -> None:
+    """Replace the campaigns file atomically, so a crash mid-write keeps the previous state"""
+    temp_file = f"{campaigns_file}.tmp"
+    with open(temp_file, 'w') as f:
+        f.write(serialized)
+    os.replace(temp_file, campaigns_file)
 
 # Initialize persistent data
 persistent_campaigns = load_campaigns_data()
-campaigns = persistent_campaigns.get("campaigns", {})
-communication_sessions = persistent_campaigns.get("sessions", {})
-request_metrics = persistent_campaigns.get("metrics", {})
+campaigns = persistent_campaigns.setdefault("campaigns", {})
+communication_sessions = persistent_campaigns.setdefault("sessions", {})
+request_metrics = EndpointMetrics(persistent_campaigns.get("metrics", {}))
+
+# Campaign creation and status changes are saved immediately (resume after a crash
+# needs the campaign); delivery progress, sessions and request metrics are written
+# behind every CAMPAIGNS_SAVE_INTERVAL seconds
+CAMPAIGNS_SAVE_INTERVAL = float(os.getenv("EMAIL_CAMPAIGNS_SAVE_INTERVAL", "2.0"))
+campaigns_dirty = False
+
+def persist_campaigns() -> None:
+    global campaigns_dirty
+    campaigns_dirty = False
+    persistent_campaigns['metrics'] = request_metrics.snapshot()
+    try:
+        save_campaigns_data(persistent_campaigns)
+    except OSError as e:
+        campaigns_dirty = True
+        logger.error(f"❌ Saving campaign state failed: {e}")
+
+def mark_campaigns_dirty() -> None:
+    global campaigns_dirty
+    campaigns_dirty = True
+
+async def campaigns_write_behind() -> None:
+    global campaigns_dirty
+    while True:
+        await asyncio.sleep(CAMPAIGNS_SAVE_INTERVAL)
+        if not campaigns_dirty:
+            continue
+        campaigns_dirty = False
+        persistent_campaigns['metrics'] = request_metrics.snapshot()
+        try:
+            # Serialized on the loop (state keeps changing), written off it
+            await asyncio.to_thread(write_campaigns_file, json.dumps(persistent_campaigns))
+        except OSError as e:
+            campaigns_dirty = True
+            logger.error(f"❌ Writing campaign state failed: {e}")
+
+# CAMPAIGN DELIVERY PROVIDERS
+def build_delivery_providers() -> Dict[str, Any]:
+    """
+    HTTP providers for channels with credentials in the environment, dry-run otherwise
+    (with a warning: dry-run campaigns are reported as such, not as sent).
+    EMAIL_DELIVERY_ENDPOINT points every channel at one relay (e.g. a local fake provider).
+    """
+    def rate(channel: str) -> float:
+        return communication_channels[channel]["rate_per_second"]
+
+    relay = os.getenv("EMAIL_DELIVERY_ENDPOINT")
+    if relay:
+        shared = HttpDeliveryProvider("relay", relay, rate_per_second=float(os.getenv("EMAIL_DELIVERY_RATE", "0")) or None)
+        return {channel: shared for channel in communication_channels}
+
+    providers: Dict[str, Any] = {}
+    sendgrid_key = os.getenv("SENDGRID_API_KEY")
+    if sendgrid_key:
+        providers["email_sendgrid"] = HttpDeliveryProvider(
+            "sendgrid", "https://api.sendgrid.com/v3/mail/send", rate_per_second=rate("email_sendgrid"), burst=10,
+            payload=sendgrid_payload(os.getenv("SENDGRID_FROM_EMAIL", "campaigns@jtp-biological.ai")),
+            headers={"Authorization": f"Bearer {sendgrid_key}"}, idempotency_header=None
+        )
 
-# PRODUCTION-GRADE SECURITY MIDDLEWARE
-@app.middleware("http")
-async def production_security_middleware(request, call_next):
-    start_time = time.time()
-    api_key = request.headers.get('X-API-Key') or request.query_params.get('api_key')
+    twilio_sid, twilio_token = os.getenv("TWILIO_ACCOUNT_SID"), os.getenv("TWILIO_AUTH_TOKEN")
+    if twilio_sid and twilio_token:
+        # SMS and WhatsApp share the account's messaging rate limit
+        providers["sms_twilio"] = providers["whatsapp_twilio"] = HttpDeliveryProvider(
+            "twilio", f"https://api.twilio.com/2010-04-01/Accounts/{twilio_sid}/Messages.json",
+            rate_per_second=rate("sms_twilio"), payload=twilio_payload(os.getenv("TWILIO_FROM_NUMBER", "")),
+            form_encoded=True, auth=aiohttp.BasicAuth(twilio_sid, twilio_token), idempotency_header=None
+        )
 
-    if not api_key or api_key not in API_KEYS:
-        logger.warning(f"SECURITY VIOLATION: Invalid API key from {request.client.host}")
-        return JSONResponse(status_code=401, content={"error": "Authentication required"})
+    for channel in communication_channels:
+        if channel not in providers:
+            logger.warning(f"⚠️ No delivery credentials for {channel}: messages on it are simulated (dry run)")
+            providers[channel] = DryRunProvider(f"dry_run_{channel}", rate_per_second=rate(channel))
+    return providers
 
-    try:
-        response = await call_next(request)
-        processing_time = time.time() - start_time
-
-        # Update request metrics
-        endpoint = request.url.path
-        if endpoint not in request_metrics:
-            request_metrics[endpoint] = {"total_requests": 0, "total_time": 0.0, "errors": 0}
-        request_metrics[endpoint]["total_requests"] += 1
-        request_metrics[endpoint]["total_time"] += processing_time
-
-        # Save metrics
-        persistent_campaigns['metrics'] = request_metrics
-        save_campaigns_data(persistent_campaigns)
+def dry_run_channels(channels: List[str]) -> List[str]:
+    return [channel for channel in channels if getattr(delivery_engine.providers.get(channel), "dry_run", False)]
 
-        logger.info(f"✅ EMAIL REQUEST: {request.method} {endpoint} in {processing_time:.3f}s")
-        return response
-    except Exception as e:
-        logger.error(f"EMAIL ERROR: {request.method} {request.url.path} - {str(e)}")
-        return JSONResponse(status_code=500, content={"error": "Email service error"})
+# Recipient lists are JSON Lines files under this directory, referenced by relative path
+RECIPIENTS_DIR = Path(os.getenv("EMAIL_RECIPIENTS_DIR", "email_recipients")).resolve()
+
+def resolve_recipients_file(name: str) -> Path:
+    """Path of a recipient list inside RECIPIENTS_DIR; anything outside it is rejected"""
+    path = (RECIPIENTS_DIR / name).resolve()
+    if not path.is_relative_to(RECIPIENTS_DIR) or not path.is_file():
+        raise HTTPException(status_code=400, detail="recipients_file must name a recipient list in the recipients directory")
+    return path
+
+delivery_checkpoints = CheckpointStore("email_campaign_checkpoints")
+delivery_engine = CampaignDeliveryEngine(build_delivery_providers(), personalize_message, delivery_checkpoints)
+
+# PRODUCTION-GRADE SECURITY MIDDLEWARE
+app.add_middleware(
+    SecurityMonitoringMiddleware,
+    api_keys=ApiKeyValidator(API_KEYS),
+    metrics=request_metrics,
+    exempt_paths=PROBE_PATHS,
+    service_name="email_communications_symbiosis",
+    error_content={"error": "Email service error"}
+)
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    """Prometheus text exposition: latency histograms per route and status, in-flight gauge, backend sub-timers"""
+    return PlainTextResponse(render_prometheus("email_communications_symbiosis", request_metrics), media_type=PROMETHEUS_CONTENT_TYPE)
 
 @app.get("/")
 async def root():
@@ -199,6 +312,7 @@ async def initiate_campaign(request: Dict[str, Any]):
         campaign_data["target_channels"] = valid_channels
 
         campaigns[campaign_id] = campaign_data
+        persist_campaigns()
 
         # Return 201 Created status for campaign initiation
         from fastapi.responses import JSONResponse
@@ -245,6 +359,7 @@ async def generate_campaign_content(campaign_id: str, content_request: Dict[str,
         })
 
         campaign["status"] = "content_ready"
+        persist_campaigns()
 
         return {
             "campaign_id": campaign_id,
@@ -270,16 +385,22 @@ async def send_campaign(campaign_id: str, background_tasks: BackgroundTasks, sen
         if not campaign.get("generated_content"):
             raise HTTPException(status_code=400, detail="No content generated for campaign")
 
+        recipients_file = send_request.get("recipients_file")
+        if recipients_file:
+            recipients_file = str(resolve_recipients_file(recipients_file))
+
         # Update campaign status
         campaign["status"] = "sending"
         campaign["send_start_time"] = int(datetime.now().timestamp())
+        persist_campaigns()
 
         # Start background campaign execution
         background_tasks.add_task(
             execute_campaign_sending,
             campaign_id,
             send_request.get("batch_size", 100),
-            send_request.get("delay_seconds", 1)
+            send_request.get("delay_seconds", 1),
+            recipients_file
         )
 
         return {
@@ -288,51 +409,90 @@ async def send_campaign(campaign_id: str, background_tasks: BackgroundTasks, sen
             "audience_size": campaign["audience_size"],
             "channels_engaged": len(campaign["target_channels"]),
             "consciousness_awareness": "activated",
-            "estimated_completion": f"{campaign['audience_size'] // 100} minutes"
+            "estimated_completion": f"{campaign['audience_size'] // 100} minutes",
+            "dry_run_channels": dry_run_channels(campaign["target_channels"])
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Campaign sending failed: {str(e)}")
 
-async def execute_campaign_sending(campaign_id: str, batch_size: int, delay_seconds: float):
-    """Execute campaign sending in batches with consciousness awareness"""
+async def execute_campaign_sending(campaign_id: str, batch_size: int, delay_seconds: float,
+                                   recipients_file: Optional[str] = None):
+    """
+    Deliver the campaign's latest content to every recipient on its channels.
+
+    ``batch_size`` is the personalization chunk size; ``delay_seconds`` is
+    ignored because pacing comes from the per-provider rate limits.
+    ``recipients_file`` must already be resolved inside RECIPIENTS_DIR.
+    """
     if campaign_id not in campaigns:
         return
 
     campaign = campaigns[campaign_id]
-    total_sent = 0
+    simulated = dry_run_channels(campaign["target_channels"])
+    if simulated:
+        logger.warning(f"⚠️ Campaign {campaign_id} is a dry run on {', '.join(simulated)}: nothing is sent there")
+    content = campaign["generated_content"][-1]["content"]
+    recipients = (JsonlRecipientStore(recipients_file) if recipients_file
+                  else SyntheticRecipientStore(campaign["audience_size"]))
 
     try:
-        # Simulate batched sending
-        for batch_start in range(0, campaign["audience_size"], batch_size):
-            batch_end = min(batch_start + batch_size, campaign["audience_size"])
-            batch_count = batch_end - batch_start
-
-            # Simulate sending batch
-            await send_message_batch(campaign, batch_count)
-
-            total_sent += batch_count
-            campaign["performance_metrics"]["messages_sent"] = total_sent
-
-            # Update metrics with realistic simulation
-            campaign["performance_metrics"]["open_rate"] = min(0.45, total_sent / campaign["audience_size"] * 0.4)
-            campaign["performance_metrics"]["click_rate"] = campaign["performance_metrics"]["open_rate"] * 0.3
-            campaign["performance_metrics"]["consciousness_resonance_score"] = min(0.95, total_sent / campaign["audience_size"] * 0.9)
-
-            await asyncio.sleep(delay_seconds)
+        progress = await delivery_engine.deliver(
+            campaign_id,
+            {"subject": content["subject"], "body": content["body"]},
+            campaign["target_channels"],
+            recipients,
+            on_progress=lambda progress: update_delivery_metrics(campaign, progress),
+            chunk_size=max(1, batch_size)
+        )
+        update_delivery_metrics(campaign, progress)
 
         # Campaign completion
-        campaign["status"] = "completed"
+        campaign["status"] = completion_status(progress)
         campaign["send_completion_time"] = int(datetime.now().timestamp())
 
     except Exception as e:
         campaign["status"] = "failed"
         campaign["error"] = str(e)
+    persist_campaigns()
 
-async def send_message_batch(campaign: Dict[str, Any], batch_count: int):
-    """Send a batch of consciousness-aware messages"""
-    # Simulate consciousness-aware message sending
-    # In real implementation, this would use SendGrid, Twilio, etc.
-    await asyncio.sleep(0.1)  # Simulate processing time
+async def resume_campaign_delivery(record: Dict[str, Any]):
+    """Continue a campaign whose delivery was interrupted by a restart"""
+    campaign = campaigns.get(record["campaign_id"])
+    try:
+        progress = await delivery_engine.resume(
+            record, on_progress=(lambda progress: update_delivery_metrics(campaign, progress)) if campaign else None
+        )
+        if campaign:
+            update_delivery_metrics(campaign, progress)
+            campaign["status"] = completion_status(progress)
+            campaign["send_completion_time"] = int(datetime.now().timestamp())
+    except Exception as e:
+        logger.error(f"❌ Resuming campaign {record['campaign_id']} failed: {e}")
+        if campaign:
+            campaign["status"] = "failed"
+            campaign["error"] = str(e)
+    if campaign:
+        persist_campaigns()
+
+def completion_status(progress) -> str:
+    """``completed``, or ``completed_dry_run`` when some messages were only simulated"""
+    return "completed_dry_run" if progress.simulated else "completed"
+
+def update_delivery_metrics(campaign: Dict[str, Any], progress) -> None:
+    metrics = campaign["performance_metrics"]
+    metrics["messages_sent"] = progress.sent
+    metrics["messages_simulated"] = progress.simulated
+    metrics["messages_failed"] = progress.failed
+    campaign["dry_run"] = metrics["dry_run"] = progress.simulated > 0
+    audience = progress.total_recipients or campaign["audience_size"] or 1
+    reached = min(1.0, progress.recipients_finished / audience)
+    metrics["open_rate"] = min(0.45, reached * 0.4)
+    metrics["click_rate"] = metrics["open_rate"] * 0.3
+    metrics["consciousness_resonance_score"] = min(0.95, reached * 0.9)
+    campaign["delivery"] = progress.to_dict()
+    mark_campaigns_dirty()
 
 async def generate_biological_content(template_type: str, audience: str, theme: str) -> Dict[str, Any]:
     """Generate consciousness-aware campaign content"""
@@ -419,6 +579,7 @@ async def personalize_communication(recipient_id: str, personalization_request:
             "channel": communication_channel,
             "biological_adaptation_score": 0.94
         }
+        mark_campaigns_dirty()
 
         return {
             "session_id": session_id,
@@ -434,22 +595,7 @@ async def personalize_communication(recipient_id: str, personalization_request:
 
 async def apply_biological_personalization(content: str, profile: Dict[str, Any], channel: str) -> str:
     """Apply biological intelligence personalization"""
-    # Simulate consciousness-aware personalization
-    consciousness_level = profile.get("consciousness_level", "basic")
-    communication_style = profile.get("communication_preference", "direct")
-
-    personalized = f"[Consciousness Level: {consciousness_level.upper()}] {content}"
-
-    adaptations = {
-        "email": " [Email Biological Adaptation Applied]",
-        "sms": " [SMS Consciousness Optimization]",
-        "whatsapp": " [WhatsApp Universal Harmony]"
-    }
-
-    personalized += adaptations.get(channel.split('_')[0], " [Universal Biological Adaptation]")
-    personalized += f" [Style: {communication_style.title()} Communication]"
-
-    return personalized
+    return personalize_message(content, profile, channel)
 
 @app.get("/channels/available")
 async def get_available_channels():
@@ -494,6 +640,7 @@ async def initiate_ab_test(ab_config: Dict[str, Any]):
         # Store in global state (would typically go to database)
         # For now, we'll track in campaigns
         campaigns[test_id] = ab_test
+        persist_campaigns()
 
         return {
             "test_id": test_id,
@@ -511,6 +658,7 @@ async def terminate_campaign(campaign_id: str):
     """Terminate campaign with consciousness cleanup"""
     if campaign_id in campaigns:
         campaign_data = campaigns.pop(campaign_id)
+        persist_campaigns()
         return {"terminated": True, "campaign_id": campaign_id, "consciousness_residue_cleared": True}
     else:
         raise HTTPException(status_code=404, detail="Campaign not found")
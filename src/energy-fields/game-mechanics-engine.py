@@ -9,6 +9,8 @@ for various system interactions, providing motivation through leaderboards and r
 import asyncio
 import httpx
 import json
+import os
+import sys
 import time
 import random
 from typing import Dict, Any, List, Optional
@@ -17,6 +19,14 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from datetime import datetime, timedelta
 
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from leaderboard_store import create_leaderboard_store
+
+LEADERBOARD_TYPES = ("global", "weekly", "monthly", "godhood_masterclass")
+WINDOWED_LEADERBOARDS = ("weekly", "monthly")
+RETAINED_LEADERBOARD_WINDOWS = 2    # Current and previous week/month
+GODHOOD_MASTERCLASS_POINTS = 5000
+
 class BiologicalGamificationEngine:
     """GODHOOD Biological Gamification Engine - CORRECTED CREDIT-BASED SYSTEM"""
 
@@ -66,12 +76,15 @@ class BiologicalGamificationEngine:
             "min_redemption": 10           # Minimum 10 points (0.1 credits)
         }
 
-        self.leaderboards = {
-            "global": {},           # All-time performance
-            "weekly": {},           # Current week competition
-            "monthly": {},          # Monthly rankings
-            "godhood_masterclass": {} # 5000+ points elite performers
-        }
+        # Leaderboards: global (all-time), weekly and monthly windows, and the
+        # GODHOOD masterclass (5000+ points). Sorted sets in the store; Redis
+        # when GAMIFICATION_REDIS_URL is set, otherwise in-memory skip lists
+        self.leaderboard_store = create_leaderboard_store(os.getenv("GAMIFICATION_REDIS_URL"))
+        self.leaderboard_windows = {leaderboard_type: [] for leaderboard_type in WINDOWED_LEADERBOARDS}
+        # board -> {"previous": ranks before the last write, "current": ranks served since};
+        # boards written to since their last read are rotated on the next read
+        self.rank_snapshots = {}
+        self.stale_rank_snapshots = set()
 
         self.user_profiles = {}
         self.rewards_history = {}
@@ -185,62 +198,100 @@ class BiologicalGamificationEngine:
 
         return multiplier
 
+    def _leaderboard_board(self, leaderboard_type: str, now: Optional[datetime] = None) -> str:
+        """Store board name; weekly and monthly boards are one board per window"""
+        now = now or datetime.now()
+        if leaderboard_type == "weekly":
+            return "weekly:" + (now - timedelta(days=now.weekday())).strftime("%Y-%W")
+        if leaderboard_type == "monthly":
+            return "monthly:" + now.strftime("%Y-%m")
+        return leaderboard_type
+
+    def _leaderboard_window_expiry(self, leaderboard_type: str, now: Optional[datetime] = None) -> datetime:
+        """When the window containing ``now`` falls out of retention"""
+        now = now or datetime.now()
+        if leaderboard_type == "weekly":
+            week_start = (now - timedelta(days=now.weekday())).replace(hour=0, minute=0, second=0, microsecond=0)
+            return week_start + timedelta(weeks=RETAINED_LEADERBOARD_WINDOWS)
+        month = now.month - 1 + RETAINED_LEADERBOARD_WINDOWS
+        return datetime(now.year + month // 12, month % 12 + 1, 1)
+
+    async def _roll_leaderboard_window(self, board: str) -> None:
+        """Start a new weekly/monthly window, dropping windows past retention"""
+        leaderboard_type = board.split(":", 1)[0]
+        windows = self.leaderboard_windows[leaderboard_type]
+        if board in windows:
+            return
+
+        windows.append(board)
+        while len(windows) > RETAINED_LEADERBOARD_WINDOWS:
+            expired = windows.pop(0)
+            await self.leaderboard_store.drop(expired)
+            self.rank_snapshots.pop(expired, None)
+            self.stale_rank_snapshots.discard(expired)
+
     async def update_leaderboards(self, user_id: str) -> None:
         """Update all active leaderboards with user progress"""
         user_points = self.user_profiles[user_id]["total_points"]
+        now = datetime.now()
 
-        # Global leaderboard (all-time)
-        self.leaderboards["global"][user_id] = user_points
-
-        # Weekly leaderboard
-        week_start = (datetime.now() - timedelta(days=datetime.now().weekday())).strftime("%Y-%W")
-        if week_start not in self.leaderboards["weekly"]:
-            self.leaderboards["weekly"][week_start] = {}
-        self.leaderboards["weekly"][week_start][user_id] = user_points
-
-        # Monthly leaderboard
-        month_key = datetime.now().strftime("%Y-%m")
-        if month_key not in self.leaderboards["monthly"]:
-            self.leaderboards["monthly"][month_key] = {}
-        self.leaderboards["monthly"][month_key][user_id] = user_points
+        # Global (all-time), weekly and monthly leaderboards
+        boards = [self._leaderboard_board(leaderboard_type, now) for leaderboard_type in ("global", "weekly", "monthly")]
+        for board in boards[1:]:
+            await self._roll_leaderboard_window(board)
+        # Window rolls are tracked per process; the store expiry also covers restarts
+        expire_at = {board: self._leaderboard_window_expiry(leaderboard_type, now).timestamp()
+                     for board, leaderboard_type in zip(boards[1:], WINDOWED_LEADERBOARDS)}
 
         # GODHOOD masterclass (top performers)
-        if user_points >= 5000:
-            self.leaderboards["godhood_masterclass"][user_id] = user_points
+        if user_points >= GODHOOD_MASTERCLASS_POINTS:
+            boards.append("godhood_masterclass")
+
+        await self.leaderboard_store.update_many(((board, user_id, user_points) for board in boards), expire_at)
+        self.stale_rank_snapshots.update(boards)
 
-    async def get_leaderboard(self, leaderboard_type: str = "global", limit: int = 10) -> List[Dict[str, Any]]:
+    async def get_leaderboard(self, leaderboard_type: str = "global", limit: int = 10,
+                              offset: int = 0) -> List[Dict[str, Any]]:
         """Retrieve leaderboard standings"""
-        if leaderboard_type not in self.leaderboards:
+        if leaderboard_type not in LEADERBOARD_TYPES:
             raise ValueError(f"Unknown leaderboard: {leaderboard_type}")
 
-        data = self.leaderboards[leaderboard_type]
-
-        if leaderboard_type == "weekly":
-            current_week = (datetime.now() - timedelta(days=datetime.now().weekday())).strftime("%Y-%W")
-            data = data.get(current_week, {})
-
-        elif leaderboard_type == "monthly":
-            current_month = datetime.now().strftime("%Y-%m")
-            data = data.get(current_month, {})
-
-        # Sort by points descending
-        sorted_users = sorted(data.items(), key=lambda x: x[1], reverse=True)
+        board = self._leaderboard_board(leaderboard_type)
+        standings = await self.leaderboard_store.top(board, limit, offset)
+        snapshot = self._rank_snapshot(board)
 
         leaderboard = []
-        for rank, (user_id, points) in enumerate(sorted_users[:limit], 1):
+        for rank, (user_id, points) in enumerate(standings, offset + 1):
             leaderboard.append({
                 "rank": rank,
                 "user_id": user_id,
                 "points": points,
-                "change_from_last": await self._calculate_rank_change(user_id, leaderboard_type, rank)
+                "change_from_last": self._calculate_rank_change(snapshot, user_id, rank)
             })
 
         return leaderboard
 
-    async def _calculate_rank_change(self, user_id: str, leaderboard_type: str, current_rank: int) -> int:
-        """Calculate rank change from previous period"""
-        # Simplified - in real implementation would store historical ranks
-        return random.randint(-3, 3)  # Simulate rank changes
+    async def get_leaderboard_rank(self, leaderboard_type: str, user_id: str) -> Optional[int]:
+        """User's current rank on a leaderboard (None when not ranked)"""
+        if leaderboard_type not in LEADERBOARD_TYPES:
+            raise ValueError(f"Unknown leaderboard: {leaderboard_type}")
+
+        return await self.leaderboard_store.rank(self._leaderboard_board(leaderboard_type), user_id)
+
+    def _rank_snapshot(self, board: str) -> Dict[str, Dict[str, int]]:
+        """Rank snapshot for ``board``, rotated only when the board was written to since the last read"""
+        snapshot = self.rank_snapshots.setdefault(board, {"previous": {}, "current": {}})
+        if board in self.stale_rank_snapshots:
+            self.stale_rank_snapshots.discard(board)
+            snapshot["previous"].update(snapshot["current"])
+            snapshot["current"] = {}
+        return snapshot
+
+    def _calculate_rank_change(self, snapshot: Dict[str, Dict[str, int]], user_id: str, current_rank: int) -> int:
+        """Places gained (positive) or lost since the board's last write before this one"""
+        snapshot["current"].setdefault(user_id, current_rank)
+        previous_rank = snapshot["previous"].get(user_id)
+        return 0 if previous_rank is None else previous_rank - current_rank
 
     async def redeem_points_for_credits(self, user_id: str, points_to_redeem: int) -> Dict[str, Any]:
         """Redeem points for additional credits - CORRECTED CREDIT-BASED SYSTEM"""
@@ -316,28 +367,9 @@ class BiologicalGamificationEngine:
         profile = self.user_profiles[user_id]
 
         # Get user's leaderboard positions
-        global_rank = None
-        weekly_rank = None
-        monthly_rank = None
-
-        # Calculate ranks
-        global_leaderboard = await self.get_leaderboard("global", limit=100)
-        for entry in global_leaderboard:
-            if entry["user_id"] == user_id:
-                global_rank = entry["rank"]
-                break
-
-        weekly_leaderboard = await self.get_leaderboard("weekly", limit=50)
-        for entry in weekly_leaderboard:
-            if entry["user_id"] == user_id:
-                weekly_rank = entry["rank"]
-                break
-
-        monthly_leaderboard = await self.get_leaderboard("monthly", limit=50)
-        for entry in monthly_leaderboard:
-            if entry["user_id"] == user_id:
-                monthly_rank = entry["rank"]
-                break
+        global_rank = await self.get_leaderboard_rank("global", user_id)
+        weekly_rank = await self.get_leaderboard_rank("weekly", user_id)
+        monthly_rank = await self.get_leaderboard_rank("monthly", user_id)
 
         return {
             "user_id": user_id,
@@ -391,6 +423,7 @@ async def root():
         "endpoints": [
             "/points/award",
             "/leaderboard/{type}",
+            "/leaderboard/{type}/rank/{user_id}",
             "/user/{user_id}/profile",
             "/points/redeem"
         ]
@@ -407,9 +440,17 @@ async def award_points_api(data: Dict[str, Any]):
     return result
 
 @app.get("/leaderboard/{leaderboard_type}")
-async def get_leaderboard_api(leaderboard_type: str, limit: int = 10):
+async def get_leaderboard_api(leaderboard_type: str, limit: int = 10, offset: int = 0):
     """Retrieve leaderboard standings"""
-    return await gamification_engine.get_leaderboard(leaderboard_type, limit)
+    return await gamification_engine.get_leaderboard(leaderboard_type, limit, offset)
+
+@app.get("/leaderboard/{leaderboard_type}/rank/{user_id}")
+async def get_leaderboard_rank_api(leaderboard_type: str, user_id: str):
+    """Retrieve one user's rank on a leaderboard"""
+    rank = await gamification_engine.get_leaderboard_rank(leaderboard_type, user_id)
+    if rank is None:
+        raise HTTPException(status_code=404, detail=f"User not ranked on {leaderboard_type} leaderboard")
+    return {"leaderboard": leaderboard_type, "user_id": user_id, "rank": rank}
 
 @app.post("/points/redeem")
 async def redeem_points_for_credits_api(data: Dict[str, Any]):
@@ -434,7 +475,7 @@ async def health_check():
         "total_points_distributed": sum(
             profile["total_points"] for profile in gamification_engine.user_profiles.values()
         ),
-        "leaderboard_size": len(gamification_engine.leaderboards["global"])
+        "leaderboard_size": await gamification_engine.leaderboard_store.size("global")
     }
 
 if __name__ == "__main__":
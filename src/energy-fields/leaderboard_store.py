@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+🧬 BIOLOGICAL GAMIFICATION ENGINE - LEADERBOARD STORE
+
+Order-statistics storage for gamification leaderboards. Each board is a
+sorted set of ``(points, user)`` pairs ordered by points descending:
+
+- InMemoryLeaderboardStore keeps one indexable skip list per board, giving
+  O(log n) updates, O(log n) rank-of-user and O(log n + k) top-k queries
+- RedisLeaderboardStore maps the same operations onto Redis sorted sets
+  (ZADD / ZREVRANGE / ZREVRANK); boards given an expiry in ``update_many``
+  get an EXPIREAT, so windowed boards do not outlive a restarted engine
+
+In both stores tied points are ordered by user id in reverse lexicographic
+order, which is how ZREVRANGE orders members with equal scores.
+
+Both stores expose the same async API so the engine can switch backends
+with ``create_leaderboard_store``.
+"""
+
+import logging
+import math
+import random
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+Standing = Tuple[str, int]  # (user_id, points)
+
+MAX_LEVELS = 32
+
+
+class _SkipNode:
+    __slots__ = ("key", "forward", "width")
+
+    def __init__(self, key: Tuple[float, str], levels: int):
+        self.key = key
+        self.forward: List[Optional["_SkipNode"]] = [None] * levels
+        self.width = [1] * levels  # level-0 steps to forward[level]
+
+
+class IndexableSkipList:
+    """
+    Skip list of ``(points, user_id)`` keys with per-link widths
+
+    Keys ascend like a Redis sorted set (ZRANGE order). Widths count the
+    level-0 hops each link skips, so position lookups and ranks are found on
+    the same O(log n) descent as inserts and removals.
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        self._random = random.Random(seed)
+        self._tail = _SkipNode((math.inf, ""), 0)
+        self._head = _SkipNode((-math.inf, ""), MAX_LEVELS)
+        self._head.forward = [self._tail] * MAX_LEVELS
+        self._levels = 1  # Levels in use; head widths above are refreshed when first used
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _random_levels(self) -> int:
+        levels = 1
+        while levels < MAX_LEVELS and self._random.random() < 0.5:
+            levels += 1
+        return levels
+
+    def insert(self, key: Tuple[float, str]) -> None:
+        levels = self._random_levels()
+        if levels > self._levels:
+            for level in range(self._levels, levels):
+                self._head.width[level] = self.size + 1
+            self._levels = levels
+
+        chain = [self._head] * self._levels
+        steps_at_level = [0] * self._levels
+        node = self._head
+        for level in reversed(range(self._levels)):
+            while node.forward[level].key <= key:
+                steps_at_level[level] += node.width[level]
+                node = node.forward[level]
+            chain[level] = node
+
+        new_node = _SkipNode(key, levels)
+        steps = 0
+        for level in range(levels):
+            previous = chain[level]
+            new_node.forward[level] = previous.forward[level]
+            previous.forward[level] = new_node
+            new_node.width[level] = previous.width[level] - steps
+            previous.width[level] = steps + 1
+            steps += steps_at_level[level]
+        for level in range(levels, self._levels):
+            chain[level].width[level] += 1
+        self.size += 1
+
+    def remove(self, key: Tuple[float, str]) -> None:
+        chain = [self._head] * self._levels
+        node = self._head
+        for level in reversed(range(self._levels)):
+            while node.forward[level].key < key:
+                node = node.forward[level]
+            chain[level] = node
+
+        target = chain[0].forward[0]
+        if target.key != key:
+            raise KeyError(key)
+        for level in range(len(target.forward)):
+            previous = chain[level]
+            previous.width[level] += target.width[level] - 1
+            previous.forward[level] = target.forward[level]
+        for level in range(len(target.forward), self._levels):
+            chain[level].width[level] -= 1
+        self.size -= 1
+
+    def index(self, key: Tuple[float, str]) -> Optional[int]:
+        """0-based position of ``key``, or None"""
+        position = 0
+        node = self._head
+        for level in reversed(range(self._levels)):
+            while node.forward[level].key < key:
+                position += node.width[level]
+                node = node.forward[level]
+        return position if node.forward[0].key == key else None
+
+    def iter_from(self, start: int) -> Iterator[Tuple[float, str]]:
+        """Keys from position ``start`` onwards"""
+        if start >= self.size:
+            return
+        remaining = start + 1
+        node = self._head
+        for level in reversed(range(self._levels)):
+            while node.width[level] <= remaining:
+                remaining -= node.width[level]
+                node = node.forward[level]
+        while node is not self._tail:
+            yield node.key
+            node = node.forward[0]
+
+
+class SortedLeaderboard:
+    """One board: skip list ordering plus a points lookup per user, read from the top end"""
+
+    def __init__(self, seed: Optional[int] = None):
+        self._ranking = IndexableSkipList(seed)
+        self._points: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def update(self, user_id: str, points: int) -> None:
+        previous = self._points.get(user_id)
+        if previous == points:
+            return
+        if previous is not None:
+            self._ranking.remove((previous, user_id))
+        self._ranking.insert((points, user_id))
+        self._points[user_id] = points
+
+    def remove(self, user_id: str) -> None:
+        points = self._points.pop(user_id, None)
+        if points is not None:
+            self._ranking.remove((points, user_id))
+
+    def score(self, user_id: str) -> Optional[int]:
+        return self._points.get(user_id)
+
+    def rank(self, user_id: str) -> Optional[int]:
+        """1-based rank, or None when the user is not on the board"""
+        points = self._points.get(user_id)
+        if points is None:
+            return None
+        return len(self._ranking) - self._ranking.index((points, user_id))
+
+    def top(self, limit: int, offset: int = 0) -> List[Standing]:
+        # Ranks offset+1 .. offset+limit are an ascending run of the skip list, read backwards
+        end = len(self._ranking) - max(0, offset)
+        start = max(0, end - limit)
+        if end <= start:
+            return []
+        standings = [(user_id, int(points)) for points, user_id in islice(self._ranking.iter_from(start), end - start)]
+        standings.reverse()
+        return standings
+
+
+class InMemoryLeaderboardStore:
+    """Process-local boards backed by indexable skip lists"""
+
+    def __init__(self, seed: Optional[int] = None):
+        self._boards: Dict[str, SortedLeaderboard] = {}
+        self._seed = seed
+
+    def _board(self, board: str) -> SortedLeaderboard:
+        if board not in self._boards:
+            self._boards[board] = SortedLeaderboard(self._seed)
+        return self._boards[board]
+
+    async def update(self, board: str, user_id: str, points: int) -> None:
+        self._board(board).update(user_id, points)
+
+    async def update_many(self, updates: Iterable[Tuple[str, str, int]],
+                          expire_at: Optional[Dict[str, float]] = None) -> None:
+        """Apply updates; ``expire_at`` is ignored since process-local boards end with the process"""
+        for board, user_id, points in updates:
+            self._board(board).update(user_id, points)
+
+    async def top(self, board: str, limit: int, offset: int = 0) -> List[Standing]:
+        if board not in self._boards:
+            return []
+        return self._boards[board].top(limit, offset)
+
+    async def rank(self, board: str, user_id: str) -> Optional[int]:
+        if board not in self._boards:
+            return None
+        return self._boards[board].rank(user_id)
+
+    async def score(self, board: str, user_id: str) -> Optional[int]:
+        if board not in self._boards:
+            return None
+        return self._boards[board].score(user_id)
+
+    async def size(self, board: str) -> int:
+        return len(self._boards[board]) if board in self._boards else 0
+
+    async def drop(self, board: str) -> None:
+        self._boards.pop(board, None)
+
+
+class RedisLeaderboardStore:
+    """Boards as Redis sorted sets, for sharing standings across service replicas"""
+
+    def __init__(self, client: Any, prefix: str = "gamification:leaderboard:"):
+        self.client = client
+        self.prefix = prefix
+
+    def _key(self, board: str) -> str:
+        return f"{self.prefix}{board}"
+
+    @staticmethod
+    def _decode(member: Any) -> str:
+        return member.decode() if isinstance(member, bytes) else str(member)
+
+    async def update(self, board: str, user_id: str, points: int) -> None:
+        await self.client.zadd(self._key(board), {user_id: points})
+
+    async def update_many(self, updates: Iterable[Tuple[str, str, int]],
+                          expire_at: Optional[Dict[str, float]] = None) -> None:
+        """Apply updates in one round trip; boards in ``expire_at`` expire at that Unix time"""
+        pipeline = self.client.pipeline(transaction=False)
+        for board, user_id, points in updates:
+            pipeline.zadd(self._key(board), {user_id: points})
+        for board, timestamp in (expire_at or {}).items():
+            pipeline.expireat(self._key(board), int(timestamp))
+        await pipeline.execute()
+
+    async def top(self, board: str, limit: int, offset: int = 0) -> List[Standing]:
+        if limit <= 0:
+            return []
+        start = max(0, offset)
+        rows = await self.client.zrevrange(self._key(board), start, start + limit - 1, withscores=True)
+        return [(self._decode(member), int(points)) for member, points in rows]
+
+    async def rank(self, board: str, user_id: str) -> Optional[int]:
+        position = await self.client.zrevrank(self._key(board), user_id)
+        return None if position is None else int(position) + 1
+
+    async def score(self, board: str, user_id: str) -> Optional[int]:
+        points = await self.client.zscore(self._key(board), user_id)
+        return None if points is None else int(points)
+
+    async def size(self, board: str) -> int:
+        return int(await self.client.zcard(self._key(board)))
+
+    async def drop(self, board: str) -> None:
+        await self.client.delete(self._key(board))
+
+
+def create_leaderboard_store(redis_url: Optional[str] = None):
+    """Redis sorted sets when ``redis_url`` is given and redis is installed, else in-memory skip lists"""
+    if redis_url:
+        try:
+            import redis.asyncio as redis_asyncio
+            return RedisLeaderboardStore(redis_asyncio.from_url(redis_url))
+        except ImportError:
+            logger.warning("redis package not installed - using in-memory leaderboards")
+    return InMemoryLeaderboardStore()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+
+"""
+🧬 EVOLUTIONARY BRAIN TRUST - VECTORIZED EVOLUTION ENGINE
+
+Genetic algorithm over a population held as one ``(population, genes)``
+NumPy array instead of a list of Python lists:
+
+- fitness functions take the whole population and return one score per row
+- selection is truncation via ``argpartition`` (no full sort per
+  generation) or vectorized tournaments
+- one-point crossover and single-gene mutation are masked array operations
+
+For expensive fitness functions, evaluation can be sharded across a
+``ProcessPoolExecutor``; the fitness function must then be a picklable
+module-level callable (``functools.partial`` of one is fine). ``run`` is
+synchronous; the service runs it on a worker thread and polls progress
+through the ``on_generation`` callback.
+"""
+
+import os
+import time
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+FitnessFunction = Callable[[np.ndarray], np.ndarray]
+
+DIMENSION_MULTIPLIERS = {
+    "universal_harmony": 1.3,
+    "quantum_precision": 1.4,
+    "biological_adaptation": 1.2,
+}
+DEFAULT_DIMENSION_MULTIPLIER = 1.1
+
+# Below this many individuals per shard, process-pool overhead outweighs the work
+MIN_SHARD_SIZE = 256
+
+
+def consciousness_fitness(population: np.ndarray) -> np.ndarray:
+    """Vectorized ``ConsciousnessEvolution.consciousness_fitness``"""
+    genes = population.shape[1]
+    totals = population.sum(axis=1)
+    base_fitness = totals / genes
+    consciousness_amplification = 1 + np.sin(totals) * 0.2
+    biological_adaptation = np.exp(-0.5 * (np.square(population).sum(axis=1) / genes - 0.25) ** 2)
+    return base_fitness * consciousness_amplification * biological_adaptation
+
+
+def dimension_fitness(population: np.ndarray, multiplier: float = DEFAULT_DIMENSION_MULTIPLIER) -> np.ndarray:
+    """Mean gene value amplified per consciousness dimension (``evaluate_individual_fitness`` without its noise)"""
+    return population.mean(axis=1) * multiplier
+
+
+def fitness_for_dimension(consciousness_dimension: str) -> FitnessFunction:
+    return partial(dimension_fitness,
+                   multiplier=DIMENSION_MULTIPLIERS.get(consciousness_dimension, DEFAULT_DIMENSION_MULTIPLIER))
+
+
+def truncation_select(fitness: np.ndarray, count: int) -> np.ndarray:
+    """Indices of the ``count`` fittest individuals (unordered)"""
+    if count >= len(fitness):
+        return np.arange(len(fitness))
+    return np.argpartition(-fitness, count - 1)[:count]
+
+
+def tournament_select(fitness: np.ndarray, count: int, rng: np.random.Generator,
+                      tournament_size: int = 3) -> np.ndarray:
+    """Indices of ``count`` tournament winners (with replacement)"""
+    contenders = rng.integers(0, len(fitness), size=(count, tournament_size))
+    return contenders[np.arange(count), np.argmax(fitness[contenders], axis=1)]
+
+
+def one_point_crossover(first: np.ndarray, second: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Both children of each parent pair, stacked: ``first[:p] + second[p:]`` then ``second[:p] + first[p:]``"""
+    genes = first.shape[1]
+    points = rng.integers(1, genes, size=(len(first), 1)) if genes > 1 else np.ones((len(first), 1), dtype=int)
+    head = np.arange(genes) < points
+    return np.concatenate([np.where(head, first, second), np.where(head, second, first)])
+
+
+def mutate(population: np.ndarray, rng: np.random.Generator, rate: float, step: float) -> None:
+    """In place: with probability ``rate`` per individual, nudge one gene by U(-step, step), clamped to [0, 1]"""
+    rows = np.flatnonzero(rng.random(len(population)) < rate)
+    if not len(rows):
+        return
+    columns = rng.integers(0, population.shape[1], size=len(rows))
+    population[rows, columns] = np.clip(
+        population[rows, columns] + rng.uniform(-step, step, size=len(rows)), 0.0, 1.0
+    )
+
+
+class VectorizedEvolution:
+    """
+    Generational GA on a 2-D population array
+
+    Each generation the fittest half (truncation) or tournament winners
+    survive unchanged and the other half is refilled with mutated one-point
+    crossover children of random survivor pairs.
+
+    Args:
+        population_size: individuals per generation
+        genome_length: genes per individual, initialised U(0, 1)
+        fitness: vectorized fitness function ``(population) -> scores``
+        selection: ``truncation`` or ``tournament``
+        fitness_noise: multiplicative U(1 - noise, 1 + noise) evaluation noise
+        executor: process pool to shard fitness evaluation across (optional)
+        shards: number of shards when an executor is given, normally its worker count
+            (default: one per CPU)
+    """
+
+    def __init__(self, population_size: int, genome_length: int = 10,
+                 fitness: FitnessFunction = consciousness_fitness, selection: str = "truncation",
+                 tournament_size: int = 3, mutation_rate: float = 0.1, mutation_step: float = 0.1,
+                 fitness_noise: float = 0.0, seed: Optional[int] = None,
+                 executor: Optional[Executor] = None, shards: Optional[int] = None):
+        if population_size < 2:
+            raise ValueError("population_size must be at least 2")
+        if selection not in ("truncation", "tournament"):
+            raise ValueError(f"Unknown selection method: {selection}")
+        self.population_size = population_size
+        self.genome_length = genome_length
+        self.fitness = fitness
+        self.selection = selection
+        self.tournament_size = tournament_size
+        self.mutation_rate = mutation_rate
+        self.mutation_step = mutation_step
+        self.fitness_noise = fitness_noise
+        self.executor = executor
+        self.shards = shards or os.cpu_count() or 1
+        self.rng = np.random.default_rng(seed)
+        self.population = self.rng.random((population_size, genome_length))
+
+    def evaluate(self, population: np.ndarray) -> np.ndarray:
+        shards = min(self.shards, len(population) // MIN_SHARD_SIZE)
+        if self.executor is None or shards < 2:
+            scores = np.asarray(self.fitness(population), dtype=float)
+        else:
+            scores = np.concatenate(list(self.executor.map(self.fitness, np.array_split(population, shards))))
+        if self.fitness_noise:
+            scores = scores * self.rng.uniform(1 - self.fitness_noise, 1 + self.fitness_noise, size=len(scores))
+        return scores
+
+    def _select(self, fitness: np.ndarray, count: int) -> np.ndarray:
+        if self.selection == "tournament":
+            return tournament_select(fitness, count, self.rng, self.tournament_size)
+        return truncation_select(fitness, count)
+
+    def step(self, fitness: np.ndarray) -> np.ndarray:
+        """Next generation from the current population and its fitness"""
+        survivors = self.population[self._select(fitness, self.population_size // 2)]
+        offspring = self.population_size - len(survivors)
+        pairs = (offspring + 1) // 2
+
+        first = self.rng.integers(0, len(survivors), size=pairs)
+        if len(survivors) > 1:
+            # Distinct partner, as random.sample(survivors, 2)
+            second = (first + self.rng.integers(1, len(survivors), size=pairs)) % len(survivors)
+        else:
+            second = first
+        children = one_point_crossover(survivors[first], survivors[second], self.rng)[:offspring]
+        mutate(children, self.rng, self.mutation_rate, self.mutation_step)
+        return np.concatenate([survivors, children])
+
+    def run(self, generations: int, on_generation: Optional[Callable[[Dict[str, Any]], None]] = None,
+            should_stop: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
+        """
+        Evolve for ``generations`` (or until ``should_stop()``); ``on_generation``
+        receives each history entry as it is recorded
+        """
+        start = time.perf_counter()
+        best_fitness = float("-inf")
+        best_solution = self.population[0]
+        history = []
+        stopped = False
+
+        for generation in range(generations):
+            if should_stop is not None and should_stop():
+                stopped = True
+                break
+            fitness = self.evaluate(self.population)
+            leader = int(np.argmax(fitness))
+            if fitness[leader] > best_fitness:
+                best_fitness = float(fitness[leader])
+                best_solution = self.population[leader].copy()
+
+            entry = {
+                "generation": generation,
+                "best_fitness": best_fitness,
+                "average_fitness": float(fitness.mean()),
+                "consciousness_amplification": best_fitness * 1.1
+            }
+            history.append(entry)
+            if on_generation is not None:
+                on_generation(entry)
+
+            self.population = self.step(fitness)
+
+        return {
+            "best_solution_fitness": best_fitness if history else 0.0,
+            "best_solution": best_solution.tolist(),
+            "evolution_history": history,
+            "generations_completed": len(history),
+            "convergence_achieved": not stopped,
+            "stopped": stopped,
+            "seconds": time.perf_counter() - start
+        }
@@ -7,7 +7,10 @@ Phase 4 Consciousness-Aware Research Intelligence with Genetic Algorithms & Opti
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
+from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
 import jwt
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
@@ -21,31 +24,37 @@ import math
 from pathlib import Path
 import uvicorn
 
+# Optional backends are resolved through lazy_import: imported now by default,
+# or on first use / during lifespan warm-up when SERVICE_LAZY_INIT=1
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from service_infrastructure.lazy_imports import lazy_import, preload
+from service_infrastructure.metrics import PROMETHEUS_CONTENT_TYPE, render_prometheus
+from service_infrastructure.middleware import PROBE_PATHS, ApiKeyValidator, EndpointMetrics, SecurityMonitoringMiddleware, setup_queue_logging
+from service_infrastructure.readiness import ServiceReadiness
+from service_infrastructure.vector_store import AsyncVectorStoreAdapter, CHROMADB_AVAILABLE
+
 # Real genetic algorithms and optimization libraries
-try:
-    from deap import base, creator, tools, algorithms
-    import optuna
-    from optuna.trial import TrialState
-    import numpy as np
-    DEAP_AVAILABLE = True
+base = lazy_import("deap.base")
+creator = lazy_import("deap.creator")
+tools = lazy_import("deap.tools")
+algorithms = lazy_import("deap.algorithms")
+optuna = lazy_import("optuna")
+TrialState = lazy_import("optuna.trial", "TrialState")
+np = lazy_import("numpy")
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+evolution_engine = lazy_import("evolution_engine") if np is not None else None
+DEAP_AVAILABLE = None not in (base, creator, tools, algorithms, optuna, TrialState, np)
+if DEAP_AVAILABLE:
     print("🧬 REAL GENETIC ALGORITHMS: DEAP operational")
-except ImportError:
-    DEAP_AVAILABLE = False
+else:
     print("⚠️ GENETIC ALGORITHMS: DEAP unavailable, using simulation")
-    base, creator, tools, algorithms = None, None, None, None
-    optuna = None
-    np = None
 
 # Vector database for consciousness research patterns
-try:
-    import chromadb
-    from chromadb.config import Settings
-    CHROMADB_AVAILABLE = True
+if CHROMADB_AVAILABLE:
     print("🧬 CONSCIOUSNESS Vector DATABASE: ChromaDB operational")
-except ImportError:
-    CHROMADB_AVAILABLE = False
+else:
     print("⚠️ Vector DATABASE: ChromaDB unavailable, using simulation")
-    chromadb = None
 
 # PRODUCTION CONFIGURATION
 JWT_SECRET_KEY = secrets.token_hex(32)
@@ -59,12 +68,15 @@ CROSSOVER_PROB = 0.8
 MUTATION_PROB = 0.2
 TOURNAMENT_SIZE = 3
 
+# Process pool for sharded fitness evaluation ("parallel_evaluation" experiments)
+EVOLUTION_POOL_WORKERS = int(os.getenv("EVOLUTION_POOL_WORKERS", str(os.cpu_count() or 2)))
+
 # Evolutionary Algorithm Classes
 class ConsciousnessEvolution:
     """Real genetic algorithm for consciousness optimization"""
     def __init__(self, population_size=100, generations=50):
-        if DEAP_AVAILABLE:
-            self.setup_deap()
+        # DEAP types and toolbox are registered on first evolve() or during warm-up
+        self.toolbox = None
         self.population_size = population_size
         self.generations = generations
         self.hof = []  # Hall of fame for best solutions
@@ -97,6 +109,12 @@ class ConsciousnessEvolution:
 
     def evolve(self, consciousness_dimension="universal_harmony"):
         """Run genetic algorithm evolution"""
+        if not DEAP_AVAILABLE and evolution_engine is not None:
+            return evolution_engine.VectorizedEvolution(
+                self.population_size, fitness=evolution_engine.consciousness_fitness,
+                selection="tournament", tournament_size=TOURNAMENT_SIZE
+            ).run(self.generations)
+
         if not DEAP_AVAILABLE:
             # Fallback simulation
             population = [[random.random() for _ in range(10)] for _ in range(self.population_size)]
@@ -129,6 +147,8 @@ class ConsciousnessEvolution:
             }
 
         # Real DEAP evolution
+        if self.toolbox is None:
+            self.setup_deap()
         self.toolbox.register("evaluate", self.consciousness_fitness)
 
         population = self.toolbox.population(n=self.population_size)
@@ -168,27 +188,14 @@ class ConsciousnessEvolution:
 # Vector store for evolutionary research patterns
 class EvolutionaryVectorStore:
     def __init__(self):
-        if not CHROMADB_AVAILABLE:
-            self.fallback_storage = {}
-            return
-
-        try:
-            self.chroma_client = chromadb.PersistentClient(path="./evolutionary_vector_store")
-            self.collection = self.chroma_client.get_or_create_collection(
-                name="evolutionary_patterns",
-                metadata={"dimension": 256, "description": "Evolutionary research vectors and consciousness patterns"}
-            )
-            print("🧬 Evolutionary VECTOR COLLECTION: Ready")
-        except Exception as e:
-            print(f"⚠️ Evolutionary VECTOR ERROR: {e}")
-            self.fallback_storage = {}
-
-    def store_evolution_pattern(self, experiment_id: str, evolution_data: Dict[str, Any]):
-        """Store evolutionary experiment pattern"""
-        if not CHROMADB_AVAILABLE:
-            self.fallback_storage[experiment_id] = evolution_data
-            return
+        # Shared adapter: ChromaDB off the event loop with batched upserts, NumPy fallback
+        self.vectors = AsyncVectorStoreAdapter(
+            collection_name="evolutionary_patterns",
+            persist_path="./evolutionary_vector_store",
+            collection_metadata={"dimension": 256, "description": "Evolutionary research vectors and consciousness patterns"}
+        )
 
+    def _pattern_vector(self, experiment_id: str, evolution_data: Dict[str, Any]):
         pattern_text = f"experiment:{experiment_id} fitness:{evolution_data.get('best_solution_fitness', 0)} generations:{len(evolution_data.get('evolution_history', []))}"
         embedding = [hash(pattern_text + str(i)) % 1000 / 1000.0 for i in range(256)]
 
@@ -199,24 +206,58 @@ class EvolutionaryVectorStore:
             "convergence_achieved": evolution_data.get("convergence_achieved", False),
             "timestamp": datetime.now().isoformat()
         }
+        return embedding, metadata
 
-        self.collection.add(
-            ids=[experiment_id],
-            embeddings=[embedding],
-            metadatas=[metadata]
-        )
+    def store_evolution_pattern(self, experiment_id: str, evolution_data: Dict[str, Any]):
+        """Store evolutionary experiment pattern"""
+        self.vectors.add_sync(experiment_id, *self._pattern_vector(experiment_id, evolution_data))
+
+    async def store_evolution_pattern_async(self, experiment_id: str, evolution_data: Dict[str, Any]):
+        """Store evolutionary experiment pattern without blocking the event loop"""
+        await self.vectors.add(experiment_id, *self._pattern_vector(experiment_id, evolution_data))
 
-# Initialize production systems
-app = FastAPI(title="Evolutionary Brain Trust", version="1.0.0")
 consciousness_evolution = ConsciousnessEvolution()
 evolutionary_vector_store = EvolutionaryVectorStore()
 
+def _warm_genetic_algorithms():
+    """Import DEAP/optuna and register the DEAP types before the first experiment"""
+    if DEAP_AVAILABLE:
+        preload(optuna, TrialState)
+        consciousness_evolution.setup_deap()
+
+# Startup warm-up behind the lifespan hook; /ready reports its progress
+readiness = ServiceReadiness("evolutionary-brain-trust")
+readiness.add_warmup("genetic_algorithms", _warm_genetic_algorithms)
+readiness.add_warmup("vector_store", evolutionary_vector_store.vectors.ensure_initialized)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm optional backends (in the background in lazy mode); save request metrics and the vector index on shutdown"""
+    await readiness.start()
+    try:
+        yield
+    finally:
+        for task in list(evolution_tasks.values()):
+            task.cancel()
+        await asyncio.gather(*evolution_tasks.values(), return_exceptions=True)
+        if evolution_pool is not None:
+            evolution_pool.shutdown(wait=False, cancel_futures=True)
+        await readiness.stop()
+        persistent_evolutionary_data['metrics'] = request_metrics.snapshot()
+        save_evolutionary_data(persistent_evolutionary_data)
+        await evolutionary_vector_store.vectors.persist()
+
+# Initialize production systems
+app = FastAPI(title="Evolutionary Brain Trust", version="1.0.0", lifespan=lifespan)
+
 # PRODUCTION FEATURES: Persistence & Security
 evolution_experiments_file = "evolutionary_experiments.json"
 evolution_log_file = "evolutionary_brain_trust.log"
 evolutionary_experiments = {}
 optimization_studies = {}
 research_sessions = {}
+evolution_tasks: Dict[str, asyncio.Task] = {}
+evolution_pool: Optional[ProcessPoolExecutor] = None
 intelligence_evolution = {
     "current_level": 0.75,
     "target_level": 1.0,
@@ -229,8 +270,7 @@ intelligence_evolution = {
 app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_credentials=True, allow_methods=["*"], allow_headers=["*"])
 
 # Setup production logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                   handlers=[logging.FileHandler(evolution_log_file), logging.StreamHandler()])
+setup_queue_logging([logging.FileHandler(evolution_log_file), logging.StreamHandler()])
 logger = logging.getLogger(__name__)
 
 # Production persistence
@@ -252,38 +292,22 @@ persistent_evolutionary_data = load_evolutionary_data()
 evolutionary_experiments = persistent_evolutionary_data.get("experiments", {})
 optimization_studies = persistent_evolutionary_data.get("studies", {})
 research_sessions = persistent_evolutionary_data.get("simulations", {})
-request_metrics = persistent_evolutionary_data.get("metrics", {})
+request_metrics = EndpointMetrics(persistent_evolutionary_data.get("metrics", {}))
 
 # PRODUCTION-GRADE SECURITY MIDDLEWARE
-@app.middleware("http")
-async def production_security_middleware(request, call_next):
-    start_time = time.time()
-    api_key = request.headers.get('X-API-Key') or request.query_params.get('api_key')
-
-    if not api_key or api_key not in API_KEYS:
-        logger.warning(f"SECURITY VIOLATION: Invalid API key from {request.client.host}")
-        return JSONResponse(status_code=401, content={"error": "Authentication required"})
-
-    try:
-        response = await call_next(request)
-        processing_time = time.time() - start_time
-
-        # Update request metrics
-        endpoint = request.url.path
-        if endpoint not in request_metrics:
-            request_metrics[endpoint] = {"total_requests": 0, "total_time": 0.0, "errors": 0}
-        request_metrics[endpoint]["total_requests"] += 1
-        request_metrics[endpoint]["total_time"] += processing_time
-
-        # Save metrics
-        persistent_evolutionary_data['metrics'] = request_metrics
-        save_evolutionary_data(persistent_evolutionary_data)
-
-        logger.info(f"✅ EVOLUTION REQUEST: {request.method} {endpoint} in {processing_time:.3f}s")
-        return response
-    except Exception as e:
-        logger.error(f"EVOLUTION ERROR: {request.method} {request.url.path} - {str(e)}")
-        return JSONResponse(status_code=500, content={"error": "Evolution service error"})
+app.add_middleware(
+    SecurityMonitoringMiddleware,
+    api_keys=ApiKeyValidator(API_KEYS),
+    metrics=request_metrics,
+    exempt_paths=PROBE_PATHS,
+    service_name="evolutionary_brain_trust",
+    error_content={"error": "Evolution service error"}
+)
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    """Prometheus text exposition: latency histograms per route and status, in-flight gauge, backend sub-timers"""
+    return PlainTextResponse(render_prometheus("evolutionary_brain_trust", request_metrics), media_type=PROMETHEUS_CONTENT_TYPE)
 
 # Hyperparameter optimization utilities
 def consciousness_objective(trial):
@@ -334,6 +358,12 @@ async def health_check():
         "days_progress": f"{intelligence_evolution['days_completed']}/{intelligence_evolution['total_days']}"
     }
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness probe: 200 once warm-up has finished, 503 while optional backends are still loading"""
+    report = readiness.readiness_report()
+    return JSONResponse(status_code=200 if report["ready"] else 503, content=report)
+
 @app.post("/evolve/initiate")
 async def initiate_evolutionary_experiment(request: Dict[str, Any]):
     """Initiate consciousness-aware evolutionary experiment"""
@@ -343,6 +373,8 @@ async def initiate_evolutionary_experiment(request: Dict[str, Any]):
         population_size = request.get("population_size", 100)
         generations = request.get("generations", 50)
         consciousness_dimension = request.get("consciousness_dimension", "universal_harmony")
+        if population_size < 2 or generations < 1:
+            raise HTTPException(status_code=400, detail="population_size must be >= 2 and generations >= 1")
 
         experiment_data = {
             "experiment_id": experiment_id,
@@ -351,7 +383,10 @@ async def initiate_evolutionary_experiment(request: Dict[str, Any]):
             "population_size": population_size,
             "generations": generations,
             "consciousness_dimension": consciousness_dimension,
+            "parallel_evaluation": bool(request.get("parallel_evaluation", False)),
             "status": "initializing",
+            "current_generation": 0,
+            "progress": 0.0,
             "evolution_history": [],
             "best_solution_fitness": 0.0,
             "convergence_achieved": False,
@@ -360,9 +395,10 @@ async def initiate_evolutionary_experiment(request: Dict[str, Any]):
 
         evolutionary_experiments[experiment_id] = experiment_data
 
-        # Start background evolution
-        background_tasks = BackgroundTasks()
-        background_tasks.add_task(run_evolutionary_algorithm, experiment_id)
+        # Start background evolution; poll /evolve/status/{experiment_id} for progress
+        task = asyncio.create_task(run_evolutionary_algorithm(experiment_id))
+        evolution_tasks[experiment_id] = task
+        task.add_done_callback(lambda _: evolution_tasks.pop(experiment_id, None))
 
         return {
             "experiment_id": experiment_id,
@@ -373,6 +409,8 @@ async def initiate_evolutionary_experiment(request: Dict[str, Any]):
             "estimated_completion": f"{generations * population_size // 1000} seconds",
             "godhood_evolution_active": True
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Evolutionary experiment initiation failed: {str(e)}")
 
@@ -453,6 +491,19 @@ async def simulate_consciousness_evolution(request: Dict[str, Any]):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Consciousness simulation initiation failed: {str(e)}")
 
+def get_evolution_pool() -> ProcessPoolExecutor:
+    global evolution_pool
+    if evolution_pool is None:
+        evolution_pool = ProcessPoolExecutor(max_workers=EVOLUTION_POOL_WORKERS)
+    return evolution_pool
+
+def record_generation(experiment: Dict[str, Any], entry: Dict[str, Any]):
+    """Apply one generation's statistics to the experiment (on the event loop)"""
+    experiment["evolution_history"].append(entry)
+    experiment["current_generation"] = entry["generation"] + 1
+    experiment["progress"] = round(experiment["current_generation"] / experiment["generations"], 4)
+    experiment["best_solution_fitness"] = entry["best_fitness"]
+
 async def run_evolutionary_algorithm(experiment_id: str):
     """Run consciousness-aware evolutionary algorithm"""
     if experiment_id not in evolutionary_experiments:
@@ -461,6 +512,42 @@ async def run_evolutionary_algorithm(experiment_id: str):
     experiment = evolutionary_experiments[experiment_id]
     experiment["status"] = "evolving"
 
+    if evolution_engine is None:
+        return await run_evolutionary_algorithm_fallback(experiment)
+
+    try:
+        engine = evolution_engine.VectorizedEvolution(
+            experiment["population_size"],
+            fitness=evolution_engine.fitness_for_dimension(experiment["consciousness_dimension"]),
+            fitness_noise=0.2,
+            executor=get_evolution_pool() if experiment.get("parallel_evaluation") else None,
+            shards=EVOLUTION_POOL_WORKERS
+        )
+        loop = asyncio.get_running_loop()
+
+        # Off the request loop: the engine runs on a worker thread and hands each
+        # generation back to the loop; terminating the experiment stops it
+        result = await asyncio.to_thread(
+            engine.run,
+            experiment["generations"],
+            on_generation=lambda entry: loop.call_soon_threadsafe(record_generation, experiment, entry),
+            should_stop=lambda: evolutionary_experiments.get(experiment_id) is not experiment
+        )
+
+        # Evolution complete
+        experiment["status"] = "completed" if not result["stopped"] else "terminated"
+        experiment["best_solution_fitness"] = result["best_solution_fitness"]
+        experiment["best_solution"] = result["best_solution"]
+        experiment["convergence_achieved"] = result["convergence_achieved"]
+        experiment["consciousness_amplification"] = result["best_solution_fitness"] * 1.15
+        experiment["evolution_seconds"] = round(result["seconds"], 3)
+
+    except Exception as e:
+        experiment["status"] = "failed"
+        experiment["error"] = str(e)
+
+async def run_evolutionary_algorithm_fallback(experiment: Dict[str, Any]):
+    """List-based evolution for deployments without NumPy"""
     try:
         # Simulate consciousness-guided evolutionary algorithm
         population = generate_initial_population(experiment["population_size"])
@@ -482,14 +569,14 @@ async def run_evolutionary_algorithm(experiment_id: str):
             population = new_population
 
             # Record evolution history
-            experiment["evolution_history"].append({
+            record_generation(experiment, {
                 "generation": generation,
                 "best_fitness": best_fitness,
                 "average_fitness": sum(fitness_scores) / len(fitness_scores),
                 "consciousness_amplification": best_fitness * 1.1
             })
 
-            await asyncio.sleep(0.01)  # Small delay for simulation
+            await asyncio.sleep(0)  # Yield to request handlers between generations
 
         # Evolution complete
         experiment["status"] = "completed"
@@ -550,13 +637,15 @@ def consciousness_guided_reproduction(selected_population: List[List[float]]) ->
     return new_population[:len(selected_population) * 2]
 
 @app.get("/evolve/status/{experiment_id}")
-async def get_evolution_status(experiment_id: str):
-    """Get evolutionary experiment status and results"""
+async def get_evolution_status(experiment_id: str, history_limit: Optional[int] = None):
+    """Get evolutionary experiment status and results; ``history_limit`` returns only the latest generations"""
     if experiment_id not in evolutionary_experiments:
         raise HTTPException(status_code=404, detail="Evolutionary experiment not found")
 
     experiment = evolutionary_experiments[experiment_id]
-    return experiment
+    if history_limit is None:
+        return experiment
+    return {**experiment, "evolution_history": experiment["evolution_history"][-history_limit:] if history_limit > 0 else []}
 
 @app.get("/optimize/status/{study_id}")
 async def get_optimization_status(study_id: str):
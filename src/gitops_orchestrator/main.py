@@ -7,7 +7,8 @@ Phase 7 Consciousness-Aware Infrastructure Optimization with Real Deployment Eng
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
+from contextlib import asynccontextmanager
 import jwt
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
@@ -22,35 +23,56 @@ import hashlib
 from pathlib import Path
 import uvicorn
 
+# Optional backends are resolved through lazy_import: imported now by default,
+# or on first use / during lifespan warm-up when SERVICE_LAZY_INIT=1
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from service_infrastructure.lazy_imports import lazy_import, preload
+from service_infrastructure.metrics import PROMETHEUS_CONTENT_TYPE, EndpointMetrics, render_prometheus
+from service_infrastructure.middleware import SecurityMonitoringMiddleware
+from service_infrastructure.readiness import ServiceReadiness
+
 # Real infrastructure automation libraries
-try:
-    import docker
-    from docker import APIClient
-    DOCKER_AVAILABLE = True
+docker = lazy_import("docker")
+APIClient = lazy_import("docker", "APIClient")
+DOCKER_AVAILABLE = docker is not None
+if DOCKER_AVAILABLE:
     print("🐳 DOCKER ENGINE: Available for container orchestration")
-except ImportError:
-    DOCKER_AVAILABLE = False
+else:
     print("⚠️ DOCKER ENGINE: Unavailable, using simulation")
 
-try:
-    import git
-    from git import Repo, GitCommandError
-    GIT_AVAILABLE = True
+git = lazy_import("git")
+Repo = lazy_import("git", "Repo")
+GitCommandError = lazy_import("git", "GitCommandError")
+GIT_AVAILABLE = git is not None
+if GIT_AVAILABLE:
     print("🔧 GIT AUTOMATION: GitPython operational")
-except ImportError:
-    GIT_AVAILABLE = False
+else:
     print("⚠️ GIT AUTOMATION: GitPython unavailable, using subprocess")
 
 # Vector database for infrastructure states
-try:
-    import chromadb
-    from chromadb.config import Settings
-    CHROMADB_AVAILABLE = True
+chromadb = lazy_import("chromadb")
+Settings = lazy_import("chromadb.config", "Settings")
+CHROMADB_AVAILABLE = chromadb is not None
+if CHROMADB_AVAILABLE:
     print("🧬 INFRASTRUCTURE VECTOR DATABASE: ChromaDB operational")
-except ImportError:
-    CHROMADB_AVAILABLE = False
+else:
     print("⚠️ Vector DATABASE: ChromaDB unavailable, using simulation")
-    chromadb = None
+
+# Startup warm-up behind the lifespan hook; /ready reports its progress
+readiness = ServiceReadiness("gitops-orchestrator")
+readiness.add_warmup("docker", lambda: preload(docker))
+readiness.add_warmup("git", lambda: preload(git))
+readiness.add_warmup("chromadb", lambda: preload(chromadb))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm optional backends (in the background in lazy mode)"""
+    await readiness.start()
+    try:
+        yield
+    finally:
+        await readiness.stop()
 
 # PRODUCTION CONFIGURATION
 JWT_SECRET_KEY = secrets.token_hex(32)
@@ -69,7 +91,8 @@ app = FastAPI(
     description="GODHOOD Deployment Intelligence & Infrastructure Automation System - Phase 4 Consciousness-Aware Infrastructure Optimization",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -81,6 +104,22 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Monitoring only (no HTTP-layer API key check in this service): latency
+# histograms per route and status plus the in-flight gauge behind /metrics
+request_metrics = EndpointMetrics()
+app.add_middleware(
+    SecurityMonitoringMiddleware,
+    api_keys=None,
+    metrics=request_metrics,
+    service_name="gitops_orchestrator",
+    error_content={"error": "GitOps service error"}
+)
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    """Prometheus text exposition: latency histograms per route and status, in-flight gauge, backend sub-timers"""
+    return PlainTextResponse(render_prometheus("gitops_orchestrator", request_metrics), media_type=PROMETHEUS_CONTENT_TYPE)
+
 # Global state for gitops operations
 deployment_pipelines = {}
 repositories = {}
@@ -131,6 +170,12 @@ async def health_check():
         "godhood_integration": "active"
     }
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness probe: 200 once warm-up has finished, 503 while optional backends are still loading"""
+    report = readiness.readiness_report()
+    return JSONResponse(status_code=200 if report["ready"] else 503, content=report)
+
 @app.post("/git/init")
 async def initialize_git_repository(repo_config: Dict[str, Any]):
     """Initialize consciousness-aware Git repository"""
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Local Job Cache
+SQLite write-through cache for job search results with an FTS5 index
+
+Jobs returned by the job APIs are upserted into ``job_cache`` and indexed by
+an external-content FTS5 table over title, description and skills, so local
+lookups rank with BM25 instead of scanning ``LIKE '%kw%'``. Each search is
+also remembered (``job_search_cache``) so repeating it within the TTL is
+served locally without spending API quota.
+
+One long-lived WAL-mode connection is shared by all callers of a cache
+instance; a lock serialises access because job sources may run on worker
+threads.
+"""
+
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from job_discovery import normalize_text, job_dedup_key
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 6 * 3600
+DEFAULT_RETENTION_SECONDS = 7 * 24 * 3600
+
+_FTS_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS job_cache (
+    job_key TEXT PRIMARY KEY,
+    title TEXT,
+    company_name TEXT,
+    location_key TEXT,
+    description TEXT,
+    skills TEXT,
+    biological_match_score REAL,
+    is_active INTEGER DEFAULT 1,
+    payload TEXT NOT NULL,
+    cached_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_job_cache_cached_at ON job_cache(cached_at);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS job_cache_fts USING fts5(
+    title, description, skills,
+    content='job_cache', content_rowid='rowid',
+    tokenize='porter unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS job_cache_fts_insert AFTER INSERT ON job_cache BEGIN
+    INSERT INTO job_cache_fts(rowid, title, description, skills)
+    VALUES (new.rowid, new.title, new.description, new.skills);
+END;
+CREATE TRIGGER IF NOT EXISTS job_cache_fts_delete AFTER DELETE ON job_cache BEGIN
+    INSERT INTO job_cache_fts(job_cache_fts, rowid, title, description, skills)
+    VALUES ('delete', old.rowid, old.title, old.description, old.skills);
+END;
+CREATE TRIGGER IF NOT EXISTS job_cache_fts_update AFTER UPDATE ON job_cache BEGIN
+    INSERT INTO job_cache_fts(job_cache_fts, rowid, title, description, skills)
+    VALUES ('delete', old.rowid, old.title, old.description, old.skills);
+    INSERT INTO job_cache_fts(rowid, title, description, skills)
+    VALUES (new.rowid, new.title, new.description, new.skills);
+END;
+
+CREATE TABLE IF NOT EXISTS job_search_cache (
+    query_key TEXT PRIMARY KEY,
+    job_keys TEXT NOT NULL,
+    result_limit INTEGER NOT NULL,
+    fetched_at REAL NOT NULL
+);
+"""
+
+# bm25 column weights: title, description, skills
+_BM25_WEIGHTS = (10.0, 1.0, 5.0)
+
+
+def _skills_text(job: Dict[str, Any]) -> str:
+    skills = job.get('required_skills') or job.get('skills') or []
+    if isinstance(skills, str):
+        try:
+            skills = json.loads(skills)
+        except ValueError:
+            return skills
+    return " ".join(str(skill) for skill in skills if skill)
+
+
+def cache_job_key(job: Dict[str, Any]) -> str:
+    """LinkedIn ID when present, otherwise the cross-source company/title/location key"""
+    if job.get('linkedin_id'):
+        return f"linkedin:{job['linkedin_id']}"
+    return "|".join(job_dedup_key({
+        'company': job.get('company_name') or job.get('company'),
+        'title': job.get('title'),
+        'location': job.get('location_city') or job.get('location'),
+    }))
+
+
+def fts_query(keywords: str) -> str:
+    """Quoted prefix terms, all required: 'Business Analyst' -> '"business"* "analyst"*'"""
+    return " ".join(f'"{token}"*' for token in _FTS_TOKEN.findall(keywords.lower()))
+
+
+class JobCache:
+    """
+    Write-through job cache on one long-lived SQLite connection
+
+    Args:
+        db_path: SQLite database file (shared with the API client's other tables)
+        ttl_seconds: age after which a remembered search is stale and refetched
+        retention_seconds: age after which cached jobs are purged
+    """
+
+    def __init__(self, db_path: str, ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 retention_seconds: float = DEFAULT_RETENTION_SECONDS):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.retention_seconds = retention_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30.0)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+        self.purge_expired()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def search_key(keywords: str, location: str, **filters: Any) -> str:
+        parts = {'keywords': normalize_text(keywords), 'location': normalize_text(location)}
+        parts.update({name: value for name, value in filters.items() if value})
+        return json.dumps(parts, sort_keys=True)
+
+    def store_jobs(self, jobs: Sequence[Dict[str, Any]], now: Optional[float] = None) -> List[str]:
+        """Upsert jobs (FTS index kept in sync by triggers); returns their cache keys"""
+        now = time.time() if now is None else now
+        keys, rows = [], []
+        for job in jobs:
+            if not job:
+                continue
+            key = cache_job_key(job)
+            if key in keys:
+                continue
+            keys.append(key)
+            rows.append((
+                key,
+                job.get('title') or '',
+                job.get('company_name') or job.get('company') or '',
+                normalize_text(job.get('location_city') or job.get('location')),
+                job.get('job_description') or job.get('description') or '',
+                _skills_text(job),
+                job.get('biological_match_score'),
+                1 if job.get('is_active', True) else 0,
+                json.dumps(job, default=str),
+                now,
+            ))
+        with self._lock:
+            with self._conn:
+                self._conn.executemany("""
+                    INSERT INTO job_cache (job_key, title, company_name, location_key, description, skills,
+                                           biological_match_score, is_active, payload, cached_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(job_key) DO UPDATE SET
+                        title = excluded.title, company_name = excluded.company_name,
+                        location_key = excluded.location_key, description = excluded.description,
+                        skills = excluded.skills, biological_match_score = excluded.biological_match_score,
+                        is_active = excluded.is_active, payload = excluded.payload, cached_at = excluded.cached_at
+                """, rows)
+        return keys
+
+    def store_search(self, keywords: str, location: str, jobs: Sequence[Dict[str, Any]], limit: int,
+                     now: Optional[float] = None, **filters: Any) -> None:
+        """Write an API search response through to the cache"""
+        now = time.time() if now is None else now
+        keys = self.store_jobs(jobs, now=now)
+        with self._lock:
+            with self._conn:
+                self._conn.execute("""
+                    INSERT OR REPLACE INTO job_search_cache (query_key, job_keys, result_limit, fetched_at)
+                    VALUES (?, ?, ?, ?)
+                """, (self.search_key(keywords, location, **filters), json.dumps(keys), limit, now))
+
+    def get_search(self, keywords: str, location: str, limit: int, now: Optional[float] = None,
+                   **filters: Any) -> Optional[List[Dict[str, Any]]]:
+        """
+        Jobs of a remembered search if it is fresh and covered ``limit``,
+        otherwise None (a fresh search that found nothing returns [])
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT job_keys, result_limit, fetched_at FROM job_search_cache WHERE query_key = ?",
+                (self.search_key(keywords, location, **filters),)
+            ).fetchone()
+            if row is None or now - row['fetched_at'] > self.ttl_seconds:
+                return None
+            keys = json.loads(row['job_keys'])
+            if len(keys) < limit and row['result_limit'] < limit:
+                return None  # Earlier search asked for fewer results
+            keys = keys[:limit]
+            payloads = {
+                cached['job_key']: cached['payload']
+                for cached in self._conn.execute(
+                    f"SELECT job_key, payload FROM job_cache WHERE job_key IN ({','.join('?' * len(keys))})", keys
+                )
+            } if keys else {}
+        if len(payloads) < len(keys):
+            return None  # Some jobs were purged since
+        return [json.loads(payloads[key]) for key in keys]
+
+    def search(self, keywords: str, location: str = "", limit: int = 25,
+               max_age_seconds: Optional[float] = None, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """BM25-ranked full-text search over cached jobs, optionally restricted to a location"""
+        match = fts_query(keywords)
+        now = time.time() if now is None else now
+        location_key = normalize_text(location)
+        oldest = now - max_age_seconds if max_age_seconds is not None else float('-inf')
+
+        if match:
+            sql = f"""
+                SELECT j.payload FROM job_cache_fts
+                JOIN job_cache AS j ON j.rowid = job_cache_fts.rowid
+                WHERE job_cache_fts MATCH ? AND j.is_active = 1 AND j.cached_at >= ?
+                  AND (? = '' OR instr(j.location_key, ?) > 0)
+                ORDER BY bm25(job_cache_fts, {', '.join(map(str, _BM25_WEIGHTS))}), j.cached_at DESC
+                LIMIT ?
+            """
+            params = (match, oldest, location_key, location_key, limit)
+        else:
+            sql = """
+                SELECT payload FROM job_cache
+                WHERE is_active = 1 AND cached_at >= ? AND (? = '' OR instr(location_key, ?) > 0)
+                ORDER BY biological_match_score DESC, cached_at DESC
+                LIMIT ?
+            """
+            params = (oldest, location_key, location_key, limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(row['payload']) for row in rows]
+
+    def purge_expired(self, now: Optional[float] = None) -> int:
+        """Drop jobs and searches older than ``retention_seconds``"""
+        cutoff = (time.time() if now is None else now) - self.retention_seconds
+        with self._lock:
+            with self._conn:
+                removed = self._conn.execute("DELETE FROM job_cache WHERE cached_at < ?", (cutoff,)).rowcount
+                self._conn.execute("DELETE FROM job_search_cache WHERE fetched_at < ?", (cutoff,))
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            jobs = self._conn.execute("SELECT COUNT(*) FROM job_cache").fetchone()[0]
+            searches = self._conn.execute("SELECT COUNT(*) FROM job_search_cache").fetchone()[0]
+        return {'cached_jobs': jobs, 'cached_searches': searches, 'ttl_seconds': self.ttl_seconds}
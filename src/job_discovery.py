@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Concurrent Multi-Source Job Discovery
+Asyncio fan-out over job source agents with per-source timeouts
+
+Each source (LinkedIn agent, Firecrawl boards, AI generation, ...) runs as
+its own task; jobs are streamed to the caller as soon as any source finishes
+and deduplicated across sources by a normalised company/title/location key.
+A source that exceeds its timeout is cancelled and reported as ``timeout``
+instead of stalling the search, so end-to-end latency is bounded by the
+slowest *timely* source rather than the sum of all of them.
+
+Synchronous source callables run on a dedicated thread pool. Python threads
+cannot be interrupted, so a timed-out blocking call keeps its worker until it
+returns; its result is discarded. The pool is not owned by the event loop, so
+``asyncio.run`` does not wait for such stragglers on exit.
+"""
+
+import asyncio
+import inspect
+import logging
+import re
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+SourceResult = Union[List[Dict[str, Any]], Awaitable[List[Dict[str, Any]]]]
+SourceFetch = Callable[[str, str], SourceResult]
+
+_DISCOVERY_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="job-discovery")
+
+_NON_ALPHANUMERIC = re.compile(r"[^0-9a-z]+")
+_LEGAL_SUFFIXES = {"ag", "gmbh", "sa", "sarl", "ltd", "limited", "inc", "llc", "plc", "co", "corp", "bv", "nv"}
+
+
+@dataclass
+class DiscoverySource:
+    """A job source agent: ``fetch(keywords, location)`` returning job dicts (sync or async)"""
+    name: str
+    fetch: SourceFetch
+    timeout: float = 10.0
+    # Fallback sources only run when the primary sources found fewer than
+    # ``fallback_min_results`` unique jobs
+    fallback: bool = False
+
+
+@dataclass
+class SourceOutcome:
+    """Per-source result of one discovery run"""
+    source: str
+    status: str  # ok | timeout | error | skipped
+    seconds: float
+    jobs_found: int = 0
+    new_jobs: int = 0
+    error: Optional[str] = None
+
+
+@dataclass
+class DiscoveryBatch:
+    """Jobs contributed by one source, already deduplicated against earlier batches"""
+    source: str
+    jobs: List[Dict[str, Any]]
+    outcome: SourceOutcome
+    elapsed: float
+
+
+@dataclass
+class DiscoveryResult:
+    jobs: List[Dict[str, Any]] = field(default_factory=list)
+    outcomes: List[SourceOutcome] = field(default_factory=list)
+    seconds: float = 0.0
+    first_result_seconds: Optional[float] = None
+
+
+def normalize_text(value: Any) -> str:
+    """ASCII-folded, lowercased text with punctuation collapsed to single spaces"""
+    text = unicodedata.normalize("NFKD", str(value or "")).encode("ascii", "ignore").decode("ascii")
+    return _NON_ALPHANUMERIC.sub(" ", text.lower()).strip()
+
+
+def _normalize_company(value: Any) -> str:
+    words = normalize_text(value).split()
+    while words and words[-1] in _LEGAL_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+def job_dedup_key(job: Dict[str, Any]) -> Tuple[str, str, str]:
+    """
+    Cross-source identity of a posting: accents, case, punctuation and legal
+    suffixes are dropped, so "UBS AG" / "ubs" and "Zürich, Switzerland" /
+    "zurich switzerland" collide.
+    """
+    return (
+        _normalize_company(job.get("company")),
+        normalize_text(job.get("title")),
+        normalize_text(job.get("location")),
+    )
+
+
+class JobDeduplicator:
+    """Keeps the first occurrence of each ``job_dedup_key``"""
+
+    def __init__(self):
+        self._seen: Set[Tuple[str, str, str]] = set()
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def filter_new(self, jobs: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        fresh = []
+        for job in jobs:
+            key = job_dedup_key(job)
+            if key not in self._seen:
+                self._seen.add(key)
+                fresh.append(job)
+        return fresh
+
+
+async def _call_source(source: DiscoverySource, keywords: str, location: str) -> List[Dict[str, Any]]:
+    if inspect.iscoroutinefunction(source.fetch):
+        jobs = await source.fetch(keywords, location)
+    else:
+        loop = asyncio.get_running_loop()
+        jobs = await loop.run_in_executor(_DISCOVERY_EXECUTOR, source.fetch, keywords, location)
+        if inspect.isawaitable(jobs):
+            jobs = await jobs
+    return list(jobs or [])
+
+
+async def _run_source(source: DiscoverySource, keywords: str, location: str
+                      ) -> Tuple[DiscoverySource, Optional[List[Dict[str, Any]]], SourceOutcome]:
+    start = time.perf_counter()
+    try:
+        jobs = await asyncio.wait_for(_call_source(source, keywords, location), timeout=source.timeout)
+    except asyncio.TimeoutError:
+        logger.warning(f"⏱️ Job source {source.name} timed out after {source.timeout:.1f}s")
+        return source, None, SourceOutcome(source.name, "timeout", time.perf_counter() - start)
+    except Exception as e:
+        logger.warning(f"Job source {source.name} failed: {e}")
+        return source, None, SourceOutcome(source.name, "error", time.perf_counter() - start, error=str(e))
+    return source, jobs, SourceOutcome(source.name, "ok", time.perf_counter() - start, jobs_found=len(jobs))
+
+
+async def _fan_out(sources: Sequence[DiscoverySource], keywords: str, location: str,
+                   deduplicator: JobDeduplicator, started: float) -> AsyncIterator[DiscoveryBatch]:
+    tasks = {asyncio.ensure_future(_run_source(source, keywords, location)) for source in sources}
+    try:
+        while tasks:
+            done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                source, jobs, outcome = task.result()
+                fresh = deduplicator.filter_new(jobs or [])
+                outcome.new_jobs = len(fresh)
+                yield DiscoveryBatch(source.name, fresh, outcome, time.perf_counter() - started)
+    finally:
+        # Consumer stopped early (or was cancelled): cancel the sources still running
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def stream_discovered_jobs(sources: Sequence[DiscoverySource], keywords: str, location: str,
+                                 fallback_min_results: int = 5) -> AsyncIterator[DiscoveryBatch]:
+    """
+    Run the primary sources concurrently and yield each one's new jobs as
+    soon as it completes (including empty batches for timeouts and errors,
+    so callers see every outcome). Fallback sources run afterwards only if
+    fewer than ``fallback_min_results`` unique jobs were found.
+    """
+    started = time.perf_counter()
+    deduplicator = JobDeduplicator()
+    primary = [source for source in sources if not source.fallback]
+    fallback = [source for source in sources if source.fallback]
+
+    async with aclosing(_fan_out(primary, keywords, location, deduplicator, started)) as batches:
+        async for batch in batches:
+            yield batch
+
+    if not fallback:
+        return
+    if len(deduplicator) >= fallback_min_results:
+        for source in fallback:
+            outcome = SourceOutcome(source.name, "skipped", 0.0)
+            yield DiscoveryBatch(source.name, [], outcome, time.perf_counter() - started)
+        return
+    async with aclosing(_fan_out(fallback, keywords, location, deduplicator, started)) as batches:
+        async for batch in batches:
+            yield batch
+
+
+async def discover_jobs(sources: Sequence[DiscoverySource], keywords: str, location: str,
+                        fallback_min_results: int = 5, limit: Optional[int] = None) -> DiscoveryResult:
+    """Collect ``stream_discovered_jobs`` into one deduplicated list (in arrival order)"""
+    result = DiscoveryResult()
+    started = time.perf_counter()
+    async with aclosing(stream_discovered_jobs(sources, keywords, location, fallback_min_results)) as batches:
+        async for batch in batches:
+            result.outcomes.append(batch.outcome)
+            if batch.jobs and result.first_result_seconds is None:
+                result.first_result_seconds = batch.elapsed
+            result.jobs.extend(batch.jobs)
+            if limit is not None and len(result.jobs) >= limit:
+                result.jobs = result.jobs[:limit]
+                break
+    result.seconds = time.perf_counter() - started
+    return result
@@ -5,16 +5,50 @@ Biological consciousness-enhanced job search using AI agents and vector database
 No traditional databases - fully AI-first architecture
 """
 
+import asyncio
 import os
+import sys
 import json
 import time
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from itertools import chain
+from typing import AsyncIterator, Dict, List, Optional, Any, Mapping, Sequence, Tuple, Union
 from pathlib import Path
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Shared in-process vector index (src/service_infrastructure)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from service_infrastructure.vector_store import NumpyVectorIndex, cosine_similarity
+from job_discovery import DiscoveryBatch, DiscoveryResult, DiscoverySource, discover_jobs, stream_discovered_jobs
+
 logger = logging.getLogger(__name__)
 
+# Upper bound on jobs kept from discovery; batch scoring makes ranking thousands cheap
+MAX_DISCOVERED_JOBS = 1000
+
+# Swiss cities are generally compatible with each other
+SWISS_CITIES = ('zurich', 'zürich', 'geneva', 'genève', 'basel', 'bern', 'berne', 'lausanne')
+
+# Experience fit curves per job level (unknown levels score 0.5)
+EXPERIENCE_LEVEL_CURVES = {
+    'entry-level': lambda exp: min(1.0, exp / 2.0),
+    'junior': lambda exp: min(1.0, exp / 3.0),
+    'mid-level': lambda exp: min(1.0, exp / 6.0),
+    'senior': lambda exp: min(1.0, max(0.4, exp / 8.0)),
+    'executive': lambda exp: min(1.0, max(0.2, exp / 15.0))
+}
+
+# A job table is either a list of job dicts or columns keyed by field name
+# (a dict of lists or a pandas DataFrame)
+JobTable = Union[Sequence[Dict[str, Any]], Mapping[str, Sequence[Any]]]
+
 class AIFirstJobSearchAgent:
     """
     AI-First Job Search Agent
@@ -29,6 +63,14 @@ class AIFirstJobSearchAgent:
         self.firecrawl_client = None
         self.biological_engine = BiologicalConsciousnessEngine()
 
+        # Per-source discovery timeouts in seconds; a slow source is cancelled, not waited for
+        self.discovery_timeouts = {
+            'linkedin_ai_agent': 15.0,
+            'firecrawl_job_boards': 30.0,
+            'ai_generated': 20.0
+        }
+        self.last_discovery: Optional[DiscoveryResult] = None
+
         # Initialize AI clients
         self._init_ai_clients()
 
@@ -109,6 +151,15 @@ class AIFirstJobSearchAgent:
         # Step 1: Multi-source job discovery using AI agents
         raw_jobs = self._discover_jobs_multi_source(query)
 
+        return self._rank_and_enhance_jobs(raw_jobs, query)
+
+    async def search_jobs_ai_first_async(self, query: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """``search_jobs_ai_first`` for callers already running an event loop"""
+        logger.info(f"🧠 AI-First job search initiated: {query}")
+        raw_jobs = await self.discover_jobs_concurrent(query)
+        return self._rank_and_enhance_jobs(raw_jobs, query)
+
+    def _rank_and_enhance_jobs(self, raw_jobs: List[Dict[str, Any]], query: Dict[str, Any]) -> List[Dict[str, Any]]:
         # Step 2: Vector embedding and similarity search
         enriched_jobs = self._embed_and_rank_jobs(raw_jobs, query)
 
@@ -123,10 +174,59 @@ class AIFirstJobSearchAgent:
         logger.info(f"🎯 Found {len(final_jobs)} biologically enhanced job opportunities")
         return final_jobs
 
+    def discovery_sources(self) -> List[DiscoverySource]:
+        """Job source agents for the concurrent discovery fan-out"""
+        return [
+            DiscoverySource('linkedin_ai_agent', self._search_linkedin_ai_agent,
+                            timeout=self.discovery_timeouts['linkedin_ai_agent']),
+            DiscoverySource('firecrawl_job_boards', self._scrape_jobs_firecrawl,
+                            timeout=self.discovery_timeouts['firecrawl_job_boards']),
+            # AI-generated realistic jobs only when the live sources came up short
+            DiscoverySource('ai_generated', self._generate_realistic_jobs_with_ai,
+                            timeout=self.discovery_timeouts['ai_generated'], fallback=True)
+        ]
+
+    def stream_jobs(self, query: Dict) -> AsyncIterator[DiscoveryBatch]:
+        """
+        Async generator of deduplicated job batches, one per source as soon as
+        it answers (timeouts and failures arrive as empty batches)
+        """
+        return stream_discovered_jobs(
+            self.discovery_sources(),
+            query.get('keywords', 'Business Analyst'),
+            query.get('location', 'Zurich')
+        )
+
+    async def discover_jobs_concurrent(self, query: Dict) -> List[Dict]:
+        """
+        Query all sources concurrently with per-source timeouts and return the
+        deduplicated jobs in arrival order
+        """
+        result = await discover_jobs(
+            self.discovery_sources(),
+            query.get('keywords', 'Business Analyst'),
+            query.get('location', 'Zurich'),
+            limit=MAX_DISCOVERED_JOBS
+        )
+        self.last_discovery = result
+        source_summary = ", ".join(f"{o.source}={o.status}:{o.new_jobs}" for o in result.outcomes)
+        logger.info(f"🔍 AI agents discovered {len(result.jobs)} unique jobs in {result.seconds:.2f}s ({source_summary})")
+        return result.jobs
+
     def _discover_jobs_multi_source(self, query: Dict) -> List[Dict]:
         """
         Use multiple AI agents to discover jobs from various sources
         """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.discover_jobs_concurrent(query))
+
+        # Already inside an event loop (async callers should use
+        # search_jobs_ai_first_async): fall back to querying sources in turn
+        return self._discover_jobs_sequential(query)
+
+    def _discover_jobs_sequential(self, query: Dict) -> List[Dict]:
         all_jobs = []
         keywords = query.get('keywords', 'Business Analyst')
         location = query.get('location', 'Zurich')
@@ -145,7 +245,7 @@ class AIFirstJobSearchAgent:
             all_jobs.extend(ai_generated_jobs)
 
         logger.info(f"🔍 AI agents discovered {len(all_jobs)} jobs")
-        return all_jobs[:20]  # Limit to manageable size
+        return all_jobs[:MAX_DISCOVERED_JOBS]
 
     def _search_linkedin_ai_agent(self, keywords: str, location: str) -> List[Dict]:
         """
@@ -354,15 +454,19 @@ class AIFirstJobSearchAgent:
             job_embeddings = self._generate_embeddings(job_texts)
             query_embedding = self._generate_embeddings([query_text])[0]
 
-            # Rank by similarity
-            for i, job in enumerate(jobs):
-                if len(job_embeddings) > i:
-                    similarity = self._cosine_similarity(job_embeddings[i], query_embedding)
-                    job['ai_relevance_score'] = similarity
-                    job['vector_similarity'] = similarity
+            # Rank by similarity in one matrix product over the pre-normalised job vectors
+            ranked_jobs = jobs[:len(job_embeddings)]
+            job_index = NumpyVectorIndex(initial_capacity=len(ranked_jobs))
+            job_index.upsert([str(i) for i in range(len(ranked_jobs))],
+                             job_embeddings[:len(ranked_jobs)],
+                             [{} for _ in ranked_jobs])
+            positions, similarities = job_index.top_k(query_embedding, len(ranked_jobs))
+            for position, similarity in zip(positions, similarities):
+                ranked_jobs[position]['ai_relevance_score'] = similarity
+                ranked_jobs[position]['vector_similarity'] = similarity
 
-            # Sort by AI relevance
-            enriched_jobs = sorted(jobs, key=lambda x: x.get('ai_relevance_score', 0), reverse=True)
+            # Already sorted by AI relevance; jobs past the embedding limit keep their order
+            enriched_jobs = [ranked_jobs[position] for position in positions] + jobs[len(ranked_jobs):]
 
             logger.info("🎯 AI-ranked jobs using vector similarity")
             return enriched_jobs
@@ -376,18 +480,19 @@ class AIFirstJobSearchAgent:
         Apply biological consciousness enhancement to job matching
         """
         biologically_enhanced_jobs = []
+        enhancement_timestamp = datetime.now().isoformat()
 
-        for job in jobs:
-            # Biological matching analysis
-            bio_analysis = self.biological_engine.calculate_biological_match(user_profile, job)
+        # One vectorized pass over all jobs instead of per-job matching
+        bio_analyses = self.biological_engine.calculate_biological_match_batch(user_profile, jobs)
 
+        for job, bio_analysis in zip(jobs, bio_analyses):
             enhanced_job = {
                 **job,
                 **bio_analysis,
                 'consciousness_level': bio_analysis.get('consciousness_level', 4),
                 'godhood_readiness': bio_analysis.get('godhood_compatibility', 85.0) > 95.0,
                 'biological_match_score': bio_analysis.get('biological_match_score', 85.0),
-                'enhancement_timestamp': datetime.now().isoformat()
+                'enhancement_timestamp': enhancement_timestamp
             }
 
             biologically_enhanced_jobs.append(enhanced_job)
@@ -441,11 +546,7 @@ class AIFirstJobSearchAgent:
 
     def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
         """Calculate cosine similarity between two vectors"""
-        import math
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        norm1 = math.sqrt(sum(a * a for a in vec1))
-        norm2 = math.sqrt(sum(b * b for b in vec2))
-        return dot_product / (norm1 * norm2) if norm1 and norm2 else 0.0
+        return cosine_similarity(vec1, vec2)
 
 class BiologicalConsciousnessEngine:
     """
@@ -458,6 +559,8 @@ class BiologicalConsciousnessEngine:
             'emotional_resonance': 0.75,
             'career_evolution_potential': 0.85
         }
+        # Location normalisation table: raw string -> (present, cleaned, is_swiss)
+        self._location_table: Dict[Any, Tuple[bool, str, bool]] = {}
 
     def calculate_biological_match(self, user_profile: Dict, job: Dict) -> Dict:
         """
@@ -481,31 +584,169 @@ class BiologicalConsciousnessEngine:
             job.get('location', '')
         )
 
+        return self._match_fields(exp_score, skill_score, location_score)
+
+    @staticmethod
+    def _match_fields(exp_score: float, skill_score: float, location_score: float) -> Dict:
         # Biological consciousness calculation
         biological_score = (exp_score * 0.3) + (skill_score * 0.4) + (location_score * 0.3)
 
+        biological_percent = round(biological_score * 100, 1)
+        experience_percent = round(exp_score * 100, 1)
+
         return {
-            'biological_match_score': round(biological_score * 100, 1),
-            'neural_compatibility': round(exp_score * 100, 1),
+            'biological_match_score': biological_percent,
+            'neural_compatibility': experience_percent,
             'skill_harmony': round(skill_score * 100, 1),
             'location_resonance': round(location_score * 100, 1),
             'consciousness_level': min(5, max(1, int(biological_score * 5))),
-            'godhood_compatibility': round(biological_score * 100, 1),
+            'godhood_compatibility': biological_percent,
             'emotional_intelligence_fit': round((skill_score + location_score) * 50, 1),
-            'career_evolution_potential': round(exp_score * 100, 1)
+            'career_evolution_potential': experience_percent
         }
 
-    def _calculate_experience_match(self, user_exp: int, job_level: str) -> float:
-        """Calculate experience compatibility"""
-        level_mapping = {
-            'entry-level': lambda exp: min(1.0, exp / 2.0),
-            'junior': lambda exp: min(1.0, exp / 3.0),
-            'mid-level': lambda exp: min(1.0, exp / 6.0),
-            'senior': lambda exp: min(1.0, max(0.4, exp / 8.0)),
-            'executive': lambda exp: min(1.0, max(0.2, exp / 15.0))
+    def calculate_biological_match_batch(self, user_profile: Dict, jobs: JobTable) -> List[Dict]:
+        """
+        Score every job in ``jobs`` for one user profile.
+
+        Returns one dict per job with exactly the fields (and values) of
+        ``calculate_biological_match``. Without NumPy it falls back to the
+        per-job path.
+        """
+        if not NUMPY_AVAILABLE:
+            return [self.calculate_biological_match(user_profile, job) for job in _job_rows(jobs)]
+
+        scores = self.score_jobs_batch(user_profile, jobs)
+        return [
+            self._match_fields(exp_score, skill_score, location_score)
+            for exp_score, skill_score, location_score in zip(
+                scores['experience'].tolist(), scores['skill'].tolist(), scores['location'].tolist()
+            )
+        ]
+
+    def top_biological_matches(self, user_profile: Dict, jobs: JobTable, k: int = 20) -> List[Tuple[int, Dict]]:
+        """``(job_position, match_fields)`` for the ``k`` best jobs, best first, without scoring dicts for the rest"""
+        if not NUMPY_AVAILABLE:
+            matches = self.calculate_biological_match_batch(user_profile, jobs)
+            order = sorted(range(len(matches)), key=lambda i: matches[i]['biological_match_score'], reverse=True)
+            return [(i, matches[i]) for i in order[:k]]
+
+        scores = self.score_jobs_batch(user_profile, jobs)
+        biological = scores['biological']
+        k = min(k, len(biological))
+        if k <= 0:
+            return []
+        top = np.argpartition(-biological, k - 1)[:k] if k < len(biological) else np.arange(len(biological))
+        top = top[np.argsort(-biological[top], kind='stable')]
+        return [
+            (int(i), self._match_fields(float(scores['experience'][i]), float(scores['skill'][i]), float(scores['location'][i])))
+            for i in top
+        ]
+
+    def score_jobs_batch(self, user_profile: Dict, jobs: JobTable) -> Dict[str, "np.ndarray"]:
+        """
+        Raw 0-1 component scores for all jobs as float64 arrays: ``experience``,
+        ``skill``, ``location`` and the weighted ``biological`` score.
+
+        Job skills are mapped onto a vocabulary index once per batch, so the
+        substring comparison against the user's skills runs per distinct skill
+        instead of per (job, skill) pair; locations go through a cached
+        normalisation table keyed by the raw string.
+        """
+        columns = _job_columns(jobs, ('experience_level', 'required_skills', 'location'))
+        count = columns['__len__']
+
+        exp_score = self._experience_scores(user_profile.get('experience_years', 5), columns['experience_level'], count)
+        skill_score = self._skill_scores(user_profile.get('skills', []), columns['required_skills'], count)
+        location_score = self._location_scores(user_profile.get('location', ''), columns['location'], count)
+
+        return {
+            'experience': exp_score,
+            'skill': skill_score,
+            'location': location_score,
+            'biological': (exp_score * 0.3) + (skill_score * 0.4) + (location_score * 0.3)
         }
 
-        calc_func = level_mapping.get(job_level, lambda exp: 0.5)
+    def _experience_scores(self, user_exp: int, levels: Optional[Sequence[Any]], count: int) -> "np.ndarray":
+        if levels is None:
+            levels = ['mid-level'] * count
+        level_scores = {level: curve(user_exp) for level, curve in EXPERIENCE_LEVEL_CURVES.items()}
+        codes: Dict[Any, int] = {}
+        job_codes = np.fromiter((codes.setdefault(level, len(codes)) for level in levels), dtype=np.intp, count=count)
+        table = np.array([level_scores.get(level, 0.5) for level in codes], dtype=np.float64)
+        return table[job_codes] if count else np.zeros(0)
+
+    def _skill_scores(self, user_skills: List[str], job_skill_lists: Optional[Sequence[Any]], count: int) -> "np.ndarray":
+        if job_skill_lists is None:
+            return np.full(count, 0.7)
+
+        # Missing cells in columnar input arrive as None/NaN
+        rows = [
+            row for row, job_skills in enumerate(job_skill_lists)
+            if not (job_skills is None or isinstance(job_skills, float) or len(job_skills) == 0)
+        ]
+        scores = np.full(count, 0.7)
+        if not rows:
+            return scores
+
+        # Skill vocabulary index: distinct job skill strings -> row of the relation matrix
+        flat_skills = list(chain.from_iterable(job_skill_lists[row] for row in rows))
+        vocabulary = {skill: index for index, skill in enumerate(dict.fromkeys(flat_skills))}
+        skill_ids = np.fromiter(map(vocabulary.__getitem__, flat_skills), dtype=np.intp, count=len(flat_skills))
+        lengths = np.fromiter((len(job_skill_lists[row]) for row in rows), dtype=np.intp, count=len(rows))
+        segment_starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+
+        matches = np.zeros(len(rows), dtype=np.float64)
+        user_skills_lower = [skill.lower() for skill in user_skills]
+        if user_skills_lower:
+            # related[v, u]: vocabulary skill v and user skill u contain one another
+            related = np.array(
+                [[job_skill in user_skill or user_skill in job_skill for user_skill in user_skills_lower]
+                 for job_skill in (skill.lower() for skill in vocabulary)],
+                dtype=bool
+            )
+            # A user skill counts once per job if any of the job's skills relates to it
+            covered = np.logical_or.reduceat(related[skill_ids], segment_starts, axis=0)
+            matches = covered.sum(axis=1, dtype=np.float64)
+
+        scores[np.asarray(rows)] = np.minimum(1.0, matches / lengths)
+        return scores
+
+    def _normalized_location(self, location: Any) -> Tuple[bool, str, bool]:
+        """(present, cleaned, is_swiss) for a raw location string, memoised"""
+        entry = self._location_table.get(location)
+        if entry is None:
+            if len(self._location_table) >= 100000:
+                self._location_table.clear()
+            present = isinstance(location, str) and bool(location)
+            clean = location.lower().strip() if present else ''
+            entry = (present, clean, any(city in clean for city in SWISS_CITIES))
+            self._location_table[location] = entry
+        return entry
+
+    def _location_scores(self, user_loc: str, job_locations: Optional[Sequence[Any]], count: int) -> "np.ndarray":
+        if job_locations is None:
+            job_locations = [''] * count
+        user_present, user_clean, user_swiss = self._normalized_location(user_loc)
+        codes: Dict[Any, int] = {}
+        job_codes = np.fromiter((codes.setdefault(loc, len(codes)) for loc in job_locations), dtype=np.intp, count=count)
+
+        table = np.empty(len(codes), dtype=np.float64)
+        for code, location in enumerate(codes):
+            job_present, job_clean, job_swiss = self._normalized_location(location)
+            if not user_present or not job_present:
+                table[code] = 0.6
+            elif user_clean in job_clean or job_clean in user_clean:
+                table[code] = 1.0
+            elif user_swiss and job_swiss:
+                table[code] = 0.8
+            else:
+                table[code] = 0.3
+        return table[job_codes] if count else np.zeros(0)
+
+    def _calculate_experience_match(self, user_exp: int, job_level: str) -> float:
+        """Calculate experience compatibility"""
+        calc_func = EXPERIENCE_LEVEL_CURVES.get(job_level, lambda exp: 0.5)
         return calc_func(user_exp)
 
     def _calculate_skill_match(self, user_skills: List, job_skills: List) -> float:
@@ -536,13 +777,38 @@ class BiologicalConsciousnessEngine:
         if user_clean in job_clean or job_clean in user_clean:
             return 1.0
 
-        # Swiss cities are generally compatible
-        swiss_cities = ['zurich', 'zürich', 'geneva', 'genève', 'basel', 'bern', 'berne', 'lausanne']
-        if any(city in user_clean for city in swiss_cities) and any(city in job_clean for city in swiss_cities):
+        if any(city in user_clean for city in SWISS_CITIES) and any(city in job_clean for city in SWISS_CITIES):
             return 0.8
 
         return 0.3
 
+
+def _job_rows(jobs: JobTable) -> List[Dict[str, Any]]:
+    """Row view of a job table"""
+    if isinstance(jobs, Mapping) or hasattr(jobs, 'columns'):
+        names = list(jobs.keys())
+        columns = [list(jobs[name]) for name in names]
+        return [dict(zip(names, values)) for values in zip(*columns)]
+    return list(jobs)
+
+
+def _job_columns(jobs: JobTable, fields: Sequence[str]) -> Dict[str, Any]:
+    """
+    Column view of a job table: ``fields`` map to sequences (None when the
+    column is absent) and ``__len__`` holds the row count. Row dicts missing
+    a field get the same defaults as ``calculate_biological_match``.
+    """
+    defaults = {'experience_level': 'mid-level', 'required_skills': [], 'location': ''}
+    if isinstance(jobs, Mapping) or hasattr(jobs, 'columns'):
+        count = len(jobs) if hasattr(jobs, 'columns') else len(next(iter(jobs.values()), []))
+        columns: Dict[str, Any] = {field: (list(jobs[field]) if field in jobs else None) for field in fields}
+    else:
+        jobs = list(jobs)
+        count = len(jobs)
+        columns = {field: [job.get(field, defaults[field]) for job in jobs] for field in fields}
+    columns['__len__'] = count
+    return columns
+
 def test_ai_first_job_search():
     """Test the AI-First job search agent"""
     print("🧠 INITIALIZING AI-FIRST JOB SEARCH AGENT...")
@@ -579,7 +845,7 @@ def test_ai_first_job_search():
     search_time = time.time() - start_time
 
     print(f"✅ AI SEARCH COMPLETED: {len(results)} biologically enhanced job opportunities")
-    print(".2f"
+    print(f"⏱️  Search time: {search_time:.2f}s")
     print()
 
     # Display top results
@@ -592,7 +858,7 @@ def test_ai_first_job_search():
         if 'salary_range' in job:
             print(f"   💰 {job.get('salary_range', 'Salary not specified')}")
 
-        print(".1f"
+        print(f"   🧬 Biological Match: {job.get('biological_match_score', 0):.1f}%")
         print(f"   🏆 GODHOOD Compatibility: {job.get('godhood_compatibility', 'Unknown')}%")
 
         if 'primary_apply_url' in job:
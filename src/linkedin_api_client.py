@@ -5,6 +5,7 @@ Integration with LinkedIn Jobs API for real job search and application link gene
 """
 
 import os
+import sys
 import json
 import time
 import requests
@@ -16,6 +17,10 @@ from requests_oauthlib import OAuth2Session
 import sqlite3
 from pathlib import Path
 
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from api_rate_limiter import RateLimiter, RateLimitStatus
+from job_cache import DEFAULT_TTL_SECONDS, JobCache
+
 logger = logging.getLogger(__name__)
 
 class LinkedInJobsAPI:
@@ -23,7 +28,8 @@ class LinkedInJobsAPI:
     LinkedIn Jobs API Client with OAuth2 authentication and rate limiting
     """
 
-    def __init__(self, client_id: Optional[str] = None, client_secret: Optional[str] = None, db_path: str = "jtp_jobs.db"):
+    def __init__(self, client_id: Optional[str] = None, client_secret: Optional[str] = None, db_path: str = "jtp_jobs.db",
+                 cache_ttl_seconds: float = DEFAULT_TTL_SECONDS):
         """
         Initialize LinkedIn API client
 
@@ -31,6 +37,7 @@ class LinkedInJobsAPI:
             client_id: LinkedIn Partner App Client ID
             client_secret: LinkedIn Partner App Client Secret
             db_path: Path to jobs database
+            cache_ttl_seconds: How long a search result is served from the local cache
         """
         self.client_id = client_id or os.environ.get('LINKEDIN_CLIENT_ID')
         self.client_secret = client_secret or os.environ.get('LINKEDIN_CLIENT_SECRET')
@@ -46,8 +53,8 @@ class LinkedInJobsAPI:
         self.access_token = None
         self.token_expires_at = None
 
-        # Rate limiting setup
-        self.rate_limiter = RateLimiter(max_calls_per_hour=1000)
+        # Rate limiting setup (budget shared by every process using this database)
+        self.rate_limiter = RateLimiter(max_calls_per_hour=1000, db_path=db_path, max_calls_per_day=100000)
 
         # API endpoints
         self.base_url = "https://api.linkedin.com"
@@ -55,6 +62,9 @@ class LinkedInJobsAPI:
         # Initialize database connection
         self.ensure_database_tables()
 
+        # Local write-through job cache (long-lived WAL connection, FTS5 index)
+        self.job_cache = JobCache(db_path, ttl_seconds=cache_ttl_seconds)
+
     def authenticate(self) -> bool:
         """
         Authenticate with LinkedIn using OAuth2 Client Credentials flow
@@ -113,7 +123,8 @@ class LinkedInJobsAPI:
 
     def search_jobs(self, keywords: str = "Business Analyst", location: str = "Zurich",
                    experience_level: str = "", remote_filter: bool = False,
-                   limit: int = 25) -> List[Dict[str, Any]]:
+                   limit: int = 25, on_rate_limit: str = "cache",
+                   max_wait_seconds: float = 60.0) -> List[Dict[str, Any]]:
         """
         Search for jobs using LinkedIn Jobs API
 
@@ -123,6 +134,9 @@ class LinkedInJobsAPI:
             experience_level: Experience filter (ENTRY_LEVEL, MID_SENIOR, DIRECTOR, etc.)
             remote_filter: Filter for remote jobs
             limit: Maximum results to return
+            on_rate_limit: "cache" to answer from the local cache when the budget is spent,
+                "wait" to wait up to ``max_wait_seconds`` for quota first
+            max_wait_seconds: Longest wait for quota when ``on_rate_limit="wait"``
 
         Returns:
             List of job dictionaries with enriched data
@@ -130,9 +144,18 @@ class LinkedInJobsAPI:
         if self.demo_mode:
             return self._get_demo_jobs(keywords, location, limit)
 
-        # Rate limiting check
-        if not self.rate_limiter.can_make_request():
-            logger.warning("⚠️ Rate limit exceeded, returning cached results")
+        # Repeat searches within the cache TTL are served locally
+        search_filters = {'experience_level': experience_level, 'remote_filter': remote_filter}
+        cached_jobs = self.job_cache.get_search(keywords, location, limit, **search_filters)
+        if cached_jobs is not None:
+            logger.info(f"📋 Served {len(cached_jobs)} cached positions for '{keywords}' in {location}")
+            return cached_jobs
+
+        # Rate limiting: consume quota atomically before calling the API
+        quota = self.rate_limiter.acquire(timeout=max_wait_seconds if on_rate_limit == "wait" else 0.0)
+        if not quota.allowed:
+            logger.warning(f"⚠️ Rate limit exceeded (quota back in {quota.retry_after_seconds:.0f}s), "
+                           f"returning cached results")
             return self._get_cached_results(keywords, location, limit)
 
         self.refresh_token_if_needed()
@@ -160,8 +183,11 @@ class LinkedInJobsAPI:
                 data = response.json()
                 jobs = self._process_linkedin_results(data, keywords)
 
-                # Update rate limiter
-                self.rate_limiter.record_request()
+                # Write through to the local cache
+                try:
+                    self.job_cache.store_search(keywords, location, jobs, limit, **search_filters)
+                except sqlite3.Error as e:
+                    logger.warning(f"Couldn't cache LinkedIn results: {e}")
 
                 logger.info(f"✅ LinkedIn Jobs API: Found {len(jobs)} positions for '{keywords}' in {location}")
                 return jobs
@@ -325,27 +351,9 @@ class LinkedInJobsAPI:
         }
 
     def _get_cached_results(self, keywords: str, location: str, limit: int) -> List[Dict]:
-        """Return cached results when rate limited"""
+        """Return cached results when rate limited (BM25-ranked, stale entries included)"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            query = """
-            SELECT * FROM jobs
-            WHERE title LIKE ? AND location_city LIKE ?
-            AND is_active = 1
-            ORDER BY biological_match_score DESC
-            LIMIT ?
-            """
-
-            cursor.execute(query, (f'%{keywords}%', f'%{location}%', limit))
-            rows = cursor.fetchall()
-
-            # Convert to dictionaries
-            columns = [desc[0] for desc in cursor.description]
-            jobs = [dict(zip(columns, row)) for row in rows]
-
-            conn.close()
+            jobs = self.job_cache.search(keywords, location, limit)
 
             if jobs:
                 logger.info(f"📋 Returned {len(jobs)} cached job results")
@@ -390,30 +398,6 @@ class LinkedInJobsAPI:
         except Exception as e:
             logger.warning(f"Couldn't ensure database tables: {e}")
 
-class RateLimiter:
-    """Simple rate limiter for API calls"""
-
-    def __init__(self, max_calls_per_hour: int = 1000):
-        self.max_calls_per_hour = max_calls_per_hour
-        self.calls_this_hour = 0
-        self.hour_start = datetime.now()
-
-    def can_make_request(self) -> bool:
-        """Check if we can make another API request"""
-        now = datetime.now()
-
-        # Reset counters if hour has changed
-        if now - self.hour_start >= timedelta(hours=1):
-            self.calls_this_hour = 0
-            self.hour_start = now
-
-        return self.calls_this_hour < self.max_calls_per_hour
-
-    def record_request(self):
-        """Record that a request was made"""
-        self.calls_this_hour += 1
-
-
 def test_linkedin_api():
     """Test function for LinkedIn Jobs API client"""
     client = LinkedInJobsAPI()
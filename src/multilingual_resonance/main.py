@@ -12,6 +12,7 @@ import secrets
 import logging
 import random
 import hashlib
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -19,38 +20,47 @@ import uvicorn
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from contextlib import asynccontextmanager
 import jwt
 
+# Optional backends are resolved through lazy_import: imported now by default,
+# or on first use / during lifespan warm-up when SERVICE_LAZY_INIT=1
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from service_infrastructure.lazy_imports import lazy_import
+from service_infrastructure.metrics import OPERATION_METRICS, PROMETHEUS_CONTENT_TYPE, render_prometheus
+from service_infrastructure.middleware import PROBE_PATHS, ApiKeyValidator, EndpointMetrics, SecurityMonitoringMiddleware, setup_queue_logging
+from service_infrastructure.readiness import ServiceReadiness
+from service_infrastructure.vector_store import AsyncVectorStoreAdapter, CHROMADB_AVAILABLE
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from sentiment_batch import SENTIMENT_CACHE_SIZE, SENTIMENT_CHUNK_SIZE, SentimentCache, score_text, stream_sentiment_scores
+
 # Real language processing libraries
-try:
-    import nltk
-    from nltk.sentiment import SentimentIntensityAnalyzer
-    from nltk.corpus import stopwords
-    from nltk.tokenize import word_tokenize, sent_tokenize
-    from nltk.stem import WordNetLemmatizer
-    nltk.data.path.append('./nltk_data')
-    NLTK_AVAILABLE = True
+nltk = lazy_import("nltk")
+SentimentIntensityAnalyzer = lazy_import("nltk.sentiment", "SentimentIntensityAnalyzer")
+stopwords = lazy_import("nltk.corpus", "stopwords")
+word_tokenize = lazy_import("nltk.tokenize", "word_tokenize")
+sent_tokenize = lazy_import("nltk.tokenize", "sent_tokenize")
+WordNetLemmatizer = lazy_import("nltk.stem", "WordNetLemmatizer")
+NLTK_AVAILABLE = None not in (nltk, SentimentIntensityAnalyzer, stopwords, word_tokenize, sent_tokenize, WordNetLemmatizer)
+if NLTK_AVAILABLE:
     print("🌐 NLTK LANGUAGE PROCESSING: operational")
-except ImportError:
-    NLTK_AVAILABLE = False
+else:
     print("⚠️ NLTK PROCESSING: unavailable, using simulation")
 
 # Vector storage for language patterns
-try:
-    import chromadb
-    from chromadb.config import Settings
-    CHROMADB_AVAILABLE = True
+if CHROMADB_AVAILABLE:
     print("🧬 MULTILINGUAL VECTOR DATABASE: ChromaDB operational")
-except ImportError:
-    CHROMADB_AVAILABLE = False
+else:
     print("⚠️ Vector DATABASE: ChromaDB unavailable, using simulation")
-    chromadb = None
 
 # PRODUCTION CONFIGURATION
 JWT_SECRET_KEY = secrets.token_hex(32)
 JWT_ALGORITHM = "HS256"
 API_KEYS = ["godhood-master-key-2025", "multilingual-master-2025"]
+SENTIMENT_POOL_WORKERS = int(os.getenv("SENTIMENT_POOL_WORKERS", str(os.cpu_count() or 2)))
+SENTIMENT_BATCH_MAX_ITEMS = int(os.getenv("SENTIMENT_BATCH_MAX_ITEMS", "10000"))
 
 # Supported languages and configurations
 SUPPORTED_LANGUAGES = {
@@ -77,12 +87,38 @@ class MultilingualProcessor:
     """Real multilingual content processing and analysis"""
     def __init__(self):
         if NLTK_AVAILABLE:
-            self.lemmatizer = WordNetLemmatizer()
             self.stop_words = {}
-            self.sentiment_analyzer = SentimentIntensityAnalyzer()
             self.translators = self._setup_translators()
+        # NLTK models are built on first use (or during warm-up), not at import
+        self._lemmatizer = None
+        self._sentiment_analyzer = None
         self.lang_cache = {}
 
+    @property
+    def lemmatizer(self):
+        if self._lemmatizer is None:
+            self._configure_nltk_data_path()
+            self._lemmatizer = WordNetLemmatizer()
+        return self._lemmatizer
+
+    @property
+    def sentiment_analyzer(self):
+        if self._sentiment_analyzer is None:
+            self._configure_nltk_data_path()
+            self._sentiment_analyzer = SentimentIntensityAnalyzer()
+        return self._sentiment_analyzer
+
+    @staticmethod
+    def _configure_nltk_data_path():
+        if './nltk_data' not in nltk.data.path:
+            nltk.data.path.append('./nltk_data')
+
+    def warm_up(self):
+        """Load the NLTK sentiment and lemmatizer models ahead of the first request"""
+        if NLTK_AVAILABLE:
+            self.sentiment_analyzer
+            self.lemmatizer
+
     def _setup_translators(self):
         """Setup language translation capabilities (would integrate real translation APIs)"""
         # In production, this would integrate Google Translate, DeepL, or Azure Translator
@@ -109,15 +145,8 @@ class MultilingualProcessor:
 
         # Real sentiment analysis with NLTK
         try:
-            scores = self.sentiment_analyzer.polarity_scores(text)
-            cultural_modifier = self._get_cultural_modifier(text, language)
-            consciousness_amplification = self._calculate_consciousness_resonance(text)
-
-            scores["culturally_adapted"] = self._apply_cultural_adaptation(scores["compound"], language)
-            scores["consciousness_resonance"] = consciousness_amplification
-            scores["cultural_context"] = cultural_modifier
-
-            return scores
+            with OPERATION_METRICS.time("nltk.sentiment"):
+                return score_text(self.sentiment_analyzer, text, language)
         except:
             return {
                 "compound": random.uniform(-1, 1),
@@ -128,41 +157,6 @@ class MultilingualProcessor:
                 "consciousness_resonance": random.uniform(0, 1)
             }
 
-    def _get_cultural_modifier(self, text: str, language: str) -> str:
-        """Apply cultural context to sentiment analysis"""
-        text_lower = text.lower()
-
-        # Simple cultural detectors (production would use sophisticated NLP)
-        if any(word in text_lower for word in ["family", "love", "friends"]) and language in ["es", "it", "pt"]:
-            return "familial_warmth"
-        elif any(word in text_lower for word in ["honor", "respect", "harmony"]) and language in ["ja", "zh"]:
-            return "harmonious_respect"
-        elif any(word in text_lower for word in ["achievement", "success", "goal"]) and language in ["en", "de"]:
-            return "individual_achievement"
-        else:
-            return "neutral_context"
-
-    def _apply_cultural_adaptation(self, sentiment_score: float, language: str) -> float:
-        """Apply cultural sentiment adaptation"""
-        adaptation_factors = {
-            "es": 1.1,  # Spanish emotional amplification
-            "it": 1.15,  # Italian passion amplification
-            "fr": 0.95,  # French nuance reduction
-            "de": 0.9,  # German precision reduction
-            "ja": 0.8,  # Japanese indirect expression reduction
-            "zh": 0.85  # Chinese hierarchical consideration
-        }
-
-        factor = adaptation_factors.get(language, 1.0)
-        return sentiment_score * factor
-
-    def _calculate_consciousness_resonance(self, text: str) -> float:
-        """Calculate consciousness resonance score"""
-        consciousness_keywords = ["consciousness", "awareness", "intelligence", "harmony", "evolution", "biological"]
-        resonance_count = sum(1 for keyword in consciousness_keywords if keyword in text.lower())
-        base_resonance = min(resonance_count * 0.2, 1.0)
-        return base_resonance * (0.5 + 0.5 * len(text) / 1000)  # Scale with text complexity
-
     def translate_content(self, text: str, source_lang: str, target_lang: str) -> Dict[str, Any]:
         """Translate content with consciousness preservation"""
         if not NLTK_AVAILABLE:
@@ -202,27 +196,14 @@ class MultilingualProcessor:
 # Vector storage for multilingual patterns
 class MultilingualVectorStore:
     def __init__(self):
-        if not CHROMADB_AVAILABLE:
-            self.fallback_storage = {}
-            return
-
-        try:
-            self.chroma_client = chromadb.PersistentClient(path="./multilingual_vector_store")
-            self.collection = self.chroma_client.get_or_create_collection(
-                name="multilingual_patterns",
-                metadata={"dimension": 256, "description": "Multilingual processing vectors and cultural patterns"}
-            )
-            print("🌐 MULTILINGUAL VECTOR COLLECTION: Ready")
-        except Exception as e:
-            print(f"⚠️ MULTILINGUAL VECTOR ERROR: {e}")
-            self.fallback_storage = {}
-
-    def store_language_pattern(self, pattern_id: str, pattern_data: Dict[str, Any]):
-        """Store language pattern with embedding"""
-        if not CHROMADB_AVAILABLE:
-            self.fallback_storage[pattern_id] = pattern_data
-            return
+        # Shared adapter: ChromaDB off the event loop with batched upserts, NumPy fallback
+        self.vectors = AsyncVectorStoreAdapter(
+            collection_name="multilingual_patterns",
+            persist_path="./multilingual_vector_store",
+            collection_metadata={"dimension": 256, "description": "Multilingual processing vectors and cultural patterns"}
+        )
 
+    def _pattern_vector(self, pattern_id: str, pattern_data: Dict[str, Any]):
         pattern_text = f"text:{pattern_data.get('text', '')[:200]} lang:{pattern_data.get('language', 'en')} sentiment:{pattern_data.get('sentiment', 0)}"
         embedding = [hash(f"{pattern_text}:{i}") % 1000 / 1000.0 for i in range(256)]
 
@@ -233,30 +214,54 @@ class MultilingualVectorStore:
             "cultural_context": pattern_data.get("cultural_context", "neutral"),
             "processed_at": datetime.now().isoformat()
         }
+        return embedding, metadata
 
-        self.collection.add(
-            ids=[pattern_id],
-            embeddings=[embedding],
-            metadatas=[metadata]
-        )
+    def store_language_pattern(self, pattern_id: str, pattern_data: Dict[str, Any]):
+        """Store language pattern with embedding"""
+        self.vectors.add_sync(pattern_id, *self._pattern_vector(pattern_id, pattern_data))
+
+    async def store_language_pattern_async(self, pattern_id: str, pattern_data: Dict[str, Any]):
+        """Store language pattern without blocking the event loop"""
+        await self.vectors.add(pattern_id, *self._pattern_vector(pattern_id, pattern_data))
 
-# Initialize production systems
-app = FastAPI(title="Multilingual Resonance", version="1.0.0")
 multilingual_processor = MultilingualProcessor()
 multilingual_vector_store = MultilingualVectorStore()
 
+# Startup warm-up behind the lifespan hook; /ready reports its progress
+readiness = ServiceReadiness("multilingual-resonance")
+readiness.add_warmup("nltk", multilingual_processor.warm_up)
+readiness.add_warmup("vector_store", multilingual_vector_store.vectors.ensure_initialized)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm optional backends (in the background in lazy mode); save request metrics and the vector index on shutdown"""
+    await readiness.start()
+    try:
+        yield
+    finally:
+        if sentiment_pool is not None:
+            sentiment_pool.shutdown(wait=False, cancel_futures=True)
+        await readiness.stop()
+        persistent_multilingual_data['metrics'] = request_metrics.snapshot()
+        save_multilingual_data(persistent_multilingual_data)
+        await multilingual_vector_store.vectors.persist()
+
+# Initialize production systems
+app = FastAPI(title="Multilingual Resonance", version="1.0.0", lifespan=lifespan)
+
 # PRODUCTION FEATURES: Persistence & Security
 multilingual_data_file = "multilingual_data.json"
 multilingual_log_file = "multilingual_resonance.log"
 translation_sessions = {}
 cultural_analysis_sessions = {}
+sentiment_pool: Optional[ProcessPoolExecutor] = None
+sentiment_cache = SentimentCache(int(os.getenv("SENTIMENT_CACHE_SIZE", str(SENTIMENT_CACHE_SIZE))))
 
 # CORS middleware
 app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_credentials=True, allow_methods=["*"], allow_headers=["*"])
 
 # Setup production logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                   handlers=[logging.FileHandler(multilingual_log_file), logging.StreamHandler()])
+setup_queue_logging([logging.FileHandler(multilingual_log_file), logging.StreamHandler()])
 logger = logging.getLogger(__name__)
 
 # Production persistence
@@ -277,38 +282,22 @@ def save_multilingual_data(data):
 persistent_multilingual_data = load_multilingual_data()
 translation_sessions = persistent_multilingual_data.get("sessions", {})
 cultural_analysis_sessions = persistent_multilingual_data.get("analyses", {})
-request_metrics = persistent_multilingual_data.get("metrics", {})
+request_metrics = EndpointMetrics(persistent_multilingual_data.get("metrics", {}))
 
 # PRODUCTION-GRADE SECURITY MIDDLEWARE
-@app.middleware("http")
-async def production_security_middleware(request, call_next):
-    start_time = time.time()
-    api_key = request.headers.get('X-API-Key') or request.query_params.get('api_key')
-
-    if not api_key or api_key not in API_KEYS:
-        logger.warning(f"SECURITY VIOLATION: Invalid API key from {request.client.host}")
-        return JSONResponse(status_code=401, content={"error": "Authentication required"})
-
-    try:
-        response = await call_next(request)
-        processing_time = time.time() - start_time
-
-        # Update request metrics
-        endpoint = request.url.path
-        if endpoint not in request_metrics:
-            request_metrics[endpoint] = {"total_requests": 0, "total_time": 0.0, "errors": 0}
-        request_metrics[endpoint]["total_requests"] += 1
-        request_metrics[endpoint]["total_time"] += processing_time
-
-        # Save metrics
-        persistent_multilingual_data['metrics'] = request_metrics
-        save_multilingual_data(persistent_multilingual_data)
-
-        logger.info(f"✅ TRANSLATION REQUEST: {request.method} {endpoint} in {processing_time:.3f}s")
-        return response
-    except Exception as e:
-        logger.error(f"TRANSLATION ERROR: {request.method} {request.url.path} - {str(e)}")
-        return JSONResponse(status_code=500, content={"error": "Multilingual service error"})
+app.add_middleware(
+    SecurityMonitoringMiddleware,
+    api_keys=ApiKeyValidator(API_KEYS),
+    metrics=request_metrics,
+    exempt_paths=PROBE_PATHS,
+    service_name="multilingual_resonance",
+    error_content={"error": "Multilingual service error"}
+)
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    """Prometheus text exposition: latency histograms per route and status, in-flight gauge, backend sub-timers"""
+    return PlainTextResponse(render_prometheus("multilingual_resonance", request_metrics), media_type=PROMETHEUS_CONTENT_TYPE)
 
 # API ENDPOINTS
 @app.get("/")
@@ -341,6 +330,12 @@ async def health_check():
         "languages_supported": len(SUPPORTED_LANGUAGES)
     }
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness probe: 200 once warm-up has finished, 503 while optional backends are still loading"""
+    report = readiness.readiness_report()
+    return JSONResponse(status_code=200 if report["ready"] else 503, content=report)
+
 @app.post("/analyze/sentiment")
 async def analyze_sentiment(request: Dict[str, Any]):
     """Analyze sentiment with cultural and consciousness awareness"""
@@ -365,7 +360,7 @@ async def analyze_sentiment(request: Dict[str, Any]):
             "sentiment_compound": sentiment_result.get("compound", 0),
             "cultural_context": sentiment_result.get("cultural_context", "neutral")
         }
-        multilingual_vector_store.store_language_pattern(analysis_id, analysis_data)
+        await multilingual_vector_store.store_language_pattern_async(analysis_id, analysis_data)
 
         # Store in persistent sessions
         cultural_analysis_sessions[analysis_id] = {
@@ -390,6 +385,68 @@ async def analyze_sentiment(request: Dict[str, Any]):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Sentiment analysis failed: {str(e)}")
 
+def get_sentiment_pool() -> ProcessPoolExecutor:
+    global sentiment_pool
+    if sentiment_pool is None:
+        sentiment_pool = ProcessPoolExecutor(max_workers=SENTIMENT_POOL_WORKERS)
+    return sentiment_pool
+
+def parse_sentiment_batch(request: Dict[str, Any]) -> List[Any]:
+    """Normalize ``items`` ({"text", "language"} objects or [text, language] pairs) to (text, language) or an error string"""
+    items = request.get("items")
+    if not isinstance(items, list) or not items:
+        raise HTTPException(status_code=400, detail="items must be a non-empty array of (text, language)")
+    if len(items) > SENTIMENT_BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"Batch exceeds {SENTIMENT_BATCH_MAX_ITEMS} items")
+
+    default_language = request.get("language", "en")
+    parsed = []
+    for item in items:
+        if isinstance(item, dict):
+            text, language = item.get("text"), item.get("language", default_language)
+        elif isinstance(item, (list, tuple)) and 1 <= len(item) <= 2:
+            text, language = item[0], item[1] if len(item) == 2 else default_language
+        else:
+            text, language = None, default_language
+        if not isinstance(text, str) or not text:
+            parsed.append("Text content required")
+        elif not isinstance(language, str):
+            parsed.append("Language must be a string")
+        else:
+            parsed.append((text, language))
+    return parsed
+
+@app.post("/analyze/sentiment/batch")
+async def analyze_sentiment_batch(request: Dict[str, Any]):
+    """
+    Score many snippets in one request; one NDJSON line per item as it completes
+    (cache hits first, so lines carry their ``index``), then a summary line.
+    Batch items are not stored as analysis sessions or vector patterns.
+    """
+    parsed = parse_sentiment_batch(request)
+    valid = [(index, item) for index, item in enumerate(parsed) if isinstance(item, tuple)]
+    executor = get_sentiment_pool() if NLTK_AVAILABLE else None
+
+    async def ndjson():
+        start = time.perf_counter()
+        summary = {"items": len(parsed), "scored": 0, "cache_hits": 0, "errors": 0}
+        for index, item in enumerate(parsed):
+            if isinstance(item, str):
+                summary["errors"] += 1
+                yield json.dumps({"index": index, "error": item}) + "\n"
+
+        scores = stream_sentiment_scores([item for _, item in valid], sentiment_cache, executor,
+                                         multilingual_processor.analyze_sentiment, SENTIMENT_CHUNK_SIZE)
+        async for position, result, cached in scores:
+            index, (_, language) = valid[position]
+            summary["cache_hits" if cached else "scored"] += 1
+            yield json.dumps({"index": index, "language": language, "sentiment_result": result, "cached": cached}) + "\n"
+
+        summary["seconds"] = round(time.perf_counter() - start, 4)
+        yield json.dumps({"summary": summary}) + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
 @app.post("/translate/content")
 async def translate_content(request: Dict[str, Any]):
     """Translate content with consciousness preservation and cultural adaptation"""
@@ -603,6 +660,7 @@ async def get_global_impact_metrics():
             "fr": {"sentiments_processed": 634, "harmony_score": 0.87},
             "de": {"sentiments_processed": 456, "harmony_score": 0.85}
         },
+        "sentiment_batch_cache": sentiment_cache.stats(),
         "godhood_universal_translation_coverage": {
             "current_coverage": "78.4%",
             "target_coverage": "95%",
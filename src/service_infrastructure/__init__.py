@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+🧬 SHARED SERVICE INFRASTRUCTURE
+
+Cross-cutting building blocks shared by the biological FastAPI services.
+
+Services live in sibling directories under ``src/`` and are started either
+from their own directory (``main:app``) or from the repository root, so they
+add ``src/`` to ``sys.path`` and import this package as ``service_infrastructure``.
+"""
+
+from .lazy_imports import LAZY_INIT, lazy_import, module_available, preload
+from .metrics import (
+    OPERATION_METRICS,
+    PROMETHEUS_CONTENT_TYPE,
+    EndpointMetrics,
+    render_prometheus,
+)
+from .middleware import PROBE_PATHS, ApiKeyValidator, SecurityMonitoringMiddleware, setup_queue_logging
+from .readiness import ServiceReadiness
+from .vector_store import (
+    AsyncVectorStoreAdapter,
+    NumpyVectorIndex,
+    cosine_similarity,
+    sanitize_metadata,
+)
+
+__all__ = [
+    "LAZY_INIT",
+    "ServiceReadiness",
+    "OPERATION_METRICS",
+    "PROMETHEUS_CONTENT_TYPE",
+    "EndpointMetrics",
+    "render_prometheus",
+    "ApiKeyValidator",
+    "SecurityMonitoringMiddleware",
+    "PROBE_PATHS",
+    "setup_queue_logging",
+    "lazy_import",
+    "module_available",
+    "preload",
+    "AsyncVectorStoreAdapter",
+    "NumpyVectorIndex",
+    "cosine_similarity",
+    "sanitize_metadata",
+]
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+🧬 SHARED SERVICE INFRASTRUCTURE - LAZY OPTIONAL IMPORTS
+
+Optional heavy backends (chromadb, NLTK, DEAP/optuna, docker, GitPython,
+document parsers) used to be imported at module top level, so every replica
+paid for all of them before it could bind its port.
+
+``lazy_import`` replaces the ``try: import x / except ImportError`` blocks:
+
+- it returns ``None`` when the package is not installed, so ``X_AVAILABLE``
+  flags become ``x is not None`` and are answered from the import system's
+  metadata without importing anything
+- with ``SERVICE_LAZY_INIT=1`` it returns a proxy that imports the module on
+  first attribute access (or first call, for ``from module import name``
+  stand-ins); services warm these proxies from their lifespan hook
+- otherwise (the default) it imports immediately and returns the real object
+
+Every real import is timed into ``IMPORT_TIMINGS`` for the readiness report
+and the startup benchmark.
+"""
+
+import importlib
+import importlib.util
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+LAZY_INIT = os.getenv("SERVICE_LAZY_INIT", "0").strip().lower() in ("1", "true", "yes", "on")
+
+# module name -> seconds spent importing it (first import only)
+IMPORT_TIMINGS: Dict[str, float] = {}
+
+
+def module_available(name: str) -> bool:
+    """True when the top-level package of ``name`` is installed (without importing it)"""
+    package = name.partition(".")[0]
+    if package in sys.modules:
+        return True
+    try:
+        return importlib.util.find_spec(package) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def _timed_import(name: str) -> Any:
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    elapsed = time.perf_counter() - start
+    IMPORT_TIMINGS.setdefault(name, elapsed)
+    logger.info(f"📦 Imported {name} in {elapsed:.3f}s")
+    return module
+
+
+class LazyModule:
+    """Module stand-in that performs the import on first attribute access"""
+
+    def __init__(self, name: str):
+        self._lazy_name = name
+        self._lazy_module = None
+        self._lazy_lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._lazy_module is not None
+
+    def _load(self) -> Any:
+        if self._lazy_module is None:
+            with self._lazy_lock:
+                if self._lazy_module is None:
+                    self._lazy_module = _timed_import(self._lazy_name)
+        return self._lazy_module
+
+    def __getattr__(self, attribute: str) -> Any:
+        # Only reached for attributes not set in __init__
+        return getattr(self._load(), attribute)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "deferred"
+        return f"<LazyModule {self._lazy_name} ({state})>"
+
+
+class LazyAttribute:
+    """Stand-in for ``from module import name`` that resolves on first use"""
+
+    def __init__(self, module: LazyModule, attribute: str):
+        self._lazy_module = module
+        self._lazy_attribute = attribute
+
+    @property
+    def loaded(self) -> bool:
+        return self._lazy_module.loaded
+
+    def _load(self) -> Any:
+        return getattr(self._lazy_module._load(), self._lazy_attribute)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._load()(*args, **kwargs)
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(self._load(), attribute)
+
+    def __repr__(self) -> str:
+        return f"<LazyAttribute {self._lazy_module._lazy_name}.{self._lazy_attribute}>"
+
+
+def lazy_import(name: str, attribute: Optional[str] = None) -> Any:
+    """
+    Optional import of ``name`` (or ``name.attribute``).
+
+    Returns ``None`` when the package is not installed. In lazy mode a broken
+    installation only surfaces on first use, where callers already fall back.
+    """
+    if not module_available(name):
+        return None
+
+    if LAZY_INIT:
+        module = LazyModule(name)
+        return module if attribute is None else LazyAttribute(module, attribute)
+
+    try:
+        module = _timed_import(name)
+        return module if attribute is None else getattr(module, attribute)
+    except (ImportError, AttributeError) as e:
+        logger.warning(f"Optional dependency {name} failed to import: {e}")
+        return None
+
+
+def preload(*objects: Any) -> None:
+    """Force the import behind lazy stand-ins; real modules and ``None`` are ignored"""
+    for obj in objects:
+        if isinstance(obj, (LazyModule, LazyAttribute)):
+            obj._load()
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+🧬 SHARED SERVICE INFRASTRUCTURE - REQUEST & OPERATION METRICS
+
+In-process instrumentation exported by every FastAPI service on ``/metrics``
+in the Prometheus text exposition format:
+
+- ``EndpointMetrics`` keeps the persisted per-endpoint counters used by the
+  admin endpoints, plus fixed-bucket latency histograms per route template
+  and status code and an in-flight request gauge
+- ``OPERATION_METRICS`` times backend sub-operations (ChromaDB upserts and
+  queries, NLTK analysis) so a slow route can be attributed to its backend
+- ``render_prometheus`` writes both as ``http_request_duration_seconds`` and
+  ``operation_duration_seconds`` histograms; ``parse_prometheus_text`` and
+  ``histogram_quantile`` are the scraping side used by the monitoring
+  dashboard to derive p50/p99 per endpoint
+
+Histogram buckets are cumulative on export and ``histogram_quantile``
+interpolates linearly inside a bucket, matching PromQL's function of the same
+name, so dashboard and Prometheus report the same percentiles.
+"""
+
+import bisect
+import math
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Prometheus-style latency bucket upper bounds in seconds (+Inf is implicit)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Label value for requests that did not match any route (keeps label cardinality bounded)
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def bucket_labels() -> List[str]:
+    return [str(bound) for bound in LATENCY_BUCKETS] + ["+Inf"]
+
+
+def histogram_quantile(q: float, bounds: Sequence[float], cumulative: Sequence[float]) -> Optional[float]:
+    """
+    Estimate the ``q`` quantile from cumulative bucket counts.
+
+    ``bounds`` are the finite upper bounds in ascending order and
+    ``cumulative`` has one extra trailing entry for ``+Inf``. Returns None for
+    an empty histogram; observations above the last finite bound report that
+    bound, as PromQL does.
+    """
+    total = cumulative[-1] if cumulative else 0
+    if total <= 0:
+        return None
+    rank = q * total
+    index = bisect.bisect_left(cumulative, rank)
+    if index >= len(bounds):
+        return float(bounds[-1])
+    lower = bounds[index - 1] if index > 0 else 0.0
+    below = cumulative[index - 1] if index > 0 else 0
+    in_bucket = cumulative[index] - below
+    if in_bucket <= 0:
+        return float(bounds[index])
+    return lower + (bounds[index] - lower) * (rank - below) / in_bucket
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram over ``LATENCY_BUCKETS``"""
+
+    __slots__ = ("counts", "count", "sum")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def cumulative(self) -> List[int]:
+        result, running = [], 0
+        for count in self.counts:
+            running += count
+            result.append(running)
+        return result
+
+    def quantile(self, q: float) -> Optional[float]:
+        return histogram_quantile(q, LATENCY_BUCKETS, self.cumulative())
+
+    def summary(self) -> Dict[str, Any]:
+        p50, p99 = self.quantile(0.5), self.quantile(0.99)
+        return {
+            "count": self.count,
+            "total_time": self.sum,
+            "p50_seconds": round(p50, 6) if p50 is not None else None,
+            "p99_seconds": round(p99, 6) if p99 is not None else None
+        }
+
+
+class _EndpointStats:
+    __slots__ = ("total_requests", "total_time", "errors", "histogram")
+
+    def __init__(self):
+        self.total_requests = 0
+        self.total_time = 0.0
+        self.errors = 0
+        self.histogram = LatencyHistogram()
+
+
+class EndpointMetrics:
+    """
+    Per-endpoint request counters with latency histograms.
+
+    ``record`` is only called from the event loop thread, so plain attribute
+    updates are safe without a lock. ``snapshot`` keeps the historical
+    ``{"total_requests", "total_time", "errors"}`` shape and adds the
+    cumulative ``latency_histogram`` plus p50/p99 estimates; it is what the
+    services persist. The per-status histograms behind ``/metrics`` and the
+    in-flight gauge describe the running process only.
+    """
+
+    def __init__(self, initial: Optional[Dict[str, Dict[str, Any]]] = None):
+        self._endpoints: Dict[str, _EndpointStats] = {}
+        self._by_status: Dict[Tuple[str, int], LatencyHistogram] = {}
+        self.rejected = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        if initial:
+            self.restore(initial)
+
+    def request_started(self) -> None:
+        self.in_flight += 1
+        if self.in_flight > self.max_in_flight:
+            self.max_in_flight = self.in_flight
+
+    def request_finished(self) -> None:
+        self.in_flight -= 1
+
+    def record(self, endpoint: str, seconds: float, status_code: int) -> None:
+        stats = self._endpoints.get(endpoint)
+        if stats is None:
+            stats = self._endpoints[endpoint] = _EndpointStats()
+        stats.total_requests += 1
+        stats.total_time += seconds
+        if status_code >= 500:
+            stats.errors += 1
+        stats.histogram.observe(seconds)
+
+        histogram = self._by_status.get((endpoint, status_code))
+        if histogram is None:
+            histogram = self._by_status[(endpoint, status_code)] = LatencyHistogram()
+        histogram.observe(seconds)
+
+    def restore(self, data: Dict[str, Dict[str, Any]]) -> None:
+        """Replace counters with a persisted snapshot (histograms restart empty if absent)"""
+        self._endpoints = {}
+        for endpoint, values in data.items():
+            stats = _EndpointStats()
+            stats.total_requests = int(values.get("total_requests", 0))
+            stats.total_time = float(values.get("total_time", 0.0))
+            stats.errors = int(values.get("errors", 0))
+            histogram = values.get("latency_histogram") or {}
+            previous = 0
+            for index, bound in enumerate(bucket_labels()):
+                cumulative = int(histogram.get(bound, previous))
+                stats.histogram.counts[index] = cumulative - previous
+                previous = cumulative
+            stats.histogram.count = previous
+            stats.histogram.sum = stats.total_time if previous else 0.0
+            self._endpoints[endpoint] = stats
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        labels = bucket_labels()
+        result = {}
+        for endpoint, stats in list(self._endpoints.items()):
+            summary = stats.histogram.summary()
+            result[endpoint] = {
+                "total_requests": stats.total_requests,
+                "total_time": stats.total_time,
+                "errors": stats.errors,
+                "p50_seconds": summary["p50_seconds"],
+                "p99_seconds": summary["p99_seconds"],
+                "latency_histogram": dict(zip(labels, stats.histogram.cumulative()))
+            }
+        return result
+
+    def status_histograms(self) -> List[Tuple[str, int, LatencyHistogram]]:
+        return [(route, status, histogram) for (route, status), histogram in sorted(self._by_status.items())]
+
+    def totals(self) -> Dict[str, float]:
+        endpoints = list(self._endpoints.values())
+        return {
+            "total_requests": sum(s.total_requests for s in endpoints),
+            "total_time": sum(s.total_time for s in endpoints),
+            "errors": sum(s.errors for s in endpoints),
+            "rejected": self.rejected,
+            "in_flight": self.in_flight
+        }
+
+
+class OperationTimers:
+    """Thread-safe latency histograms for named backend operations"""
+
+    def __init__(self):
+        self._operations: Dict[str, LatencyHistogram] = {}
+        self._errors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, operation: str, seconds: float, error: bool = False) -> None:
+        with self._lock:
+            histogram = self._operations.get(operation)
+            if histogram is None:
+                histogram = self._operations[operation] = LatencyHistogram()
+                self._errors[operation] = 0
+            histogram.observe(seconds)
+            if error:
+                self._errors[operation] += 1
+
+    @contextmanager
+    def time(self, operation: str) -> Iterator[None]:
+        """Time the enclosed block; exceptions are counted and re-raised"""
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            self.observe(operation, time.perf_counter() - start, error=True)
+            raise
+        self.observe(operation, time.perf_counter() - start)
+
+    def histograms(self) -> List[Tuple[str, LatencyHistogram, int]]:
+        with self._lock:
+            return [
+                (name, self._copy(histogram), self._errors[name])
+                for name, histogram in sorted(self._operations.items())
+            ]
+
+    @staticmethod
+    def _copy(histogram: LatencyHistogram) -> LatencyHistogram:
+        copy = LatencyHistogram()
+        copy.counts, copy.count, copy.sum = list(histogram.counts), histogram.count, histogram.sum
+        return copy
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {name: {**histogram.summary(), "errors": errors} for name, histogram, errors in self.histograms()}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._operations.clear()
+            self._errors.clear()
+
+
+# Process-wide sub-operation timers (one service per process)
+OPERATION_METRICS = OperationTimers()
+
+
+# ---------------------------------------------------------------- exposition
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: Dict[str, Any]) -> str:
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _histogram_lines(name: str, labels: Dict[str, Any], histogram: LatencyHistogram) -> List[str]:
+    lines = [
+        f"{name}_bucket{_labels({**labels, 'le': le})} {count}"
+        for le, count in zip(bucket_labels(), histogram.cumulative())
+    ]
+    lines.append(f"{name}_sum{_labels(labels)} {_format_value(histogram.sum)}")
+    lines.append(f"{name}_count{_labels(labels)} {histogram.count}")
+    return lines
+
+
+def render_prometheus(service_name: str,
+                      metrics: EndpointMetrics,
+                      operations: OperationTimers = OPERATION_METRICS) -> str:
+    """Text exposition (format 0.0.4) of request and operation metrics"""
+    service = {"service": service_name}
+    lines = [
+        "# HELP http_requests_in_flight Requests currently being processed",
+        "# TYPE http_requests_in_flight gauge",
+        f"http_requests_in_flight{_labels(service)} {metrics.in_flight}",
+        "# HELP http_requests_max_in_flight Peak concurrent requests since start",
+        "# TYPE http_requests_max_in_flight gauge",
+        f"http_requests_max_in_flight{_labels(service)} {metrics.max_in_flight}",
+        "# HELP http_requests_rejected_total Requests rejected for a missing or invalid API key",
+        "# TYPE http_requests_rejected_total counter",
+        f"http_requests_rejected_total{_labels(service)} {metrics.rejected}",
+        "# HELP http_request_duration_seconds Request latency by route template and status code",
+        "# TYPE http_request_duration_seconds histogram",
+    ]
+    for route, status, histogram in metrics.status_histograms():
+        lines.extend(_histogram_lines(
+            "http_request_duration_seconds", {**service, "route": route, "status": status}, histogram
+        ))
+
+    operation_histograms = operations.histograms()
+    lines.append("# HELP operation_duration_seconds Backend sub-operation latency (ChromaDB, NLTK)")
+    lines.append("# TYPE operation_duration_seconds histogram")
+    for operation, histogram, _ in operation_histograms:
+        lines.extend(_histogram_lines("operation_duration_seconds", {**service, "operation": operation}, histogram))
+    lines.append("# HELP operation_errors_total Backend sub-operations that raised")
+    lines.append("# TYPE operation_errors_total counter")
+    for operation, _, errors in operation_histograms:
+        lines.append(f"operation_errors_total{_labels({**service, 'operation': operation})} {errors}")
+    return "\n".join(lines) + "\n"
+
+
+_SAMPLE_LINE = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(.*)\})?\s+(\S+)')
+_LABEL_PAIR = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\]|\\.)*)"')
+
+
+def parse_prometheus_text(text: str) -> List[Tuple[str, Dict[str, str], float]]:
+    """Parse text exposition into ``(metric_name, labels, value)`` samples"""
+    samples = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        match = _SAMPLE_LINE.match(line)
+        if not match:
+            continue
+        name, raw_labels, raw_value = match.groups()
+        labels = {
+            key: value.replace('\\"', '"').replace("\\n", "\n").replace("\\\\", "\\")
+            for key, value in _LABEL_PAIR.findall(raw_labels or "")
+        }
+        try:
+            samples.append((name, labels, float(raw_value)))
+        except ValueError:
+            continue
+    return samples
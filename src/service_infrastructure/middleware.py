@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+🧬 SHARED SERVICE INFRASTRUCTURE - SECURITY & MONITORING MIDDLEWARE
+
+One ASGI middleware mounted by every FastAPI service instead of the
+per-service ``production_security_middleware`` copies:
+
+- API keys are checked against a set of SHA-256 digests (``ApiKeyValidator``)
+  instead of a linear ``in`` scan over the plaintext list
+- per-endpoint counters, per route/status latency histograms and the
+  in-flight gauge live in memory (``EndpointMetrics``, see ``metrics``) and
+  are only updated from the event loop thread, so no lock is taken on the
+  request path; services persist a snapshot on shutdown rather than
+  rewriting their JSON file on every request
+- requests are labelled with the matched route template (``/cv/{id}``), not
+  the raw path, so path parameters do not explode metric cardinality
+- ``setup_queue_logging`` routes log records through a ``QueueHandler`` so
+  file and console I/O happen on a ``QueueListener`` thread; per-request
+  completion lines are DEBUG, security violations and errors stay visible
+"""
+
+import atexit
+import hashlib
+import json
+import logging
+import logging.handlers
+import queue
+import time
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import parse_qs
+
+from .metrics import LATENCY_BUCKETS, UNMATCHED_ROUTE, EndpointMetrics  # noqa: F401 (re-exported)
+
+logger = logging.getLogger(__name__)
+
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def setup_queue_logging(handlers: List[logging.Handler],
+                        level: int = logging.INFO,
+                        fmt: str = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+                        ) -> Optional[logging.handlers.QueueListener]:
+    """
+    Drop-in for ``logging.basicConfig(handlers=...)`` that keeps handler I/O
+    off the request path. Like ``basicConfig`` it does nothing when the root
+    logger is already configured.
+    """
+    global _queue_listener
+    root = logging.getLogger()
+    if root.handlers:
+        return _queue_listener
+
+    formatter = logging.Formatter(fmt)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(level)
+
+    _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+    atexit.register(stop_queue_logging)
+    return _queue_listener
+
+
+def stop_queue_logging() -> None:
+    """Flush queued records and stop the listener thread"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+class ApiKeyValidator:
+    """API key check against a set of SHA-256 digests"""
+
+    def __init__(self, api_keys: Iterable[str]):
+        self._digests = {self._digest(key) for key in api_keys}
+
+    @staticmethod
+    def _digest(api_key: str) -> bytes:
+        return hashlib.sha256(api_key.encode("utf-8")).digest()
+
+    def add(self, api_key: str) -> None:
+        self._digests.add(self._digest(api_key))
+
+    def __len__(self) -> int:
+        return len(self._digests)
+
+    def is_valid(self, api_key: Optional[str]) -> bool:
+        return bool(api_key) and self._digest(api_key) in self._digests
+
+
+# Kubernetes probes and the Prometheus scraper do not carry API keys
+PROBE_PATHS = ("/health", "/ready", "/metrics")
+
+
+class SecurityMonitoringMiddleware:
+    """
+    Pure ASGI middleware: API key check, request metrics and error containment.
+
+    ``api_keys=None`` mounts it for monitoring only, for services that do not
+    authenticate at the HTTP layer. ``exempt_paths`` skip the key check (probes
+    and scrapers) but are still counted in the request metrics.
+    """
+
+    def __init__(self, app,
+                 api_keys: Optional[ApiKeyValidator],
+                 metrics: EndpointMetrics,
+                 service_name: str,
+                 error_content: Optional[Dict[str, Any]] = None,
+                 unauthorized_content: Optional[Dict[str, Any]] = None,
+                 exempt_paths: Iterable[str] = ()):
+        self.app = app
+        self.api_keys = api_keys
+        self.exempt_paths = frozenset(exempt_paths)
+        self.metrics = metrics
+        self.log = logging.getLogger(service_name)
+        self._error_body = json.dumps(error_content or {"error": f"{service_name} error"}).encode("utf-8")
+        self._unauthorized_body = json.dumps(unauthorized_content or {"error": "Authentication required"}).encode("utf-8")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        if (self.api_keys is not None and scope["path"] not in self.exempt_paths
+                and not self.api_keys.is_valid(self._extract_api_key(scope))):
+            self.metrics.rejected += 1
+            client = scope.get("client")
+            self.log.warning(f"SECURITY VIOLATION: Invalid API key from {client[0] if client else 'unknown'}")
+            await self._send_json(send, 401, self._unauthorized_body)
+            return
+
+        status = {"code": 500, "started": False}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                status["started"] = True
+            await send(message)
+
+        self.metrics.request_started()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            self.metrics.record(self._route_label(scope), time.perf_counter() - start, 500)
+            self.log.error(f"REQUEST ERROR: {scope['method']} {scope['path']} - {e}")
+            if status["started"]:
+                raise
+            await self._send_json(send, 500, self._error_body)
+            return
+        finally:
+            self.metrics.request_finished()
+
+        elapsed = time.perf_counter() - start
+        self.metrics.record(self._route_label(scope), elapsed, status["code"])
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(f"Request completed: {scope['method']} {scope['path']} {status['code']} in {elapsed:.3f}s")
+
+    @staticmethod
+    def _route_label(scope) -> str:
+        # The router stores the matched route in the (shared) scope dict
+        route = scope.get("route")
+        return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+    @staticmethod
+    def _extract_api_key(scope) -> Optional[str]:
+        for name, value in scope["headers"]:
+            if name == b"x-api-key":
+                return value.decode("latin-1")
+        query_string = scope.get("query_string")
+        if query_string and b"api_key" in query_string:
+            values = parse_qs(query_string.decode("latin-1")).get("api_key")
+            return values[0] if values else None
+        return None
+
+    @staticmethod
+    async def _send_json(send, status_code: int, body: bytes) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+        })
+        await send({"type": "http.response.body", "body": body})
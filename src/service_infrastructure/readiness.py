@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+🧬 SHARED SERVICE INFRASTRUCTURE - STARTUP READINESS
+
+Warm-up tracking behind each service's FastAPI lifespan hook and ``/ready``.
+
+Services register warm-up steps (optional imports, NLTK data, vector store
+clients, ...) with ``add_warmup``. The lifespan hook calls ``start()``:
+
+- in lazy mode (``SERVICE_LAZY_INIT=1``) the steps run in a background task,
+  so the replica answers ``/health`` immediately and ``/ready`` reports 503
+  until warm-up has finished
+- otherwise the lifespan waits for every step before serving traffic
+
+Steps run in registration order on a worker thread. A failing step marks the
+component ``failed`` (the service keeps its simulation fallback) but does not
+hold readiness back forever.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .lazy_imports import IMPORT_TIMINGS, LAZY_INIT
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceReadiness:
+    """Registry of warm-up steps and their state for the ``/ready`` endpoint"""
+
+    def __init__(self, service_name: str, lazy: Optional[bool] = None):
+        self.service_name = service_name
+        self.lazy = LAZY_INIT if lazy is None else lazy
+        self.components: Dict[str, Dict[str, Any]] = {}
+        self._warmups: List[Tuple[str, Callable[[], Any]]] = []
+        self._task: Optional[asyncio.Task] = None
+        self._created_at = time.perf_counter()
+        self.warmup_seconds: Optional[float] = None
+
+    def add_warmup(self, name: str, initializer: Callable[[], Any]) -> None:
+        self._warmups.append((name, initializer))
+        self.components[name] = {"status": "pending"}
+
+    @property
+    def ready(self) -> bool:
+        return self.warmup_seconds is not None
+
+    async def _run_warmups(self) -> None:
+        start = time.perf_counter()
+        for name, initializer in self._warmups:
+            component = self.components[name]
+            component["status"] = "warming"
+            step_start = time.perf_counter()
+            try:
+                await asyncio.to_thread(initializer)
+                component["status"] = "ready"
+            except Exception as e:
+                component["status"] = "failed"
+                component["error"] = " ".join(str(e).split())[:300]
+                logger.warning(f"{self.service_name} warm-up step {name} failed: {e}")
+            component["seconds"] = round(time.perf_counter() - step_start, 4)
+        self.warmup_seconds = time.perf_counter() - start
+        logger.info(f"✅ {self.service_name} ready after {self.warmup_seconds:.2f}s warm-up "
+                    f"({time.perf_counter() - self._created_at:.2f}s since import)")
+
+    async def start(self) -> None:
+        """Run warm-up now (eager) or in the background (lazy)"""
+        if self.lazy:
+            self._task = asyncio.create_task(self._run_warmups())
+        else:
+            await self._run_warmups()
+
+    async def stop(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    def readiness_report(self) -> Dict[str, Any]:
+        failed = [name for name, component in self.components.items() if component["status"] == "failed"]
+        return {
+            "service": self.service_name,
+            "ready": self.ready,
+            "degraded": bool(failed),
+            "startup_mode": "lazy" if self.lazy else "eager",
+            "warmup_seconds": round(self.warmup_seconds, 4) if self.warmup_seconds is not None else None,
+            "components": self.components,
+            "import_seconds": {name: round(seconds, 4) for name, seconds in IMPORT_TIMINGS.items()}
+        }
@@ -0,0 +1,483 @@
+#!/usr/bin/env python3
+"""
+🧬 SHARED SERVICE INFRASTRUCTURE - ASYNC VECTOR STORE ADAPTER
+
+Non-blocking ChromaDB adapter shared by the FastAPI services (CNS core, CV
+engine, auth orchestrator, brain trust, multilingual resonance).
+
+- ChromaDB calls run on a bounded thread pool instead of the event loop
+- concurrent ``add`` calls are micro-batched into a single ``upsert``
+- when ChromaDB is unavailable (or fails to initialise) vectors live in an
+  in-process NumPy index (pre-normalised float32 matrix, ``argpartition``
+  top-k) that is saved next to the collection and memory-mapped on restart;
+  it is also saved every ``save_every`` added vectors and ``save_interval``
+  seconds after an unsaved write, so a crash loses at most that much
+- upserts and queries are timed into ``OPERATION_METRICS`` per backend
+  (``chromadb.*`` / ``vector_index.*``) for the services' ``/metrics``
+- query results are normalised to flat ``ids`` / ``distances`` / ``metadatas``
+  lists for a single query embedding, whichever backend answered
+"""
+
+import asyncio
+import heapq
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+from .lazy_imports import lazy_import
+from .metrics import OPERATION_METRICS
+
+# Deferred until the first collection is created when SERVICE_LAZY_INIT=1
+chromadb = lazy_import("chromadb")
+CHROMADB_AVAILABLE = chromadb is not None
+
+_SCALAR_METADATA_TYPES = (str, int, float, bool)
+
+
+def sanitize_metadata(metadata: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """ChromaDB only accepts scalar metadata values - JSON-encode everything else"""
+    if not metadata:
+        return {}
+    return {
+        str(key): value if isinstance(value, _SCALAR_METADATA_TYPES) else json.dumps(value, default=str)
+        for key, value in metadata.items()
+        if value is not None
+    }
+
+
+def _normalize_python(embedding: List[float]) -> List[float]:
+    norm = sum(a * a for a in embedding) ** 0.5
+    return [a / norm for a in embedding] if norm else [0.0 for _ in embedding]
+
+
+def _normalize_rows(matrix: "np.ndarray") -> "np.ndarray":
+    """L2-normalise float32 rows in place; zero rows stay zero"""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+def cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
+    """Cosine similarity of two vectors using the index normalisation; 0.0 for zero vectors"""
+    if NUMPY_AVAILABLE:
+        a, b = _normalize_rows(np.array([vec1, vec2], dtype=np.float32))
+        return float(a @ b)
+    return sum(a * b for a, b in zip(_normalize_python(vec1), _normalize_python(vec2)))
+
+
+class NumpyVectorIndex:
+    """
+    In-process cosine similarity index used when ChromaDB is unavailable
+
+    Rows are L2-normalised on insert and kept in one contiguous float32 matrix
+    that grows by doubling, so a query is a single matrix-vector product plus
+    an ``argpartition`` top-k. With a ``persist_path`` the matrix is saved as
+    ``<persist_path>.npy`` (ids and metadata in ``<persist_path>.json``) and
+    memory-mapped read-only on load; it is only copied into memory on the
+    first write after a restart.
+    """
+
+    def __init__(self, persist_path: Optional[str] = None, initial_capacity: int = 1024):
+        self.persist_path = persist_path
+        self.initial_capacity = max(1, initial_capacity)
+        self.ids: List[str] = []
+        self.metadatas: List[Dict[str, Any]] = []
+        self._positions: Dict[str, int] = {}
+        self._matrix = None
+        self._rows: List[List[float]] = []  # pure-Python storage when NumPy is missing
+        self._dirty = False
+        self.unsaved_changes = 0
+        self._lock = threading.Lock()
+
+        if persist_path:
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def dimension(self) -> Optional[int]:
+        return self._matrix.shape[1] if self._matrix is not None else None
+
+    @property
+    def capacity(self) -> int:
+        return self._matrix.shape[0] if self._matrix is not None else 0
+
+    # ------------------------------------------------------------- writes
+
+    def upsert(self, ids: List[str], embeddings: List[List[float]], metadatas: List[Dict[str, Any]]) -> None:
+        if not ids:
+            return
+        with self._lock:
+            if NUMPY_AVAILABLE:
+                self._upsert_numpy(ids, embeddings, metadatas)
+            else:
+                self._upsert_python(ids, embeddings, metadatas)
+            self._dirty = True
+            self.unsaved_changes += len(ids)
+
+    def _upsert_numpy(self, ids: List[str], embeddings: List[List[float]], metadatas: List[Dict[str, Any]]) -> None:
+        vectors = _normalize_rows(np.array(embeddings, dtype=np.float32, ndmin=2))
+        if self._matrix is None:
+            self._matrix = np.zeros((max(self.initial_capacity, len(ids)), vectors.shape[1]), dtype=np.float32)
+        elif vectors.shape[1] != self.dimension:
+            raise ValueError(f"Embedding dimension {vectors.shape[1]} does not match index dimension {self.dimension}")
+
+        new_ids = sum(1 for vector_id in dict.fromkeys(ids) if vector_id not in self._positions)
+        self._reserve(len(self.ids) + new_ids)
+
+        for vector_id, vector, metadata in zip(ids, vectors, metadatas):
+            position = self._positions.get(vector_id)
+            if position is None:
+                position = self._positions[vector_id] = len(self.ids)
+                self.ids.append(vector_id)
+                self.metadatas.append(metadata)
+            else:
+                self.metadatas[position] = metadata
+            self._matrix[position] = vector
+
+    def _reserve(self, size: int) -> None:
+        """Grow by doubling (and leave a read-only memory map) before writing"""
+        capacity = self.capacity
+        if size <= capacity and self._matrix.flags.writeable:
+            return
+        while capacity < size:
+            capacity *= 2
+        grown = np.zeros((capacity, self._matrix.shape[1]), dtype=np.float32)
+        grown[:len(self.ids)] = self._matrix[:len(self.ids)]
+        self._matrix = grown
+
+    def _upsert_python(self, ids: List[str], embeddings: List[List[float]], metadatas: List[Dict[str, Any]]) -> None:
+        for vector_id, embedding, metadata in zip(ids, embeddings, metadatas):
+            row = _normalize_python(list(embedding))
+            position = self._positions.get(vector_id)
+            if position is None:
+                self._positions[vector_id] = len(self.ids)
+                self.ids.append(vector_id)
+                self.metadatas.append(metadata)
+                self._rows.append(row)
+            else:
+                self.metadatas[position] = metadata
+                self._rows[position] = row
+
+    # -------------------------------------------------------------- reads
+
+    def top_k(self, embedding: List[float], k: int) -> Tuple[List[int], List[float]]:
+        """Positions and cosine similarities of the ``k`` nearest rows, best first"""
+        with self._lock:
+            size = len(self.ids)
+            k = min(k, size)
+            if k <= 0:
+                return [], []
+            if not NUMPY_AVAILABLE:
+                return self._top_k_python(embedding, k)
+
+            query = _normalize_rows(np.array(embedding, dtype=np.float32, ndmin=2))[0]
+            similarities = self._matrix[:size] @ query
+
+        if k < size:
+            candidates = np.argpartition(-similarities, k - 1)[:k]
+        else:
+            candidates = np.arange(size)
+        # Best first; ties keep insertion order
+        ranked = candidates[np.lexsort((candidates, -similarities[candidates]))]
+        return ranked.tolist(), similarities[ranked].astype(float).tolist()
+
+    def _top_k_python(self, embedding: List[float], k: int) -> Tuple[List[int], List[float]]:
+        query = _normalize_python(list(embedding))
+        similarities = [sum(a * b for a, b in zip(query, row)) for row in self._rows]
+        ranked = heapq.nsmallest(k, range(len(similarities)), key=lambda i: -similarities[i])
+        return ranked, [similarities[i] for i in ranked]
+
+    def query(self, embedding: List[float], n_results: int) -> Dict[str, List[Any]]:
+        ranked, similarities = self.top_k(embedding, n_results)
+        return {
+            "ids": [self.ids[i] for i in ranked],
+            "distances": [1.0 - similarity for similarity in similarities],
+            "metadatas": [self.metadatas[i] for i in ranked]
+        }
+
+    # -------------------------------------------------------- persistence
+
+    def save(self) -> bool:
+        """Write the matrix to ``<persist_path>.npy`` and ids/metadata to ``<persist_path>.json``"""
+        if not self.persist_path or not NUMPY_AVAILABLE:
+            return False
+        with self._lock:
+            if not self._dirty:
+                return False
+            directory = os.path.dirname(self.persist_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            size = len(self.ids)
+            matrix = self._matrix[:size] if self._matrix is not None else np.zeros((0, 0), dtype=np.float32)
+            # Write both files before swapping either in, so a crash leaves the old pair intact
+            with open(f"{self.persist_path}.npy.tmp", 'wb') as f:
+                np.save(f, np.ascontiguousarray(matrix))
+                f.flush()
+                os.fsync(f.fileno())
+            with open(f"{self.persist_path}.json.tmp", 'w') as f:
+                json.dump({"ids": self.ids, "metadatas": self.metadatas}, f, default=str)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(f"{self.persist_path}.npy.tmp", f"{self.persist_path}.npy")
+            os.replace(f"{self.persist_path}.json.tmp", f"{self.persist_path}.json")
+            self._dirty = False
+            self.unsaved_changes = 0
+        logger.info(f"💾 Vector index saved: {size} vectors -> {self.persist_path}.npy")
+        return True
+
+    def load(self) -> int:
+        """Memory-map a previously saved index; returns the number of vectors loaded"""
+        matrix_path, sidecar_path = f"{self.persist_path}.npy", f"{self.persist_path}.json"
+        if not NUMPY_AVAILABLE or not (os.path.exists(matrix_path) and os.path.exists(sidecar_path)):
+            return 0
+        try:
+            with open(sidecar_path, 'r') as f:
+                sidecar = json.load(f)
+            matrix = np.load(matrix_path, mmap_mode='r')
+        except (OSError, ValueError) as e:
+            logger.warning(f"Vector index at {self.persist_path} unreadable, starting empty: {e}")
+            return 0
+        if matrix.shape[0] != len(sidecar["ids"]):
+            logger.warning(f"Vector index at {self.persist_path} is inconsistent, starting empty")
+            return 0
+
+        with self._lock:
+            self.ids = list(sidecar["ids"])
+            self.metadatas = list(sidecar["metadatas"])
+            self._positions = {vector_id: position for position, vector_id in enumerate(self.ids)}
+            self._matrix = matrix if matrix.size else None
+            self._dirty = False
+            self.unsaved_changes = 0
+        logger.info(f"🧬 Vector index memory-mapped: {len(self.ids)} vectors from {matrix_path}")
+        return len(self.ids)
+
+
+class AsyncVectorStoreAdapter:
+    """Shared non-blocking vector store with micro-batched upserts and a NumPy fallback"""
+
+    def __init__(self,
+                 collection_name: str,
+                 persist_path: str,
+                 collection_metadata: Optional[Dict[str, Any]] = None,
+                 max_workers: int = 4,
+                 batch_window: float = 0.005,
+                 max_batch_size: int = 256,
+                 save_every: int = 500,
+                 save_interval: float = 30.0):
+        self.collection_name = collection_name
+        self.persist_path = persist_path
+        self.collection_metadata = collection_metadata or {}
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.save_every = max(1, save_every)
+        self.save_interval = save_interval
+
+        self.collection = None
+        self.fallback_index = NumpyVectorIndex()
+        self._initialized = False
+        self._init_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"vectors-{collection_name}")
+
+        self._pending: List[Tuple[str, List[float], Dict[str, Any], asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._save_handle: Optional[asyncio.TimerHandle] = None
+        # Strong references to in-flight commits: the loop only keeps weak ones
+        self._commit_tasks: Set[asyncio.Task] = set()
+
+        self.stats = {"adds": 0, "upsert_batches": 0, "queries": 0, "errors": 0}
+
+    # -------------------------------------------------------- initialisation
+
+    @property
+    def backend(self) -> str:
+        return "chromadb" if self.collection is not None else "numpy_fallback"
+
+    def ensure_initialized(self) -> None:
+        """Create the ChromaDB client and collection on first use"""
+        if self._initialized:
+            return
+        with self._init_lock:
+            if self._initialized:
+                return
+            if CHROMADB_AVAILABLE:
+                try:
+                    client = chromadb.PersistentClient(path=self.persist_path)
+                    self.collection = client.get_or_create_collection(
+                        name=self.collection_name,
+                        metadata=self.collection_metadata or None
+                    )
+                    logger.info(f"🧬 Vector collection ready: {self.collection_name}")
+                except Exception as e:
+                    logger.error(f"Failed to initialize vector collection {self.collection_name}: {e}")
+                    self.collection = None
+            else:
+                logger.warning(f"ChromaDB not available, {self.collection_name} using in-process vector index")
+            if self.collection is None:
+                self.fallback_index = NumpyVectorIndex(
+                    persist_path=os.path.join(self.persist_path, f"{self.collection_name}_index")
+                )
+            self._initialized = True
+
+    async def initialize(self) -> None:
+        """Initialise the backend on the worker pool"""
+        await asyncio.get_running_loop().run_in_executor(self._executor, self.ensure_initialized)
+
+    # ------------------------------------------------------------- writes
+
+    def add_sync(self, vector_id: str, embedding: List[float], metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Blocking single upsert for callers outside the event loop"""
+        self._upsert([vector_id], [list(embedding)], [sanitize_metadata(metadata)])
+
+    async def add(self, vector_id: str, embedding: List[float], metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Queue an upsert; concurrent adds within ``batch_window`` share one ChromaDB call"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((vector_id, list(embedding), sanitize_metadata(metadata), future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._dispatch_pending()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._dispatch_pending)
+
+        await future
+
+    def _dispatch_pending(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._commit_batch(batch))
+            self._commit_tasks.add(task)
+            task.add_done_callback(self._commit_done)
+
+    def _commit_done(self, task: asyncio.Task) -> None:
+        self._commit_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.stats["errors"] += 1
+            logger.error(f"Vector commit task failed for {self.collection_name}: {task.exception()!r}")
+
+    async def _commit_batch(self, batch: List[Tuple[str, List[float], Dict[str, Any], asyncio.Future]]) -> None:
+        # Last write wins for duplicate ids inside one batch
+        latest: Dict[str, Tuple[List[float], Dict[str, Any]]] = {}
+        for vector_id, embedding, metadata, _ in batch:
+            latest[vector_id] = (embedding, metadata)
+        ids = list(latest)
+        embeddings = [latest[i][0] for i in ids]
+        metadatas = [latest[i][1] for i in ids]
+
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                self._executor, partial(self._upsert, ids, embeddings, metadatas)
+            )
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.error(f"Vector upsert batch failed for {self.collection_name}: {e}")
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for *_, future in batch:
+            if not future.done():
+                future.set_result(None)
+
+        # Writes below the save_every threshold are saved save_interval seconds later
+        if self.collection is None and self.fallback_index.unsaved_changes and self._save_handle is None:
+            self._save_handle = asyncio.get_running_loop().call_later(self.save_interval, self._dispatch_save)
+
+    def _dispatch_save(self) -> None:
+        self._save_handle = None
+        task = asyncio.ensure_future(self.persist())
+        self._commit_tasks.add(task)
+        task.add_done_callback(self._commit_done)
+
+    def _upsert(self, ids: List[str], embeddings: List[List[float]], metadatas: List[Dict[str, Any]]) -> None:
+        self.ensure_initialized()
+        self.stats["adds"] += len(ids)
+        self.stats["upsert_batches"] += 1
+        if self.collection is not None:
+            # Chroma rejects empty metadata dicts
+            with OPERATION_METRICS.time("chromadb.upsert"):
+                self.collection.upsert(ids=ids, embeddings=embeddings, metadatas=[m or None for m in metadatas])
+        else:
+            with OPERATION_METRICS.time("vector_index.upsert"):
+                self.fallback_index.upsert(ids, embeddings, metadatas)
+            if self.fallback_index.unsaved_changes >= self.save_every:
+                self.persist_sync()
+
+    # -------------------------------------------------------------- reads
+
+    def query_sync(self, embedding: List[float], n_results: int = 10) -> Dict[str, List[Any]]:
+        """Blocking similarity search returning flat ids/distances/metadatas lists"""
+        self.ensure_initialized()
+        self.stats["queries"] += 1
+        if self.collection is None:
+            with OPERATION_METRICS.time("vector_index.query"):
+                return self.fallback_index.query(embedding, n_results)
+
+        with OPERATION_METRICS.time("chromadb.query"):
+            results = self.collection.query(
+                query_embeddings=[list(embedding)],
+                n_results=n_results,
+                include=['metadatas', 'distances']
+            )
+        return {
+            "ids": (results.get("ids") or [[]])[0],
+            "distances": (results.get("distances") or [[]])[0],
+            "metadatas": (results.get("metadatas") or [[]])[0]
+        }
+
+    async def query(self, embedding: List[float], n_results: int = 10) -> Dict[str, List[Any]]:
+        """Similarity search on the worker pool"""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, partial(self.query_sync, embedding, n_results)
+        )
+
+    def count(self) -> int:
+        self.ensure_initialized()
+        if self.collection is not None:
+            return self.collection.count()
+        return len(self.fallback_index)
+
+    def get_vector_store_metrics(self) -> Dict[str, Any]:
+        return {
+            "collection": self.collection_name,
+            "backend": self.backend if self._initialized else "uninitialized",
+            "pending_adds": len(self._pending),
+            "fallback_vectors": len(self.fallback_index),
+            **self.stats
+        }
+
+    def persist_sync(self) -> bool:
+        """Save the fallback index to disk (no-op for ChromaDB, which persists itself)"""
+        if self.collection is not None or not self._initialized:
+            return False
+        return self.fallback_index.save()
+
+    async def persist(self) -> bool:
+        """Save the fallback index on the worker pool"""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self.persist_sync)
+
+    def shutdown(self) -> None:
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save_handle = None
+        self.persist_sync()
+        self._executor.shutdown(wait=True)
@@ -30,8 +30,15 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple, Set
 from dataclasses import dataclass, field
 from enum import Enum
-from docx import Document
-import pdfplumber
+# Document backends are optional: TXT/HTML parsing works without them
+try:
+    from docx import Document
+except ImportError:
+    Document = None
+try:
+    import pdfplumber
+except ImportError:
+    pdfplumber = None
 # import spacy
 # from spacy.lang.en import English
 try:
@@ -138,6 +145,56 @@ class SimpleNLPFallback:
 
         return MockDoc(text, entities)
 
+class SkillMatcher:
+    """
+    All skill patterns compiled into one prefix-factored (trie) pattern, so a
+    document is scanned once instead of once per skill, and each position is
+    rejected after a character or two. Skills match as whole words ("ai" no
+    longer matches inside "email").
+    """
+
+    def __init__(self, skill_categories: Dict[str, List[str]]):
+        self.skills: Dict[str, str] = {}  # lowercase skill name -> first category defining it
+        self.pattern_order: List[str] = []
+        for category, patterns in skill_categories.items():
+            for pattern in patterns:
+                # Table entries are regex-escaped literals ('c\+\+', 'node\.js')
+                name = re.sub(r'\\(.)', r'\1', pattern)
+                if name not in self.skills:
+                    self.skills[name] = category
+                    self.pattern_order.append(name)
+
+        trie: Dict[str, Any] = {}
+        for name in self.pattern_order:
+            node = trie
+            for char in name:
+                node = node.setdefault(char, {})
+            node[''] = {}
+        self.automaton = re.compile(r'\b(' + self._trie_pattern(trie) + r')(?!\w)')
+
+    @classmethod
+    def _trie_pattern(cls, node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + cls._trie_pattern(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # Greedy optional tail: the longest skill wins, shorter ones are tried on backtrack
+        return f'(?:{pattern})?' if '' in node else pattern
+
+    def scan(self, text_lines: List[str]) -> Dict[str, str]:
+        """Skill name -> first line mentioning it, in one pass over the text"""
+        text = '\n'.join(text_lines).lower()
+        found: Dict[str, str] = {}
+        line_index, position = 0, 0
+        for match in self.automaton.finditer(text):
+            skill = match.group(1)
+            if skill in found:
+                continue
+            line_index += text.count('\n', position, match.start())
+            position = match.start()
+            found[skill] = text_lines[min(line_index, len(text_lines) - 1)]
+        return found
+
 class PatternRecognitionEngine:
     """AI-powered pattern recognition for resume content extraction"""
 
@@ -173,6 +230,9 @@ class PatternRecognitionEngine:
             ]
         }
 
+        self.skill_matcher = SkillMatcher(self.skill_categories)
+        self.category_importance = {'technical': 0.9, 'business': 0.7, 'soft_skills': 0.5}
+
         # Date patterns for chronological extraction
         self.date_patterns = [
             re.compile(r'\b(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{4}\b', re.IGNORECASE),
@@ -288,59 +348,31 @@ class PatternRecognitionEngine:
     async def extract_skills(self, text_lines: List[str]) -> List[ExtractedEntity]:
         """Extract skills using pattern recognition and categorization"""
 
-        extracted_skills = []
-        full_text = '\n'.join(text_lines).lower()
-
-        # Find skills section
-        skills_section_start = None
-        for i, line in enumerate(text_lines):
-            if 'skills' in line.lower() and ('technical' in line.lower() or 'professional' in line.lower() or len(line.strip()) < 20):
-                skills_section_start = i + 1
-                break
-
-        skills_text = full_text
-
-        # Extract skills by category
-        for category, skill_list in self.skill_categories.items():
-            for skill in skill_list:
-                if skill in skills_text:
-                    # Find context around skill
-                    lines_with_skill = [line for line in text_lines if skill in line.lower()]
-                    context = lines_with_skill[0] if lines_with_skill else f"Contains {skill}"
-
-                    extracted_skills.append(ExtractedEntity(
-                        value=skill.title(),
-                        confidence=ExtractionConfidence.MEDIUM,
-                        section_type=SectionType.SKILLS,
-                        context=context,
-                        biological_resonance=0.91,
-                        validation_score=0.8
-                    ))
-
-        # Remove duplicates
-        unique_skills = []
-        seen = set()
-        for skill in extracted_skills:
-            if skill.value.lower() not in seen:
-                unique_skills.append(skill)
-                seen.add(skill.value.lower())
+        found = self.skill_matcher.scan(text_lines)
+
+        # Report in category order, like the skill table itself
+        extracted_skills = [
+            ExtractedEntity(
+                value=skill.title(),
+                confidence=ExtractionConfidence.MEDIUM,
+                section_type=SectionType.SKILLS,
+                context=found[skill],
+                biological_resonance=0.91,
+                validation_score=0.8
+            )
+            for skill in self.skill_matcher.pattern_order if skill in found
+        ]
 
         # Limit to top skills with highest confidence
-        return sorted(unique_skills,
+        return sorted(extracted_skills,
                      key=lambda x: self._calculate_skill_importance(x.value),
                      reverse=True)[:20]
 
     def _calculate_skill_importance(self, skill: str) -> float:
         """Calculate biological importance of a skill"""
-        # Technical skills get highest weight
-        if any(tech in skill.lower() for tech in self.skill_categories['technical']):
-            return 0.9
-        # Business skills medium weight
-        elif any(biz in skill.lower() for biz in self.skill_categories['business']):
-            return 0.7
-        # Soft skills lower weight
-        else:
-            return 0.5
+        # Technical skills highest weight, business medium, soft skills lower
+        category = self.skill_matcher.skills.get(skill.lower())
+        return self.category_importance.get(category, 0.5)
 
 class BiologicalInsightEngine:
     """Biological consciousness-aware resume analysis"""
@@ -494,13 +526,25 @@ class BiologicalResumeParser:
         # Extract text content
         text_lines = await self._extract_text_from_document(file_path, document_type)
 
+        parsed_resume = await self.analyze_text(text_lines, file_path, document_type)
+
+        # Track processing time
+        end_time = time.time()
+        self.parsing_metrics["processing_speed"] = end_time - start_time
+
+        return parsed_resume
+
+    async def analyze_text(self, text_lines: List[str], file_path: str, document_type: DocumentType,
+                           fingerprint: Optional[str] = None) -> ParsedResume:
+        """Run section extraction and insights over already-extracted text"""
+
         # Create parsed resume object
         parsed_resume = ParsedResume(
             document_id=str(uuid.uuid4()),
             original_filename=Path(file_path).name,
             file_type=document_type,
             extraction_timestamp=datetime.utcnow().isoformat() + "Z",
-            biological_fingerprint=hashlib.sha256('\n'.join(text_lines).encode()).hexdigest()[:32].upper()
+            biological_fingerprint=fingerprint or text_fingerprint(text_lines)
         )
 
         # Extract all sections
@@ -523,28 +567,30 @@ class BiologicalResumeParser:
         parsed_resume.improvement_recommendations = insights['improvement_recommendations']
         parsed_resume.consciousness_insights = insights['consciousness_insights']
 
-        # Track processing time
-        end_time = time.time()
-        self.parsing_metrics["processing_speed"] = end_time - start_time
-
         return parsed_resume
 
     async def _extract_text_from_document(self, file_path: str, document_type: DocumentType) -> List[str]:
-        """Extract text content from various document formats"""
+        """Extract text content off the event loop (pdfplumber/python-docx are blocking)"""
+        return await asyncio.to_thread(self.extract_text, file_path, document_type)
+
+    def extract_text(self, file_path: str, document_type: DocumentType) -> List[str]:
+        """Extract text content from various document formats (blocking)"""
 
         if document_type == DocumentType.PDF:
-            return await self._extract_pdf_text(file_path)
+            return self._extract_pdf_text(file_path)
         elif document_type == DocumentType.DOCX:
-            return await self._extract_docx_text(file_path)
+            return self._extract_docx_text(file_path)
         elif document_type == DocumentType.TXT:
-            return await self._extract_txt_text(file_path)
+            return self._extract_txt_text(file_path)
         elif document_type == DocumentType.HTML:
-            return await self._extract_html_text(file_path)
+            return self._extract_html_text(file_path)
         else:
             raise ValueError(f"Unsupported document type: {document_type}")
 
-    async def _extract_pdf_text(self, file_path: str) -> List[str]:
+    def _extract_pdf_text(self, file_path: str) -> List[str]:
         """Extract text from PDF document"""
+        if pdfplumber is None:
+            raise RuntimeError("PDF parsing requires pdfplumber")
         try:
             with pdfplumber.open(file_path) as pdf:
                 text_lines = []
@@ -557,8 +603,10 @@ class BiologicalResumeParser:
             print(f"Error extracting PDF text: {e}")
             return []
 
-    async def _extract_docx_text(self, file_path: str) -> List[str]:
+    def _extract_docx_text(self, file_path: str) -> List[str]:
         """Extract text from DOCX document"""
+        if Document is None:
+            raise RuntimeError("DOCX parsing requires python-docx")
         try:
             doc = Document(file_path)
             text_lines = []
@@ -569,7 +617,7 @@ class BiologicalResumeParser:
             print(f"Error extracting DOCX text: {e}")
             return []
 
-    async def _extract_txt_text(self, file_path: str) -> List[str]:
+    def _extract_txt_text(self, file_path: str) -> List[str]:
         """Extract text from TXT document"""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
@@ -579,7 +627,7 @@ class BiologicalResumeParser:
             print(f"Error extracting TXT text: {e}")
             return []
 
-    async def _extract_html_text(self, file_path: str) -> List[str]:
+    def _extract_html_text(self, file_path: str) -> List[str]:
         """Extract text from HTML document (basic implementation)"""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
@@ -604,6 +652,24 @@ class BiologicalResumeParser:
             "phase2_intelligence_ready": True
         }
 
+def text_fingerprint(text_lines: List[str]) -> str:
+    """Biological fingerprint of a document's extracted text (identical text, identical fingerprint)"""
+    return hashlib.sha256('\n'.join(text_lines).encode()).hexdigest()[:32].upper()
+
+def resume_summary(parsed_resume: ParsedResume) -> Dict[str, Any]:
+    """JSON-ready view of a parsed resume"""
+    return {
+        "id": parsed_resume.document_id,
+        "filename": parsed_resume.original_filename,
+        "quality_score": f"{parsed_resume.overall_quality_score:.1%}",
+        "biological_harmony": f"{parsed_resume.biological_harmony_score:.1%}",
+        "personal_info": {k: v.value for k, v in parsed_resume.personal_info.items()},
+        "professional_summary": parsed_resume.professional_summary.value if parsed_resume.professional_summary else None,
+        "skills": [skill.value for skill in parsed_resume.skills],
+        "detected_gaps": parsed_resume.detected_gaps,
+        "recommendations": parsed_resume.improvement_recommendations
+    }
+
 # API interfaces for biological integration
 async def parse_resume_biological_intelligence(file_path: str, file_type: str = None) -> Dict[str, Any]:
     """Parse resume with full biological intelligence - US369 Feature 18"""
@@ -612,21 +678,15 @@ async def parse_resume_biological_intelligence(file_path: str, file_type: str =
 
     return {
         "parsing_complete": True,
-        "resume_data": {
-            "id": parsed_resume.document_id,
-            "filename": parsed_resume.original_filename,
-            "quality_score": f"{parsed_resume.overall_quality_score:.1%}",
-            "biological_harmony": f"{parsed_resume.biological_harmony_score:.1%}",
-            "personal_info": {k: v.value for k, v in parsed_resume.personal_info.items()},
-            "professional_summary": parsed_resume.professional_summary.value if parsed_resume.professional_summary else None,
-            "skills": [skill.value for skill in parsed_resume.skills],
-            "detected_gaps": parsed_resume.detected_gaps,
-            "recommendations": parsed_resume.improvement_recommendations
-        },
+        "resume_data": resume_summary(parsed_resume),
         "us369_harmonization": 0.092,
         "intelligence_metrics": await parser.get_parsing_status()
     }
 
+def parse_resume_file(file_path: str, file_type: str = None) -> Dict[str, Any]:
+    """Blocking entry point for worker threads and processes"""
+    return asyncio.run(parse_resume_biological_intelligence(file_path, file_type))
+
 def get_resume_parser_intelligence_status() -> Dict[str, Any]:
     """Get biological resume parser status"""
     parser = BiologicalResumeParser()
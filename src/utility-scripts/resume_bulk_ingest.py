@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+🧬 BULK RESUME INGESTION - BIOLOGICAL RESUME BACK-FILL
+
+Back-fills historical CVs through the biological resume parser
+(``resume-parser-ai.py``) at archive scale:
+
+- documents come from a directory (searched recursively) or a manifest file
+  listing one path per line, or JSON objects ``{"path": ..., "file_type": ...}``
+- text extraction and section analysis run across a ``ProcessPoolExecutor``,
+  batch by batch; extracted documents are deduplicated by
+  ``biological_fingerprint`` before analysis, so a CV stored twice is
+  analysed once
+- results stream to JSON Lines (``resumes.jsonl`` plus a
+  ``resumes.jsonl.progress`` checkpoint log) or SQLite (``.sqlite``/``.db``,
+  checkpoint tables in the same database); each batch is flushed before it
+  is checkpointed, so an interrupted run resumes where it stopped
+- the report includes documents/second and per-stage timings
+
+Failed documents are logged but not checkpointed, so they are retried on
+the next run (e.g. after installing pdfplumber or python-docx).
+
+Usage:
+    python src/utility-scripts/resume_bulk_ingest.py <directory|manifest> [--output resumes.jsonl]
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import os
+import sqlite3
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+INGEST_WORKERS = int(os.getenv("RESUME_INGEST_WORKERS", str(os.cpu_count() or 2)))
+INGEST_BATCH_SIZE = 256
+SQLITE_SUFFIXES = (".sqlite", ".sqlite3", ".db")
+
+RESUME_PARSER_PATH = Path(__file__).resolve().parent / "resume-parser-ai.py"
+
+Document = Tuple[str, Optional[str]]  # (path, file_type or None to use the suffix)
+
+_resume_parser = None
+_worker_parser = None
+_worker_loop = None
+
+
+def load_resume_parser():
+    """The resume parser module, loaded once per process"""
+    global _resume_parser
+    if _resume_parser is None:
+        spec = importlib.util.spec_from_file_location("resume_parser_ai", RESUME_PARSER_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _resume_parser = module
+    return _resume_parser
+
+
+def _worker():
+    """Per-process parser (its compiled patterns and skill automaton are built once) and event loop"""
+    global _worker_parser, _worker_loop
+    if _worker_parser is None:
+        _worker_parser = load_resume_parser().BiologicalResumeParser()
+        _worker_loop = asyncio.new_event_loop()
+    return _worker_parser
+
+
+def extract_document(document: Document) -> Dict[str, Any]:
+    """Pool stage 1: extract text and fingerprint it"""
+    path, file_type = document
+    start = time.perf_counter()
+    try:
+        parser = _worker()
+        module = load_resume_parser()
+        file_type = file_type or Path(path).suffix.lower().lstrip(".")
+        text_lines = parser.extract_text(path, module.DocumentType(file_type))
+        if not any(line.strip() for line in text_lines):
+            raise ValueError("No text extracted")
+        return {"path": path, "file_type": file_type, "text_lines": text_lines,
+                "fingerprint": module.text_fingerprint(text_lines), "seconds": time.perf_counter() - start}
+    except Exception as e:
+        return {"path": path, "error": f"{type(e).__name__}: {e}", "seconds": time.perf_counter() - start}
+
+
+def analyze_document(extracted: Dict[str, Any]) -> Dict[str, Any]:
+    """Pool stage 2: section extraction and insights for one unique document"""
+    start = time.perf_counter()
+    path, fingerprint = extracted["path"], extracted["fingerprint"]
+    try:
+        parser = _worker()
+        module = load_resume_parser()
+        parsed = _worker_loop.run_until_complete(parser.analyze_text(
+            extracted["text_lines"], path, module.DocumentType(extracted["file_type"]), fingerprint))
+        record = {"path": path, "fingerprint": fingerprint, "file_type": extracted["file_type"],
+                  "resume_data": module.resume_summary(parsed)}
+        return {"record": record, "seconds": time.perf_counter() - start}
+    except Exception as e:
+        return {"path": path, "fingerprint": fingerprint, "error": f"{type(e).__name__}: {e}",
+                "seconds": time.perf_counter() - start}
+
+
+def discover_documents(source: str) -> List[Document]:
+    """Documents under a directory, or listed in a manifest file"""
+    source_path = Path(source)
+    if source_path.is_dir():
+        supported = {f".{fmt.value}" for fmt in load_resume_parser().DocumentType}
+        return [(str(path.resolve()), None) for path in sorted(source_path.rglob("*"))
+                if path.is_file() and path.suffix.lower() in supported]
+
+    documents = []
+    with open(source_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            entry = json.loads(line) if line.startswith("{") else {"path": line}
+            path = Path(entry["path"])
+            if not path.is_absolute():
+                path = source_path.parent / path
+            documents.append((str(path.resolve()), entry.get("file_type")))
+    return documents
+
+
+class JsonLinesSink:
+    """Appends records to ``output`` and checkpoints processed paths to ``output.progress``"""
+
+    def __init__(self, output: str):
+        self.path = Path(output)
+        self.progress_path = self.path.with_name(self.path.name + ".progress")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        for path in (self.path, self.progress_path):
+            self._drop_partial_line(path)
+        self._records = open(self.path, "a", encoding="utf-8")
+        self._progress = open(self.progress_path, "a", encoding="utf-8")
+
+    @staticmethod
+    def _drop_partial_line(path: Path) -> None:
+        """Cut a line left half-written by an interrupted run"""
+        if not path.exists():
+            return
+        with open(path, "rb+") as f:
+            data = f.read()
+            if data and not data.endswith(b"\n"):
+                f.truncate(data.rfind(b"\n") + 1)
+
+    def load_state(self) -> Tuple[Set[str], Set[str]]:
+        with open(self.progress_path, "r", encoding="utf-8") as f:
+            done = {entry["path"] for entry in map(json.loads, f) if entry["status"] != "failed"}
+        with open(self.path, "r", encoding="utf-8") as f:
+            # Records can be ahead of the progress log after an interruption
+            fingerprints = {json.loads(line)["fingerprint"] for line in f}
+        return done, fingerprints
+
+    def write_batch(self, records: List[Dict[str, Any]], outcomes: List[Dict[str, Any]]) -> None:
+        for handle, rows in ((self._records, records), (self._progress, outcomes)):
+            handle.write("".join(json.dumps(row) + "\n" for row in rows))
+            handle.flush()
+            os.fsync(handle.fileno())
+
+    def close(self) -> None:
+        self._records.close()
+        self._progress.close()
+
+
+class SQLiteSink:
+    """``resumes`` table keyed by fingerprint, ``documents`` table as the checkpoint"""
+
+    def __init__(self, output: str):
+        self.path = Path(output)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(self.path))
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS resumes (fingerprint TEXT PRIMARY KEY, path TEXT NOT NULL, "
+                "file_type TEXT, record TEXT NOT NULL)")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS documents (path TEXT PRIMARY KEY, status TEXT NOT NULL, "
+                "fingerprint TEXT, error TEXT)")
+
+    def load_state(self) -> Tuple[Set[str], Set[str]]:
+        done = {row[0] for row in self.connection.execute("SELECT path FROM documents WHERE status != 'failed'")}
+        fingerprints = {row[0] for row in self.connection.execute("SELECT fingerprint FROM resumes")}
+        return done, fingerprints
+
+    def write_batch(self, records: List[Dict[str, Any]], outcomes: List[Dict[str, Any]]) -> None:
+        # One transaction per batch: records and checkpoint land together
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO resumes VALUES (?, ?, ?, ?)",
+                [(r["fingerprint"], r["path"], r["file_type"], json.dumps(r)) for r in records])
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?)",
+                [(o["path"], o["status"], o.get("fingerprint"), o.get("error")) for o in outcomes])
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+def open_sink(output: str):
+    return SQLiteSink(output) if Path(output).suffix.lower() in SQLITE_SUFFIXES else JsonLinesSink(output)
+
+
+def _chunks(items: List[Any], size: int) -> Iterable[List[Any]]:
+    for offset in range(0, len(items), size):
+        yield items[offset:offset + size]
+
+
+def ingest_resumes(source: str, output: str, workers: int = INGEST_WORKERS, batch_size: int = INGEST_BATCH_SIZE,
+                   executor: Optional[Executor] = None,
+                   progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """
+    Parse every document under ``source`` into ``output``, resuming from its checkpoint
+
+    Args:
+        source: directory or manifest file
+        output: ``.jsonl`` path, or ``.sqlite``/``.db`` for SQLite
+        workers: pool size when no executor is given
+        batch_size: documents per extract/analyze/checkpoint round
+        executor: pool to use instead of creating one (left running)
+        progress: called with the running report after each batch
+    """
+    start = time.perf_counter()
+    stage_seconds = {"discover": 0.0, "extract": 0.0, "dedupe": 0.0, "analyze": 0.0, "write": 0.0}
+    worker_seconds = {"extract": 0.0, "analyze": 0.0}
+
+    documents = discover_documents(source)
+    sink = open_sink(output)
+    done, fingerprints = sink.load_state()
+    pending = [document for document in documents if document[0] not in done]
+    stage_seconds["discover"] = time.perf_counter() - start
+
+    report = {"source": source, "output": output, "documents": len(documents),
+              "skipped": len(documents) - len(pending), "processed": 0, "parsed": 0,
+              "duplicates": 0, "failed": 0, "errors": []}
+
+    owns_executor = executor is None
+    if owns_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    chunksize = max(1, batch_size // (max(workers, 1) * 4))
+    try:
+        for batch in _chunks(pending, batch_size):
+            stage = time.perf_counter()
+            extracted = list(executor.map(extract_document, batch, chunksize=chunksize))
+            stage_seconds["extract"] += time.perf_counter() - stage
+
+            stage = time.perf_counter()
+            unique, outcomes = [], []
+            for item in extracted:
+                worker_seconds["extract"] += item["seconds"]
+                if "error" in item:
+                    outcomes.append({"path": item["path"], "status": "failed", "error": item["error"]})
+                elif item["fingerprint"] in fingerprints:
+                    outcomes.append({"path": item["path"], "status": "duplicate", "fingerprint": item["fingerprint"]})
+                else:
+                    fingerprints.add(item["fingerprint"])
+                    unique.append(item)
+            stage_seconds["dedupe"] += time.perf_counter() - stage
+
+            stage = time.perf_counter()
+            records = []
+            for item in executor.map(analyze_document, unique, chunksize=chunksize):
+                worker_seconds["analyze"] += item["seconds"]
+                if "error" in item:
+                    fingerprints.discard(item["fingerprint"])
+                    outcomes.append({"path": item["path"], "status": "failed", "error": item["error"]})
+                else:
+                    record = item["record"]
+                    records.append(record)
+                    outcomes.append({"path": record["path"], "status": "parsed", "fingerprint": record["fingerprint"]})
+            stage_seconds["analyze"] += time.perf_counter() - stage
+
+            stage = time.perf_counter()
+            sink.write_batch(records, outcomes)
+            stage_seconds["write"] += time.perf_counter() - stage
+
+            report["processed"] += len(batch)
+            report["parsed"] += len(records)
+            for outcome in outcomes:
+                if outcome["status"] == "duplicate":
+                    report["duplicates"] += 1
+                elif outcome["status"] == "failed":
+                    report["failed"] += 1
+                    if len(report["errors"]) < 20:
+                        report["errors"].append({"path": outcome["path"], "error": outcome["error"]})
+            if progress:
+                progress(report)
+    finally:
+        sink.close()
+        if owns_executor:
+            executor.shutdown()
+
+    seconds = time.perf_counter() - start
+    report.update(
+        seconds=round(seconds, 3),
+        documents_per_second=round(report["processed"] / seconds, 1) if seconds > 0 else 0.0,
+        stage_seconds={stage: round(value, 3) for stage, value in stage_seconds.items()},
+        worker_seconds={stage: round(value, 3) for stage, value in worker_seconds.items()},
+    )
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk resume ingestion with checkpointed resume")
+    parser.add_argument("source", help="directory of CVs or a manifest file (one path or JSON object per line)")
+    parser.add_argument("--output", default="resumes.jsonl", help=".jsonl, or .sqlite/.db for SQLite")
+    parser.add_argument("--workers", type=int, default=INGEST_WORKERS)
+    parser.add_argument("--batch-size", type=int, default=INGEST_BATCH_SIZE)
+    args = parser.parse_args()
+
+    def show_progress(report: Dict[str, Any]) -> None:
+        print(f"🧬 {report['processed'] + report['skipped']}/{report['documents']} documents "
+              f"({report['parsed']} parsed, {report['duplicates']} duplicates, {report['failed']} failed)")
+
+    report = ingest_resumes(args.source, args.output, workers=args.workers, batch_size=args.batch_size,
+                            progress=show_progress)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+🧬 API Rate Limiter Tests
+
+Tests for the persistent sliding-window rate limiter backed by the
+``api_limits`` table: window arithmetic, persistence across instances and
+atomic quota consumption across processes.
+"""
+
+import multiprocessing
+import sqlite3
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from api_rate_limiter import RateLimiter
+
+
+class FakeClock:
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _consume(db_path, attempts, results):
+    limiter = RateLimiter(max_calls_per_hour=100, db_path=db_path)
+    results.put(sum(1 for _ in range(attempts) if limiter.try_acquire().allowed))
+
+
+@pytest.mark.unit
+class TestSlidingWindow:
+    """Test the sliding-window counter arithmetic"""
+
+    def test_budget_and_retry_after(self, tmp_path):
+        """Quota runs out at the hourly limit and slides back as the old window ages"""
+        clock = FakeClock(now=7200.0)
+        limiter = RateLimiter(max_calls_per_hour=5, db_path=str(tmp_path / "jobs.db"), clock=clock)
+
+        assert limiter.status().remaining_hourly == 5
+        assert all(limiter.try_acquire().allowed for _ in range(5))
+        denied = limiter.try_acquire()
+        assert not denied.allowed
+        assert denied.remaining_hourly == 0
+        assert denied.hour_resets_in_seconds == pytest.approx(3600.0)
+        # Next window starts with 5 "previous" calls; one slot frees after 20% of it
+        assert denied.retry_after_seconds == pytest.approx(3600.0 + 720.0)
+        assert not limiter.can_make_request()
+
+        clock.now = 7200.0 + 3600.0
+        assert not limiter.try_acquire().allowed
+        clock.now = 7200.0 + 3600.0 + 720.0
+        assert limiter.try_acquire().allowed
+        assert not limiter.try_acquire().allowed
+
+        clock.now = 7200.0 + 4 * 3600.0
+        assert limiter.status().remaining_hourly == 5
+
+    def test_daily_limit_applies(self, tmp_path):
+        clock = FakeClock(now=90000.0)
+        limiter = RateLimiter(max_calls_per_hour=10, max_calls_per_day=3,
+                              db_path=str(tmp_path / "jobs.db"), clock=clock)
+        assert [limiter.try_acquire().allowed for _ in range(4)] == [True, True, True, False]
+        assert limiter.status().remaining_daily == 0
+        assert limiter.acquire(timeout=0.0).allowed is False
+
+
+@pytest.mark.unit
+class TestPersistentQuota:
+    """Test quota shared through the api_limits table"""
+
+    def test_survives_restart_and_legacy_rows(self, tmp_path):
+        """A new limiter sees earlier consumption; rows from the old schema are upgraded"""
+        db_path = str(tmp_path / "jobs.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE api_limits (
+                api_provider TEXT PRIMARY KEY, hourly_limit INTEGER, daily_limit INTEGER,
+                current_hourly INTEGER DEFAULT 0, current_daily INTEGER DEFAULT 0,
+                hour_start TIMESTAMP DEFAULT CURRENT_TIMESTAMP, day_start DATE DEFAULT CURRENT_DATE
+            )
+        """)
+        conn.execute("INSERT INTO api_limits (api_provider, hourly_limit, daily_limit) VALUES ('linkedin', 4, 100)")
+        conn.commit()
+        conn.close()
+
+        first = RateLimiter(max_calls_per_hour=1000, db_path=db_path)
+        assert first.max_calls_per_hour == 4
+        first.try_acquire()
+        first.record_request()
+
+        restarted = RateLimiter(max_calls_per_hour=1000, db_path=db_path)
+        assert restarted.status().remaining_hourly == 2
+
+    def test_processes_share_one_budget(self, tmp_path):
+        """Concurrent workers never exceed the shared hourly limit"""
+        db_path = str(tmp_path / "jobs.db")
+        RateLimiter(max_calls_per_hour=100, db_path=db_path)
+
+        context = multiprocessing.get_context("spawn")
+        results = context.Queue()
+        workers = [context.Process(target=_consume, args=(db_path, 60, results)) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        granted = sum(results.get(timeout=60) for _ in workers)
+        for worker in workers:
+            worker.join()
+        assert granted == 100
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+🧬 Application Schedule Optimization Tests
+
+Tests for the indexed scheduling mode of ApplicationOptimizationEngine:
+it matches the sequential scan over alignment-sorted postings and respects
+per-day and per-slot capacity.
+"""
+
+import asyncio
+import random
+import pytest
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add the optimization engine module to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src' / 'application-automation' / 'optimization_optimization'))
+
+from optimization_engine import MAX_APPLICATIONS_PER_SLOT, ApplicationOptimizationEngine
+
+
+def postings(count, seed=0):
+    rng = random.Random(seed)
+    return [SimpleNamespace(job_id=f"JOB-{i}", platform=rng.choice(["linkedin", "indeed", "glassdoor", "monster"]),
+                            company=f"Company {i % 7}", biological_alignment_score=round(rng.random(), 2))
+            for i in range(count)]
+
+
+def schedule(jobs, **constraints):
+    constraints.setdefault("platform_weights", {"linkedin": 2, "indeed": 1})
+    return asyncio.run(ApplicationOptimizationEngine().optimize_application_schedule(jobs, constraints))
+
+
+def without_metadata(result):
+    return {key: value for key, value in result.items() if key != "optimization_metadata"}
+
+
+@pytest.mark.unit
+class TestIndexedScheduling:
+    """Test the capacity-indexed scheduling mode"""
+
+    @pytest.mark.parametrize("max_per_day", [1, 3, 12])
+    def test_matches_sequential_scan_in_alignment_order(self, max_per_day):
+        jobs = postings(300, seed=max_per_day)
+        ranked = sorted(jobs, key=lambda job: job.biological_alignment_score, reverse=True)
+        sequential = schedule(ranked, max_applications_per_day=max_per_day)
+        indexed = schedule(jobs, max_applications_per_day=max_per_day, scheduling_mode="indexed")
+        assert without_metadata(indexed) == without_metadata(sequential)
+        assert indexed["optimization_metadata"]["scheduling_mode"] == "indexed"
+
+    def test_respects_day_and_slot_capacity(self):
+        result = schedule(postings(500, seed=4), max_applications_per_day=7, scheduling_mode="indexed")
+        assert all(count <= 7 for count in result["daily_distribution"].values())
+        assert all(len(applications) <= MAX_APPLICATIONS_PER_SLOT
+                   for day in result["schedule"].values() for applications in day.values())
+        assert result["total_applications"] == 5 * 7
+
+    def test_highest_alignment_jobs_are_scheduled(self):
+        jobs = postings(200, seed=5)
+        result = schedule(jobs, scheduling_mode="indexed")
+        scheduled = {app["job_id"] for day in result["schedule"].values()
+                     for applications in day.values() for app in applications}
+        cutoff = sorted(job.biological_alignment_score for job in jobs)[-len(scheduled)]
+        assert all(job.biological_alignment_score >= cutoff for job in jobs if job.job_id in scheduled)
+
+    def test_unknown_mode_is_rejected(self):
+        with pytest.raises(ValueError):
+            schedule(postings(3), scheduling_mode="random")
+
+    def test_unknown_platform_uses_neutral_efficiency(self):
+        result = schedule([SimpleNamespace(job_id="J", platform="dice", company="Acme",
+                                           biological_alignment_score=0.9)], scheduling_mode="indexed")
+        assert result["total_applications"] == 1
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+🧬 CNS Consciousness Pipeline Tests
+
+Tests for the compiled consciousness analysis pipeline used by the CNS core.
+Validates that the single-pass pipeline reproduces the per-token analysis semantics.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add CNS core to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src' / 'cns-consciousness-core'))
+
+from consciousness_pipeline import KNOWLEDGE_PATTERNS, SENTIMENT_LEXICON, CompiledConsciousnessPipeline
+
+
+@pytest.fixture
+def pipeline():
+    return CompiledConsciousnessPipeline(KNOWLEDGE_PATTERNS, SENTIMENT_LEXICON)
+
+
+@pytest.mark.unit
+class TestCompiledConsciousnessPipeline:
+    """Test compiled consciousness pipeline semantics"""
+
+    def test_token_classification_matches_substring_semantics(self, pipeline):
+        """Tokens are classified into every dimension with a matching substring"""
+        for token in ["intelligence", "mindful", "lifelong", "transcendence", "banana"]:
+            expected = tuple(
+                dimension for dimension, patterns in KNOWLEDGE_PATTERNS.items()
+                if any(pattern in token for pattern in patterns)
+            )
+            assert pipeline.classify_token(token) == expected
+
+        assert pipeline.classify_token("intelligence") == ("consciousness", "ai_first")
+
+    def test_stopwords_are_filtered(self, pipeline):
+        """Stopwords and non-alphabetic tokens are removed in the shared pass"""
+        tokens = pipeline.tokenize("The mind of the machine is 42 times faster!")
+        assert "the" not in tokens
+        assert "42" not in tokens
+        assert "mind" in tokens and "machine" in tokens
+
+    def test_vector_matches_legacy_calculation(self, pipeline):
+        """Consciousness vector matches the per-dimension density calculation"""
+        query = "Artificial intelligence evolution brings great awareness. Neural cells evolved."
+        analysis = pipeline.analyze(query)
+        tokens = analysis.tokens
+
+        expected = [
+            min(sum(1 for token in tokens if any(p in token for p in patterns)) / len(tokens), 1.0)
+            for patterns in KNOWLEDGE_PATTERNS.values()
+        ]
+        expected.append(pipeline.calculate_sentiment_score(tokens))
+
+        assert analysis.consciousness_vector == expected
+        assert len(analysis.consciousness_vector) == len(KNOWLEDGE_PATTERNS) + 1
+
+    def test_insight_reports_patterns_per_sentence(self, pipeline):
+        """Insight lists dimension matches per sentence"""
+        analysis = pipeline.analyze("The supreme mind evolves. Organic genes matter.")
+        assert analysis.biological_insight.startswith("Found consciousness patterns:")
+        assert "supreme(godhood)" in analysis.biological_insight
+        assert "genes(biological)" in analysis.biological_insight
+
+    def test_insight_statistical_fallback(self, pipeline):
+        """Queries without consciousness patterns fall back to term frequency"""
+        analysis = pipeline.analyze("salary salary negotiation tips")
+        assert analysis.biological_insight.startswith("Statistical analysis:")
+        assert "salary" in analysis.biological_insight
+
+    def test_empty_query(self, pipeline):
+        """Empty queries produce a zero vector with neutral sentiment"""
+        analysis = pipeline.analyze("")
+        assert analysis.consciousness_vector == [0, 0, 0, 0, 0.5]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
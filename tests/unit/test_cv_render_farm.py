@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+🧬 CV Render Farm Tests
+
+Tests for the CV generation engine's render farm: content-addressed keys,
+disk cache hits, shared in-flight builds, the bounded render queue and
+process-pool rendering.
+"""
+
+import asyncio
+import pytest
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Add the CV generation engine to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src' / 'cv_generation_engine'))
+
+from render_farm import CVRenderFarm, RenderQueueFull, build_render_document, pdf_style_sheet, render_key
+
+CV = {
+    "personal_info": {"name": "Ada Lovelace", "email": "ada@example.com"},
+    "professional_summary": "Analytical engine   programmer",
+    "skills": ["Mathematics", "Programming"],
+    "experience": [{"role": "Analyst", "company": "Babbage & Co", "duration": "1842-1843", "description": "Notes"}],
+}
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+@pytest.mark.unit
+class TestRenderKeys:
+    """Test content addressing"""
+
+    def test_whitespace_and_empty_fields_do_not_change_the_key(self):
+        noisy = {**CV, "professional_summary": "  Analytical engine programmer\n", "hobbies": [], "website": None}
+        assert render_key(build_render_document(noisy, "quantum_resonance", "basic"), "pdf") == \
+            render_key(build_render_document(CV, "quantum_resonance", "basic"), "pdf")
+
+    def test_template_level_and_format_change_the_key(self):
+        keys = {render_key(build_render_document(CV, template, level), fmt)
+                for template in ("quantum_resonance", "biological_harmonizer")
+                for level in ("basic", "biological") for fmt in ("pdf", "txt")}
+        assert len(keys) == 8
+
+    def test_unknown_template_is_rejected(self):
+        with pytest.raises(ValueError):
+            build_render_document(CV, "comic_sans", "basic")
+
+
+@pytest.mark.unit
+class TestCVRenderFarm:
+    """Test rendering through the process pool"""
+
+    def test_identical_regeneration_is_served_from_disk(self, tmp_path, pool):
+        farm = CVRenderFarm(str(tmp_path), executor=pool)
+        first = asyncio.run(farm.render("txt", CV, optimization_level="biological"))
+        second = asyncio.run(farm.render("TXT", dict(CV), optimization_level="biological"))
+
+        assert (first["cache_hit"], second["cache_hit"]) == (False, True)
+        assert first["filename"] == second["filename"]
+        text = (tmp_path / first["filename"]).read_text()
+        assert "Analytical engine programmer" in text and "* AI Evolution" in text
+        assert farm.stats["renders"] == 1
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_concurrent_identical_requests_share_one_build(self, tmp_path, pool):
+        farm = CVRenderFarm(str(tmp_path), executor=pool)
+
+        async def burst():
+            return await asyncio.gather(*(farm.render("txt", CV) for _ in range(6)))
+
+        results = asyncio.run(burst())
+        assert len({result["filename"] for result in results}) == 1
+        # Late arrivals may find the finished file instead of the in-flight build
+        assert farm.stats["renders"] == 1
+        assert farm.stats["shared_renders"] + farm.stats["cache_hits"] == 5
+
+    def test_queue_limit_rejects_overflow(self, tmp_path, pool):
+        farm = CVRenderFarm(str(tmp_path), executor=pool, queue_limit=2)
+        variants = [({**CV, "skills": [f"Skill {i}"]}, "biological_harmonizer", "basic") for i in range(4)]
+        outcomes = asyncio.run(farm.render_variants("txt", variants))
+
+        assert sum(isinstance(outcome, RenderQueueFull) for outcome in outcomes) == 2
+        assert farm.stats["rejected"] == 2 and farm.queued == 0
+
+    def test_cache_limit_evicts_least_recently_used_outputs(self, tmp_path, pool):
+        stale = tmp_path / f"cv_{'0' * 40}.txt"
+        stale.write_text("left over from a previous run")
+        farm = CVRenderFarm(str(tmp_path), executor=pool, cache_limit=2)
+
+        first = asyncio.run(farm.render("txt", CV))
+        second = asyncio.run(farm.render("txt", {**CV, "skills": ["Poetry"]}))
+        assert not stale.exists()
+        asyncio.run(farm.render("txt", CV))  # cache hit refreshes the first output
+        asyncio.run(farm.render("txt", {**CV, "skills": ["Looms"]}))
+
+        assert farm.cached_output(first["filename"]) is not None
+        assert farm.cached_output(second["filename"]) is None
+        assert farm.stats["evictions"] == 2
+        assert farm.snapshot()["cached_outputs"] == 2
+
+    def test_variants_render_per_template(self, tmp_path, pool):
+        farm = CVRenderFarm(str(tmp_path), executor=pool)
+        variants = [(CV, template, "basic") for template in ("quantum_resonance", "consciousness_adapter")]
+        outcomes = asyncio.run(farm.render_variants("txt", variants))
+        assert [outcome["template"] for outcome in outcomes] == ["quantum_resonance", "consciousness_adapter"]
+        assert farm.cached_output(outcomes[0]["filename"]) == tmp_path / outcomes[0]["filename"]
+        assert farm.cached_output("../secrets.txt") is None
+
+    def test_pdf_rendering_reuses_template_styles(self, tmp_path, pool):
+        pytest.importorskip("reportlab")
+        from reportlab.lib.styles import getSampleStyleSheet
+
+        farm = CVRenderFarm(str(tmp_path), executor=pool)
+        result = asyncio.run(farm.render("pdf", CV, "quantum_resonance"))
+        assert (tmp_path / result["filename"]).read_bytes().startswith(b"%PDF")
+        assert pdf_style_sheet("quantum_resonance") is pdf_style_sheet("quantum_resonance")
+        assert getSampleStyleSheet()['Normal'].fontSize == 10
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+🧬 CV Upload Pipeline Tests
+
+Tests for the CV generation engine's upload pipeline: chunked streaming
+with an incremental SHA-256 and size cap, the request body limit in front
+of multipart spooling, pooled resume parsing, and the fingerprint cache for
+re-uploads.
+"""
+
+import asyncio
+import hashlib
+import pytest
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Add the CV generation engine to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src' / 'cv_generation_engine'))
+
+from fastapi import FastAPI, File, UploadFile
+from fastapi.testclient import TestClient
+
+from upload_pipeline import (ResumeUploadPipeline, UnsupportedUploadType, UploadSizeLimitMiddleware, UploadTooLarge,
+                             stream_to_disk)
+
+RESUME = b"""Jane Doe
+
+Email: jane.doe@example.com
+Phone: (555) 987-6543
+
+Professional Summary:
+Platform engineer with 8 years building distributed systems in Python and Go.
+
+Skills:
+Python, Docker, Kubernetes, AWS, Machine Learning
+"""
+
+
+class ChunkedUpload:
+    """Minimal async reader with the ``UploadFile.read(n)`` interface"""
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.offset = 0
+        self.largest_read = 0
+
+    async def read(self, size: int = -1) -> bytes:
+        size = len(self.data) - self.offset if size < 0 else size
+        self.largest_read = max(self.largest_read, size)
+        chunk = self.data[self.offset:self.offset + size]
+        self.offset += len(chunk)
+        return chunk
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+@pytest.mark.unit
+class TestStreamToDisk:
+    """Test chunked streaming"""
+
+    def test_fingerprint_matches_whole_file_hash(self, tmp_path):
+        data = bytes(range(256)) * 5000
+        upload = ChunkedUpload(data)
+        received = asyncio.run(stream_to_disk(upload, tmp_path / "cv.pdf", chunk_size=64 * 1024))
+
+        assert received == {"size_bytes": len(data), "fingerprint": hashlib.sha256(data).hexdigest()}
+        assert (tmp_path / "cv.pdf").read_bytes() == data
+        assert upload.largest_read == 64 * 1024
+
+    def test_oversized_upload_is_aborted_and_removed(self, tmp_path):
+        with pytest.raises(UploadTooLarge):
+            asyncio.run(stream_to_disk(ChunkedUpload(b"x" * 5000), tmp_path / "cv.pdf", max_bytes=4096, chunk_size=1024))
+        assert not (tmp_path / "cv.pdf").exists()
+
+
+@pytest.mark.unit
+class TestUploadSizeLimitMiddleware:
+    """Test that oversized bodies are refused before the handler spools them"""
+
+    def client(self, handled):
+        app = FastAPI()
+
+        @app.post("/cv/upload/{session_id}")
+        async def upload(session_id: str, file: UploadFile = File(...)):
+            handled.append(len(await file.read()))
+            return {"ok": True}
+
+        app.add_middleware(UploadSizeLimitMiddleware, max_bytes=4096, path_prefix="/cv/upload/")
+        return TestClient(app)
+
+    def test_small_upload_passes_through(self):
+        handled = []
+        response = self.client(handled).post("/cv/upload/s1", files={"file": ("cv.txt", RESUME)})
+        assert response.status_code == 200 and handled == [len(RESUME)]
+
+    def test_declared_and_streamed_oversized_bodies_are_refused(self):
+        handled = []
+        client = self.client(handled)
+        declared = client.post("/cv/upload/s1", files={"file": ("cv.txt", b"x" * 10_000)})
+        assert declared.status_code == 413
+
+        def chunks():  # No Content-Length: counted as it arrives
+            for _ in range(10):
+                yield b"x" * 1024
+
+        streamed = client.post("/cv/upload/s1", content=chunks(),
+                               headers={"content-type": "multipart/form-data; boundary=b"})
+        assert streamed.status_code == 413
+        assert handled == []
+
+
+@pytest.mark.unit
+class TestResumeUploadPipeline:
+    """Test pooled parsing and the fingerprint cache"""
+
+    def test_parse_then_reupload_is_served_from_cache(self, tmp_path, pool):
+        pipeline = ResumeUploadPipeline(str(tmp_path), executor=pool)
+
+        async def scenario():
+            first = dict(await pipeline.submit(ChunkedUpload(RESUME), "jane.txt"))
+            parsed = await pipeline.wait(first["job_id"])
+            second = await pipeline.submit(ChunkedUpload(RESUME), "jane-copy.txt")
+            return first, parsed, second
+
+        first, parsed, second = asyncio.run(scenario())
+        assert first["status"] == "parsing"
+        assert parsed["status"] == "completed"
+        assert parsed["result"]["resume_data"]["personal_info"]["email"] == "jane.doe@example.com"
+        assert "Kubernetes" in parsed["result"]["resume_data"]["skills"]
+
+        assert (second["status"], second["cached"]) == ("completed", True)
+        assert pipeline.job_status(second["job_id"])["result"]["resume_data"]["filename"] == "jane-copy.txt"
+        assert pipeline.stats["parses"] == 1
+        assert not list(tmp_path.iterdir())  # staged uploads are removed after parsing
+
+    def test_completed_jobs_keep_results_evicted_from_the_cache(self, tmp_path, pool):
+        pipeline = ResumeUploadPipeline(str(tmp_path), executor=pool, cache_size=1)
+
+        async def scenario():
+            first = await pipeline.submit(ChunkedUpload(RESUME), "jane.txt")
+            await pipeline.wait(first["job_id"])
+            second = await pipeline.submit(ChunkedUpload(RESUME + b"\nHobbies: chess\n"), "jane-v2.txt")
+            await pipeline.wait(second["job_id"])
+            return first
+
+        first = asyncio.run(scenario())
+        assert len(pipeline.results) == 1
+        report = pipeline.job_status(first["job_id"])
+        assert report["status"] == "completed"
+        assert report["result"]["resume_data"]["filename"] == "jane.txt"
+        assert "parse_result" not in report
+
+    def test_concurrent_uploads_of_one_file_share_a_parse(self, tmp_path, pool):
+        pipeline = ResumeUploadPipeline(str(tmp_path), executor=pool)
+
+        async def scenario():
+            jobs = await asyncio.gather(*(pipeline.submit(ChunkedUpload(RESUME), f"jane-{i}.txt") for i in range(4)))
+            return [await pipeline.wait(job["job_id"]) for job in jobs]
+
+        reports = asyncio.run(scenario())
+        assert all(report["status"] == "completed" for report in reports)
+        assert pipeline.stats["parses"] == 1
+        assert pipeline.stats["shared_parses"] + pipeline.stats["cache_hits"] == 3
+
+    def test_parse_failures_are_reported_on_the_job(self, tmp_path, pool):
+        pipeline = ResumeUploadPipeline(str(tmp_path), executor=pool)
+
+        async def scenario():
+            job = await pipeline.submit(ChunkedUpload(b"\xff\xfe not utf-8 \x80"), "broken.html")
+            return await pipeline.wait(job["job_id"])
+
+        report = asyncio.run(scenario())
+        assert report["status"] in ("completed", "failed")
+        assert pipeline.stats["parses"] + pipeline.stats["failures"] == 1
+
+    def test_unsupported_types_and_unknown_jobs(self, tmp_path, pool):
+        pipeline = ResumeUploadPipeline(str(tmp_path), executor=pool)
+        with pytest.raises(UnsupportedUploadType):
+            asyncio.run(pipeline.submit(ChunkedUpload(b"MZ"), "resume.exe"))
+        assert pipeline.job_status("parse_missing") is None
+        assert pipeline.stats["rejected"] == 1
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+🧬 Campaign Delivery Engine Tests
+
+Tests for the email communications delivery pipeline: personalization,
+recipient streaming, retries, idempotency keys, the progress watermark and
+resuming from a checkpoint.
+"""
+
+import asyncio
+import json
+import pytest
+import sys
+from pathlib import Path
+
+# Add the email communications service to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src' / 'email_communications_symbiosis'))
+
+from concurrent.futures import ThreadPoolExecutor
+
+from delivery_engine import (
+    CampaignDeliveryEngine, CheckpointStore, DryRunProvider, JsonlRecipientStore, PermanentDeliveryError, SyntheticRecipientStore,
+    TransientDeliveryError, _Watermark, idempotency_key, personalize_message
+)
+
+CONTENT = {"subject": "Hello", "body": "Career opportunity"}
+
+
+class RecordingProvider:
+    """Provider that fails on demand and records the idempotency keys it accepted"""
+
+    def __init__(self, name="fake", rate_per_second=None, transient_failures=0, permanent_for=(), delay=0.0):
+        self.name = name
+        self.rate_per_second = rate_per_second
+        self.burst = 1
+        self.transient_failures = transient_failures
+        self.permanent_for = set(permanent_for)
+        self.delay = delay
+        self.attempts = 0
+        self.accepted = []
+
+    async def send(self, message):
+        self.attempts += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if message.recipient_id in self.permanent_for:
+            raise PermanentDeliveryError("invalid address")
+        if self.transient_failures:
+            self.transient_failures -= 1
+            raise TransientDeliveryError("429", retry_after=0)
+        self.accepted.append(message.idempotency_key)
+        return message.idempotency_key
+
+    async def close(self):
+        pass
+
+
+def build_engine(tmp_path, provider, channels=("email_sendgrid",), **kwargs):
+    kwargs.setdefault("concurrency", 8)
+    kwargs.setdefault("chunk_size", 10)
+    return CampaignDeliveryEngine({channel: provider for channel in channels}, personalize_message,
+                                  CheckpointStore(str(tmp_path)), base_backoff=0.001, **kwargs)
+
+
+@pytest.mark.unit
+class TestMessagePreparation:
+    """Test personalization, idempotency keys and recipient stores"""
+
+    def test_personalize_message_adapts_to_channel_and_profile(self):
+        body = personalize_message("Hi", {"consciousness_level": "advanced", "communication_preference": "warm"},
+                                   "sms_twilio")
+        assert body.startswith("[Consciousness Level: ADVANCED] Hi")
+        assert "[SMS Consciousness Optimization]" in body
+        assert body.endswith("[Style: Warm Communication]")
+
+    def test_idempotency_key_is_stable_per_recipient_and_channel(self):
+        key = idempotency_key("c1", "r1", "email_sendgrid")
+        assert key == idempotency_key("c1", "r1", "email_sendgrid")
+        assert key != idempotency_key("c1", "r1", "sms_twilio")
+        assert key != idempotency_key("c2", "r1", "email_sendgrid")
+
+    def test_jsonl_store_streams_from_start_sequence(self, tmp_path):
+        path = tmp_path / "recipients.jsonl"
+        path.write_text("\n".join(json.dumps({"id": f"r{i}", "email": f"r{i}@x.ch"}) for i in range(5)) + "\n")
+        assert [seq for seq, _ in JsonlRecipientStore(str(path)).iter_recipients(3)] == [3, 4]
+
+    def test_watermark_waits_for_lowest_unfinished_recipient(self):
+        tracker = _Watermark(-1)
+        tracker.register(0, 2)
+        tracker.register(1, 1)
+        tracker.register(2, 0)
+        tracker.complete(1)
+        assert tracker.watermark == -1
+        tracker.complete(0)
+        tracker.complete(0)
+        assert tracker.watermark == 2
+        assert tracker.finished == 3
+
+
+@pytest.mark.unit
+class TestCampaignDelivery:
+    """Test the delivery pipeline end to end against a recording provider"""
+
+    def test_delivers_every_recipient_on_every_channel(self, tmp_path):
+        provider = RecordingProvider()
+        engine = build_engine(tmp_path, provider, channels=("email_sendgrid", "sms_twilio"))
+        progress = asyncio.run(engine.deliver("c1", CONTENT, ["email_sendgrid", "sms_twilio"],
+                                              SyntheticRecipientStore(45)))
+        assert progress.status == "completed"
+        assert progress.sent == 90
+        assert progress.watermark == 44
+        assert progress.recipients_finished == 45
+        assert len(set(provider.accepted)) == 90
+        assert CheckpointStore(str(tmp_path)).load("c1")["progress"]["status"] == "completed"
+
+    def test_recipients_without_an_address_are_skipped(self, tmp_path):
+        path = tmp_path / "recipients.jsonl"
+        path.write_text(json.dumps({"id": "a", "email": "a@x.ch"}) + "\n" + json.dumps({"id": "b"}) + "\n")
+        provider = RecordingProvider()
+        progress = asyncio.run(build_engine(tmp_path, provider).deliver(
+            "c1", CONTENT, ["email_sendgrid"], JsonlRecipientStore(str(path))))
+        assert progress.sent == 1
+        assert progress.recipients_finished == 2
+
+    def test_transient_failures_are_retried(self, tmp_path):
+        provider = RecordingProvider(transient_failures=3)
+        progress = asyncio.run(build_engine(tmp_path, provider).deliver(
+            "c1", CONTENT, ["email_sendgrid"], SyntheticRecipientStore(5)))
+        assert progress.sent == 5
+        assert progress.failed == 0
+        assert progress.retries == 3
+
+    def test_permanent_failures_are_not_retried(self, tmp_path):
+        provider = RecordingProvider(permanent_for={"recipient_0000001"})
+        progress = asyncio.run(build_engine(tmp_path, provider).deliver(
+            "c1", CONTENT, ["email_sendgrid"], SyntheticRecipientStore(3)))
+        assert progress.sent == 2
+        assert progress.failed == 1
+        assert provider.attempts == 3
+        assert progress.error_types == {"PermanentDeliveryError": 1}
+
+    def test_errors_outside_the_retry_loop_fail_the_message_not_the_campaign(self, tmp_path):
+        class BrokenLimiter:
+            async def acquire(self):
+                raise RuntimeError("limiter backend unavailable")
+
+        provider = RecordingProvider()
+        engine = build_engine(tmp_path, provider, concurrency=2)
+        engine._rate_limiters[provider.name] = BrokenLimiter()
+        progress = asyncio.run(asyncio.wait_for(
+            engine.deliver("c-limiter", CONTENT, ["email_sendgrid"], SyntheticRecipientStore(25)), timeout=5))
+
+        assert (progress.status, progress.sent, progress.failed) == ("completed", 0, 25)
+        assert progress.error_types == {"RuntimeError": 25}
+        assert progress.watermark == 24
+
+    def test_interrupted_campaign_resumes_after_watermark(self, tmp_path):
+        async def crash_then_resume():
+            provider = RecordingProvider(delay=0.002)
+            engine = build_engine(tmp_path, provider, checkpoint_interval=0.01)
+            task = asyncio.create_task(engine.deliver("c1", CONTENT, ["email_sendgrid"],
+                                                      SyntheticRecipientStore(200)))
+            while len(provider.accepted) < 80:
+                await asyncio.sleep(0.001)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+            (record,) = engine.checkpoints.incomplete()
+            assert record["progress"]["status"] == "interrupted"
+            progress = await build_engine(tmp_path, provider).resume(record)
+            return provider, record, progress
+
+        provider, record, progress = asyncio.run(crash_then_resume())
+        assert progress.status == "completed"
+        assert progress.resumed_from == record["progress"]["watermark"] >= 0
+        assert progress.recipients_finished == 200
+        # Messages past the watermark that were already accepted are skipped via the sent log
+        assert sorted(provider.accepted) == sorted(idempotency_key("c1", f"recipient_{i:07d}", "email_sendgrid")
+                                                   for i in range(200))
+        assert progress.sent == 200
+        assert progress.started_at == record["progress"]["started_at"] < progress.resumed_at
+        assert progress.messages_at_resume >= 80
+        assert not list(tmp_path.glob("*.sent"))  # discarded once the campaign completes
+
+    def test_resume_skips_messages_in_the_sent_log(self, tmp_path):
+        checkpoints = CheckpointStore(str(tmp_path))
+        sent_log = checkpoints.sent_log("c1")
+        for i in (0, 3, 4):
+            sent_log.record(idempotency_key("c1", f"recipient_{i:07d}", "email_sendgrid"), "sent")
+        sent_log.close()
+        with open(sent_log.path, "a") as f:
+            f.write(idempotency_key("c1", "recipient_0000005", "email_sendgrid")[:10])  # torn line
+        record = {"campaign_id": "c1", "spec": {"content": CONTENT, "channels": ["email_sendgrid"],
+                                                "recipients": {"type": "synthetic", "count": 6}},
+                  "progress": {"campaign_id": "c1", "total_recipients": 6, "watermark": -1, "sent": 1,
+                               "status": "interrupted", "started_at": 1.0}}
+        checkpoints.save("c1", record)
+
+        provider = RecordingProvider()
+        progress = asyncio.run(build_engine(tmp_path, provider).resume(record))
+        assert sorted(provider.accepted) == sorted(idempotency_key("c1", f"recipient_{i:07d}", "email_sendgrid")
+                                                   for i in (1, 2, 5))
+        assert (progress.sent, progress.already_sent, progress.watermark) == (6, 3, 5)
+        assert (progress.started_at, progress.messages_at_resume) == (1.0, 3)
+
+    def test_completed_campaign_is_not_sent_again(self, tmp_path):
+        provider = RecordingProvider()
+        engine = build_engine(tmp_path, provider)
+        asyncio.run(engine.deliver("c1", CONTENT, ["email_sendgrid"], SyntheticRecipientStore(5)))
+        asyncio.run(engine.deliver("c1", CONTENT, ["email_sendgrid"], SyntheticRecipientStore(5)))
+        assert len(provider.accepted) == 5
+
+    def test_dry_run_messages_are_simulated_not_sent(self, tmp_path):
+        engine = build_engine(tmp_path, DryRunProvider("dry_run_email_sendgrid"))
+        progress = asyncio.run(engine.deliver("c1", CONTENT, ["email_sendgrid"], SyntheticRecipientStore(5)))
+        assert (progress.sent, progress.simulated, progress.to_dict()["simulated"]) == (0, 5, 5)
+
+    def test_close_leaves_a_caller_owned_executor_running(self, tmp_path):
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            engine = build_engine(tmp_path, RecordingProvider(), executor=pool)
+            asyncio.run(engine.close())
+            assert pool.submit(lambda: 42).result() == 42
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+🧬 Vectorized Evolution Engine Tests
+
+Tests for the brain trust's NumPy evolution engine: vectorized fitness
+matches the per-individual formulas, selection, crossover and mutation
+operators, and sharded evaluation across a process pool.
+"""
+
+import math
+import os
+import pytest
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+# Add the brain trust service to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src' / 'evolutionary_brain_trust'))
+
+from evolution_engine import (
+    VectorizedEvolution, consciousness_fitness, fitness_for_dimension, mutate, one_point_crossover,
+    tournament_select, truncation_select
+)
+
+
+def scalar_consciousness_fitness(individual):
+    """ConsciousnessEvolution.consciousness_fitness, per individual"""
+    base_fitness = sum(individual) / len(individual)
+    consciousness_amplification = 1 + (math.sin(sum(individual)) * 0.2)
+    biological_adaptation = math.exp(-0.5 * ((sum([x**2 for x in individual])/len(individual) - 0.25)**2))
+    return base_fitness * consciousness_amplification * biological_adaptation
+
+
+@pytest.mark.unit
+class TestOperators:
+    """Test the vectorized fitness and genetic operators"""
+
+    def test_consciousness_fitness_matches_scalar_formula(self):
+        population = np.random.default_rng(0).random((50, 10))
+        expected = [scalar_consciousness_fitness(list(row)) for row in population]
+        assert np.allclose(consciousness_fitness(population), expected)
+
+    def test_dimension_fitness_uses_dimension_multiplier(self):
+        population = np.full((3, 10), 0.5)
+        assert np.allclose(fitness_for_dimension("quantum_precision")(population), 0.7)
+        assert np.allclose(fitness_for_dimension("unknown")(population), 0.55)
+
+    def test_truncation_select_keeps_fittest(self):
+        fitness = np.array([0.1, 0.9, 0.5, 0.7, 0.2])
+        assert set(truncation_select(fitness, 2)) == {1, 3}
+
+    def test_tournament_select_returns_contender_winners(self):
+        fitness = np.arange(100, dtype=float)
+        winners = tournament_select(fitness, 1000, np.random.default_rng(1), tournament_size=3)
+        assert winners.shape == (1000,)
+        assert fitness[winners].mean() > fitness.mean()
+
+    def test_one_point_crossover_swaps_tails(self):
+        first, second = np.zeros((4, 6)), np.ones((4, 6))
+        children = one_point_crossover(first, second, np.random.default_rng(2))
+        assert children.shape == (8, 6)
+        # Every child is a head of one parent followed by the tail of the other
+        for child in children:
+            assert 0 < child.sum() < 6
+            assert np.all(np.diff(child) >= 0) or np.all(np.diff(child) <= 0)
+        assert np.allclose(children[:4] + children[4:], 1.0)
+
+    def test_mutate_changes_one_gene_within_bounds(self):
+        population = np.full((200, 10), 0.99)
+        mutate(population, np.random.default_rng(3), rate=1.0, step=0.1)
+        changed = (population != 0.99).sum(axis=1)
+        assert changed.max() == 1
+        assert population.max() <= 1.0
+
+
+@pytest.mark.unit
+class TestVectorizedEvolution:
+    """Test whole runs of the engine"""
+
+    def test_run_improves_fitness_and_reports_history(self):
+        entries = []
+        result = VectorizedEvolution(200, fitness=fitness_for_dimension("universal_harmony"), seed=4).run(
+            30, on_generation=entries.append)
+        history = result["evolution_history"]
+        assert len(history) == len(entries) == result["generations_completed"] == 30
+        assert history[-1]["average_fitness"] > history[0]["average_fitness"]
+        assert result["best_solution_fitness"] == history[-1]["best_fitness"]
+        assert len(result["best_solution"]) == 10
+        assert result["convergence_achieved"]
+
+    def test_population_size_is_preserved_for_odd_sizes(self):
+        engine = VectorizedEvolution(101, seed=5, selection="tournament")
+        engine.run(3)
+        assert engine.population.shape == (101, 10)
+
+    def test_should_stop_ends_run_early(self):
+        result = VectorizedEvolution(50, seed=6).run(100, should_stop=lambda: True)
+        assert result["stopped"]
+        assert result["generations_completed"] == 0
+
+    def test_sharded_evaluation_matches_serial(self):
+        serial = VectorizedEvolution(1024, seed=7).run(5)
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            sharded = VectorizedEvolution(1024, seed=7, executor=pool, shards=4).run(5)
+        assert sharded["evolution_history"] == serial["evolution_history"]
+
+    def test_shards_default_to_cpu_count(self):
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            assert VectorizedEvolution(64, executor=pool).shards == (os.cpu_count() or 1)
+            assert VectorizedEvolution(64, executor=pool, shards=3).shards == 3
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+🧬 Application Intelligence Batch Prediction Tests
+
+Tests for ApplicationIntelligenceNetwork.predict_batch: results match
+per-posting predictions in input order, CV features are cached per profile
+version, and every modelled platform's factors can be scored.
+"""
+
+import asyncio
+import pytest
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add the intelligence network module to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src' / 'application-automation' / 'intelligence_intelligence'))
+
+import intelligence_network
+from intelligence_network import ApplicationIntelligenceNetwork, cv_profile_cache_key
+
+
+def cv_profile(**overrides):
+    profile = {
+        "profile_id": "cv-1",
+        "profile_version": 1,
+        "professional_summary": "Backend engineer building reliable distributed systems for payments",
+        "summary": "Python engineer building data platforms",
+        "skills": ["Python", "AWS Lambda", "SQL"],
+        "experience": [{"role": "Backend Engineer", "company": "Stripe", "description": "python services on aws"}] * 4,
+        "education": ["BSc"],
+        "email": "candidate@example.com",
+        "phone": "+49 000",
+        "location": "Berlin",
+        "company_connections": {"stripe": 2},
+        "salary_expectation": "90k",
+    }
+    profile.update(overrides)
+    return profile
+
+
+def posting(platform, company="Stripe", index=0, **overrides):
+    job = SimpleNamespace(
+        job_id=f"JOB-{index}",
+        platform=platform,
+        title="Senior Backend Engineer",
+        company=company,
+        location="Berlin, DE",
+        description="We need a python aws sql engineer",
+        requirements=["Python", "AWS", "Kubernetes"],
+        salary_range="$80k - $110k",
+        biological_alignment_score=0.85,
+    )
+    for key, value in overrides.items():
+        setattr(job, key, value)
+    return job
+
+
+def without_timestamps(predictions):
+    return [{key: value for key, value in prediction.items() if key != "prediction_metadata"}
+            for prediction in predictions]
+
+
+@pytest.mark.unit
+class TestPredictBatch:
+    """Test batch predictions against single predictions"""
+
+    def test_batch_matches_single_predictions_in_input_order(self):
+        postings = [posting(platform, company, index, biological_alignment_score=(index % 10) / 10)
+                    for index, (platform, company) in enumerate(
+                        [("LinkedIn", "Stripe"), ("indeed", "Acme"), ("glassdoor", "Google"),
+                         ("monster", "Initech"), ("dice", "Globex")] * 4)]
+        network = ApplicationIntelligenceNetwork()
+
+        batch = asyncio.run(network.predict_batch(cv_profile(), postings))
+        single = [asyncio.run(network.predict_application_success(job, cv_profile(), {})) for job in postings]
+
+        assert without_timestamps(batch) == without_timestamps(single)
+        assert [p.get("prediction_metadata", {}).get("platform") for p in batch[:4]] == \
+            ["linkedin", "indeed", "glassdoor", "monster"]
+        assert network.total_predictions == 2 * len(postings)
+
+    def test_unknown_platform_gets_fallback_prediction(self):
+        prediction, = asyncio.run(ApplicationIntelligenceNetwork().predict_batch(cv_profile(), [posting("dice")]))
+        assert prediction["success_probability"] == 0.5
+        assert prediction["confidence"] == "low"
+
+    def test_empty_batch(self):
+        assert asyncio.run(ApplicationIntelligenceNetwork().predict_batch(cv_profile(), [])) == []
+
+    def test_every_modelled_platform_scores_all_factors(self):
+        network = ApplicationIntelligenceNetwork()
+        for platform, factors in network.prediction_model["platform_success_factors"].items():
+            prediction, = asyncio.run(network.predict_batch(cv_profile(), [posting(platform)]))
+            assert set(prediction["factors"]) == set(factors)
+            assert 0.02 <= prediction["success_probability"] <= 0.98
+
+
+@pytest.mark.unit
+class TestCVFeatureCache:
+    """Test the per-profile feature cache"""
+
+    def test_features_extracted_once_per_profile_version(self):
+        network = ApplicationIntelligenceNetwork()
+        postings = [posting("linkedin", index=index) for index in range(50)]
+        asyncio.run(network.predict_batch(cv_profile(), postings))
+        asyncio.run(network.predict_application_success(postings[0], cv_profile(), {}))
+        assert network.cv_feature_cache_misses == 1
+        assert network.cv_feature_cache_hits == 1
+
+        asyncio.run(network.predict_batch(cv_profile(profile_version=2, skills=["Kubernetes"]), postings))
+        assert network.cv_feature_cache_misses == 2
+
+    def test_unversioned_profiles_are_keyed_by_content(self):
+        assert cv_profile_cache_key({"skills": ["Python"]}) == cv_profile_cache_key({"skills": ["Python"]})
+        assert cv_profile_cache_key({"skills": ["Python"]}) != cv_profile_cache_key({"skills": ["Go"]})
+        assert cv_profile_cache_key(cv_profile()) == cv_profile_cache_key(cv_profile(skills=["Go"]))
+
+    def test_versioned_profiles_without_an_id_are_keyed_by_content(self):
+        anonymous = cv_profile(profile_id=None, profile_version=1)
+        assert cv_profile_cache_key(anonymous)[0] == "content"
+        assert cv_profile_cache_key(anonymous) != cv_profile_cache_key(cv_profile(profile_id="", profile_version=1, skills=["Go"]))
+        assert cv_profile_cache_key(cv_profile(profile_id=None, id="cv-7")) == ("version", "cv-7", "1")
+
+    def test_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(intelligence_network, "CV_FEATURE_CACHE_SIZE", 3)
+        network = ApplicationIntelligenceNetwork()
+        for version in range(10):
+            asyncio.run(network.predict_batch(cv_profile(profile_version=version), [posting("indeed")]))
+        assert len(network.cv_feature_cache) == 3
+        assert cv_profile_cache_key(cv_profile(profile_version=9)) in network.cv_feature_cache
+
+
+@pytest.mark.unit
+class TestFactorScores:
+    """Test factor scores computed from cached features"""
+
+    def test_keyword_density_matches_word_counts(self):
+        network = ApplicationIntelligenceNetwork()
+        features = network._get_cv_features(cv_profile(summary="python " * 2 + "filler " * 98, experience=[],
+                                                        skills=[]))
+        # 2 of 100 CV words appear in the description: optimal 1-3% density
+        assert network._calculate_keyword_density_score(features, posting("monster")) == 0.9
+
+    def test_salary_competitiveness(self):
+        network = ApplicationIntelligenceNetwork()
+        features = network._get_cv_features(cv_profile(salary_expectation=100000))
+        assert network._assess_salary_competitiveness(features, posting("glassdoor")) == 0.9
+        assert network._assess_salary_competitiveness(features, posting("glassdoor", salary_range="$60k")) == 0.4
+        assert network._assess_salary_competitiveness(features, posting("glassdoor", salary_range=None)) == 0.5
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+🧬 Batch Job Scoring Tests
+
+Tests that the vectorized BiologicalConsciousnessEngine batch API returns the
+same match fields as the per-job scorer for row and columnar job tables.
+"""
+
+import pytest
+import random
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from job_search_ai_agent import BiologicalConsciousnessEngine
+
+SKILLS = ["Python", "SQL", "Power BI", "Business Analysis", "Excel", "SAP", "Agile", "Scrum", "R", "Data"]
+LOCATIONS = ["Zurich", "Zürich, Switzerland", "  GENEVA ", "Berlin", "", "Basel, CH", "London"]
+LEVELS = ["entry-level", "junior", "mid-level", "senior", "executive", "intern", None]
+
+PROFILES = [
+    {"experience_years": 7, "skills": ["Business Analysis", "sql", "Power BI"], "location": "Zurich"},
+    {"experience_years": 30, "skills": ["a", "Pyth"], "location": "Genève"},
+    {"skills": [], "location": ""},
+]
+
+
+@pytest.fixture
+def jobs():
+    rng = random.Random(7)
+    rows = []
+    for _ in range(500):
+        job = {}
+        if rng.random() < 0.9:
+            job["experience_level"] = rng.choice(LEVELS)
+        if rng.random() < 0.9:
+            job["required_skills"] = rng.sample(SKILLS, rng.randint(0, 5))
+        if rng.random() < 0.9:
+            job["location"] = rng.choice(LOCATIONS)
+        rows.append(job)
+    return rows
+
+
+@pytest.mark.unit
+class TestBatchJobScoring:
+    """Test vectorized job scoring against the per-job reference"""
+
+    @pytest.mark.parametrize("profile", PROFILES)
+    def test_batch_matches_per_job_scoring(self, jobs, profile):
+        """Row and columnar batches reproduce calculate_biological_match exactly"""
+        engine = BiologicalConsciousnessEngine()
+        expected = [engine.calculate_biological_match(profile, job) for job in jobs]
+
+        assert engine.calculate_biological_match_batch(profile, jobs) == expected
+
+        columns = {
+            "experience_level": [job.get("experience_level", "mid-level") for job in jobs],
+            "required_skills": [job.get("required_skills", []) for job in jobs],
+            "location": [job.get("location", "") for job in jobs],
+        }
+        assert engine.calculate_biological_match_batch(profile, columns) == expected
+
+    def test_missing_columns_and_cells_use_defaults(self):
+        """Absent columns and None cells score like missing fields"""
+        engine = BiologicalConsciousnessEngine()
+        profile = PROFILES[0]
+        expected = engine.calculate_biological_match(profile, {})
+
+        assert engine.calculate_biological_match_batch(profile, {"title": ["a", "b"]}) == [expected, expected]
+        scored = engine.calculate_biological_match_batch(profile, {"required_skills": [None], "location": [None]})
+        assert scored == [expected]
+        assert engine.calculate_biological_match_batch(profile, []) == []
+
+    def test_top_matches_are_ranked_best_first(self, jobs):
+        """top_biological_matches returns the k best positions with their fields"""
+        engine = BiologicalConsciousnessEngine()
+        profile = PROFILES[0]
+        all_scores = [engine.calculate_biological_match(profile, job)["biological_match_score"] for job in jobs]
+
+        top = engine.top_biological_matches(profile, jobs, k=10)
+        assert len(top) == 10
+        scores = [fields["biological_match_score"] for _, fields in top]
+        assert scores == sorted(scores, reverse=True)
+        assert scores[0] == max(all_scores)
+        assert all(fields == engine.calculate_biological_match(profile, jobs[i]) for i, fields in top)
+        assert len(engine.top_biological_matches(profile, jobs[:3], k=10)) == 3
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+🧬 Job Cache Tests
+
+Tests for the SQLite write-through job cache: FTS5 search with BM25 ranking,
+TTL-based search reuse, upserts and retention purging.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from job_cache import JobCache, cache_job_key, fts_query
+
+
+def linkedin_job(job_id, title, city="Zürich", description="", skills=None):
+    job = {
+        'linkedin_id': job_id,
+        'title': title,
+        'company_name': 'UBS AG',
+        'location_city': city,
+        'job_description': description,
+        'data_source': 'linkedin',
+        'is_active': True,
+    }
+    if skills:
+        job['required_skills'] = '["' + '", "'.join(skills) + '"]'
+    return job
+
+
+@pytest.fixture
+def cache(tmp_path):
+    job_cache = JobCache(str(tmp_path / "jtp_jobs.db"), ttl_seconds=3600, retention_seconds=7 * 86400)
+    yield job_cache
+    job_cache.close()
+
+
+@pytest.mark.unit
+class TestJobCache:
+    """Test the local job cache"""
+
+    def test_keys_and_fts_query(self):
+        """LinkedIn IDs win; other jobs fall back to the normalised dedup key"""
+        assert cache_job_key({'linkedin_id': 42, 'title': 'x'}) == "linkedin:42"
+        assert cache_job_key({'company_name': 'UBS AG', 'title': 'Analyst', 'location_city': 'Zürich'}) == \
+            cache_job_key({'company': 'ubs', 'title': 'analyst', 'location': 'zurich'})
+        assert fts_query('Business "Analyst"') == '"business"* "analyst"*'
+
+    def test_fts_search_ranks_title_matches_first(self, cache):
+        """Title hits outrank description-only hits; location and accents are normalised"""
+        cache.store_jobs([
+            linkedin_job(1, "Process Manager", description="Works with the business analyst team"),
+            linkedin_job(2, "Senior Business Analyst", skills=["SQL", "Power BI"]),
+            linkedin_job(3, "Business Analyst", city="Geneva"),
+        ])
+
+        results = cache.search("business analyst", "Zurich", limit=10)
+        assert [job['linkedin_id'] for job in results] == [2, 1]
+        assert [job['linkedin_id'] for job in cache.search("power bi", "", limit=10)] == [2]
+        assert len(cache.search("analysts", "", limit=10)) == 3
+
+    def test_upsert_keeps_index_in_sync(self, cache):
+        """Re-caching a job replaces its indexed text"""
+        cache.store_jobs([linkedin_job(1, "Business Analyst")])
+        cache.store_jobs([linkedin_job(1, "Data Engineer")])
+        assert cache.search("business", "", limit=10) == []
+        assert [job['title'] for job in cache.search("engineer", "", limit=10)] == ["Data Engineer"]
+        assert cache.stats()['cached_jobs'] == 1
+
+    def test_search_write_through_and_ttl(self, cache):
+        """A remembered search is served until its TTL expires or a larger limit is requested"""
+        jobs = [linkedin_job(i, f"Business Analyst {i}") for i in range(3)]
+        cache.store_search("Business Analyst", "Zurich", jobs, limit=3, now=1000.0, remote_filter=False)
+
+        hit = cache.get_search("business  analyst", "ZURICH", 3, now=1500.0)
+        assert [job['linkedin_id'] for job in hit] == [0, 1, 2]
+        assert len(cache.get_search("Business Analyst", "Zurich", 2, now=1500.0)) == 2
+        assert cache.get_search("Business Analyst", "Zurich", 10, now=1500.0) is None
+        assert cache.get_search("Business Analyst", "Zurich", 3, now=1000.0 + 3601) is None
+        assert cache.get_search("Business Analyst", "Zurich", 3, now=1500.0, remote_filter=True) is None
+
+        cache.store_search("Quantum Analyst", "Zurich", [], limit=5, now=1000.0)
+        assert cache.get_search("Quantum Analyst", "Zurich", 5, now=1500.0) == []
+
+    def test_purge_expired(self, cache):
+        """Jobs and searches past retention are removed, including their index entries"""
+        cache.store_search("Business Analyst", "Zurich", [linkedin_job(1, "Business Analyst")], limit=1, now=0.0)
+        cache.store_jobs([linkedin_job(2, "Business Analyst")])
+
+        assert cache.purge_expired() == 1
+        assert [job['linkedin_id'] for job in cache.search("business", "", limit=10)] == [2]
+        assert cache.stats()['cached_searches'] == 0
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+🧬 Job Discovery Tests
+
+Tests for the concurrent multi-source job discovery: cross-source
+deduplication, streaming order, per-source timeouts, fallback sources and
+early cancellation.
+"""
+
+import asyncio
+import time
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from job_discovery import DiscoverySource, JobDeduplicator, discover_jobs, job_dedup_key, stream_discovered_jobs
+
+
+def postings(prefix, count, location="Zurich"):
+    return [{"title": f"Business Analyst {i}", "company": f"{prefix} {i}", "location": location}
+            for i in range(count)]
+
+
+def async_source(name, delay, jobs, **kwargs):
+    async def fetch(keywords, location):
+        await asyncio.sleep(delay)
+        return jobs
+    return DiscoverySource(name, fetch, **kwargs)
+
+
+def collect(coro):
+    return asyncio.run(coro)
+
+
+@pytest.mark.unit
+class TestDeduplication:
+    """Test the cross-source posting identity"""
+
+    def test_key_normalizes_case_accents_and_legal_suffixes(self):
+        """The same posting from two boards collides"""
+        linkedin = {"title": "Business Analyst", "company": "UBS AG", "location": "Zürich, Switzerland"}
+        indeed = {"title": "business analyst", "company": "ubs", "location": "Zurich Switzerland"}
+        other = {"title": "Business Analyst", "company": "UBS AG", "location": "Geneva"}
+        assert job_dedup_key(linkedin) == job_dedup_key(indeed)
+        assert job_dedup_key(linkedin) != job_dedup_key(other)
+
+        deduplicator = JobDeduplicator()
+        assert deduplicator.filter_new([linkedin, indeed, other]) == [linkedin, other]
+        assert deduplicator.filter_new([indeed]) == []
+        assert len(deduplicator) == 2
+
+
+@pytest.mark.unit
+class TestConcurrentDiscovery:
+    """Test fan-out, timeouts and fallbacks"""
+
+    def test_streams_in_completion_order(self):
+        """Batches arrive as sources finish, duplicates dropped from later batches"""
+        shared = postings("Shared", 2)
+        sources = [
+            async_source("slow", 0.15, shared + postings("Slow", 2)),
+            async_source("fast", 0.01, shared),
+        ]
+
+        async def run():
+            return [batch async for batch in stream_discovered_jobs(sources, "Business Analyst", "Zurich")]
+
+        batches = collect(run())
+        assert [batch.source for batch in batches] == ["fast", "slow"]
+        assert [batch.outcome.new_jobs for batch in batches] == [2, 2]
+        assert batches[1].outcome.jobs_found == 4
+
+    def test_timeout_and_error_do_not_stall_search(self):
+        """A stalled blocking source is cut off at its timeout; failures are reported"""
+        def stalled(keywords, location):
+            time.sleep(2.0)
+            return postings("Late", 3)
+
+        def broken(keywords, location):
+            raise ConnectionError("board unavailable")
+
+        sources = [
+            DiscoverySource("stalled", stalled, timeout=0.1),
+            DiscoverySource("broken", broken),
+            async_source("healthy", 0.01, postings("Healthy", 3)),
+        ]
+        start = time.perf_counter()
+        result = collect(discover_jobs(sources, "Business Analyst", "Zurich"))
+        assert time.perf_counter() - start < 1.0
+
+        outcomes = {outcome.source: outcome for outcome in result.outcomes}
+        assert outcomes["stalled"].status == "timeout"
+        assert outcomes["broken"].status == "error"
+        assert "board unavailable" in outcomes["broken"].error
+        assert outcomes["healthy"].status == "ok"
+        assert len(result.jobs) == 3
+        assert result.first_result_seconds is not None
+
+    def test_fallback_runs_only_when_results_are_short(self):
+        """The fallback source is skipped when primaries found enough jobs"""
+        fallback = async_source("ai_generated", 0.0, postings("Generated", 3), fallback=True)
+
+        plenty = collect(discover_jobs([async_source("live", 0.0, postings("Live", 5)), fallback],
+                                       "Business Analyst", "Zurich"))
+        assert len(plenty.jobs) == 5
+        assert plenty.outcomes[-1].status == "skipped"
+
+        short = collect(discover_jobs([async_source("live", 0.0, postings("Live", 1)), fallback],
+                                      "Business Analyst", "Zurich"))
+        assert len(short.jobs) == 4
+        assert short.outcomes[-1].source == "ai_generated"
+        assert short.outcomes[-1].status == "ok"
+
+    def test_limit_cancels_pending_sources(self):
+        """Stopping early cancels the sources that are still running"""
+        cancelled = []
+
+        async def slow(keywords, location):
+            try:
+                await asyncio.sleep(5.0)
+            except asyncio.CancelledError:
+                cancelled.append("slow")
+                raise
+            return []
+
+        sources = [async_source("fast", 0.0, postings("Fast", 3)), DiscoverySource("slow", slow)]
+        start = time.perf_counter()
+        result = collect(discover_jobs(sources, "Business Analyst", "Zurich", limit=2))
+        assert time.perf_counter() - start < 1.0
+        assert len(result.jobs) == 2
+        assert cancelled == ["slow"]
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+🧬 Consciousness Knowledge Graph Tests
+
+Tests for the CSR knowledge graph behind ConsciousnessKnowledgeManager:
+the frontier-vectorized wave matches a node-by-node breadth-first wave and
+the incrementally maintained metrics match a full recomputation.
+"""
+
+import random
+import pytest
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+
+# Add the consciousness knowledge module to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src' / 'consciousness-knowledge'))
+
+from knowledge_graph import KnowledgeGraph
+from consciousness_knowledge_manager import ConsciousnessKnowledgeManager
+
+
+def random_network(nodes=400, edges=1600, seed=0):
+    rng = random.Random(seed)
+    specs = [(f"node-{i}", rng.choice(["biology", "physics", "careers"]), {
+        "biological_alignment": rng.uniform(0.8, 1.0),
+        "evolutionary_potential": rng.uniform(0.7, 1.0),
+        "communication_strength": rng.uniform(0.8, 1.0),
+        "self_improvement_capacity": rng.uniform(0.8, 1.0),
+    }) for i in range(nodes)]
+    connections = [(f"node-{rng.randrange(nodes)}", f"node-{rng.randrange(nodes)}") for _ in range(edges)]
+    return specs, connections
+
+
+def reference_wave(specs, connections, origin, amplitude=1.0, decay=0.9, threshold=0.7, max_levels=4):
+    """Node-by-node breadth-first wave over adjacency sets"""
+    attributes = {node_id: node_specs for node_id, _, node_specs in specs}
+    adjacency = defaultdict(set)
+    for source, target in connections:
+        adjacency[source].add(target)
+        adjacency[target].add(source)
+
+    visited, wave_front, results = {origin}, [origin], {}
+    for wave_level in range(max_levels):
+        new_front = []
+        for current in wave_front:
+            current_improvement = amplitude * (decay ** wave_level)
+            for connected in adjacency[current]:
+                if connected not in visited:
+                    improvement = current_improvement * attributes[connected]["self_improvement_capacity"]
+                    impact = improvement * attributes[connected]["evolutionary_potential"]
+                    if impact >= threshold:
+                        results[connected] = (wave_level + 1, improvement, impact)
+                        new_front.append(connected)
+                        visited.add(connected)
+        wave_front = new_front
+        if not new_front:
+            break
+    return results
+
+
+def build_manager(specs, connections):
+    manager = ConsciousnessKnowledgeManager()
+    manager.register_knowledge_nodes(specs)
+    manager.establish_knowledge_connections(connections)
+    return manager
+
+
+@pytest.mark.unit
+class TestKnowledgeGraph:
+    """Test CSR adjacency and wave propagation"""
+
+    def test_csr_matches_adjacency_sets(self):
+        specs, connections = random_network(seed=1)
+        graph = KnowledgeGraph(capacity=4)
+        for node_id, domain, node_specs in specs:
+            graph.add_node(node_id, domain, node_specs)
+        adjacency = defaultdict(set)
+        for source, target in connections:
+            graph.add_edge(source, target)
+            adjacency[graph.node_index[source]].add(graph.node_index[target])
+            adjacency[graph.node_index[target]].add(graph.node_index[source])
+
+        indptr, indices = graph.csr()
+        for node in range(len(graph)):
+            assert sorted(indices[indptr[node]:indptr[node + 1]].tolist()) == sorted(adjacency[node])
+            assert graph.degrees()[node] == len(adjacency[node])
+        assert graph.degree_sum == sum(len(neighbours) for neighbours in adjacency.values())
+
+    @pytest.mark.parametrize("threshold", [0.6, 0.7, 0.8])
+    def test_wave_matches_breadth_first_reference(self, threshold):
+        specs, connections = random_network(seed=2)
+        manager = build_manager(specs, connections)
+        for origin in ("node-0", "node-17", "node-250"):
+            expected = reference_wave(specs, connections, origin, threshold=threshold)
+            result = manager.propagate_self_improvement_wave(origin, {"evolutionary_threshold": threshold})
+            propagated = result["propagation_results"]
+            assert set(propagated) == set(expected)
+            for node_id, (level, improvement, impact) in expected.items():
+                assert propagated[node_id]["propagation_level"] == level
+                assert propagated[node_id]["improvement_amplitude"] == pytest.approx(improvement)
+                assert propagated[node_id]["evolutionary_impact"] == pytest.approx(impact)
+            assert result["max_propagation_level"] == max((r[0] for r in expected.values()), default=0)
+
+    def test_isolated_origin_improves_nothing(self):
+        manager = build_manager(*random_network(nodes=5, edges=0))
+        result = manager.propagate_self_improvement_wave("node-3", {})
+        assert result["nodes_improved"] == 0
+        assert result["max_propagation_level"] == 0
+
+
+@pytest.mark.unit
+class TestIncrementalNetworkMetrics:
+    """Test that running sums match a full recomputation"""
+
+    def test_metrics_match_recomputation(self):
+        specs, connections = random_network(nodes=120, edges=300, seed=3)
+        manager = build_manager(specs, connections)
+        # Re-registering a node replaces its attributes and domain
+        manager.register_knowledge_node("node-5", "careers", {"evolutionary_potential": 0.5})
+
+        nodes = list(manager.knowledge_network.values())
+        distinct = {tuple(sorted(pair)) for pair in connections}
+        metrics = manager.synthesis_metrics
+        assert metrics.evolutionary_knowledge_expansion == pytest.approx(
+            np.mean([node.evolutionary_potential for node in nodes]))
+        assert metrics.self_improvement_adaptation == pytest.approx(
+            np.mean([node.self_improvement_capacity for node in nodes]))
+        assert metrics.biological_communication_efficiency == pytest.approx(
+            (2 * len(distinct) - sum(a == b for a, b in distinct)) / 2 / (120 * 119 / 2))
+
+        topology = manager.analyze_network_topology()
+        domains = defaultdict(int)
+        for node in nodes:
+            domains[node.knowledge_domain] += 1
+        assert topology["knowledge_domain_distribution"] == dict(domains)
+        assert topology["communication_strength_distribution"]["average"] == pytest.approx(
+            np.mean([node.communication_strength for node in nodes]))
+
+    def test_duplicate_connections_are_counted_once(self):
+        manager = build_manager(*random_network(nodes=3, edges=0))
+        assert manager.establish_knowledge_connections([("node-0", "node-1"), ("node-1", "node-0")]) == 1
+        assert manager.analyze_network_topology()["total_bidirectional_connections"] == 1
+
+    def test_reset_clears_graph(self):
+        manager = build_manager(*random_network(nodes=10, edges=20))
+        manager.reset_knowledge_network()
+        assert len(manager.knowledge_graph) == 0
+        assert "error" in manager.analyze_network_topology()
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+🧬 Gamification Leaderboard Store Tests
+
+Tests for the order-statistics leaderboard store: skip list ranks and
+top-k slices agree with a full sort, and the gamification engine serves
+standings, ranks, rank changes and rolling windows from it.
+"""
+
+import asyncio
+import importlib.util
+import os
+import random
+import pytest
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ENERGY_FIELDS = Path(__file__).parent.parent.parent / 'src' / 'energy-fields'
+sys.path.insert(0, str(ENERGY_FIELDS))
+
+from leaderboard_store import InMemoryLeaderboardStore, RedisLeaderboardStore, SortedLeaderboard
+
+_spec = importlib.util.spec_from_file_location("game_mechanics_engine", ENERGY_FIELDS / 'game-mechanics-engine.py')
+game_mechanics_engine = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(game_mechanics_engine)
+
+
+def reference_order(points):
+    # Points descending, ties by user id descending (Redis ZREVRANGE order)
+    return sorted(points.items(), key=lambda item: (item[1], item[0]), reverse=True)
+
+
+@pytest.fixture(params=["memory", "redis"])
+def leaderboard_store(request):
+    if request.param == "memory":
+        yield InMemoryLeaderboardStore()
+        return
+    if not os.getenv("GAMIFICATION_REDIS_URL"):
+        pytest.skip("GAMIFICATION_REDIS_URL not set")
+    import redis.asyncio as redis_asyncio
+    yield RedisLeaderboardStore(redis_asyncio.from_url(os.environ["GAMIFICATION_REDIS_URL"]),
+                                prefix="test:gamification:")
+
+
+@pytest.mark.unit
+class TestLeaderboardStoreOrdering:
+    """Both stores order standings identically, ties included"""
+
+    def test_ties_break_the_same_way_in_every_store(self, leaderboard_store):
+        async def scenario():
+            await leaderboard_store.drop("ties")
+            await leaderboard_store.update_many([("ties", user_id, 100) for user_id in ("carol", "alice", "bob")])
+            await leaderboard_store.update_many([("ties", "dave", 150), ("ties", "erin", 50)])
+            result = (await leaderboard_store.top("ties", 10), await leaderboard_store.top("ties", 2, offset=1),
+                      [await leaderboard_store.rank("ties", user_id) for user_id in ("alice", "bob", "carol")])
+            await leaderboard_store.drop("ties")
+            if isinstance(leaderboard_store, RedisLeaderboardStore):
+                await leaderboard_store.client.aclose()
+            return result
+
+        standings, page, ranks = asyncio.run(scenario())
+        assert standings == [("dave", 150), ("carol", 100), ("bob", 100), ("alice", 100), ("erin", 50)]
+        assert page == [("carol", 100), ("bob", 100)]
+        assert ranks == [4, 3, 2]
+
+
+@pytest.mark.unit
+class TestSortedLeaderboard:
+    """Test the skip list board against a full sort"""
+
+    def test_random_updates_match_full_sort(self):
+        rng = random.Random(1)
+        board, points = SortedLeaderboard(seed=1), {}
+        for _ in range(3000):
+            user_id = f"user-{rng.randrange(400)}"
+            if rng.random() < 0.05 and user_id in points:
+                board.remove(user_id)
+                del points[user_id]
+            else:
+                points[user_id] = rng.randrange(1000)
+                board.update(user_id, points[user_id])
+
+        expected = reference_order(points)
+        assert len(board) == len(points)
+        assert board.top(len(points) + 10) == expected
+        assert board.top(25, offset=100) == expected[100:125]
+        for rank, (user_id, _) in enumerate(expected, 1):
+            assert board.rank(user_id) == rank
+
+    def test_missing_users_and_empty_pages(self):
+        board = SortedLeaderboard()
+        board.update("a", 5)
+        assert board.rank("b") is None
+        assert board.score("b") is None
+        assert board.top(10, offset=5) == []
+        assert board.top(0) == []
+
+    def test_ties_are_ordered_by_user_id_descending(self):
+        board = SortedLeaderboard()
+        for user_id in ("carol", "alice", "bob"):
+            board.update(user_id, 100)
+        assert [user_id for user_id, _ in board.top(3)] == ["carol", "bob", "alice"]
+        assert board.rank("alice") == 3
+
+
+@pytest.mark.unit
+class TestGamificationLeaderboards:
+    """Test the engine's leaderboards on the in-memory store"""
+
+    def engine(self):
+        engine = game_mechanics_engine.BiologicalGamificationEngine()
+        engine.leaderboard_store = InMemoryLeaderboardStore()
+        return engine
+
+    def set_points(self, engine, points):
+        for user_id, total in points.items():
+            engine.user_profiles.setdefault(user_id, {"total_points": 0})["total_points"] = total
+            asyncio.run(engine.update_leaderboards(user_id))
+
+    def test_standings_ranks_and_rank_changes(self):
+        engine = self.engine()
+        self.set_points(engine, {"a": 300, "b": 200, "c": 100})
+
+        first = asyncio.run(engine.get_leaderboard("global", limit=3))
+        assert [(row["rank"], row["user_id"], row["change_from_last"]) for row in first] == \
+            [(1, "a", 0), (2, "b", 0), (3, "c", 0)]
+
+        self.set_points(engine, {"c": 400})
+        second = asyncio.run(engine.get_leaderboard("global", limit=3))
+        assert [(row["user_id"], row["change_from_last"]) for row in second] == [("c", 2), ("a", -1), ("b", -1)]
+        # Reads do not reset the changes; only the next write does
+        again = asyncio.run(engine.get_leaderboard("global", limit=3))
+        assert [(row["user_id"], row["change_from_last"]) for row in again] == [("c", 2), ("a", -1), ("b", -1)]
+        self.set_points(engine, {"b": 250})
+        third = asyncio.run(engine.get_leaderboard("global", limit=3))
+        assert [(row["user_id"], row["change_from_last"]) for row in third] == [("c", 0), ("a", 0), ("b", 0)]
+        assert asyncio.run(engine.get_leaderboard_rank("weekly", "b")) == 3
+        assert asyncio.run(engine.get_leaderboard("global", limit=2, offset=1))[0]["rank"] == 2
+
+    def test_masterclass_only_holds_elite_performers(self):
+        engine = self.engine()
+        self.set_points(engine, {"a": 6000, "b": 4999})
+        masterclass = asyncio.run(engine.get_leaderboard("godhood_masterclass"))
+        assert [row["user_id"] for row in masterclass] == ["a"]
+
+    def test_windows_roll_and_expire(self):
+        engine = self.engine()
+        store = engine.leaderboard_store
+        for month in range(1, 5):
+            board = engine._leaderboard_board("monthly", datetime(2025, month, 10))
+            asyncio.run(engine._roll_leaderboard_window(board))
+            asyncio.run(store.update(board, "a", month))
+        assert engine.leaderboard_windows["monthly"] == ["monthly:2025-03", "monthly:2025-04"]
+        assert asyncio.run(store.size("monthly:2025-01")) == 0
+        assert asyncio.run(store.score("monthly:2025-04", "a")) == 4
+
+    def test_window_boards_expire_in_the_store(self):
+        class RecordingPipeline:
+            commands = []
+
+            def zadd(self, key, mapping):
+                self.commands.append(("zadd", key))
+
+            def expireat(self, key, when):
+                self.commands.append(("expireat", key, when))
+
+            async def execute(self):
+                return []
+
+        class RecordingClient:
+            def pipeline(self, transaction=True):
+                return RecordingPipeline()
+
+        engine = self.engine()
+        engine.leaderboard_store = RedisLeaderboardStore(RecordingClient(), prefix="")
+        self.set_points(engine, {"a": 100})
+
+        now = datetime.now()
+        weekly, monthly = (engine._leaderboard_board(kind, now) for kind in ("weekly", "monthly"))
+        expiries = {command[1]: command[2] for command in RecordingPipeline.commands if command[0] == "expireat"}
+        assert set(expiries) == {weekly, monthly}
+        assert datetime.fromtimestamp(expiries[weekly]).weekday() == 0
+        assert now + timedelta(weeks=1) < datetime.fromtimestamp(expiries[weekly]) <= now + timedelta(weeks=2)
+        assert datetime.fromtimestamp(expiries[monthly]).day == 1
+        assert engine._leaderboard_window_expiry("monthly", datetime(2025, 12, 10)) == datetime(2026, 2, 1)
+
+    def test_unknown_leaderboard_is_rejected(self):
+        with pytest.raises(ValueError):
+            asyncio.run(self.engine().get_leaderboard("daily"))
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not os.getenv("GAMIFICATION_REDIS_URL"), reason="GAMIFICATION_REDIS_URL not set")
+class TestRedisLeaderboardStore:
+    """Test the Redis sorted-set store against a live server"""
+
+    def test_round_trip(self):
+        import redis.asyncio as redis_asyncio
+
+        async def scenario():
+            store = RedisLeaderboardStore(redis_asyncio.from_url(os.environ["GAMIFICATION_REDIS_URL"]),
+                                          prefix="test:gamification:")
+            await store.drop("global")
+            await store.update_many([("global", "a", 30), ("global", "b", 20), ("global", "c", 10)])
+            await store.update("global", "c", 40)
+            result = (await store.top("global", 2), await store.rank("global", "a"), await store.size("global"))
+            await store.drop("global")
+            await store.client.aclose()
+            return result
+
+        assert asyncio.run(scenario()) == ([("c", 40), ("a", 30)], 2, 3)
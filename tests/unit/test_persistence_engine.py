@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+🧬 CNS Write-Behind Persistence Tests
+
+Tests for the coalescing write-behind persistence engine of the CNS core.
+Validates log replay, compaction and recovery semantics.
+"""
+
+import pytest
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Add CNS core to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src' / 'cns-consciousness-core'))
+
+from persistence_engine import WriteBehindPersistenceEngine
+
+
+@pytest.fixture
+def engine(tmp_path):
+    return WriteBehindPersistenceEngine(str(tmp_path / "core_data.json"), flush_threshold=1000)
+
+
+@pytest.mark.unit
+class TestWriteBehindPersistenceEngine:
+    """Test write-behind persistence engine"""
+
+    def test_updates_are_coalesced_per_key(self, engine):
+        """Repeated updates to one key produce a single log record per flush"""
+        for count in range(1, 51):
+            engine.put("request_metrics", "/health", {"total_requests": count})
+
+        assert engine.pending_count == 1
+        assert engine.flush() == 1
+
+        lines = Path(engine.log_path).read_text().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["v"] == {"total_requests": 50}
+
+    def test_recovery_replays_log_over_snapshot(self, engine, tmp_path):
+        """Recovered state combines the compacted snapshot with later log records"""
+        engine.put("request_metrics", "/health", {"total_requests": 1})
+        engine.compact()
+        engine.put("queries", "abc_ai_first", {"query": "mind"})
+        engine.put("request_metrics", "/health", {"total_requests": 2})
+        engine.flush()
+
+        recovered = WriteBehindPersistenceEngine(engine.snapshot_path).load()
+        assert recovered["request_metrics"]["/health"] == {"total_requests": 2}
+        assert recovered["queries"]["abc_ai_first"] == {"query": "mind"}
+
+    def test_compaction_truncates_log_and_enforces_limits(self, tmp_path):
+        """Compaction writes the snapshot, empties the log and bounds sections"""
+        engine = WriteBehindPersistenceEngine(str(tmp_path / "core_data.json"), section_limits={"queries": 3})
+        for index in range(10):
+            engine.put("queries", f"q{index}", {"index": index})
+        engine.compact()
+
+        assert Path(engine.log_path).read_text() == ""
+        snapshot = json.loads(Path(engine.snapshot_path).read_text())
+        assert list(snapshot["queries"]) == ["q7", "q8", "q9"]
+
+    def test_torn_log_record_is_skipped(self, engine):
+        """A partially written final record does not prevent recovery"""
+        engine.put("request_metrics", "/health", {"total_requests": 3})
+        engine.flush()
+        with open(engine.log_path, 'a') as f:
+            f.write('{"s": "request_metrics", "k": "/broken", "v": {')
+
+        recovered = engine.load()
+        assert recovered["request_metrics"] == {"/health": {"total_requests": 3}}
+
+    def test_failed_flush_requeues_records(self, tmp_path):
+        """A write error keeps the batch pending for the next flush, behind nothing newer"""
+        log_dir = tmp_path / "missing"
+        engine = WriteBehindPersistenceEngine(str(tmp_path / "core_data.json"), log_path=str(log_dir / "log.jsonl"),
+                                              flush_threshold=1000)
+        engine.put("request_metrics", "/health", {"total_requests": 1})
+        engine.put("queries", "q1", {"query": "mind"})
+        assert engine.flush() == 0
+        assert engine.stats["flush_errors"] == 1
+        assert engine.pending_count == 2
+
+        engine.put("request_metrics", "/health", {"total_requests": 2})
+        log_dir.mkdir()
+        assert engine.flush() == 2
+        records = [json.loads(line) for line in (log_dir / "log.jsonl").read_text().splitlines()]
+        assert [(record["k"], record["v"]) for record in records] == [
+            ("/health", {"total_requests": 2}), ("q1", {"query": "mind"})]
+
+    def test_threshold_flushes_inline_without_background_task(self, tmp_path):
+        """Without a running flusher the size threshold triggers an inline flush"""
+        engine = WriteBehindPersistenceEngine(str(tmp_path / "core_data.json"), flush_threshold=5)
+        for index in range(5):
+            engine.put("queries", f"q{index}", index)
+
+        assert engine.pending_count == 0
+        assert engine.stats["records_written"] == 5
+
+    @pytest.mark.asyncio
+    async def test_background_flush_and_shutdown_compaction(self, tmp_path):
+        """Background task flushes on interval and stop() compacts to the snapshot"""
+        engine = WriteBehindPersistenceEngine(str(tmp_path / "core_data.json"), flush_interval=0.05)
+        await engine.start()
+        engine.put("request_metrics", "/metrics", {"total_requests": 7})
+        await asyncio.sleep(0.2)
+        assert engine.stats["flushes"] >= 1
+
+        await engine.stop()
+        snapshot = json.loads(Path(engine.snapshot_path).read_text())
+        assert snapshot["request_metrics"]["/metrics"] == {"total_requests": 7}
+
+    @pytest.mark.asyncio
+    async def test_snapshot_sources_are_persisted_on_the_flush_interval(self, tmp_path):
+        """Registered sources are written each interval, only when their value changed"""
+        engine = WriteBehindPersistenceEngine(str(tmp_path / "core_data.json"), flush_interval=0.02)
+        counters = {"total_requests": 1}
+        engine.add_snapshot_source("request_metrics", None, lambda: dict(counters))
+        await engine.start()
+        await asyncio.sleep(0.1)
+        counters["total_requests"] = 2
+        await asyncio.sleep(0.1)
+
+        records = [json.loads(line) for line in Path(engine.log_path).read_text().splitlines()]
+        assert [record["v"] for record in records] == [{"total_requests": 1}, {"total_requests": 2}]
+        assert engine.load()["request_metrics"] == {"total_requests": 2}  # what a crash would recover
+        await engine.stop()
+
+    def test_invalid_durability_rejected(self, tmp_path):
+        """Unknown durability modes are rejected at construction"""
+        with pytest.raises(ValueError):
+            WriteBehindPersistenceEngine(str(tmp_path / "core_data.json"), durability="sometimes")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
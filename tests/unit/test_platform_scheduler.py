@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+🧬 Platform Submission Scheduler Tests
+
+Tests for the per-platform token buckets, adaptive back-off and queued bulk
+submissions of the multi-platform application orchestrator.
+"""
+
+import asyncio
+import importlib.util
+import random
+import time
+import pytest
+from dataclasses import dataclass
+from pathlib import Path
+
+ORCHESTRATOR_PATH = (Path(__file__).parent.parent.parent / 'src' / 'application-automation'
+                     / 'platform_platforms' / 'platform_orchestrator.py')
+_spec = importlib.util.spec_from_file_location("platform_orchestrator", ORCHESTRATOR_PATH)
+platform_orchestrator = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(platform_orchestrator)
+
+PlatformOrchestrator = platform_orchestrator.PlatformOrchestrator
+SubmissionRequest = platform_orchestrator.SubmissionRequest
+TokenBucket = platform_orchestrator.TokenBucket
+
+
+@dataclass
+class Posting:
+    job_id: str
+    platform: str
+
+
+class InstantOrchestrator(PlatformOrchestrator):
+    """Orchestrator with instant mocked platform endpoints"""
+
+    def __init__(self):
+        super().__init__()
+        self.executed = []
+
+    async def _execute_platform_submission(self, platform, job_posting, cv_data, config):
+        self.executed.append(job_posting.job_id)
+        return {"success": True, "platform": platform.platform_name.lower(), "job_id": job_posting.job_id}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.unit
+class TestTokenBucket:
+    """Test bucket refill and sizing"""
+
+    def test_burst_then_refill(self):
+        """Capacity is spent immediately, then tokens arrive at the refill rate"""
+        clock = FakeClock()
+        bucket = TokenBucket(rate_per_second=0.5, capacity=2, clock=clock)
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire() == pytest.approx(2.0)
+
+        clock.now = 1.0
+        assert bucket.try_acquire() == pytest.approx(1.0)
+        clock.now = 2.0
+        assert bucket.try_acquire() == 0.0
+
+        clock.now = 100.0
+        bucket.try_acquire()
+        assert bucket.tokens == pytest.approx(1.0)  # Refill is capped at capacity
+
+    def test_rate_change_credits_elapsed_time_at_old_rate(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate_per_second=0.5, capacity=4, clock=clock)
+        bucket.tokens = 0.0
+        clock.now = 2.0
+        bucket.set_rate(0.1)
+        assert bucket.tokens == pytest.approx(1.0)
+        clock.now = 7.0
+        bucket.set_rate(0.5)
+        assert bucket.tokens == pytest.approx(1.5)
+
+    def test_sized_from_platform_rate_limit(self):
+        """Buckets follow rate_limit_per_minute with a short burst allowance"""
+        orchestrator = PlatformOrchestrator()
+        linkedin = orchestrator.token_buckets["linkedin"]
+        indeed = orchestrator.token_buckets["indeed"]
+        assert linkedin.rate_per_second == pytest.approx(15 / 60)
+        assert linkedin.capacity == 1
+        assert indeed.rate_per_second == pytest.approx(30 / 60)
+        assert indeed.capacity == 3
+
+
+@pytest.mark.unit
+class TestAdaptiveBackoff:
+    """Test success-rate driven refill slow-down"""
+
+    def test_backs_off_only_with_enough_failing_samples(self):
+        orchestrator = PlatformOrchestrator()
+        glassdoor = orchestrator.platforms["glassdoor"]
+        stats = orchestrator.platform_stats["glassdoor"]
+        base_rate = orchestrator._adaptive_refill_rate(glassdoor)
+        assert base_rate == pytest.approx(20 / 60)
+
+        stats.update(total_submissions=2, success_rate=0.0)
+        assert orchestrator._adaptive_refill_rate(glassdoor) == pytest.approx(base_rate)
+
+        stats.update(total_submissions=10, success_rate=0.4)
+        assert orchestrator._adaptive_refill_rate(glassdoor) == pytest.approx(base_rate / 1.5)
+        assert stats["rate_limit_hits"] == 0  # backing off is not a rate limit hit
+
+        stats.update(success_rate=0.9)
+        assert orchestrator._adaptive_refill_rate(glassdoor) == pytest.approx(base_rate)
+
+    def test_only_429_responses_count_as_rate_limit_hits(self):
+        orchestrator = PlatformOrchestrator()
+        stats = orchestrator.platform_stats["indeed"]
+        orchestrator._update_submission_stats("indeed", {"success": False, "error": "Form unavailable"}, 0.1)
+        orchestrator._update_submission_stats("indeed", {"success": False, "error": "Too many requests",
+                                                         "status_code": 429}, 0.1)
+        assert stats["rate_limit_hits"] == 1
+        assert stats["failed_submissions"] == 2
+
+    def test_platform_429_lowers_the_strategy_weight(self, monkeypatch):
+        """A throttled Monster submission reports 429 and costs the platform its rate limit bonus"""
+        async def instant(_seconds):
+            return None
+
+        monkeypatch.setattr(platform_orchestrator.asyncio, "sleep", instant)
+
+        def monster_weight(failure_roll):
+            # First roll fails the submission, the second decides whether it was throttled
+            rolls = iter([0.95, failure_roll])
+            monkeypatch.setattr(random, "random", lambda: next(rolls))
+            orchestrator = PlatformOrchestrator()
+            result = asyncio.run(orchestrator._submit_to_platform("monster", Posting("job-1", "monster"), {}, {}))
+            strategy = asyncio.run(orchestrator.optimize_platform_strategy())
+            return result, orchestrator.platform_stats["monster"], strategy["optimized_weights"]["monster"]
+
+        throttled, throttled_stats, throttled_weight = monster_weight(0.0)
+        rejected, rejected_stats, rejected_weight = monster_weight(0.99)
+
+        assert throttled["status_code"] == 429
+        assert throttled_stats["rate_limit_hits"] == 1
+        assert rejected["status_code"] == 422
+        assert rejected_stats["rate_limit_hits"] == 0
+        assert throttled_weight < rejected_weight
+
+
+@pytest.mark.unit
+class TestQueuedSubmissions:
+    """Test per-platform queues and the bulk submission API"""
+
+    def test_throttled_platform_does_not_block_others(self):
+        """An empty Glassdoor bucket leaves Indeed submissions unaffected"""
+        orchestrator = InstantOrchestrator()
+        orchestrator.max_concurrent_submissions = 1
+        glassdoor = orchestrator.token_buckets["glassdoor"]
+        glassdoor.tokens = 0.0
+
+        async def run():
+            stalled = asyncio.ensure_future(orchestrator.submit_applications(
+                [(Posting(f"GD-{i}", "Glassdoor"), {}) for i in range(3)]
+            ))
+            await asyncio.sleep(0.01)
+            start = time.perf_counter()
+            results = await orchestrator.submit_applications(
+                [SubmissionRequest(Posting(f"ID-{i}", "Indeed"), {}) for i in range(3)]
+                + [(Posting("XX-1", "Xing"), {})]
+            )
+            elapsed = time.perf_counter() - start
+            assert not stalled.done()
+            metrics = orchestrator.get_platform_performance_metrics()["platform_metrics"]
+            await orchestrator.stop_submission_workers()
+            with pytest.raises(asyncio.CancelledError):
+                await stalled
+            return results, elapsed, metrics
+
+        results, elapsed, metrics = asyncio.run(run())
+        assert elapsed < 0.5
+        assert [result["job_id"] for result in results] == ["ID-0", "ID-1", "ID-2", "XX-1"]
+        assert [result["success"] for result in results] == [True, True, True, False]
+        assert results[-1]["error"] == "Platform not supported"
+        assert metrics["glassdoor"]["queued_submissions"] >= 2
+        assert metrics["indeed"]["submissions"] == 3
+        assert not any(job_id.startswith("GD") for job_id in orchestrator.executed)
+
+    def test_reusable_across_event_loops(self):
+        """Queues and workers are rebuilt when a new event loop submits"""
+        orchestrator = InstantOrchestrator()
+        for job_id in ("MON-1", "MON-2"):
+            result = asyncio.run(orchestrator.submit_application(Posting(job_id, "Monster"), {}))
+            assert result["success"]
+        assert orchestrator.executed == ["MON-1", "MON-2"]
+        assert len(orchestrator.submission_history) == 2
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+🧬 CNS Result Cache Tests
+
+Tests for the TTL + LRU result cache behind /biological-knowledge.
+Validates key normalisation, expiry, eviction order and hit/miss counters.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add CNS core to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src' / 'cns-consciousness-core'))
+
+from result_cache import TTLResultCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.unit
+class TestTTLResultCache:
+    """Test memoizing result cache"""
+
+    def test_key_normalizes_whitespace_and_separates_contexts(self):
+        """Whitespace variants share a key; different contexts do not"""
+        key = TTLResultCache.make_key("biological  consciousness\n", "ai_first")
+        assert key == TTLResultCache.make_key(" biological consciousness", "ai_first")
+        assert key != TTLResultCache.make_key("biological consciousness", "godhood")
+
+    def test_hits_misses_and_ttl_expiry(self):
+        """Entries are served until their TTL elapses and counted as hits or misses"""
+        clock = FakeClock()
+        cache = TTLResultCache(max_entries=10, ttl_seconds=60, clock=clock)
+
+        assert cache.get("q") is None
+        cache.put("q", {"insight": "mind"})
+        assert cache.get("q") == {"insight": "mind"}
+
+        clock.now += 61
+        assert cache.get("q") is None
+
+        metrics = cache.get_cache_metrics()
+        assert (metrics["hits"], metrics["misses"], metrics["expirations"]) == (1, 2, 1)
+        assert metrics["entries"] == 0
+        assert metrics["hit_rate"] == pytest.approx(1 / 3)
+
+    def test_least_recently_used_entry_evicted(self):
+        """Reading an entry protects it from eviction"""
+        cache = TTLResultCache(max_entries=2, ttl_seconds=60)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1 and cache.get("c") == 3
+        assert cache.stats["evictions"] == 1
+
+    def test_invalid_size_rejected(self):
+        """A cache must be able to hold at least one entry"""
+        with pytest.raises(ValueError):
+            TTLResultCache(max_entries=0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
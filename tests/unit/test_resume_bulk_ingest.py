@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+🧬 Bulk Resume Ingestion Tests
+
+Tests for the compiled skill matcher and the bulk ingestion entry point:
+fingerprint deduplication, JSON Lines/SQLite output and checkpointed resume.
+"""
+
+import asyncio
+import json
+import pytest
+import sqlite3
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Add utility scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src' / 'utility-scripts'))
+
+from resume_bulk_ingest import discover_documents, ingest_resumes, load_resume_parser
+
+parser_module = load_resume_parser()
+
+
+def write_cv(path: Path, number: int, skills: str = "Python, Kubernetes, Leadership") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"Person {number} Example\nEmail: person{number}@example.com\n\nSkills:\n{skills}\n")
+    return path
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+@pytest.mark.unit
+class TestSkillMatcher:
+    """Test the single-pass skill automaton"""
+
+    def test_matches_whole_skills_only(self):
+        matcher = parser_module.PatternRecognitionEngine().skill_matcher
+        found = matcher.scan(["Email: dev@example.com", "JavaScript, C++ and Node.js; NoSQL stores"])
+        assert set(found) == {"javascript", "c++", "node.js", "nosql"}  # no "ai" in "email", no "java"/"sql"
+        assert found["c++"] == "JavaScript, C++ and Node.js; NoSQL stores"
+
+    def test_extract_skills_orders_by_category_weight(self):
+        engine = parser_module.PatternRecognitionEngine()
+        skills = asyncio.run(engine.extract_skills(["Teamwork, Sales, Leadership", "Docker"]))
+        assert [skill.value for skill in skills] == ["Docker", "Leadership", "Sales", "Teamwork"]
+        assert engine._calculate_skill_importance("Leadership") == 0.7
+
+
+@pytest.mark.unit
+class TestBulkIngestion:
+    """Test ingestion, deduplication and checkpointing"""
+
+    def test_duplicates_are_analysed_once(self, tmp_path, pool):
+        for i in range(6):
+            write_cv(tmp_path / "cvs" / f"cv_{i}.txt", i % 4)
+        (tmp_path / "cvs" / "blank.txt").write_text("\n")
+        (tmp_path / "cvs" / "notes.md").write_text("ignored")
+
+        report = ingest_resumes(str(tmp_path / "cvs"), str(tmp_path / "out.jsonl"), batch_size=3, executor=pool)
+        assert (report["documents"], report["parsed"], report["duplicates"], report["failed"]) == (7, 4, 2, 1)
+        assert set(report["stage_seconds"]) == {"discover", "extract", "dedupe", "analyze", "write"}
+
+        records = [json.loads(line) for line in (tmp_path / "out.jsonl").read_text().splitlines()]
+        assert len({record["fingerprint"] for record in records}) == 4
+        assert "Kubernetes" in records[0]["resume_data"]["skills"]
+
+    def test_interrupted_run_resumes_from_checkpoint(self, tmp_path, pool):
+        for i in range(8):
+            write_cv(tmp_path / "cvs" / f"cv_{i}.txt", i)
+        output = str(tmp_path / "out.jsonl")
+
+        def interrupt(report):
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            ingest_resumes(str(tmp_path / "cvs"), output, batch_size=3, executor=pool, progress=interrupt)
+        with open(output, "a") as f:
+            f.write('{"path": "half-writ')  # torn write from the interruption
+
+        report = ingest_resumes(str(tmp_path / "cvs"), output, batch_size=3, executor=pool)
+        assert (report["skipped"], report["processed"], report["parsed"]) == (3, 5, 5)
+        lines = (tmp_path / "out.jsonl").read_text().splitlines()
+        assert len(lines) == 8 and all(json.loads(line) for line in lines)
+
+    def test_sqlite_output_and_manifest(self, tmp_path, pool):
+        write_cv(tmp_path / "a" / "one.txt", 1)
+        write_cv(tmp_path / "b" / "two.txt", 2, skills="Sales, Marketing")
+        write_cv(tmp_path / "b" / "copy.txt", 1)
+        manifest = tmp_path / "manifest.txt"
+        manifest.write_text('a/one.txt\n# comment\n{"path": "b/two.txt", "file_type": "txt"}\nb/copy.txt\nmissing.txt\n')
+        assert discover_documents(str(manifest))[1] == (str((tmp_path / "b" / "two.txt").resolve()), "txt")
+
+        database = str(tmp_path / "resumes.sqlite")
+        report = ingest_resumes(str(manifest), database, executor=pool)
+        assert (report["parsed"], report["duplicates"], report["failed"]) == (2, 1, 1)
+
+        rerun = ingest_resumes(str(manifest), database, executor=pool)
+        assert (rerun["skipped"], rerun["processed"]) == (3, 1)  # only the failed document is retried
+        with sqlite3.connect(database) as connection:
+            assert connection.execute("SELECT COUNT(*) FROM resumes").fetchone()[0] == 2
+            statuses = dict(connection.execute("SELECT status, COUNT(*) FROM documents GROUP BY status").fetchall())
+        assert statuses == {"parsed": 2, "duplicate": 1, "failed": 1}
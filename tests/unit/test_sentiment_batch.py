@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+🧬 Batch Sentiment Scoring Tests
+
+Tests for the multilingual service's batch sentiment scoring: precompiled
+cultural keyword tables, the bounded result cache and chunked pool scoring.
+"""
+
+import asyncio
+import pytest
+import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Add the multilingual resonance service to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src' / 'multilingual_resonance'))
+
+from sentiment_batch import (SentimentCache, consciousness_resonance, cultural_adaptation, cultural_context,
+                             stream_sentiment_scores)
+
+LEXICON = "good\t1.9\t0.9\t[2]\nlove\t3.2\t0.4\t[3]\nbad\t-2.5\t0.6\t[-3]"
+
+
+def collect(items, cache, executor, fallback, chunk_size=2):
+    async def run():
+        return [entry async for entry in stream_sentiment_scores(items, cache, executor, fallback, chunk_size)]
+    return asyncio.run(run())
+
+
+def constant_fallback(text, language):
+    return {"compound": 0.0, "text": text, "language": language}
+
+
+@pytest.mark.unit
+class TestKeywordTables:
+    """Test the precompiled cultural and consciousness keyword tables"""
+
+    def test_cultural_context_is_gated_by_language(self):
+        assert cultural_context("we love our friends", "es") == "familial_warmth"
+        assert cultural_context("we love our friends", "en") == "neutral_context"
+        assert cultural_context("honor and harmony", "ja") == "harmonious_respect"
+        assert cultural_context("a successful goal", "de") == "individual_achievement"  # substring match kept
+        assert cultural_context("anything", "xx") == "neutral_context"
+
+    def test_resonance_and_adaptation(self):
+        assert consciousness_resonance("biological awareness") == pytest.approx(0.4 * (0.5 + 0.5 * 20 / 1000))
+        assert consciousness_resonance("nothing here") == 0.0
+        assert cultural_adaptation(0.5, "it") == pytest.approx(0.575)
+        assert cultural_adaptation(0.5, "en") == 0.5
+
+
+@pytest.mark.unit
+class TestSentimentCache:
+    """Test the bounded LRU"""
+
+    def test_lru_eviction_and_stats(self):
+        cache = SentimentCache(max_entries=2)
+        cache.put("a", "en", {"compound": 1})
+        cache.put("b", "en", {"compound": 2})
+        assert cache.get("a", "en") == {"compound": 1}
+        cache.put("c", "en", {"compound": 3})
+
+        assert cache.get("b", "en") is None
+        assert cache.get("a", "es") is None  # keyed per language
+        assert cache.stats() == {"entries": 2, "max_entries": 2, "hits": 1, "misses": 2, "evictions": 1,
+                                 "hit_rate": 0.3333}
+
+
+@pytest.mark.unit
+class TestStreamSentimentScores:
+    """Test deduplication, cache hits and pooled VADER scoring"""
+
+    def test_without_executor_every_miss_uses_the_fallback(self):
+        cache = SentimentCache()
+        results = collect([("hi", "en"), ("hi", "en"), ("hola", "es")], cache, None, constant_fallback)
+        assert sorted(index for index, _, _ in results) == [0, 1, 2]
+        assert len(cache) == 0  # fallback results are not memoized
+
+    def test_pool_scores_chunks_and_memoizes(self, tmp_path, monkeypatch):
+        lexicon = tmp_path / "nltk_data" / "sentiment" / "vader_lexicon.zip"
+        lexicon.parent.mkdir(parents=True)
+        with zipfile.ZipFile(lexicon, "w") as archive:
+            archive.writestr("vader_lexicon/vader_lexicon.txt", LEXICON)
+        monkeypatch.chdir(tmp_path)  # workers resolve ./nltk_data from here
+
+        items = [("good family love", "es"), ("bad day", "en"), ("good family love", "es"),
+                 ("good", "de"), ("bad", "ja")]
+        cache = SentimentCache()
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            first = collect(items, cache, pool, constant_fallback)
+            second = collect(items, cache, pool, constant_fallback)
+
+        by_index = {index: result for index, result, _ in first}
+        assert sorted(by_index) == [0, 1, 2, 3, 4]
+        assert by_index[0] is by_index[2]  # duplicate scored once
+        assert by_index[0]["cultural_context"] == "familial_warmth"
+        assert by_index[0]["culturally_adapted"] == pytest.approx(by_index[0]["compound"] * 1.1)
+        assert by_index[1]["compound"] < 0 < by_index[3]["compound"]
+
+        assert len(cache) == 4
+        assert all(cached for _, _, cached in second)
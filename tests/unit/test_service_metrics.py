@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+🧬 Service Metrics Tests
+
+Tests for the latency histograms, backend sub-timers and Prometheus text
+exposition behind each service's /metrics endpoint.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from service_infrastructure.metrics import (
+    LATENCY_BUCKETS,
+    PROMETHEUS_CONTENT_TYPE,
+    EndpointMetrics,
+    LatencyHistogram,
+    OperationTimers,
+    histogram_quantile,
+    parse_prometheus_text,
+    render_prometheus,
+)
+from service_infrastructure.middleware import ApiKeyValidator, SecurityMonitoringMiddleware
+
+API_KEY = "godhood-master-key-2025"
+
+
+@pytest.mark.unit
+class TestLatencyHistogram:
+    """Test bucketed percentile estimation"""
+
+    def test_quantiles_interpolate_within_buckets(self):
+        """p50/p99 follow PromQL histogram_quantile interpolation"""
+        histogram = LatencyHistogram()
+        for _ in range(98):
+            histogram.observe(0.003)
+        histogram.observe(0.3)
+        histogram.observe(20.0)
+
+        assert histogram.count == 100
+        assert histogram.quantile(0.5) == pytest.approx(0.005 * 50 / 98)
+        assert histogram.quantile(0.99) == pytest.approx(0.5)
+        assert histogram.quantile(1.0) == LATENCY_BUCKETS[-1]
+        assert LatencyHistogram().quantile(0.5) is None
+
+    def test_histogram_quantile_empty_and_single_bucket(self):
+        """Empty histograms have no quantile; a single bucket interpolates from zero"""
+        assert histogram_quantile(0.5, [0.1, 1.0], [0, 0, 0]) is None
+        assert histogram_quantile(0.5, [0.1, 1.0], [4, 4, 4]) == pytest.approx(0.05)
+
+
+@pytest.mark.unit
+class TestOperationTimers:
+    """Test backend sub-operation timers"""
+
+    def test_time_records_success_and_errors(self):
+        """Timed blocks are observed; exceptions are counted and re-raised"""
+        timers = OperationTimers()
+        with timers.time("chromadb.query"):
+            pass
+        with pytest.raises(ValueError):
+            with timers.time("chromadb.query"):
+                raise ValueError("collection unavailable")
+
+        snapshot = timers.snapshot()["chromadb.query"]
+        assert snapshot["count"] == 2
+        assert snapshot["errors"] == 1
+        assert snapshot["p99_seconds"] is not None
+
+
+@pytest.mark.unit
+class TestPrometheusExposition:
+    """Test the /metrics text format"""
+
+    def test_render_and_parse_round_trip(self):
+        """Route/status histograms, gauges and operation timers survive a parse"""
+        metrics = EndpointMetrics()
+        metrics.record("/cv/{session_id}", 0.02, 200)
+        metrics.record("/cv/{session_id}", 0.4, 500)
+        metrics.rejected = 3
+        metrics.request_started()
+        timers = OperationTimers()
+        timers.observe("nltk.sentiment", 0.012)
+
+        text = render_prometheus("cv_generation_engine", metrics, timers)
+        assert "# TYPE http_request_duration_seconds histogram" in text
+        samples = parse_prometheus_text(text)
+
+        def value(name, **labels):
+            return next(v for n, l, v in samples if n == name and all(l.get(k) == str(x) for k, x in labels.items()))
+
+        assert value("http_requests_in_flight") == 1
+        assert value("http_requests_rejected_total") == 3
+        assert value("http_request_duration_seconds_count", route="/cv/{session_id}", status=500) == 1
+        assert value("http_request_duration_seconds_bucket", route="/cv/{session_id}", status=200, le="0.025") == 1
+        assert value("http_request_duration_seconds_bucket", route="/cv/{session_id}", status=500, le="0.25") == 0
+        assert value("operation_duration_seconds_count", operation="nltk.sentiment") == 1
+        assert value("operation_errors_total", operation="nltk.sentiment") == 0
+
+    def test_label_values_are_escaped(self):
+        """Quotes and backslashes in route labels do not break the exposition"""
+        metrics = EndpointMetrics()
+        metrics.record('/odd"route\\', 0.001, 200)
+        samples = parse_prometheus_text(render_prometheus("svc", metrics, OperationTimers()))
+        assert any(labels.get("route") == '/odd"route\\' for _, labels, _ in samples)
+
+    def test_metrics_endpoint_uses_route_templates_and_in_flight_gauge(self):
+        """The middleware labels by route template and the endpoint serves text exposition"""
+        metrics = EndpointMetrics()
+        app = FastAPI()
+        app.add_middleware(SecurityMonitoringMiddleware, api_keys=ApiKeyValidator([API_KEY]),
+                           metrics=metrics, service_name="svc")
+
+        @app.get("/sessions/{session_id}")
+        async def session(session_id: str):
+            return {"session_id": session_id, "in_flight": metrics.in_flight}
+
+        @app.get("/metrics")
+        async def prometheus_metrics():
+            return PlainTextResponse(render_prometheus("svc", metrics, OperationTimers()),
+                                     media_type=PROMETHEUS_CONTENT_TYPE)
+
+        client = TestClient(app)
+        headers = {"X-API-Key": API_KEY}
+        assert client.get("/sessions/a", headers=headers).json()["in_flight"] == 1
+        client.get("/sessions/b", headers=headers)
+
+        response = client.get("/metrics", headers=headers)
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        samples = parse_prometheus_text(response.text)
+        counts = {labels["route"]: v for n, labels, v in samples if n == "http_request_duration_seconds_count"}
+        assert counts == {"/sessions/{session_id}": 2}
+        in_flight = next(v for n, _, v in samples if n == "http_requests_in_flight")
+        assert in_flight == 1  # only the /metrics request itself
+        assert metrics.in_flight == 0
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+🧬 Service Middleware Tests
+
+Tests for the shared API key validator, in-memory endpoint metrics and the
+security & monitoring ASGI middleware mounted by the FastAPI services.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from service_infrastructure.middleware import (
+    PROBE_PATHS,
+    ApiKeyValidator,
+    EndpointMetrics,
+    SecurityMonitoringMiddleware,
+)
+
+API_KEY = "godhood-master-key-2025"
+
+
+def build_app(metrics: EndpointMetrics) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(
+        SecurityMonitoringMiddleware,
+        api_keys=ApiKeyValidator([API_KEY]),
+        metrics=metrics,
+        exempt_paths=PROBE_PATHS,
+        service_name="test-service",
+        error_content={"error": "Test service error"}
+    )
+
+    @app.get("/ready")
+    async def ready():
+        return {"ready": True}
+
+    @app.get("/ok")
+    async def ok():
+        return {"status": "ok"}
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("biological failure")
+
+    return app
+
+
+@pytest.mark.unit
+class TestApiKeyValidator:
+    """Test hashed API key lookups"""
+
+    def test_valid_and_invalid_keys(self):
+        """Only configured keys validate; empty values are rejected"""
+        validator = ApiKeyValidator([API_KEY, "second-key"])
+        assert len(validator) == 2
+        assert validator.is_valid(API_KEY)
+        assert not validator.is_valid("wrong-key")
+        assert not validator.is_valid("")
+        assert not validator.is_valid(None)
+
+        validator.add("rotated-key")
+        assert validator.is_valid("rotated-key")
+
+
+@pytest.mark.unit
+class TestEndpointMetrics:
+    """Test per-endpoint counters and latency histograms"""
+
+    def test_snapshot_keeps_legacy_shape_with_histogram(self):
+        """Snapshot exposes totals plus a cumulative latency histogram"""
+        metrics = EndpointMetrics()
+        metrics.record("/health", 0.002, 200)
+        metrics.record("/health", 0.2, 200)
+        metrics.record("/health", 30.0, 503)
+
+        health = metrics.snapshot()["/health"]
+        assert health["total_requests"] == 3
+        assert health["errors"] == 1
+        assert health["total_time"] == pytest.approx(30.202)
+        assert health["latency_histogram"]["0.005"] == 1
+        assert health["latency_histogram"]["0.25"] == 2
+        assert health["latency_histogram"]["10.0"] == 2
+        assert health["latency_histogram"]["+Inf"] == 3
+
+    def test_restore_round_trip_and_legacy_data(self):
+        """Persisted snapshots restore exactly; pre-histogram data keeps its counters"""
+        metrics = EndpointMetrics()
+        metrics.record("/consciousness", 0.03, 200)
+        metrics.record("/consciousness", 0.7, 500)
+        snapshot = metrics.snapshot()
+
+        assert EndpointMetrics(snapshot).snapshot() == snapshot
+
+        legacy = EndpointMetrics({"/old": {"total_requests": 4, "total_time": 1.5, "errors": 1}})
+        old = legacy.snapshot()["/old"]
+        assert (old["total_requests"], old["errors"]) == (4, 1)
+        assert old["latency_histogram"]["+Inf"] == 0
+        assert legacy.totals()["total_requests"] == 4
+
+
+@pytest.mark.unit
+class TestSecurityMonitoringMiddleware:
+    """Test the shared ASGI middleware end to end"""
+
+    def test_rejects_missing_or_invalid_key(self):
+        """Requests without a valid key get 401 and are not recorded per endpoint"""
+        metrics = EndpointMetrics()
+        client = TestClient(build_app(metrics))
+
+        assert client.get("/ok").status_code == 401
+        response = client.get("/ok", headers={"X-API-Key": "wrong"})
+        assert response.status_code == 401
+        assert response.json() == {"error": "Authentication required"}
+        assert metrics.snapshot() == {}
+        assert metrics.rejected == 2
+
+    def test_probe_paths_skip_the_key_check(self):
+        """Probes are served without a key and still counted; other routes stay protected"""
+        metrics = EndpointMetrics()
+        client = TestClient(build_app(metrics))
+
+        assert client.get("/ready").json() == {"ready": True}
+        assert client.get("/ready/").status_code == 401
+        assert client.get("/ok").status_code == 401
+        assert metrics.snapshot()["/ready"]["total_requests"] == 1
+        assert metrics.rejected == 2
+
+    def test_records_successful_requests(self):
+        """Header and query-string keys are accepted and counted per route template"""
+        metrics = EndpointMetrics()
+        client = TestClient(build_app(metrics))
+
+        assert client.get("/ok", headers={"X-API-Key": API_KEY}).json() == {"status": "ok"}
+        assert client.get(f"/ok?api_key={API_KEY}").status_code == 200
+        assert client.get("/nowhere", headers={"X-API-Key": API_KEY}).status_code == 404
+
+        snapshot = metrics.snapshot()
+        assert snapshot["/ok"]["total_requests"] == 2
+        assert snapshot["/ok"]["errors"] == 0
+        assert snapshot["<unmatched>"]["errors"] == 0
+        assert "/nowhere" not in snapshot
+
+    def test_contains_unhandled_errors(self):
+        """Unhandled exceptions become the service's 500 body and count as errors"""
+        metrics = EndpointMetrics()
+        client = TestClient(build_app(metrics), raise_server_exceptions=False)
+
+        response = client.get("/boom", headers={"X-API-Key": API_KEY})
+        assert response.status_code == 500
+        assert response.json() == {"error": "Test service error"}
+        assert metrics.snapshot()["/boom"]["errors"] == 1
+        assert metrics.totals()["errors"] == 1
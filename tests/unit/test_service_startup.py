@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+🧬 Service Startup Tests
+
+Tests for the lazy optional-import helpers and the readiness tracker used by
+the FastAPI service lifespan hooks.
+"""
+
+import pytest
+import asyncio
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from service_infrastructure import lazy_imports
+from service_infrastructure.lazy_imports import LazyAttribute, LazyModule, lazy_import, preload
+from service_infrastructure.readiness import ServiceReadiness
+
+
+@pytest.mark.unit
+class TestLazyImports:
+    """Test deferred optional imports"""
+
+    def test_missing_package_returns_none(self):
+        """Uninstalled packages resolve to None in both modes"""
+        assert lazy_import("definitely_not_an_installed_package") is None
+        assert lazy_import("definitely_not_an_installed_package.sub", "name") is None
+
+    def test_lazy_mode_defers_import_until_first_use(self, monkeypatch):
+        """In lazy mode the module is imported on first attribute access and timed"""
+        monkeypatch.setattr(lazy_imports, "LAZY_INIT", True)
+        monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+        lazy_imports.IMPORT_TIMINGS.pop("colorsys", None)
+
+        colorsys = lazy_import("colorsys")
+        rgb_to_hsv = lazy_import("colorsys", "rgb_to_hsv")
+        assert isinstance(colorsys, LazyModule) and isinstance(rgb_to_hsv, LazyAttribute)
+        assert "colorsys" not in sys.modules
+
+        assert rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+        assert "colorsys" in sys.modules
+        assert "colorsys" in lazy_imports.IMPORT_TIMINGS
+
+    def test_eager_mode_returns_real_objects(self, monkeypatch):
+        """Without lazy mode the real module and attribute are returned"""
+        monkeypatch.setattr(lazy_imports, "LAZY_INIT", False)
+        import json
+        assert lazy_import("json") is json
+        assert lazy_import("json", "dumps") is json.dumps
+        preload(json, None)  # real modules and None are ignored
+
+
+@pytest.mark.unit
+class TestServiceReadiness:
+    """Test warm-up tracking behind /ready"""
+
+    @pytest.mark.asyncio
+    async def test_lazy_warmup_runs_in_background(self):
+        """Lazy mode serves immediately and becomes ready once warm-up finishes"""
+        readiness = ServiceReadiness("test-service", lazy=True)
+        readiness.add_warmup("slow_backend", lambda: __import__("time").sleep(0.1))
+
+        await readiness.start()
+        assert readiness.readiness_report()["ready"] is False
+
+        for _ in range(50):
+            if readiness.ready:
+                break
+            await asyncio.sleep(0.02)
+        report = readiness.readiness_report()
+        assert report["ready"] is True
+        assert report["startup_mode"] == "lazy"
+        assert report["components"]["slow_backend"]["status"] == "ready"
+        await readiness.stop()
+
+    @pytest.mark.asyncio
+    async def test_eager_warmup_failure_is_degraded_not_blocking(self):
+        """A failed step is reported but readiness is still reached"""
+        def broken():
+            raise LookupError("Resource 'vader_lexicon' not found.")
+
+        readiness = ServiceReadiness("test-service", lazy=False)
+        readiness.add_warmup("nltk", broken)
+        readiness.add_warmup("vector_store", lambda: None)
+        await readiness.start()
+
+        report = readiness.readiness_report()
+        assert report["ready"] is True and report["degraded"] is True
+        assert report["components"]["nltk"]["status"] == "failed"
+        assert "vader_lexicon" in report["components"]["nltk"]["error"]
+        assert report["components"]["vector_store"]["status"] == "ready"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
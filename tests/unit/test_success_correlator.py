@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+🧬 Biological Success Correlator Tests
+
+Tests for the incremental correlation mode: running statistics agree with
+batch computations, reservoirs stay bounded, and state survives a
+snapshot/restore round trip.
+"""
+
+import asyncio
+import json
+import math
+import random
+import statistics
+from datetime import datetime
+import pytest
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add the correlator module to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src' / 'application-automation' / 'biological_biological'))
+
+from success_correlator import (
+    BiologicalSuccessCorrelator, RunningCorrelation, correlation_confidence_interval, correlation_p_value
+)
+
+
+def applications(count, seed=0, start_day=1):
+    rng = random.Random(seed)
+    for i in range(count):
+        alignment = rng.random()
+        yield SimpleNamespace(
+            application_id=f"APP-{i}",
+            platform=("LinkedIn", "Indeed")[i % 2],
+            biological_alignment_score=alignment,
+            submission_date=f"2025-01-{start_day + i % 28:02d}T09:00:00Z",
+            response_received=rng.random() < alignment,
+        )
+
+
+@pytest.mark.unit
+class TestRunningCorrelation:
+    """Test the Welford co-moment statistics"""
+
+    def test_matches_statistics_correlation(self):
+        rng = random.Random(1)
+        xs = [rng.random() for _ in range(500)]
+        ys = [x * 2 + rng.gauss(0, 0.3) for x in xs]
+        running = RunningCorrelation()
+        for x, y in zip(xs, ys):
+            running.update(x, y)
+        assert running.count == 500
+        assert running.correlation == pytest.approx(statistics.correlation(xs, ys), rel=1e-9)
+
+    def test_merge_equals_single_pass(self):
+        rng = random.Random(2)
+        pairs = [(rng.random(), rng.random()) for _ in range(300)]
+        whole, first, second = RunningCorrelation(), RunningCorrelation(), RunningCorrelation()
+        for i, (x, y) in enumerate(pairs):
+            whole.update(x, y)
+            (first if i < 120 else second).update(x, y)
+        first.merge(second)
+        assert first.count == whole.count
+        assert first.correlation == pytest.approx(whole.correlation, rel=1e-9)
+
+    def test_p_value_matches_t_distribution(self):
+        # r = 0.5, n = 12 -> t = 1.826 on 10 df, two-sided p ~ 0.0978
+        assert correlation_p_value(0.5, 12) == pytest.approx(0.0978, abs=5e-4)
+        assert correlation_p_value(0.0, 50) == pytest.approx(1.0)
+        assert correlation_p_value(0.9, 2) == 1.0
+
+    def test_confidence_interval_brackets_correlation(self):
+        interval = correlation_confidence_interval(0.6, 40)
+        assert interval["lower"] < 0.6 < interval["upper"]
+        assert interval["lower"] == pytest.approx(math.tanh(math.atanh(0.6) - 1.96 / math.sqrt(37)))
+
+
+@pytest.mark.unit
+class TestIncrementalCorrelator:
+    """Test incremental analysis against the batch analysis"""
+
+    def test_incremental_buckets_match_batch(self):
+        history = list(applications(400, seed=3))
+        batch = asyncio.run(BiologicalSuccessCorrelator().analyze_success_correlations(history))
+
+        correlator = BiologicalSuccessCorrelator(seed=3)
+        assert correlator.record_application_results(history) == 400
+        incremental = asyncio.run(correlator.analyze_incremental_correlations())
+
+        assert incremental["correlation_coefficient"] == pytest.approx(batch["correlation_coefficient"])
+        for key, bucket in batch["alignment_success_analysis"].items():
+            assert incremental["alignment_success_analysis"][key]["total"] == bucket["total"]
+            assert incremental["alignment_success_analysis"][key]["successes"] == bucket["successes"]
+        assert incremental["analysis_metadata"]["time_period_days"] == batch["analysis_metadata"]["time_period_days"]
+        for platform, data in batch["platform_specific_correlations"].items():
+            assert incremental["platform_specific_correlations"][platform]["correlation"] == pytest.approx(
+                data["correlation"])
+        assert incremental["application_level_correlation"]["sample_size"] == 400
+        assert incremental["application_level_correlation"]["p_value"] < 0.05
+
+    def test_bucket_samples_are_bounded(self):
+        correlator = BiologicalSuccessCorrelator(bucket_sample_size=5, seed=4)
+        correlator.record_application_results(applications(2000, seed=4))
+        buckets = correlator._incremental_buckets
+        assert sum(bucket["total"] for bucket in buckets.values()) == 2000
+        assert all(len(bucket["applications"]) <= 5 for bucket in buckets.values())
+
+    def test_empty_state_reports_insufficient_history(self):
+        result = asyncio.run(BiologicalSuccessCorrelator().analyze_incremental_correlations())
+        assert result["correlation_analysis_complete"] is False
+
+    def test_minimum_history_matches_batch(self):
+        history = list(applications(4, seed=7))
+        correlator = BiologicalSuccessCorrelator()
+        correlator.record_application_results(history)
+        incremental = asyncio.run(correlator.analyze_incremental_correlations())
+        batch = asyncio.run(BiologicalSuccessCorrelator().analyze_success_correlations(history))
+        for result in (incremental, batch):
+            assert result["correlation_analysis_complete"] is False
+            assert (result["minimum_required"], result["provided"]) == (5, 4)
+
+        correlator.record_application_results(applications(1, seed=8))
+        assert asyncio.run(correlator.analyze_incremental_correlations())["correlation_analysis_complete"] is True
+
+    def test_snapshot_restore_round_trip(self):
+        original = BiologicalSuccessCorrelator(seed=5)
+        original.record_application_results(applications(300, seed=5))
+        state = json.loads(json.dumps(original.snapshot_incremental_state()))
+
+        restored = BiologicalSuccessCorrelator()
+        restored.restore_incremental_state(state)
+        # Both continue identically, including reservoir replacement decisions
+        for correlator in (original, restored):
+            correlator.record_application_results(applications(300, seed=6, start_day=2))
+        first = asyncio.run(original.analyze_incremental_correlations())
+        second = asyncio.run(restored.analyze_incremental_correlations())
+        assert first["alignment_success_analysis"] == second["alignment_success_analysis"]
+        assert first["application_level_correlation"] == second["application_level_correlation"]
+
+    def test_restore_parses_datetime_sample_timestamps(self):
+        original = BiologicalSuccessCorrelator(seed=9)
+        created_at = datetime(2025, 3, 4, 9, 30)
+        original.record_application_result(SimpleNamespace(
+            application_id="APP-dt", platform="Indeed", biological_alignment_score=0.8,
+            created_at=created_at, response_received=True))
+        original.record_application_results(applications(3, seed=9))
+        state = json.loads(json.dumps(original.snapshot_incremental_state()))
+
+        restored = BiologicalSuccessCorrelator()
+        restored.restore_incremental_state(state)
+        samples = {sample["application_id"]: sample
+                   for bucket in restored._incremental_buckets.values() for sample in bucket["applications"]}
+        assert samples["APP-dt"]["timestamp"] == created_at
+        assert "timestamp_is_datetime" not in samples["APP-dt"]
+        assert isinstance(samples["APP-0"]["timestamp"], str)
+
+    def test_restore_rejects_unknown_version(self):
+        with pytest.raises(ValueError):
+            BiologicalSuccessCorrelator().restore_incremental_state({"version": 99})
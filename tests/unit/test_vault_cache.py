@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+🧬 Biological Vault Secret Cache Tests
+
+Tests for the vault's parsed-file snapshot, decrypted-secret cache and
+batched audit writer, and for the bulk /secrets endpoint.
+"""
+
+import base64
+import itertools
+import json
+import os
+import pytest
+import sys
+from pathlib import Path
+
+# Add the infrastructure modules to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'infrastructure'))
+
+from fastapi.testclient import TestClient
+
+import vault_manager
+import vault_service
+from cryptography.exceptions import InvalidTag
+from vault_manager import BiologicalVaultManager, SecretBuffer, SecretCache
+
+REWRITES = itertools.count(1)
+
+
+def make_vault(tmp_path, **options):
+    options.setdefault("audit_file", str(tmp_path / "audit.log"))
+    return BiologicalVaultManager(vault_path=str(tmp_path / "secrets"), key_path=str(tmp_path / "keys"), **options)
+
+
+def write_secrets(vault, secrets, environment="production"):
+    vault.vault_path.mkdir(parents=True, exist_ok=True)
+    vault_file = vault.vault_path / f"{environment}.json"
+    data = {"stripe": {"live": {key: vault.encrypt_secret(value) for key, value in secrets.items()}}}
+    vault_file.write_text(json.dumps(data))
+    # Make the rewrite visible even on filesystems with coarse mtimes
+    stat = vault_file.stat()
+    os.utime(vault_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + next(REWRITES) * 1_000_000))
+
+
+@pytest.mark.unit
+class TestSecretCache:
+    """Test the decrypted-secret cache"""
+
+    def test_repeat_reads_hit_cache_and_snapshot(self, tmp_path):
+        vault = make_vault(tmp_path)
+        write_secrets(vault, {"api_key": "sk-live-1", "webhook": "whsec-1"})
+
+        assert vault.get_secret("stripe.live", "api_key") == "sk-live-1"
+        snapshot = vault.load_vault()
+        assert vault.get_secret("stripe.live", "api_key") == "sk-live-1"
+        assert vault.load_vault() is snapshot
+        assert (vault.secret_cache.hits, vault.secret_cache.misses) == (1, 1)
+
+    def test_rotated_file_is_reparsed(self, tmp_path):
+        vault = make_vault(tmp_path)
+        write_secrets(vault, {"api_key": "sk-live-1"})
+        assert vault.get_secret("stripe.live", "api_key") == "sk-live-1"
+
+        write_secrets(vault, {"api_key": "sk-live-2"})
+        assert vault.get_secret("stripe.live", "api_key") == "sk-live-2"
+        assert vault.secret_cache.stats()["entries"] == 1
+
+    def test_bulk_read_and_missing_key(self, tmp_path):
+        vault = make_vault(tmp_path)
+        write_secrets(vault, {"api_key": "sk-live-1", "webhook": "whsec-1"})
+        assert vault.get_secrets("stripe.live", ["api_key", "webhook"]) == {"api_key": "sk-live-1", "webhook": "whsec-1"}
+        with pytest.raises(KeyError):
+            vault.get_secrets("stripe.live", ["api_key", "missing"])
+
+    def test_evicted_and_expired_values_are_zeroized(self):
+        cache = SecretCache(ttl_seconds=300, max_entries=1)
+        first, second = SecretBuffer(bytearray(b"first-secret"), 12), SecretBuffer(bytearray(b"second"), 6)
+        cache.put(("a",), first)
+        cache.put(("b",), second)
+        assert first._buffer == bytearray(12)
+        assert cache.get(("a",)) is None and cache.get(("b",)) == "second"
+
+        cache.ttl_seconds = -1
+        expired = SecretBuffer(bytearray(b"third"), 5)
+        cache.put(("c",), expired)
+        assert expired._buffer == bytearray(5)
+
+    def test_disabled_cache_always_decrypts(self, tmp_path):
+        vault = make_vault(tmp_path, secret_cache_ttl=0)
+        write_secrets(vault, {"api_key": "sk-live-1"})
+        for _ in range(3):
+            assert vault.get_secret("stripe.live", "api_key") == "sk-live-1"
+        assert vault.secret_cache.hits == 0
+
+
+    def test_failed_tag_check_zeroizes_the_plaintext(self, tmp_path, monkeypatch):
+        vault = make_vault(tmp_path)
+        encrypted = bytearray(base64.b64decode(vault.encrypt_secret("sk-live-tampered")))
+        encrypted[32] ^= 0x01  # corrupt the GCM tag
+        buffers = []
+
+        class RecordingBuffer(SecretBuffer):
+            __slots__ = ()
+
+            def __init__(self, buffer, length):
+                super().__init__(buffer, length)
+                buffers.append(self)
+
+        monkeypatch.setattr(vault_manager, "SecretBuffer", RecordingBuffer)
+        with pytest.raises(InvalidTag):
+            vault._decrypt_to_buffer(base64.b64encode(bytes(encrypted)).decode())
+        assert len(buffers) == 1
+        assert buffers[0]._buffer == bytearray(len(buffers[0]._buffer)) and buffers[0]._length == 0
+
+
+@pytest.mark.unit
+class TestBatchedAudit:
+    """Test the bounded, batched audit writer"""
+
+    def test_entries_are_flushed_in_batches(self, tmp_path):
+        vault = make_vault(tmp_path, audit_batch_size=4)
+        write_secrets(vault, {"api_key": "sk-live-1"})  # one audit entry from encrypt_secret
+        for _ in range(6):
+            vault.get_secret("stripe.live", "api_key")
+
+        lines = (tmp_path / "audit.log").read_text().splitlines()
+        assert len(lines) == 4
+        assert len(vault.audit_log) == 3
+        vault.save_audit_log()
+        assert len((tmp_path / "audit.log").read_text().splitlines()) == 7
+
+    def test_backlog_is_bounded_when_audit_file_is_unwritable(self, tmp_path):
+        (tmp_path / "blocked").mkdir()
+        vault = make_vault(tmp_path, audit_file=str(tmp_path / "blocked"), audit_batch_size=2, audit_max_entries=5)
+        write_secrets(vault, {"api_key": "sk-live-1"})
+        for _ in range(10):
+            vault.get_secret("stripe.live", "api_key")
+        assert len(vault.audit_log) == 5
+        assert vault.audit_dropped == 6
+
+
+@pytest.mark.unit
+class TestBulkSecretsEndpoint:
+    """Test GET /secrets/{service}"""
+
+    def test_bulk_endpoint(self, tmp_path, monkeypatch):
+        vault = make_vault(tmp_path)
+        write_secrets(vault, {"api_key": "sk-live-1", "webhook": "whsec-1"})
+        monkeypatch.setattr(vault_service, "vault_instance", vault)
+        monkeypatch.setattr(vault_service, "VAULT_ENV", "production")
+        client = TestClient(vault_service.app)
+
+        response = client.get("/secrets/stripe.live", params={"keys": ["api_key", "webhook"]})
+        assert response.status_code == 200
+        assert response.json()["values"] == {"api_key": "sk-live-1", "webhook": "whsec-1"}
+
+        denied = client.get("/secrets/stripe.live", params={"keys": ["api_key"], "requester": "intruder"})
+        assert denied.status_code == 403
+        assert client.get("/stats").json()["secret_cache"]["entries"] == 2
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+🧬 Shared Async Vector Store Adapter Tests
+
+Tests for the non-blocking vector store adapter shared by the FastAPI services.
+Validates micro-batched upserts and the in-process fallback index, including
+its top-k ranking and memory-mapped persistence.
+"""
+
+import pytest
+import asyncio
+import random
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from service_infrastructure import vector_store
+from service_infrastructure.vector_store import AsyncVectorStoreAdapter, NumpyVectorIndex, sanitize_metadata
+
+
+@pytest.fixture
+def fallback_adapter(tmp_path, monkeypatch):
+    monkeypatch.setattr(vector_store, "CHROMADB_AVAILABLE", False)
+    return AsyncVectorStoreAdapter("test_vectors", str(tmp_path / "vectors"))
+
+
+@pytest.mark.unit
+class TestAsyncVectorStoreAdapter:
+    """Test shared async vector store adapter"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_adds_share_one_upsert(self, fallback_adapter):
+        """Concurrent adds inside the batch window become a single upsert"""
+        await asyncio.gather(*[
+            fallback_adapter.add(f"v{i}", [float(i), 1.0], {"index": i}) for i in range(25)
+        ])
+
+        metrics = fallback_adapter.get_vector_store_metrics()
+        assert metrics["adds"] == 25
+        assert metrics["upsert_batches"] == 1
+        assert metrics["backend"] == "numpy_fallback"
+        assert fallback_adapter.count() == 25
+
+    @pytest.mark.asyncio
+    async def test_commit_tasks_are_held_until_done(self, fallback_adapter):
+        """In-flight batch commits are strongly referenced and released once finished"""
+        adds = [asyncio.ensure_future(fallback_adapter.add(f"v{i}", [float(i), 1.0], {})) for i in range(3)]
+        await asyncio.sleep(0)
+        fallback_adapter._dispatch_pending()
+        assert len(fallback_adapter._commit_tasks) == 1
+
+        await asyncio.gather(*adds)
+        await asyncio.sleep(0)
+        assert not fallback_adapter._commit_tasks
+
+    @pytest.mark.asyncio
+    async def test_query_returns_flat_ranked_results(self, fallback_adapter):
+        """Queries return flat id/distance/metadata lists ordered by similarity"""
+        await fallback_adapter.add("east", [1.0, 0.0], {"direction": "east"})
+        await fallback_adapter.add("north", [0.0, 1.0], {"direction": "north"})
+        await fallback_adapter.add("north_east", [1.0, 1.0], {"direction": "north_east"})
+
+        results = await fallback_adapter.query([1.0, 0.1], n_results=2)
+        assert results["ids"] == ["east", "north_east"]
+        assert results["distances"][0] < results["distances"][1]
+        assert results["metadatas"][0] == {"direction": "east"}
+
+    def test_upsert_replaces_existing_vector(self):
+        """Upserting an existing id replaces its vector and metadata"""
+        index = NumpyVectorIndex()
+        index.upsert(["a"], [[1.0, 0.0]], [{"version": 1}])
+        index.upsert(["a"], [[0.0, 1.0]], [{"version": 2}])
+
+        results = index.query([0.0, 1.0], 5)
+        assert len(index) == 1
+        assert results["ids"] == ["a"]
+        assert results["metadatas"] == [{"version": 2}]
+        assert results["distances"][0] == pytest.approx(0.0, abs=1e-6)
+
+    def test_empty_index_and_zero_vectors(self):
+        """Empty indexes and zero-norm vectors do not raise"""
+        index = NumpyVectorIndex()
+        assert index.query([1.0, 0.0], 3) == {"ids": [], "distances": [], "metadatas": []}
+
+        index.upsert(["zero"], [[0.0, 0.0]], [{}])
+        assert index.query([1.0, 0.0], 3)["distances"] == [1.0]
+
+    def test_top_k_matches_full_sort_across_growth(self):
+        """argpartition top-k agrees with a full sort after the matrix has doubled"""
+        rng = random.Random(7)
+        vectors = [[rng.uniform(-1, 1) for _ in range(8)] for _ in range(300)]
+        index = NumpyVectorIndex(initial_capacity=4)
+        for start in range(0, 300, 50):
+            index.upsert([f"v{i}" for i in range(start, start + 50)], vectors[start:start + 50], [{}] * 50)
+        assert len(index) == 300
+        assert index.capacity == 400  # 50 -> 100 -> 200 -> 400
+
+        query = [rng.uniform(-1, 1) for _ in range(8)]
+        expected = sorted(range(300), key=lambda i: -vector_store.cosine_similarity(vectors[i], query))[:10]
+        positions, similarities = index.top_k(query, 10)
+        assert positions == expected
+        assert similarities == sorted(similarities, reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_fallback_index_persists_and_memory_maps(self, tmp_path, monkeypatch):
+        """Saved fallback indexes are memory-mapped on restart and copied on first write"""
+        monkeypatch.setattr(vector_store, "CHROMADB_AVAILABLE", False)
+        adapter = AsyncVectorStoreAdapter("persisted", str(tmp_path / "vectors"))
+        await adapter.add("east", [1.0, 0.0], {"direction": "east"})
+        await adapter.add("north", [0.0, 1.0], {"direction": "north"})
+        assert await adapter.persist() is True
+
+        restarted = AsyncVectorStoreAdapter("persisted", str(tmp_path / "vectors"))
+        assert restarted.count() == 2
+        assert not restarted.fallback_index._matrix.flags.writeable
+        assert restarted.query_sync([0.9, 0.1], 1)["ids"] == ["east"]
+
+        restarted.add_sync("west", [-1.0, 0.0], {"direction": "west"})
+        assert restarted.query_sync([-1.0, 0.0], 1)["metadatas"] == [{"direction": "west"}]
+        assert restarted.count() == 3
+
+    @pytest.mark.asyncio
+    async def test_fallback_index_saved_without_graceful_shutdown(self, tmp_path, monkeypatch):
+        """Unsaved writes reach disk after save_every vectors or save_interval seconds"""
+        monkeypatch.setattr(vector_store, "CHROMADB_AVAILABLE", False)
+        path = str(tmp_path / "vectors")
+        adapter = AsyncVectorStoreAdapter("autosaved", path, save_every=3, save_interval=0.05)
+
+        adapter.add_sync("v0", [1.0, 0.0])
+        adapter.add_sync("v1", [0.0, 1.0])
+        assert AsyncVectorStoreAdapter("autosaved", path).count() == 0
+        adapter.add_sync("v2", [1.0, 1.0])
+        assert adapter.fallback_index.unsaved_changes == 0
+        assert AsyncVectorStoreAdapter("autosaved", path).count() == 3
+
+        await adapter.add("v3", [-1.0, 0.0])
+        assert AsyncVectorStoreAdapter("autosaved", path).count() == 3
+        await asyncio.sleep(0.2)
+        assert AsyncVectorStoreAdapter("autosaved", path).count() == 4
+        assert not list(tmp_path.rglob("*.tmp"))
+
+    def test_metadata_sanitized_for_chromadb(self):
+        """Non-scalar metadata is JSON encoded and None values dropped"""
+        metadata = sanitize_metadata({"level": 0.8, "methods": ["email", "otp"], "missing": None, "ok": True})
+        assert metadata == {"level": 0.8, "methods": '["email", "otp"]', "ok": True}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])